@@ -15,12 +15,12 @@ import os
 import json
 import math
 from collections import defaultdict, Counter
-import re
 from pathlib import Path
 
 from crawl4ai.async_webcrawler import AsyncWebCrawler
 from crawl4ai.async_configs import CrawlerRunConfig, LinkPreviewConfig, LLMConfig
 from crawl4ai.models import Link, CrawlResult
+from crawl4ai.bm25 import BM25Index, tokenize
 import numpy as np
 
 @dataclass
@@ -373,12 +373,11 @@ class StatisticalStrategy(CrawlStrategy):
             
         # Calculate pairwise term overlap
         overlaps = []
+        term_sets = [set(self._get_document_terms(result)) for result in state.knowledge_base]
         
-        for i in range(len(state.knowledge_base)):
-            for j in range(i + 1, len(state.knowledge_base)):
-                # Get terms from both documents
-                terms_i = set(self._get_document_terms(state.knowledge_base[i]))
-                terms_j = set(self._get_document_terms(state.knowledge_base[j]))
+        for i in range(len(term_sets)):
+            for j in range(i + 1, len(term_sets)):
+                terms_i, terms_j = term_sets[i], term_sets[j]
                 
                 if terms_i and terms_j:
                     # Jaccard similarity
@@ -596,15 +595,8 @@ class StatisticalStrategy(CrawlStrategy):
             state.crawl_order.append(result.url)
     
     def _tokenize(self, text: str) -> List[str]:
-        """Simple tokenization - can be enhanced"""
-        # Remove punctuation and split
-        text = re.sub(r'[^\w\s]', ' ', text)
-        tokens = text.split()
-        
-        # Filter short tokens and stop words (basic)
-        tokens = [t for t in tokens if len(t) > 2]
-        
-        return tokens
+        """Split on punctuation and whitespace, dropping tokens of 1-2 characters"""
+        return tokenize(text, strip_punctuation=True, min_length=3)
     
     def _get_document_terms(self, crawl_result: CrawlResult) -> List[str]:
         """Extract terms from a crawl result"""
@@ -1899,17 +1891,17 @@ class AdaptiveCrawler:
         if not self.state or not self.state.knowledge_base:
             return []
         
-        # Simple relevance ranking based on term overlap
+        # BM25 ranking over the knowledge base, scaled so the best match is 1.0
         scored_docs = []
-        query_terms = set(self.state.query.lower().split())
+        index = BM25Index(
+            tokenize(result.markdown.raw_markdown or "", strip_punctuation=True)
+            for result in self.state.knowledge_base
+        )
+        scores = index.get_scores(tokenize(self.state.query or "", strip_punctuation=True))
+        best = scores.max()
         
         for i, result in enumerate(self.state.knowledge_base):
-            content = (result.markdown.raw_markdown or "").lower()
-            content_terms = set(content.split())
-            
-            # Calculate relevance score
-            overlap = len(query_terms & content_terms)
-            score = overlap / len(query_terms) if query_terms else 0.0
+            score = float(scores[i] / best) if best > 0 else 0.0
             
             scored_docs.append({
                 'url': result.url,
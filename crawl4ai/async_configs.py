@@ -37,6 +37,12 @@ from enum import Enum
 UrlMatcher = Union[str, Callable[[str], bool], List[Union[str, Callable[[str], bool]]]]
 
 
+@functools.lru_cache(maxsize=None)
+def _init_parameters(cls) -> Dict[str, inspect.Parameter]:
+    """``__init__`` parameters of a config class, computed once per class."""
+    return inspect.signature(cls.__init__).parameters
+
+
 def _with_defaults(cls):
     """Class decorator: adds set_defaults/get_defaults/reset_defaults classmethods.
 
@@ -241,6 +247,7 @@ UNTRUSTED_FIELD_ALLOWLIST = {
         # cache
         "cache_mode", "bypass_cache", "disable_cache", "no_cache_read",
         "no_cache_write", "check_cache_freshness", "cache_validation_timeout",
+        "revalidate_cache", "cache_max_age", "cache_fields",
         "fetch_ssl_certificate",
         # timing / waiting
         "wait_until", "page_timeout", "wait_for", "wait_for_timeout",
@@ -397,6 +404,13 @@ def to_serializable_dict(obj: Any, ignore_default_value : bool = False):
     return str(obj)
 
 
+@functools.lru_cache(maxsize=None)
+def _deserialize_registry() -> Dict[str, type]:
+    """Classes of ALLOWED_DESERIALIZE_TYPES, looked up in the crawl4ai package once."""
+    mod = importlib.import_module("crawl4ai")
+    return {name: getattr(mod, name) for name in ALLOWED_DESERIALIZE_TYPES if hasattr(mod, name)}
+
+
 def from_serializable_dict(data: Any, provenance: "Provenance" = None) -> Any:
     """
     Recursively convert a serializable dictionary back to an object instance.
@@ -445,17 +459,7 @@ def from_serializable_dict(data: Any, provenance: "Provenance" = None) -> Any:
                 f"type '{type_name}' may not be constructed from an untrusted request"
             )
 
-        cls = None
-        module_paths = ["crawl4ai"]
-        for module_path in module_paths:
-            try:
-                mod = importlib.import_module(module_path)
-                if hasattr(mod, type_name):
-                    cls = getattr(mod, type_name)
-                    break
-            except (ImportError, AttributeError):
-                continue
-
+        cls = _deserialize_registry().get(type_name)
         if cls is not None:
             # Handle Enum
             if issubclass(cls, Enum):
@@ -771,6 +775,17 @@ class BrowserConfig:
                                         process to reclaim leaked memory. 0 = disabled.
                                         Recommended: 500-1000 for long-running crawlers.
                                         Default: 0.
+        page_pool_size (int): Number of ready pages kept per browser context, so a crawl
+                              takes a warm page instead of opening one. Pages are reset
+                              (about:blank, cleared storage) and returned to the pool after
+                              a crawl; the pool is refilled in the background. 0 = disabled.
+                              Default: 0.
+        page_pool_max_idle (float): Seconds a pooled page may stay unused before it is closed.
+                                    Default: 60.0.
+        page_pool_clear_storage (bool): If True, localStorage and sessionStorage of the last
+                                        visited origin are cleared before a page returns to
+                                        the pool. Cookies belong to the context and are kept.
+                                        Default: True.
         avoid_ads (bool): If True, blocks ad-related and tracker network requests at the
                           browser context level using a curated blocklist of top ad/tracker
                           domains. Default: False.
@@ -829,6 +844,9 @@ class BrowserConfig:
         init_scripts: List[str] = None,
         memory_saving_mode: bool = False,
         max_pages_before_recycle: int = 0,
+        page_pool_size: int = 0,
+        page_pool_max_idle: float = 60.0,
+        page_pool_clear_storage: bool = True,
     ):
         
         self.browser_type = browser_type
@@ -896,6 +914,9 @@ class BrowserConfig:
         self.init_scripts = init_scripts if init_scripts is not None else []
         self.memory_saving_mode = memory_saving_mode
         self.max_pages_before_recycle = max_pages_before_recycle
+        self.page_pool_size = page_pool_size
+        self.page_pool_max_idle = page_pool_max_idle
+        self.page_pool_clear_storage = page_pool_clear_storage
 
         fa_user_agenr_generator = ValidUAGenerator()
         if self.user_agent_mode == "random":
@@ -945,7 +966,7 @@ class BrowserConfig:
         }
         # Only pass keys present in kwargs so that __init__ defaults (and
         # set_defaults() overrides) are respected for missing keys.
-        valid = inspect.signature(BrowserConfig.__init__).parameters.keys() - {"self"}
+        valid = _init_parameters(BrowserConfig).keys() - {"self"}
         return BrowserConfig(**{k: v for k, v in kwargs.items() if k in valid})
 
     def to_dict(self):
@@ -991,6 +1012,9 @@ class BrowserConfig:
             "init_scripts": self.init_scripts,
             "memory_saving_mode": self.memory_saving_mode,
             "max_pages_before_recycle": self.max_pages_before_recycle,
+            "page_pool_size": self.page_pool_size,
+            "page_pool_max_idle": self.page_pool_max_idle,
+            "page_pool_clear_storage": self.page_pool_clear_storage,
         }
 
 
@@ -1430,6 +1454,24 @@ class CrawlerRunConfig():
                                       Default: False.
         cache_validation_timeout (float): Timeout in seconds for cache validation HTTP requests.
                                           Default: 10.0.
+        revalidate_cache (bool): If True, stale cached entries are re-requested with
+                                 If-None-Match / If-Modified-Since built from the stored
+                                 ETag / Last-Modified. A 304 refreshes the entry's age and
+                                 returns the cached result; a 200 replaces the entry. Needs a
+                                 crawler strategy with conditional request support
+                                 (AsyncHTTPCrawlerStrategy); other strategies recrawl stale
+                                 entries. Ignored when check_cache_freshness is set.
+                                 Default: False.
+        cache_max_age (float or None): Age in seconds after which a cached entry is stale for
+                                       revalidate_cache. None treats every entry as stale.
+                                       Default: None.
+        cache_fields (list of str or None): Content fields to load for a result served from the
+                                            cache, out of "html", "cleaned_html", "markdown",
+                                            "extracted_content" and "screenshot"; the others come
+                                            back empty. The entry is used if any requested field
+                                            is non-empty. None loads all of them, the screenshot
+                                            only when screenshot is set.
+                                            Default: None.
 
         # Page Navigation and Timing Parameters
         wait_until (str): The condition to wait for when navigating, e.g. "domcontentloaded".
@@ -1591,6 +1633,16 @@ class CrawlerRunConfig():
         'no_cache_write' : 'Instead, use cache_mode=CacheMode.READ_ONLY',
     }
 
+    # Parameters that __init__ validates, converts or fills in from other
+    # values; clone() overrides them by running the constructor again.
+    _CLONE_REBUILD_PARAMS = frozenset({
+        "extraction_strategy", "chunking_strategy", "markdown_generator",
+        "scraping_strategy", "table_extraction", "target_elements",
+        "excluded_tags", "excluded_selector", "keep_attrs",
+        "exclude_social_media_domains", "exclude_domains", "experimental",
+        "link_preview_config", "virtual_scroll_config", "c4a_script",
+    })
+
     def __init__(
         self,
         # Content Processing Parameters
@@ -1632,6 +1684,9 @@ class CrawlerRunConfig():
         # Cache Validation Parameters (Smart Cache)
         check_cache_freshness: bool = False,
         cache_validation_timeout: float = 10.0,
+        revalidate_cache: bool = False,
+        cache_max_age: Optional[float] = None,
+        cache_fields: Optional[List[str]] = None,
         # Page Navigation and Timing Parameters
         wait_until: str = "domcontentloaded",
         page_timeout: int = PAGE_TIMEOUT,
@@ -1761,6 +1816,12 @@ class CrawlerRunConfig():
         # Cache Validation (Smart Cache)
         self.check_cache_freshness = check_cache_freshness
         self.cache_validation_timeout = cache_validation_timeout
+        self.revalidate_cache = revalidate_cache
+        self.cache_max_age = cache_max_age
+        self.cache_fields = cache_fields
+        # Verdicts of arun_many's bulk freshness check, set on the config of
+        # that call only
+        self._cache_verdicts: Optional[Dict[str, Any]] = None
 
         # Page Navigation and Timing Parameters
         self.wait_until = wait_until
@@ -2057,13 +2118,9 @@ class CrawlerRunConfig():
 
     def __setattr__(self, name, value):
         """Handle attribute setting."""
-        # TODO: Planning to set properties dynamically based on the __init__ signature
-        sig = inspect.signature(self.__init__)
-        all_params = sig.parameters  # Dictionary of parameter names and their details
-
-        if name in self._UNWANTED_PROPS and value is not all_params[name].default:
+        if name in self._UNWANTED_PROPS and value is not _init_parameters(CrawlerRunConfig)[name].default:
             raise AttributeError(f"Setting '{name}' is deprecated. {self._UNWANTED_PROPS[name]}")
-        
+
         super().__setattr__(name, value)
 
     @staticmethod
@@ -2077,7 +2134,7 @@ class CrawlerRunConfig():
         }
         # Only pass keys present in kwargs so that __init__ defaults (and
         # set_defaults() overrides) are respected for missing keys.
-        valid = inspect.signature(CrawlerRunConfig.__init__).parameters.keys() - {"self"}
+        valid = _init_parameters(CrawlerRunConfig).keys() - {"self"}
         return CrawlerRunConfig(**{k: v for k, v in kwargs.items() if k in valid})
 
     # Create a funciton returns dict of the object
@@ -2201,6 +2258,11 @@ class CrawlerRunConfig():
     def clone(self, **kwargs):
         """Create a copy of this configuration with updated values.
 
+        The copy is shallow: strategies and other nested objects are shared
+        with this config. Overrides that ``__init__`` only stores are set on
+        a copy of the instance dict, which takes microseconds; the others
+        (see ``_CLONE_REBUILD_PARAMS``) go through the constructor.
+
         Args:
             **kwargs: Key-value pairs of configuration options to update
 
@@ -2220,7 +2282,15 @@ class CrawlerRunConfig():
             )
             ```
         """
-        config_dict = self.to_dict()
+        params = _init_parameters(CrawlerRunConfig)
+        if kwargs.keys() <= params.keys() and not kwargs.keys() & self._CLONE_REBUILD_PARAMS:
+            config = object.__new__(CrawlerRunConfig)
+            config.__dict__.update(self.__dict__)
+            for name, value in kwargs.items():
+                setattr(config, name, value)
+            return config
+
+        config_dict = {name: getattr(self, name) for name in params if name != "self"}
         config_dict.update(kwargs)
         return CrawlerRunConfig.from_kwargs(config_dict)
 
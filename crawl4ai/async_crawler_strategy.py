@@ -60,6 +60,10 @@ class AsyncCrawlerStrategy(ABC):
     Subclasses must implement the crawl method.
     """
 
+    # Strategies that accept ``conditional_headers`` in ``crawl`` and return
+    # a 304 response instead of raising set this to True
+    supports_conditional_requests = False
+
     @abstractmethod
     async def crawl(self, url: str, **kwargs) -> AsyncCrawlResponse:
         pass  # 4 + 3
@@ -1282,11 +1286,21 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 except Exception:
                     pass
 
-                # Close the page unless it's the last one in a headless/managed browser
+                # Hand the page back to the page pool, if enabled; a pooled
+                # page is reset instead of closed.
+                recycled = False
+                try:
+                    recycled = await self.browser_manager.recycle_page(
+                        page, reusable=self._page_reusable(config)
+                    )
+                except Exception:
+                    pass
+
+                # Close the page unless it's pooled or the last one in a headless/managed browser
                 try:
                     all_contexts = page.context.browser.contexts
                     total_pages = sum(len(context.pages) for context in all_contexts)
-                    if not (total_pages <= 1 and (self.browser_config.use_managed_browser or self.browser_config.headless)):
+                    if not recycled and not (total_pages <= 1 and (self.browser_config.use_managed_browser or self.browser_config.headless)):
                         # page.close() is also sent without a timeout and waits
                         # on the target's closed-promise, so a wedged renderer
                         # can block cleanup indefinitely — including while this
@@ -1554,6 +1568,20 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             )
             # Continue with normal flow even if virtual scroll fails
 
+    def _page_reusable(self, config: CrawlerRunConfig) -> bool:
+        """
+        Whether a crawled page can go back to the page pool.
+
+        Download and console handlers stay attached to the page, and user hooks
+        may add their own listeners or routes, so such pages are closed.
+        """
+        if self.browser_config.accept_downloads or config.capture_console_messages:
+            return False
+        return not any(
+            hook for name, hook in self.hooks.items()
+            if name not in ("on_browser_created", "on_user_agent_updated")
+        )
+
     async def _handle_download(self, download):
         """
         Handle file downloads.
@@ -2020,7 +2048,8 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             if page:
                 try:
                     await self.browser_manager.release_page_with_context(page)
-                    await page.close()
+                    if not await self.browser_manager.recycle_page(page):
+                        await page.close()
                 except Exception:
                     pass
 
@@ -2725,6 +2754,7 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
     DEFAULT_MAX_CONNECTIONS: Final[int] = min(32, (os.cpu_count() or 1) * 4)
     DEFAULT_DNS_CACHE_TTL: Final[int] = 300
     VALID_SCHEMES: Final = frozenset({'http', 'https', 'file', 'raw'})
+    supports_conditional_requests = True
 
     _BASE_HEADERS: Final = MappingProxyType({
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -2929,7 +2959,8 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
     async def _handle_http(
         self,
         url: str,
-        config: CrawlerRunConfig
+        config: CrawlerRunConfig,
+        conditional_headers: Optional[Dict[str, str]] = None
     ) -> AsyncCrawlResponse:
         async with self._session_context() as session:
             # page_timeout is in ms (Playwright convention), but aiohttp expects seconds
@@ -2943,6 +2974,8 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
             headers = dict(self._BASE_HEADERS)
             if self.browser_config.headers:
                 headers.update(self.browser_config.headers)
+            if conditional_headers:
+                headers.update(conditional_headers)
 
             request_kwargs = {
                 'timeout': timeout,
@@ -2970,6 +3003,17 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
                     raw_bytes = await response.read()
                     content = memoryview(raw_bytes)
 
+                    if response.status == 304 and conditional_headers:
+                        # Not modified: the caller keeps its cached copy
+                        result = AsyncCrawlResponse(
+                            html="",
+                            response_headers=dict(response.headers),
+                            status_code=304,
+                            redirected_url=str(response.url),
+                        )
+                        await self.hooks['after_request'](result)
+                        return result
+
                     if not (200 <= response.status < 300):
                         raise HTTPStatusError(
                             response.status,
@@ -3049,8 +3093,16 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
         self, 
         url: str, 
         config: Optional[CrawlerRunConfig] = None, 
+        conditional_headers: Optional[Dict[str, str]] = None,
         **kwargs
     ) -> AsyncCrawlResponse:
+        """
+        Fetch a URL over plain HTTP.
+
+        ``conditional_headers`` (If-None-Match / If-Modified-Since) are sent
+        with http(s) requests; a 304 answer then comes back as a response with
+        status 304 and empty html instead of raising ``HTTPStatusError``.
+        """
         config = config or CrawlerRunConfig.from_kwargs(kwargs)
         
         parsed = urlparse(url)
@@ -3068,7 +3120,7 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
                 raw_content = url[6:] if url.startswith("raw://") else url[4:]
                 return await self._handle_raw(raw_content, base_url=config.base_url)
             else:  # http or https
-                return await self._handle_http(url, config)
+                return await self._handle_http(url, config, conditional_headers)
                 
         except Exception as e:
             if self.logger:
@@ -3,14 +3,21 @@ import time
 from pathlib import Path
 import aiosqlite
 import asyncio
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterable, List, Tuple
 from contextlib import asynccontextmanager
 import json
+from urllib.parse import urlparse
 from .models import CrawlResult, MarkdownGenerationResult, StringCompatibleMarkdown
-import aiofiles
 from .async_logger import AsyncLogger
 
-from .utils import ensure_content_dirs, generate_content_hash
+from .content_store import (
+    HAS_ZSTD,
+    ContentCompressor,
+    FileContentStore,
+    PackContentStore,
+    create_content_store,
+)
+from .memory_cache import MemoryCache
 from .utils import VersionManager
 from .utils import get_error_context, create_box_message
 
@@ -20,11 +27,66 @@ base_directory = DB_PATH = os.path.join(
 os.makedirs(DB_PATH, exist_ok=True)
 DB_PATH = os.path.join(base_directory, "crawl4ai.db")
 
+# Fields of a cached CrawlResult whose payload lives in the content store
+CACHED_CONTENT_FIELDS = ("html", "cleaned_html", "markdown", "extracted_content", "screenshot")
+
+# Cache validation metadata returned by aget_cache_metadata(_many)
+METADATA_COLUMNS = "url, etag, last_modified, head_fingerprint, cached_at, response_headers"
+# URLs per IN (...) query, below SQLite's default bound-parameter limit
+METADATA_BATCH_SIZE = 900
+
+
+def _metadata_row(columns, row) -> Dict:
+    row_dict = dict(zip(columns, row))
+    # Parse response_headers JSON
+    try:
+        row_dict["response_headers"] = (
+            json.loads(row_dict["response_headers"])
+            if row_dict["response_headers"] else {}
+        )
+    except json.JSONDecodeError:
+        row_dict["response_headers"] = {}
+    return row_dict
+
 
 class AsyncDatabaseManager:
-    def __init__(self, pool_size: int = 10, max_retries: int = 3):
+    def __init__(
+        self,
+        pool_size: int = 10,
+        max_retries: int = 3,
+        content_store: Optional[str] = None,
+        compression: Optional[str] = None,
+        write_batch_size: int = 100,
+        write_flush_interval: float = 0.5,
+        memory_cache_bytes: Optional[int] = None,
+        memory_cache_ttl: float = 300.0,
+    ):
+        """
+        Args:
+            pool_size: Maximum number of concurrent connections.
+            max_retries: Attempts per database operation.
+            content_store: Backend for cached payloads, "files" (one file per
+                hash) or "pack" (compressed pack files with an offset index).
+                Defaults to the CRAWL4_AI_CONTENT_STORE environment variable,
+                then "files".
+            compression: "zstd" to store text payloads as zstd frames (with
+                per-domain dictionaries once trained), "none" to store them
+                as-is. Defaults to the CRAWL4_AI_CACHE_COMPRESSION environment
+                variable, then "none". zstd is opt-in because crawl4ai versions
+                without it cannot read such caches; reads handle both formats
+                either way (zstd frames need the zstandard package).
+            write_batch_size: ``acache_url`` buffers rows and writes them in
+                one transaction once this many are pending. 1 writes every
+                row immediately.
+            write_flush_interval: Seconds after which a partial batch is
+                written anyway.
+            memory_cache_bytes: Byte budget of the in-process L1 tier that
+                serves repeated ``aget_cached_url`` calls without disk I/O.
+                Defaults to the CRAWL4_AI_MEMORY_CACHE_BYTES environment
+                variable, then 64 MiB. 0 disables the tier.
+            memory_cache_ttl: Seconds an L1 entry stays valid.
+        """
         self.db_path = DB_PATH
-        self.content_paths = ensure_content_dirs(os.path.dirname(DB_PATH))
         self.pool_size = pool_size
         self.max_retries = max_retries
         self.connection_pool: Dict[int, aiosqlite.Connection] = {}
@@ -38,6 +100,59 @@ class AsyncDatabaseManager:
             verbose=False,
             tag_width=10,
         )
+        self.content_store_backend = content_store or os.getenv(
+            "CRAWL4_AI_CONTENT_STORE", "files"
+        )
+        self.write_batch_size = max(1, write_batch_size)
+        self.write_flush_interval = write_flush_interval
+        # url -> row; a newer write of the same url replaces the pending one
+        self._pending_writes: Dict[str, tuple] = {}
+        # Rows taken by the running aflush_writes, until its commit completes
+        self._flushing: Dict[str, tuple] = {}
+        self._write_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        # acache_url calls between storing content and buffering its row, and
+        # whether acompact_content is holding new ones off
+        self._storing = 0
+        self._compacting = False
+        self._store_gate = asyncio.Condition()
+        if memory_cache_bytes is None:
+            memory_cache_bytes = int(
+                os.getenv("CRAWL4_AI_MEMORY_CACHE_BYTES", 64 * 1024 * 1024)
+            )
+        self.memory_cache = MemoryCache(max_bytes=memory_cache_bytes, ttl=memory_cache_ttl)
+        self.compression = compression or os.getenv("CRAWL4_AI_CACHE_COMPRESSION", "none")
+        base_dir = os.path.dirname(self.db_path)
+        dictionary_dir = os.path.join(base_dir, "zstd_dictionaries")
+        self.compressor = (
+            ContentCompressor(dictionary_dir=dictionary_dir)
+            if self.compression == "zstd"
+            else None
+        )
+        # Content compressed earlier (or by crawl4ai-migrate --compress) stays
+        # readable, with its domain dictionaries, whatever the write setting
+        self.decompressor = self.compressor or (
+            ContentCompressor(dictionary_dir=dictionary_dir) if HAS_ZSTD else None
+        )
+        # The file store also serves reads of content cached before a switch
+        # to another backend.
+        self.file_store = FileContentStore(
+            base_dir,
+            logger=self.logger,
+            compressor=self.compressor,
+            decompressor=self.decompressor,
+        )
+        self.content_paths = self.file_store.content_paths
+        if self.content_store_backend == "files":
+            self.content_store = self.file_store
+        else:
+            self.content_store = create_content_store(
+                self.content_store_backend,
+                base_dir,
+                logger=self.logger,
+                compressor=self.compressor,
+                decompressor=self.decompressor,
+            )
 
     async def initialize(self):
         """Initialize the database and connection pool"""
@@ -93,6 +208,7 @@ class AsyncDatabaseManager:
 
     async def cleanup(self):
         """Cleanup connections when shutting down"""
+        await self.aflush_writes()
         async with self.pool_lock:
             for conn in self.connection_pool.values():
                 await conn.close()
@@ -296,8 +412,24 @@ class AsyncDatabaseManager:
             params={"column": new_column},
         )
 
-    async def aget_cached_url(self, url: str) -> Optional[CrawlResult]:
-        """Retrieve cached URL data as CrawlResult"""
+    async def aget_cached_url(
+        self, url: str, fields: Optional[Iterable[str]] = None
+    ) -> Optional[CrawlResult]:
+        """
+        Retrieve cached URL data as CrawlResult.
+
+        Args:
+            url: The cached URL.
+            fields: Content fields to load, a subset of CACHED_CONTENT_FIELDS.
+                Fields left out are not read from the content store and come
+                back as None ("" for html). None loads every field.
+        """
+        projection = None if fields is None else frozenset(fields)
+        cached = self.memory_cache.get(url, projection)
+        if cached is not None:
+            return cached
+        if self._unflushed(url):
+            await self.aflush_writes()
 
         async def _get(db):
             async with db.execute(
@@ -314,16 +446,13 @@ class AsyncDatabaseManager:
 
                 # Load content from files using stored hashes
                 content_fields = {
-                    "html": row_dict["html"],
-                    "cleaned_html": row_dict["cleaned_html"],
-                    "markdown": row_dict["markdown"],
-                    "extracted_content": row_dict["extracted_content"],
-                    "screenshot": row_dict["screenshot"],
-                    "screenshots": row_dict["screenshot"],
+                    field: row_dict[field] for field in CACHED_CONTENT_FIELDS
                 }
 
                 for field, hash_value in content_fields.items():
-                    if hash_value:
+                    if projection is not None and field not in projection:
+                        row_dict[field] = "" if field == "html" else None
+                    elif hash_value:
                         content = await self._load_content(
                             hash_value,
                             field.split("_")[0],  # Get content type from field name
@@ -341,6 +470,8 @@ class AsyncDatabaseManager:
                     "markdown",
                 ]
                 for field in json_fields:
+                    if row_dict[field] is None:
+                        continue
                     try:
                         row_dict[field] = (
                             json.loads(row_dict[field]) if row_dict[field] else {}
@@ -379,7 +510,11 @@ class AsyncDatabaseManager:
                 return CrawlResult(**filtered_dict)
 
         try:
-            return await self.execute_with_retry(_get)
+            result = await self.execute_with_retry(_get)
+            # A write that arrived during the read makes this row stale
+            if result is not None and not self._unflushed(url):
+                self.memory_cache.put(url, result, projection)
+            return result
         except Exception as e:
             self.logger.error(
                 message="Error retrieving cached URL: {error}",
@@ -396,29 +531,60 @@ class AsyncDatabaseManager:
         Returns dict with: url, etag, last_modified, head_fingerprint, cached_at, response_headers
         This is used for cache validation without loading full content.
         """
+        if self._unflushed(url):
+            await self.aflush_writes()
+
         async def _get_metadata(db):
             async with db.execute(
-                """SELECT url, etag, last_modified, head_fingerprint, cached_at, response_headers
-                   FROM crawled_data WHERE url = ?""",
+                f"SELECT {METADATA_COLUMNS} FROM crawled_data WHERE url = ?",
                 (url,)
             ) as cursor:
                 row = await cursor.fetchone()
                 if not row:
                     return None
-
                 columns = [description[0] for description in cursor.description]
-                row_dict = dict(zip(columns, row))
+                return _metadata_row(columns, row)
 
-                # Parse response_headers JSON
-                try:
-                    row_dict["response_headers"] = (
-                        json.loads(row_dict["response_headers"])
-                        if row_dict["response_headers"] else {}
-                    )
-                except json.JSONDecodeError:
-                    row_dict["response_headers"] = {}
+        try:
+            return await self.execute_with_retry(_get_metadata)
+        except Exception as e:
+            self.logger.error(
+                message="Error retrieving cache metadata: {error}",
+                tag="ERROR",
+                force_verbose=True,
+                params={"error": str(e)},
+            )
+            return None
+
+    async def aget_cache_metadata_many(self, urls: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Bulk variant of ``aget_cache_metadata``.
 
-                return row_dict
+        Reads the validation metadata of all ``urls`` over one connection,
+        with one ``IN`` query per ``METADATA_BATCH_SIZE`` URLs.
+
+        Returns:
+            Dict mapping each cached URL to its metadata. URLs that are not
+            cached are absent.
+        """
+        urls = list(dict.fromkeys(urls))
+        if any(self._unflushed(url) for url in urls):
+            await self.aflush_writes()
+
+        async def _get_metadata(db):
+            found = {}
+            for start in range(0, len(urls), METADATA_BATCH_SIZE):
+                batch = urls[start:start + METADATA_BATCH_SIZE]
+                placeholders = ", ".join("?" * len(batch))
+                async with db.execute(
+                    f"SELECT {METADATA_COLUMNS} FROM crawled_data WHERE url IN ({placeholders})",
+                    batch,
+                ) as cursor:
+                    columns = [description[0] for description in cursor.description]
+                    async for row in cursor:
+                        row_dict = _metadata_row(columns, row)
+                        found[row_dict["url"]] = row_dict
+            return found
 
         try:
             return await self.execute_with_retry(_get_metadata)
@@ -429,7 +595,7 @@ class AsyncDatabaseManager:
                 force_verbose=True,
                 params={"error": str(e)},
             )
-            return None
+            return {}
 
     async def aupdate_cache_metadata(
         self,
@@ -437,11 +603,17 @@ class AsyncDatabaseManager:
         etag: Optional[str] = None,
         last_modified: Optional[str] = None,
         head_fingerprint: Optional[str] = None,
+        cached_at: Optional[float] = None,
     ):
         """
         Update only the cache validation metadata for a URL.
-        Used to update etag/last_modified after a successful validation.
+        Used to update etag/last_modified after a successful validation,
+        and to restart the entry's age (``cached_at``) after a 304.
         """
+        self.memory_cache.invalidate(url)
+        if self._unflushed(url):
+            await self.aflush_writes()
+
         async def _update(db):
             updates = []
             values = []
@@ -455,6 +627,9 @@ class AsyncDatabaseManager:
             if head_fingerprint is not None:
                 updates.append("head_fingerprint = ?")
                 values.append(head_fingerprint)
+            if cached_at is not None:
+                updates.append("cached_at = ?")
+                values.append(cached_at)
 
             if not updates:
                 return
@@ -476,7 +651,13 @@ class AsyncDatabaseManager:
             )
 
     async def acache_url(self, result: CrawlResult):
-        """Cache CrawlResult data"""
+        """
+        Cache CrawlResult data.
+
+        Content is stored right away; the row is buffered and written with
+        others in one transaction (see ``aflush_writes``). Reads of a URL that
+        is still buffered flush it first.
+        """
         # Store content files and get hashes
         content_map = {
             "html": (result.html, "html"),
@@ -518,77 +699,136 @@ class AsyncDatabaseManager:
                 "markdown",
             )
 
-        content_hashes = {}
-        for field, (content, content_type) in content_map.items():
-            content_hashes[field] = await self._store_content(content, content_type)
-
         # Extract cache validation headers from response
-        response_headers = result.response_headers or {}
-        etag = response_headers.get("etag") or response_headers.get("ETag") or ""
-        last_modified = response_headers.get("last-modified") or response_headers.get("Last-Modified") or ""
+        # Header names keep the server's casing (aiohttp sends back "Etag")
+        response_headers = {k.lower(): v for k, v in (result.response_headers or {}).items()}
+        etag = response_headers.get("etag") or ""
+        last_modified = response_headers.get("last-modified") or ""
         # head_fingerprint is set by caller via result attribute (if available)
         head_fingerprint = getattr(result, "head_fingerprint", None) or ""
         cached_at = time.time()
 
-        async def _cache(db):
-            await db.execute(
-                """
-                INSERT INTO crawled_data (
-                    url, html, cleaned_html, markdown,
-                    extracted_content, success, media, links, metadata,
-                    screenshot, response_headers, downloaded_files,
-                    etag, last_modified, head_fingerprint, cached_at
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(url) DO UPDATE SET
-                    html = excluded.html,
-                    cleaned_html = excluded.cleaned_html,
-                    markdown = excluded.markdown,
-                    extracted_content = excluded.extracted_content,
-                    success = excluded.success,
-                    media = excluded.media,
-                    links = excluded.links,
-                    metadata = excluded.metadata,
-                    screenshot = excluded.screenshot,
-                    response_headers = excluded.response_headers,
-                    downloaded_files = excluded.downloaded_files,
-                    etag = excluded.etag,
-                    last_modified = excluded.last_modified,
-                    head_fingerprint = excluded.head_fingerprint,
-                    cached_at = excluded.cached_at
-            """,
-                (
-                    result.url,
-                    content_hashes["html"],
-                    content_hashes["cleaned_html"],
-                    content_hashes["markdown"],
-                    content_hashes["extracted_content"],
-                    result.success,
-                    json.dumps(result.media),
-                    json.dumps(result.links),
-                    json.dumps(result.metadata or {}),
-                    content_hashes["screenshot"],
-                    json.dumps(result.response_headers or {}),
-                    json.dumps(result.downloaded_files or []),
-                    etag,
-                    last_modified,
-                    head_fingerprint,
-                    cached_at,
-                ),
+        domain = urlparse(result.url).hostname
+        async with self._content_writes():
+            content_hashes = dict(
+                zip(content_map, await self._store_contents(list(content_map.values()), domain))
+            )
+            self._pending_writes[result.url] = (
+                result.url,
+                content_hashes["html"],
+                content_hashes["cleaned_html"],
+                content_hashes["markdown"],
+                content_hashes["extracted_content"],
+                result.success,
+                json.dumps(result.media),
+                json.dumps(result.links),
+                json.dumps(result.metadata or {}),
+                content_hashes["screenshot"],
+                json.dumps(result.response_headers or {}),
+                json.dumps(result.downloaded_files or []),
+                etag,
+                last_modified,
+                head_fingerprint,
+                cached_at,
             )
 
+        self.memory_cache.invalidate(result.url)
+
+        if len(self._pending_writes) >= self.write_batch_size:
+            await self.aflush_writes()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_interval())
+
+    @asynccontextmanager
+    async def _content_writes(self):
+        """
+        Mark a store-then-buffer step, so compaction never sees a payload
+        whose row is not buffered yet.
+        """
+        async with self._store_gate:
+            await self._store_gate.wait_for(lambda: not self._compacting)
+            self._storing += 1
         try:
-            await self.execute_with_retry(_cache)
-        except Exception as e:
-            self.logger.error(
-                message="Error caching URL: {error}",
-                tag="ERROR",
-                force_verbose=True,
-                params={"error": str(e)},
-            )
+            yield
+        finally:
+            async with self._store_gate:
+                self._storing -= 1
+                self._store_gate.notify_all()
+
+    async def _flush_after_interval(self):
+        try:
+            await asyncio.sleep(self.write_flush_interval)
+        finally:
+            # Rows cached while this flush runs schedule their own. A
+            # cancelled wait still writes the buffer: asyncio.run cancels
+            # this task when a script ends without close().
+            self._flush_task = None
+            await self.aflush_writes()
+
+    def _unflushed(self, url: str) -> bool:
+        """Whether a write of ``url`` is still buffered or being flushed"""
+        return url in self._pending_writes or url in self._flushing
+
+    async def aflush_writes(self):
+        """Write all rows buffered by ``acache_url`` in a single transaction"""
+        async with self._write_lock:
+            if not self._pending_writes:
+                return
+            # Readers that see a url in _flushing wait for the lock, so they
+            # never read the row this flush is replacing
+            self._flushing = self._pending_writes
+            self._pending_writes = {}
+            rows = list(self._flushing.values())
+
+            async def _cache(db):
+                await db.executemany(
+                    """
+                    INSERT INTO crawled_data (
+                        url, html, cleaned_html, markdown,
+                        extracted_content, success, media, links, metadata,
+                        screenshot, response_headers, downloaded_files,
+                        etag, last_modified, head_fingerprint, cached_at
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(url) DO UPDATE SET
+                        html = excluded.html,
+                        cleaned_html = excluded.cleaned_html,
+                        markdown = excluded.markdown,
+                        extracted_content = excluded.extracted_content,
+                        success = excluded.success,
+                        media = excluded.media,
+                        links = excluded.links,
+                        metadata = excluded.metadata,
+                        screenshot = excluded.screenshot,
+                        response_headers = excluded.response_headers,
+                        downloaded_files = excluded.downloaded_files,
+                        etag = excluded.etag,
+                        last_modified = excluded.last_modified,
+                        head_fingerprint = excluded.head_fingerprint,
+                        cached_at = excluded.cached_at
+                """,
+                    rows,
+                )
+
+            try:
+                await self.execute_with_retry(_cache)
+            except Exception as e:
+                # Keep the rows for the next flush; a newer write of the same
+                # url replaces its row as usual
+                for url, row in self._flushing.items():
+                    self._pending_writes.setdefault(url, row)
+                self.logger.error(
+                    message="Error caching {count} URLs, keeping them for the next flush: {error}",
+                    tag="ERROR",
+                    force_verbose=True,
+                    params={"count": len(rows), "error": str(e)},
+                )
+            finally:
+                self._flushing = {}
 
     async def aget_total_count(self) -> int:
         """Get total number of cached URLs"""
+        await self.aflush_writes()
 
         async def _count(db):
             async with db.execute("SELECT COUNT(*) FROM crawled_data") as cursor:
@@ -608,6 +848,8 @@ class AsyncDatabaseManager:
 
     async def aclear_db(self):
         """Clear all data from the database"""
+        self._pending_writes = {}
+        self.memory_cache.clear()
 
         async def _clear(db):
             await db.execute("DELETE FROM crawled_data")
@@ -624,6 +866,8 @@ class AsyncDatabaseManager:
 
     async def aflush_db(self):
         """Drop the entire table"""
+        self._pending_writes = {}
+        self.memory_cache.clear()
 
         async def _flush(db):
             await db.execute("DROP TABLE IF EXISTS crawled_data")
@@ -638,41 +882,125 @@ class AsyncDatabaseManager:
                 params={"error": str(e)},
             )
 
-    async def _store_content(self, content: str, content_type: str) -> str:
-        """Store content in filesystem and return hash"""
-        if not content:
-            return ""
+    async def acompact_content(self) -> Dict[str, int]:
+        """
+        Reclaim space held by payloads no cached URL references any more.
+
+        Only the pack store supports compaction; the file store returns
+        zero counts. ``acache_url`` calls made meanwhile wait until it is
+        done, and payloads of rows that are still buffered are kept.
+        """
+        if not isinstance(self.content_store, PackContentStore):
+            return {"removed": 0, "reclaimed_bytes": 0}
+        async with self._store_gate:
+            await self._store_gate.wait_for(lambda: not self._compacting)
+            self._compacting = True
+            await self._store_gate.wait_for(lambda: self._storing == 0)
+        try:
+            return await self._compact_content()
+        finally:
+            async with self._store_gate:
+                self._compacting = False
+                self._store_gate.notify_all()
+
+    async def _compact_content(self) -> Dict[str, int]:
+        await self.aflush_writes()
 
-        content_hash = generate_content_hash(content)
-        file_path = os.path.join(self.content_paths[content_type], content_hash)
+        async def _live_hashes(db):
+            hashes = set()
+            async with db.execute(
+                """SELECT html, cleaned_html, markdown, extracted_content, screenshot
+                   FROM crawled_data"""
+            ) as cursor:
+                async for row in cursor:
+                    hashes.update(value for value in row if value)
+            return hashes
 
-        # Only write if file doesn't exist
-        if not os.path.exists(file_path):
-            async with aiofiles.open(file_path, "w", encoding="utf-8") as f:
-                await f.write(content)
+        try:
+            live = await self.execute_with_retry(_live_hashes)
+        except Exception as e:
+            self.logger.error(
+                message="Error compacting content store: {error}",
+                tag="ERROR",
+                force_verbose=True,
+                params={"error": str(e)},
+            )
+            return {"removed": 0, "reclaimed_bytes": 0}
+        # Rows a failed flush left buffered still reference their payloads
+        for row in (*self._pending_writes.values(), *self._flushing.values()):
+            live.update(row[i] for i in (1, 2, 3, 4, 9) if row[i])
+        return await self.content_store.acompact(live)
+
+    async def atrain_compression_dictionary(
+        self, domain: str, max_samples: int = 500, dict_size: int = 112640
+    ) -> Optional[int]:
+        """
+        Train a zstd dictionary from the cached pages of ``domain``.
 
-        return content_hash
+        Payloads cached for the domain afterwards are compressed with it;
+        earlier ones stay readable as they are.
 
-    async def _load_content(
-        self, content_hash: str, content_type: str
-    ) -> Optional[str]:
-        """Load content from filesystem by hash"""
-        if not content_hash:
+        Args:
+            domain: Host name, e.g. "docs.python.org".
+            max_samples: Maximum number of cached pages to sample.
+            dict_size: Target dictionary size in bytes.
+
+        Returns:
+            The dictionary id, or None if compression is off or training failed.
+        """
+        if self.compressor is None:
             return None
+        await self.aflush_writes()
+
+        async def _sample_hashes(db):
+            async with db.execute(
+                """SELECT html, cleaned_html FROM crawled_data
+                   WHERE url LIKE ? OR url LIKE ? LIMIT ?""",
+                (f"http://{domain}/%", f"https://{domain}/%", max_samples),
+            ) as cursor:
+                return await cursor.fetchall()
 
-        file_path = os.path.join(self.content_paths[content_type], content_hash)
         try:
-            async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-                return await f.read()
-        except:
+            rows = await self.execute_with_retry(_sample_hashes)
+            samples = []
+            for html_hash, cleaned_hash in rows:
+                for content_hash, content_type in ((html_hash, "html"), (cleaned_hash, "cleaned")):
+                    content = await self._load_content(content_hash, content_type)
+                    if content:
+                        samples.append(content)
+            return await asyncio.to_thread(
+                self.compressor.train, domain, samples, dict_size
+            )
+        except Exception as e:
             self.logger.error(
-                message="Failed to load content: {file_path}",
+                message="Error training compression dictionary for {domain}: {error}",
                 tag="ERROR",
                 force_verbose=True,
-                params={"file_path": file_path},
+                params={"domain": domain, "error": str(e)},
             )
             return None
 
+    async def _store_content(
+        self, content: str, content_type: str, domain: Optional[str] = None
+    ) -> str:
+        """Store content in the content store and return hash"""
+        return await self.content_store.store(content, content_type, domain)
+
+    async def _store_contents(
+        self, items: List[Tuple[str, str]], domain: Optional[str] = None
+    ) -> List[str]:
+        """Store ``(content, content_type)`` pairs together and return their hashes"""
+        return await self.content_store.store_many(items, domain)
+
+    async def _load_content(
+        self, content_hash: str, content_type: str
+    ) -> Optional[str]:
+        """Load content from the content store by hash"""
+        content = await self.content_store.load(content_hash, content_type)
+        if content is None and content_hash and self.content_store is not self.file_store:
+            content = await self.file_store.load(content_hash, content_type)
+        return content
+
 
 # Create a singleton instance
 async_db_manager = AsyncDatabaseManager()
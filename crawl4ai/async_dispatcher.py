@@ -1,4 +1,4 @@
-from typing import Dict, Optional, List, Tuple, Union
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Optional, List, Tuple, Union
 from .async_configs import CrawlerRunConfig
 from .models import (
     CrawlResult,
@@ -16,8 +16,12 @@ from collections.abc import AsyncGenerator
 import time
 import psutil
 import asyncio
+import heapq
+import itertools
 import uuid
+from collections import deque
 
+from email.utils import parsedate_to_datetime
 from urllib.parse import urlparse
 import random
 from abc import ABC, abstractmethod
@@ -25,6 +29,25 @@ from abc import ABC, abstractmethod
 from .utils import get_true_memory_usage_percent
 
 
+# How far past ``read_ahead`` MemoryAdaptiveDispatcher reads its input looking
+# for URLs of eligible hosts while every queued host is throttled
+THROTTLED_READ_AHEAD_FACTOR = 10
+
+# What arun_many and the dispatchers accept as input: URLs, or dicts with a
+# "url" key as produced by AsyncUrlSeeder, from a sync or async iterable
+UrlSource = Union[Iterable[Union[str, Dict[str, Any]]], AsyncIterable[Union[str, Dict[str, Any]]]]
+
+
+async def iter_url_source(urls: UrlSource) -> AsyncIterator[str]:
+    """Yield the URLs of ``urls`` one at a time, pulling from the source lazily."""
+    if hasattr(urls, "__aiter__"):
+        async for item in urls:
+            yield item["url"] if isinstance(item, dict) else item
+    else:
+        for item in urls:
+            yield item["url"] if isinstance(item, dict) else item
+
+
 class RateLimiter:
     def __init__(
         self,
@@ -42,19 +65,24 @@ class RateLimiter:
     def get_domain(self, url: str) -> str:
         return urlparse(url).netloc
 
-    async def wait_if_needed(self, url: str) -> None:
+    def _get_state(self, url: str) -> DomainState:
         domain = self.get_domain(url)
         state = self.domains.get(domain)
+        if not state:
+            state = self.domains[domain] = DomainState()
+        return state
 
+    def ready_time(self, domain: str) -> float:
+        """Earliest ``time.time()`` at which ``domain`` may be requested again."""
+        state = self.domains.get(domain)
         if not state:
-            self.domains[domain] = DomainState()
-            state = self.domains[domain]
+            return 0.0
+        ready = state.last_request_time + state.current_delay if state.last_request_time else 0.0
+        return max(ready, state.retry_after_until)
 
-        now = time.time()
-        if state.last_request_time:
-            wait_time = max(0, state.current_delay - (now - state.last_request_time))
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
+    def record_request(self, url: str) -> None:
+        """Mark a request to the URL's domain as started now, without waiting."""
+        state = self._get_state(url)
 
         # Random delay within base range if no current delay
         if state.current_delay == 0:
@@ -62,12 +90,32 @@ class RateLimiter:
 
         state.last_request_time = time.time()
 
-    def update_delay(self, url: str, status_code: int) -> bool:
-        domain = self.get_domain(url)
-        state = self.domains[domain]
+    async def wait_if_needed(self, url: str) -> None:
+        wait_time = self.ready_time(self.get_domain(url)) - time.time()
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        self.record_request(url)
+
+    def update_delay(self, url: str, status_code: int, retry_after: Optional[float] = None) -> bool:
+        """
+        Adjust the domain's delay after a response.
+
+        Args:
+            url: The crawled URL.
+            status_code: HTTP status of the response.
+            retry_after: Seconds from the response's Retry-After header, if
+                any. On a rate-limit status the domain is not requested again
+                before then (capped at ``max_delay``).
+
+        Returns:
+            False once the domain exceeded ``max_retries`` rate-limit responses.
+        """
+        state = self._get_state(url)
 
         if status_code in self.rate_limit_codes:
             state.fail_count += 1
+            if retry_after:
+                state.retry_after_until = time.time() + min(retry_after, self.max_delay)
             if state.fail_count > self.max_retries:
                 return False
 
@@ -85,6 +133,31 @@ class RateLimiter:
         return True
 
 
+def _get_header(headers: Optional[Dict[str, str]], name: str) -> Optional[str]:
+    if not headers:
+        return None
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
 
 class BaseDispatcher(ABC):
     def __init__(
@@ -137,7 +210,7 @@ class BaseDispatcher(ABC):
     @abstractmethod
     async def run_urls(
         self,
-        urls: List[str],
+        urls: UrlSource,
         crawler: AsyncWebCrawler,  # noqa: F821
         config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
         monitor: Optional[CrawlerMonitor] = None,
@@ -145,6 +218,296 @@ class BaseDispatcher(ABC):
         pass
 
 
+class AgingTaskQueue:
+    """
+    Task queue of MemoryAdaptiveDispatcher with lazy fairness aging.
+
+    Tasks are served by retry count (fewest first), except that a task queued
+    for longer than ``fairness_timeout`` jumps ahead, oldest first. Instead of
+    re-scoring every queued task as time passes, each task sits both in a heap
+    keyed by retry count and in an arrival-ordered FIFO; ``get_nowait`` only
+    has to look at the head of the FIFO to see whether the oldest task has aged
+    out. A task taken from one structure is marked and skipped in the other.
+    ``put`` and ``get_nowait`` are O(log n), the statistics are O(1).
+
+    Args:
+        fairness_timeout: Seconds after which a queued task takes precedence.
+    """
+
+    def __init__(self, fairness_timeout: float = 600.0):
+        self.fairness_timeout = fairness_timeout
+        self._heap: List[list] = []
+        self._arrivals: deque = deque()
+        self._counter = itertools.count()
+        self._size = 0
+        self._enqueue_time_sum = 0.0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def put(self, url: str, task_id: str, retry_count: int = 0, enqueue_time: Optional[float] = None) -> list:
+        """
+        Queue a task; ``enqueue_time`` defaults to now and must not go back in time.
+
+        Returns:
+            The queue entry. Its last item turns True once the task is taken.
+        """
+        if enqueue_time is None:
+            enqueue_time = time.time()
+        # [retry_count, seq, enqueue_time, url, task_id, taken]
+        entry = [retry_count, next(self._counter), enqueue_time, url, task_id, False]
+        heapq.heappush(self._heap, entry)
+        self._arrivals.append(entry)
+        self._size += 1
+        self._enqueue_time_sum += enqueue_time
+        return entry
+
+    def get_nowait(self, now: Optional[float] = None) -> Tuple[str, str, int, float]:
+        """
+        Take the next task as ``(url, task_id, retry_count, enqueue_time)``.
+
+        Raises:
+            asyncio.QueueEmpty: If no task is queued.
+        """
+        if not self._size:
+            raise asyncio.QueueEmpty
+        now = time.time() if now is None else now
+        oldest = self._oldest()
+        if oldest[2] < now - self.fairness_timeout:
+            entry = self._arrivals.popleft()
+        else:
+            entry = heapq.heappop(self._heap)
+            while entry[5]:
+                entry = heapq.heappop(self._heap)
+        entry[5] = True
+        self._size -= 1
+        self._enqueue_time_sum -= entry[2]
+        if not self._size:
+            # Drop the entries already taken through the other structure
+            self._heap.clear()
+            self._arrivals.clear()
+            self._enqueue_time_sum = 0.0
+        return entry[3], entry[4], entry[0], entry[2]
+
+    def _oldest(self) -> list:
+        while self._arrivals[0][5]:
+            self._arrivals.popleft()
+        return self._arrivals[0]
+
+    def clear(self):
+        self._heap.clear()
+        self._arrivals.clear()
+        self._size = 0
+        self._enqueue_time_sum = 0.0
+
+    def statistics(self, now: Optional[float] = None) -> Dict[str, float]:
+        """Queue size and wait times in the shape of ``update_queue_statistics``."""
+        if not self._size:
+            return {"total_queued": 0, "highest_wait_time": 0.0, "avg_wait_time": 0.0}
+        now = time.time() if now is None else now
+        return {
+            "total_queued": self._size,
+            "highest_wait_time": now - self._oldest()[2],
+            "avg_wait_time": now - self._enqueue_time_sum / self._size,
+        }
+
+
+class _HostState:
+    __slots__ = ("queue", "in_flight", "token")
+
+    def __init__(self, fairness_timeout: float):
+        self.queue = AgingTaskQueue(fairness_timeout)
+        self.in_flight = 0
+        # Token of this host's live entry in the ready heap, None if unscheduled
+        self.token: Optional[int] = None
+
+
+class HostScheduler:
+    """
+    Host-aware task queue of MemoryAdaptiveDispatcher.
+
+    URLs wait in one ``AgingTaskQueue`` per host, and hosts with waiting URLs
+    sit in a heap ordered by the time they may next be requested: the later
+    of the rate limiter's ready time (backoff and Retry-After) and the last
+    dispatch plus the robots.txt crawl-delay. ``get_nowait`` only hands out a
+    URL whose host is eligible now and below ``max_per_host`` requests in
+    flight, so a throttled host never holds a session slot while it waits.
+    Heap entries whose host's ready time moved are corrected when they reach
+    the top. ``put``, ``get_nowait`` and ``release`` are O(log n).
+
+    Args:
+        fairness_timeout: Aging timeout of the per-host queues.
+        max_per_host: Maximum in-flight URLs per host; None for no limit.
+        rate_limiter: Rate limiter whose per-domain delays gate dispatch.
+    """
+
+    def __init__(
+        self,
+        fairness_timeout: float = 600.0,
+        max_per_host: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        self.fairness_timeout = fairness_timeout
+        self.max_per_host = max_per_host
+        self.rate_limiter = rate_limiter
+        self._hosts: Dict[str, _HostState] = {}
+        self._ready: List[Tuple[float, int, str]] = []
+        self._counter = itertools.count()
+        self._crawl_delays: Dict[str, float] = {}
+        self._last_dispatch: Dict[str, float] = {}
+        # Arrival-ordered entries of all hosts, for the queue statistics
+        self._arrivals: deque = deque()
+        self._size = 0
+        self._enqueue_time_sum = 0.0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def host_of(self, url: str) -> str:
+        if self.rate_limiter:
+            return self.rate_limiter.get_domain(url)
+        return urlparse(url).netloc
+
+    def put(self, url: str, task_id: str, retry_count: int = 0, enqueue_time: Optional[float] = None):
+        """Queue a task; ``enqueue_time`` defaults to now."""
+        host = self.host_of(url)
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.fairness_timeout)
+        entry = state.queue.put(url, task_id, retry_count, enqueue_time)
+        self._arrivals.append(entry)
+        self._size += 1
+        self._enqueue_time_sum += entry[2]
+        self._schedule(host, state)
+
+    def get_nowait(self, now: Optional[float] = None) -> Tuple[str, str, int, float]:
+        """
+        Take the next task of an eligible host as ``(url, task_id, retry_count, enqueue_time)``.
+
+        Raises:
+            asyncio.QueueEmpty: If no task is queued or no host is eligible yet.
+        """
+        now = time.time() if now is None else now
+        while self._ready:
+            ready_at, token, host = self._ready[0]
+            state = self._hosts.get(host)
+            if state is None or state.token != token:
+                heapq.heappop(self._ready)
+                continue
+            current = self._ready_at(host)
+            if current > ready_at:
+                # Backoff grew since the host was scheduled
+                state.token = next(self._counter)
+                heapq.heapreplace(self._ready, (current, state.token, host))
+                continue
+            if ready_at > now:
+                break
+            heapq.heappop(self._ready)
+            state.token = None
+            url, task_id, retry_count, enqueue_time = state.queue.get_nowait(now)
+            self._size -= 1
+            self._enqueue_time_sum -= enqueue_time
+            self._prune_arrivals()
+            state.in_flight += 1
+            if self._crawl_delays.get(host):
+                self._last_dispatch[host] = now
+            if self.rate_limiter:
+                self.rate_limiter.record_request(url)
+            self._schedule(host, state)
+            return url, task_id, retry_count, enqueue_time
+        raise asyncio.QueueEmpty
+
+    def release(self, url: str):
+        """Free the host slot taken by ``url``; call once its crawl finished."""
+        host = self.host_of(url)
+        state = self._hosts.get(host)
+        if state is None:
+            return
+        state.in_flight = max(0, state.in_flight - 1)
+        if not state.in_flight and state.queue.empty():
+            del self._hosts[host]
+            return
+        # Reschedule with the ready time the finished request left behind
+        state.token = None
+        self._schedule(host, state)
+
+    def set_crawl_delay(self, url: str, delay: Optional[float]):
+        """
+        Space requests to the URL's host at least ``delay`` seconds apart.
+
+        None records that the host has no crawl-delay.
+        """
+        host = self.host_of(url)
+        self._crawl_delays[host] = delay or None
+        if not delay:
+            self._last_dispatch.pop(host, None)
+
+    def has_crawl_delay(self, url: str) -> bool:
+        """Whether a crawl-delay (possibly None) was recorded for the URL's host."""
+        return self.host_of(url) in self._crawl_delays
+
+    def next_ready_in(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the earliest waiting host may be eligible; None if none waits."""
+        if not self._ready:
+            return None
+        now = time.time() if now is None else now
+        return max(0.0, self._ready[0][0] - now)
+
+    def clear(self):
+        """Drop all queued tasks. Crawl delays are kept."""
+        self._hosts.clear()
+        self._ready.clear()
+        self._arrivals.clear()
+        self._size = 0
+        self._enqueue_time_sum = 0.0
+
+    def statistics(self, now: Optional[float] = None) -> Dict[str, float]:
+        """Queue size and wait times in the shape of ``update_queue_statistics``."""
+        if not self._size:
+            return {"total_queued": 0, "highest_wait_time": 0.0, "avg_wait_time": 0.0}
+        now = time.time() if now is None else now
+        return {
+            "total_queued": self._size,
+            "highest_wait_time": now - self._arrivals[0][2],
+            "avg_wait_time": now - self._enqueue_time_sum / self._size,
+        }
+
+    def _prune_arrivals(self):
+        """Drop taken entries from ``_arrivals`` so it holds only queued tasks."""
+        if not self._size:
+            self._arrivals.clear()
+            return
+        while self._arrivals[0][5]:
+            self._arrivals.popleft()
+        # Hosts are served out of arrival order, so taken entries can pile up
+        # behind a waiting head; rebuild once they outnumber the queued ones
+        if len(self._arrivals) > 2 * self._size + 64:
+            self._arrivals = deque(entry for entry in self._arrivals if not entry[5])
+
+    def _ready_at(self, host: str) -> float:
+        ready = 0.0
+        last = self._last_dispatch.get(host)
+        if last is not None:
+            ready = last + self._crawl_delays[host]
+        if self.rate_limiter:
+            ready = max(ready, self.rate_limiter.ready_time(host))
+        return ready
+
+    def _schedule(self, host: str, state: _HostState):
+        if state.token is not None or state.queue.empty():
+            return
+        if self.max_per_host is not None and state.in_flight >= self.max_per_host:
+            return
+        state.token = next(self._counter)
+        heapq.heappush(self._ready, (self._ready_at(host), state.token, host))
+
+
 class MemoryAdaptiveDispatcher(BaseDispatcher):
     def __init__(
         self,
@@ -157,8 +520,22 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         memory_wait_timeout: Optional[float] = 600.0,
         rate_limiter: Optional[RateLimiter] = None,
         monitor: Optional[CrawlerMonitor] = None,
+        read_ahead: Optional[int] = None,
+        max_per_host: Optional[int] = None,
     ):
+        """
+        Args:
+            read_ahead: URLs pulled from the input and queued ahead of free
+                session slots; defaults to twice ``max_session_permit``. The
+                input is only read as the queue drains, so memory stays flat
+                for inputs of any size.
+            max_per_host: Maximum concurrent crawls per host; None for no
+                limit. URLs of hosts at the limit, backing off, or inside
+                their robots.txt crawl-delay stay queued while other hosts
+                fill the free slots.
+        """
         super().__init__(rate_limiter, monitor)
+        self.read_ahead = read_ahead or 2 * max_session_permit
         self.memory_threshold_percent = memory_threshold_percent
         self.critical_threshold_percent = critical_threshold_percent
         self.recovery_threshold_percent = recovery_threshold_percent
@@ -167,10 +544,13 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         self.fairness_timeout = fairness_timeout
         self.memory_wait_timeout = memory_wait_timeout
         self.result_queue = asyncio.Queue()
-        self.task_queue = asyncio.PriorityQueue()  # Priority queue for better management
+        self.max_per_host = max_per_host
+        self.task_queue = HostScheduler(fairness_timeout, max_per_host, rate_limiter)
         self.memory_pressure_mode = False  # Flag to indicate when we're in memory pressure mode
         self.current_memory_percent = 0.0  # Track current memory usage
         self._high_memory_start_time: Optional[float] = None
+        # Pending read from the input of the running run_urls/run_urls_stream
+        self._source_read: Optional[asyncio.Future] = None
         
     async def _memory_monitor_task(self):
         """Background task to continuously monitor memory usage and update state"""
@@ -214,17 +594,6 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                 
             await asyncio.sleep(self.check_interval)
     
-    def _get_priority_score(self, wait_time: float, retry_count: int) -> float:
-        """Calculate priority score (lower is higher priority)
-        - URLs waiting longer than fairness_timeout get higher priority
-        - More retry attempts decreases priority
-        """
-        if wait_time > self.fairness_timeout:
-            # High priority for long-waiting URLs
-            return -wait_time
-        # Standard priority based on retries
-        return retry_count
-    
     async def crawl_url(
         self,
         url: str,
@@ -281,16 +650,14 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                 )
                 
             self.concurrent_sessions += 1
-            
-            if self.rate_limiter:
-                await self.rate_limiter.wait_if_needed(url)
-                
+
+            # Rate limits are enforced by the task queue, which only hands
+            # out URLs of hosts that may be requested now
+
             # Check if we're in critical memory state
             if self.current_memory_percent >= self.critical_threshold_percent:
-                # Requeue this task with increased priority and retry count
-                enqueue_time = time.time()
-                priority = self._get_priority_score(enqueue_time - start_time, retry_count + 1)
-                await self.task_queue.put((priority, (url, task_id, retry_count + 1, enqueue_time)))
+                # Requeue this task with increased retry count
+                self.task_queue.put(url, task_id, retry_count + 1)
                 
                 # Update monitoring
                 if self.monitor:
@@ -322,10 +689,21 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             # Measure memory usage
             end_memory = process.memory_info().rss / (1024 * 1024)
             memory_usage = peak_memory = end_memory - start_memory
-            
+
+            # The crawl cached the host's robots.txt; honour its crawl-delay
+            if selected_config.check_robots_txt and not self.task_queue.has_crawl_delay(url):
+                robots_parser = getattr(self.crawler, "robots_parser", None)
+                if robots_parser:
+                    self.task_queue.set_crawl_delay(
+                        url, robots_parser.crawl_delay(url, self.crawler.browser_config.user_agent)
+                    )
+
             # Handle rate limiting
             if self.rate_limiter and result.status_code:
-                if not self.rate_limiter.update_delay(url, result.status_code):
+                retry_after = parse_retry_after(
+                    _get_header(getattr(result, "response_headers", None), "Retry-After")
+                )
+                if not self.rate_limiter.update_delay(url, result.status_code, retry_after):
                     error_message = f"Rate limit retry count exceeded for domain {urlparse(url).netloc}"
                     if self.monitor:
                         self.monitor.update_task(task_id, status=CrawlStatus.FAILED)
@@ -373,7 +751,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         
     async def run_urls(
         self,
-        urls: List[str],
+        urls: UrlSource,
         crawler: AsyncWebCrawler,
         config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
     ) -> List[CrawlerTaskResult]:
@@ -386,20 +764,15 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             self.monitor.start()
             
         results = []
+        source = iter_url_source(urls)
+        source_open = True
+        self._source_read = None
 
         try:
-            # Initialize task queue
-            for url in urls:
-                task_id = str(uuid.uuid4())
-                if self.monitor:
-                    self.monitor.add_task(task_id, url)
-                # Add to queue with initial priority 0, retry count 0, and current time
-                await self.task_queue.put((0, (url, task_id, 0, time.time())))
-
             active_tasks = []
 
-            # Process until both queues are empty
-            while not self.task_queue.empty() or active_tasks:
+            # Process until the input and both queues are empty
+            while source_open or not self.task_queue.empty() or active_tasks:
                 if memory_monitor.done():
                     exc = memory_monitor.exception()
                     if exc:
@@ -407,35 +780,8 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                             t.cancel()
                         raise exc
 
-                # If memory pressure is low, greedily fill all available slots
-                if not self.memory_pressure_mode:
-                    slots = self.max_session_permit - len(active_tasks)
-                    while slots > 0:
-                        try:
-                            # Use get_nowait() to immediately get tasks without blocking
-                            priority, (url, task_id, retry_count, enqueue_time) = self.task_queue.get_nowait()
-                            
-                            # Create and start the task
-                            task = asyncio.create_task(
-                                self.crawl_url(url, config, task_id, retry_count)
-                            )
-                            active_tasks.append(task)
-                            
-                            # Update waiting time in monitor
-                            if self.monitor:
-                                wait_time = time.time() - enqueue_time
-                                self.monitor.update_task(
-                                    task_id, 
-                                    wait_time=wait_time,
-                                    status=CrawlStatus.IN_PROGRESS
-                                )
-                            
-                            slots -= 1
-                            
-                        except asyncio.QueueEmpty:
-                            # No more tasks in queue, exit the loop
-                            break
-                        
+                source_open = await self._fill_slots(active_tasks, config, source, source_open)
+
                 # Wait for completion even if queue is starved
                 if active_tasks:
                     done, pending = await asyncio.wait(
@@ -445,16 +791,20 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                     # Process completed tasks
                     for completed_task in done:
                         result = await completed_task
+                        self.task_queue.release(result.url)
                         results.append(result)
                         
                     # Update active tasks list
                     active_tasks = list(pending)
                 else:
-                    # If no active tasks but still waiting, sleep briefly
-                    await asyncio.sleep(self.check_interval / 2)
+                    # Nothing running: sleep until the next host is eligible
+                    ready_in = self.task_queue.next_ready_in()
+                    await asyncio.sleep(
+                        self.check_interval / 2 if ready_in is None
+                        else min(self.check_interval / 2, ready_in)
+                    )
                     
-                # Update priorities for waiting tasks if needed
-                await self._update_queue_priorities()
+                self._update_queue_statistics()
 
         except Exception as e:
             if self.monitor:
@@ -464,72 +814,111 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         finally:
             # Clean up
             memory_monitor.cancel()
+            await self._close_source(source)
             if self.monitor:
                 self.monitor.stop()
         return results
                 
-    async def _update_queue_priorities(self):
-        """Periodically update priorities of items in the queue to prevent starvation"""
-        # Skip if queue is empty
-        if self.task_queue.empty():
-            return
-            
-        # Use a drain-and-refill approach to update all priorities
-        temp_items = []
-        
-        # Drain the queue (with a safety timeout to prevent blocking)
-        try:
-            drain_start = time.time()
-            while not self.task_queue.empty() and time.time() - drain_start < 5.0:  # 5 second safety timeout
-                try:
-                    # Get item from queue with timeout
-                    priority, (url, task_id, retry_count, enqueue_time) = await asyncio.wait_for(
-                        self.task_queue.get(), timeout=0.1
-                    )
-                    
-                    # Calculate new priority based on current wait time
-                    current_time = time.time()
-                    wait_time = current_time - enqueue_time
-                    new_priority = self._get_priority_score(wait_time, retry_count)
-                    
-                    # Store with updated priority
-                    temp_items.append((new_priority, (url, task_id, retry_count, enqueue_time)))
-                    
-                    # Update monitoring stats for this task
-                    if self.monitor and task_id in self.monitor.stats:
-                        self.monitor.update_task(task_id, wait_time=wait_time)
-                        
-                except asyncio.TimeoutError:
-                    # Queue might be empty or very slow
+    async def _fill_slots(
+        self,
+        active_tasks: List[asyncio.Task],
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+        source: AsyncIterator[str],
+        source_open: bool,
+    ) -> bool:
+        """
+        Start queued URLs of eligible hosts in the free session slots.
+
+        The queue is topped up to ``read_ahead`` first. If slots stay free
+        because every queued host is throttled, the input is read further, up
+        to ``THROTTLED_READ_AHEAD_FACTOR`` times ``read_ahead``, to find a URL
+        of another host.
+
+        Returns:
+            False once the source is exhausted.
+        """
+        # Only wait for the input when nothing else could make progress
+        if source_open:
+            source_open = await self._top_up_queue(source, self.read_ahead, not active_tasks)
+        # Under memory pressure no new tasks are started
+        if self.memory_pressure_mode:
+            return source_open
+
+        slots = self.max_session_permit - len(active_tasks)
+        while slots > 0:
+            try:
+                url, task_id, retry_count, enqueue_time = self.task_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                queued = len(self.task_queue)
+                if not source_open or queued >= self.read_ahead * THROTTLED_READ_AHEAD_FACTOR:
                     break
-        except Exception as e:
-            # If anything goes wrong, make sure we refill the queue with what we've got
-            self.monitor.update_memory_status(f"QUEUE_ERROR: {str(e)}")
-        
-        # Calculate queue statistics
-        if temp_items and self.monitor:
-            total_queued = len(temp_items)
-            wait_times = [item[1][3] for item in temp_items]
-            highest_wait_time = time.time() - min(wait_times) if wait_times else 0
-            avg_wait_time = sum(time.time() - t for t in wait_times) / len(wait_times) if wait_times else 0
-            
-            # Update queue statistics in monitor
-            self.monitor.update_queue_statistics(
-                total_queued=total_queued,
-                highest_wait_time=highest_wait_time,
-                avg_wait_time=avg_wait_time
+                source_open = await self._top_up_queue(source, queued + 1, not active_tasks)
+                if len(self.task_queue) == queued:
+                    # The source has no URL at hand
+                    break
+                continue
+
+            task = asyncio.create_task(
+                self.crawl_url(url, config, task_id, retry_count)
             )
-        
-        # Sort by priority (lowest number = highest priority)
-        temp_items.sort(key=lambda x: x[0])
-        
-        # Refill the queue with updated priorities
-        for item in temp_items:
-            await self.task_queue.put(item)
-                
+            active_tasks.append(task)
+
+            # Update waiting time in monitor
+            if self.monitor:
+                self.monitor.update_task(
+                    task_id,
+                    wait_time=time.time() - enqueue_time,
+                    status=CrawlStatus.IN_PROGRESS
+                )
+            slots -= 1
+        return source_open
+
+    async def _top_up_queue(self, source: AsyncIterator[str], limit: int, block: bool = True) -> bool:
+        """
+        Queue URLs from ``source`` until ``limit`` are waiting.
+
+        A read the source cannot answer right away is left pending for the
+        next call rather than stalling the run loop, so a source that waits
+        on results of this run (a deep crawl frontier) keeps getting them.
+        Only with ``block`` set and an empty queue is the read awaited.
+
+        Returns:
+            False once the source is exhausted.
+        """
+        while len(self.task_queue) < limit:
+            if self._source_read is None:
+                self._source_read = asyncio.ensure_future(source.__anext__())
+                # Give sources with a URL at hand the chance to answer now
+                await asyncio.sleep(0)
+            if not self._source_read.done() and not (block and self.task_queue.empty()):
+                return True
+            read, self._source_read = self._source_read, None
+            try:
+                url = await read
+            except StopAsyncIteration:
+                return False
+            task_id = str(uuid.uuid4())
+            if self.monitor:
+                self.monitor.add_task(task_id, url)
+            self.task_queue.put(url, task_id)
+        return True
+
+    async def _close_source(self, source: AsyncIterator[str]):
+        """Drop a pending read and close the input."""
+        read, self._source_read = self._source_read, None
+        if read is not None:
+            read.cancel()
+            await asyncio.gather(read, return_exceptions=True)
+        await source.aclose()
+
+    def _update_queue_statistics(self):
+        """Report queue size and wait times to the monitor."""
+        if self.monitor and not self.task_queue.empty():
+            self.monitor.update_queue_statistics(**self.task_queue.statistics())
+
     async def run_urls_stream(
         self,
-        urls: List[str],
+        urls: UrlSource,
         crawler: AsyncWebCrawler,
         config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
     ) -> AsyncGenerator[CrawlerTaskResult, None]:
@@ -542,54 +931,20 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         if self.monitor:
             self.monitor.start()
             
-        try:
-            # Initialize task queue
-            for url in urls:
-                task_id = str(uuid.uuid4())
-                if self.monitor:
-                    self.monitor.add_task(task_id, url)
-                # Add to queue with initial priority 0, retry count 0, and current time
-                await self.task_queue.put((0, (url, task_id, 0, time.time())))
-                
-            completed_count = 0
-            total_urls = len(urls)
+        source = iter_url_source(urls)
+        source_open = True
+        self._source_read = None
 
-            while completed_count < total_urls:
+        try:
+            while source_open or not self.task_queue.empty() or active_tasks:
                 if memory_monitor.done():
                     exc = memory_monitor.exception()
                     if exc:
                         for t in active_tasks:
                             t.cancel()
                         raise exc
-                # If memory pressure is low, greedily fill all available slots
-                if not self.memory_pressure_mode:
-                    slots = self.max_session_permit - len(active_tasks)
-                    while slots > 0:
-                        try:
-                            # Use get_nowait() to immediately get tasks without blocking
-                            priority, (url, task_id, retry_count, enqueue_time) = self.task_queue.get_nowait()
-                            
-                            # Create and start the task
-                            task = asyncio.create_task(
-                                self.crawl_url(url, config, task_id, retry_count)
-                            )
-                            active_tasks.append(task)
-                            
-                            # Update waiting time in monitor
-                            if self.monitor:
-                                wait_time = time.time() - enqueue_time
-                                self.monitor.update_task(
-                                    task_id, 
-                                    wait_time=wait_time,
-                                    status=CrawlStatus.IN_PROGRESS
-                                )
-                            
-                            slots -= 1
-                            
-                        except asyncio.QueueEmpty:
-                            # No more tasks in queue, exit the loop
-                            break
-                        
+                source_open = await self._fill_slots(active_tasks, config, source, source_open)
+
                 # Process completed tasks and yield results
                 if active_tasks:
                     done, pending = await asyncio.wait(
@@ -598,20 +953,23 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                     
                     for completed_task in done:
                         result = await completed_task
-                        
-                        # Only count as completed if it wasn't requeued
+                        self.task_queue.release(result.url)
+
+                        # Requeued tasks come back through the queue
                         if "requeued" not in result.error_message:
-                            completed_count += 1
                             yield result
                         
                     # Update active tasks list
                     active_tasks = list(pending)
                 else:
-                    # If no active tasks but still waiting, sleep briefly
-                    await asyncio.sleep(self.check_interval / 2)
+                    # Nothing running: sleep until the next host is eligible
+                    ready_in = self.task_queue.next_ready_in()
+                    await asyncio.sleep(
+                        self.check_interval / 2 if ready_in is None
+                        else min(self.check_interval / 2, ready_in)
+                    )
                 
-                # Update priorities for waiting tasks if needed
-                await self._update_queue_priorities()
+                self._update_queue_statistics()
                 
         finally:
             # Cancel and await every task owned by this stream before returning
@@ -624,11 +982,8 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                 await asyncio.gather(*active_tasks, return_exceptions=True)
 
             # Discard URLs that were queued by this stream but never started.
-            while True:
-                try:
-                    self.task_queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    break
+            self.task_queue.clear()
+            await self._close_source(source)
 
             memory_monitor.cancel()
             await asyncio.gather(memory_monitor, return_exceptions=True)
@@ -707,7 +1062,10 @@ class SemaphoreDispatcher(BaseDispatcher):
                 memory_usage = peak_memory = end_memory - start_memory
 
                 if self.rate_limiter and result.status_code:
-                    if not self.rate_limiter.update_delay(url, result.status_code):
+                    retry_after = parse_retry_after(
+                        _get_header(getattr(result, "response_headers", None), "Retry-After")
+                    )
+                    if not self.rate_limiter.update_delay(url, result.status_code, retry_after):
                         error_message = f"Rate limit retry count exceeded for domain {urlparse(url).netloc}"
                         if self.monitor:
                             self.monitor.update_task(task_id, status=CrawlStatus.FAILED)
@@ -762,7 +1120,7 @@ class SemaphoreDispatcher(BaseDispatcher):
     async def run_urls(
         self,
         crawler: AsyncWebCrawler,  # noqa: F821
-        urls: List[str],
+        urls: UrlSource,
         config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
     ) -> List[CrawlerTaskResult]:
         self.crawler = crawler
@@ -772,8 +1130,13 @@ class SemaphoreDispatcher(BaseDispatcher):
         try:
             semaphore = asyncio.Semaphore(self.semaphore_count)
             tasks = []
+            # Tasks started but not finished; the input is read no further
+            # ahead of the semaphore than this
+            pending = set()
 
-            for url in urls:
+            async for url in iter_url_source(urls):
+                while len(pending) >= 2 * self.semaphore_count:
+                    _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
                 task_id = str(uuid.uuid4())
                 if self.monitor:
                     self.monitor.add_task(task_id, url)
@@ -781,6 +1144,7 @@ class SemaphoreDispatcher(BaseDispatcher):
                     self.crawl_url(url, config, task_id, semaphore)
                 )
                 tasks.append(task)
+                pending.add(task)
 
             return await asyncio.gather(*tasks, return_exceptions=True)
         finally:
@@ -24,9 +24,10 @@ import os
 import pathlib
 import re
 import time
+import zlib
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 from urllib.parse import quote, urljoin
 
 import httpx
@@ -42,17 +43,14 @@ try:
     HAS_BROTLI = True
 except ImportError:
     HAS_BROTLI = False
-try:
-    import rank_bm25
-    HAS_BM25 = True
-except ImportError:
-    HAS_BM25 = False
 
 # Import AsyncLoggerBase from crawl4ai's logger module
 # Assuming crawl4ai/async_logger.py defines AsyncLoggerBase
 # You might need to adjust this import based on your exact file structure
 # Import AsyncLogger for default if needed
 from .async_logger import AsyncLoggerBase, AsyncLogger
+from .bm25 import BM25Index, normalize_scores, tokenize
+from .seed_cache import SeedCache, pattern_prefix
 
 # Import SeedingConfig for type hints
 from typing import TYPE_CHECKING
@@ -78,101 +76,117 @@ _link_rx = re.compile(
 # ────────────────────────────────────────────────────────────────────────── helpers
 
 
-def _parse_sitemap_lastmod(xml_content: bytes) -> Optional[str]:
-    """Extract the most recent lastmod from sitemap XML."""
-    try:
-        if LXML:
-            root = etree.fromstring(xml_content)
-            # Get all lastmod elements (namespace-agnostic)
-            lastmods = root.xpath("//*[local-name()='lastmod']/text()")
-            if lastmods:
-                # Return the most recent one
-                return max(lastmods)
-    except Exception:
-        pass
-    return None
+SITEMAP_CHUNK_SIZE = 64 * 1024  # bytes read per await when streaming a sitemap
+SITEMAP_QUEUE_SIZE = 10_000     # URLs buffered from sub-sitemaps of an index
+SEED_CACHE_BATCH = 1000         # URLs written to the seed cache per insert
 
 
-def _is_cache_valid(
-    cache_path: pathlib.Path,
-    ttl_hours: int,
-    validate_lastmod: bool,
-    current_lastmod: Optional[str] = None
-) -> bool:
+class _SitemapParser:
     """
-    Check if sitemap cache is still valid.
-
-    Returns False (invalid) if:
-    - File doesn't exist
-    - File is corrupted/unreadable
-    - TTL expired (if ttl_hours > 0)
-    - Sitemap lastmod is newer than cache (if validate_lastmod=True)
+    Incremental, namespace-agnostic sitemap parser.
+
+    ``feed`` takes the raw bytes of a sitemap as they are downloaded, gzipped
+    or not, and returns the ``(kind, loc, lastmod)`` entries completed so far:
+    kind is "sitemap" for the entries of a sitemap index and "url" for pages.
+    Only ``<loc>`` and ``<lastmod>`` elements directly inside ``<url>`` or
+    ``<sitemap>`` count, whatever their namespace. Finished entries are
+    removed from the tree, so memory stays flat however large the sitemap
+    is. ``lastmod`` is the most recent entry ``<lastmod>`` seen so far.
     """
-    if not cache_path.exists():
-        return False
-
-    try:
-        with open(cache_path, "r") as f:
-            data = json.load(f)
-
-        # Check version
-        if data.get("version") != 1:
-            return False
 
-        # Check TTL
-        if ttl_hours > 0:
-            created_at = datetime.fromisoformat(data["created_at"].replace("Z", "+00:00"))
-            age_hours = (datetime.now(timezone.utc) - created_at).total_seconds() / 3600
-            if age_hours > ttl_hours:
-                return False
-
-        # Check lastmod
-        if validate_lastmod and current_lastmod:
-            cached_lastmod = data.get("sitemap_lastmod")
-            if cached_lastmod and current_lastmod > cached_lastmod:
-                return False
-
-        # Check URL count (sanity check - if 0, likely corrupted)
-        if data.get("url_count", 0) == 0:
-            return False
-
-        return True
+    def __init__(self):
+        if LXML:
+            self._parser = etree.XMLPullParser(
+                events=("start", "end"), recover=True, resolve_entities=False, huge_tree=True
+            )
+        else:
+            import xml.etree.ElementTree as ET
+            self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._head = b""
+        self._gunzip = None
+        self._started = False
+        self._root = None
+        self._path: List[str] = []
+        self._loc: Optional[str] = None
+        self._entry_lastmod: Optional[str] = None
+        self.lastmod: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> List[Tuple[str, str, Optional[str]]]:
+        if not self._started:
+            # Gzipped files (.xml.gz) are served as-is; compressed transfers are
+            # already decoded by httpx. Sniff the magic bytes to tell them apart.
+            self._head += chunk
+            if len(self._head) < 2:
+                return []
+            chunk, self._head, self._started = self._head, b"", True
+            if chunk[:2] == b"\x1f\x8b":
+                self._gunzip = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        if self._gunzip is not None:
+            chunk = self._gunzip.decompress(chunk)
+        if chunk:
+            self._parser.feed(chunk)
+        return self._read_entries()
+
+    def close(self) -> List[Tuple[str, str, Optional[str]]]:
+        if not self._started and self._head:
+            self._parser.feed(self._head)
+        if self._gunzip is not None:
+            rest = self._gunzip.flush()
+            if rest:
+                self._parser.feed(rest)
+        self._parser.close()
+        return self._read_entries()
+
+    def _read_entries(self) -> List[Tuple[str, str, Optional[str]]]:
+        entries = []
+        for event, elem in self._parser.read_events():
+            tag = elem.tag
+            if not isinstance(tag, str):
+                continue  # comments and processing instructions
+            name = tag.rpartition("}")[2]
+            if event == "start":
+                if self._root is None:
+                    self._root = elem
+                self._path.append(name)
+                continue
 
-    except (json.JSONDecodeError, KeyError, ValueError, IOError):
-        # Corrupted cache - return False to trigger refetch
-        return False
+            if self._path:
+                self._path.pop()
+            parent = self._path[-1] if self._path else None
+            if parent in ("url", "sitemap"):
+                if name == "loc":
+                    self._loc = elem.text
+                elif name == "lastmod" and elem.text:
+                    lastmod = elem.text.strip() or None
+                    self._entry_lastmod = lastmod
+                    if lastmod and (self.lastmod is None or lastmod > self.lastmod):
+                        self.lastmod = lastmod
+            elif name in ("url", "sitemap"):
+                if self._loc:
+                    entries.append((name, self._loc, self._entry_lastmod))
+                self._loc = self._entry_lastmod = None
+                self._drop(elem)
+        return entries
+
+    def _drop(self, elem) -> None:
+        elem.clear()
+        if LXML:
+            parent = elem.getparent()
+            if parent is not None:
+                parent.remove(elem)
+        elif self._root is not None and elem is not self._root:
+            self._root.clear()
 
 
-def _read_cache(cache_path: pathlib.Path) -> List[str]:
-    """Read URLs from cache file. Returns empty list on error."""
-    try:
-        with open(cache_path, "r") as f:
-            data = json.load(f)
-        return data.get("urls", [])
-    except Exception:
-        return []
-
-
-def _write_cache(
-    cache_path: pathlib.Path,
-    urls: List[str],
-    sitemap_url: str,
-    sitemap_lastmod: Optional[str]
-) -> None:
-    """Write URLs to cache with metadata."""
-    data = {
-        "version": 1,
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "sitemap_lastmod": sitemap_lastmod,
-        "sitemap_url": sitemap_url,
-        "url_count": len(urls),
-        "urls": urls
-    }
+def _parse_sitemap_lastmod(xml_content: bytes) -> Optional[str]:
+    """Extract the most recent lastmod from sitemap XML."""
+    parser = _SitemapParser()
     try:
-        with open(cache_path, "w") as f:
-            json.dump(data, f)
+        parser.feed(xml_content)
+        parser.close()
     except Exception:
-        pass  # Fail silently - cache is optional
+        pass
+    return parser.lastmod
 
 
 def _match(url: str, pattern: str) -> bool:
@@ -183,6 +197,29 @@ def _match(url: str, pattern: str) -> bool:
             or (canon.startswith("www.") and fnmatch.fnmatch(canon[4:], pattern)))
 
 
+def _query_seed_cache(cache: SeedCache, pattern: str, part: Optional[str] = None) -> Iterable[str]:
+    """Cached URLs matching ``pattern``, read through the canonical-prefix index."""
+    for url in cache.query(pattern_prefix(pattern), part):
+        if _match(url, pattern):
+            yield url
+
+
+def _remove_legacy_cache(path: pathlib.Path) -> bool:
+    """Delete a cache file of the JSON/JSONL formats used before ``SeedCache``."""
+    if not path.exists():
+        return False
+    try:
+        path.unlink()
+        return True
+    except Exception:
+        return False
+
+
+async def _aiter(items: Iterable[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
 def _parse_head(src: str) -> Dict[str, Any]:
     if LXML:
         try:
@@ -751,10 +788,6 @@ class AsyncUrlSeeder:
 
     async def _apply_bm25_scoring(self, results: List[Dict[str, Any]], config: "SeedingConfig") -> List[Dict[str, Any]]:
         """Apply BM25 scoring to results that have head_data."""
-        if not HAS_BM25:
-            self._log("warning", "BM25 scoring requested but rank_bm25 not available", tag="URL_SEED")
-            return results
-        
         # Extract text contexts from head data
         text_contexts = []
         valid_results = []
@@ -836,50 +869,62 @@ class AsyncUrlSeeder:
 
         # ── sanitize only for cache-file name
         safe = re.sub('[/?#]+', '_', raw)
-        path = self.cache_dir / f"{self.index_id}_{safe}_{digest}.jsonl"
-
-        if path.exists() and not force:
-            self._log("info", "Loading CC URLs for {domain} from cache: {path}",
-                      params={"domain": domain, "path": path}, tag="URL_SEED")
-            async with aiofiles.open(path, "r") as fp:
-                async for line in fp:
-                    url = line.strip()
-                    if _match(url, pattern):
-                        yield url
-            return
+        if _remove_legacy_cache(self.cache_dir / f"{self.index_id}_{safe}_{digest}.jsonl"):
+            self._log("info", "Deleted old cache format for {domain}",
+                      params={"domain": domain}, tag="URL_SEED")
+        # One listing per domain and index; the pattern is applied on read
+        cache = SeedCache(str(self.cache_dir / f"{self.index_id}_{safe}.db"))
+        try:
+            if cache.is_valid() and not force:
+                self._log("info", "Loading CC URLs for {domain} from cache: {path}",
+                          params={"domain": domain, "path": cache.path}, tag="URL_SEED")
+                for url in _query_seed_cache(cache, pattern):
+                    yield url
+                return
 
-        # build CC glob – if a path is present keep it, else add trailing /*
-        glob = f"*.{raw}*" if '/' in raw else f"*.{raw}/*"
-        url = f"https://index.commoncrawl.org/{self.index_id}-index?url={quote(glob, safe='*')}&output=json"
+            # build CC glob – if a path is present keep it, else add trailing /*
+            glob = f"*.{raw}*" if '/' in raw else f"*.{raw}/*"
+            url = f"https://index.commoncrawl.org/{self.index_id}-index?url={quote(glob, safe='*')}&output=json"
 
-        retries = (1, 3, 7)
-        self._log("info", "Fetching CC URLs for {domain} from Common Crawl index: {url}",
-                  params={"domain": domain, "url": url}, tag="URL_SEED")
-        for i, d in enumerate(retries+(-1,)):  # last -1 means don't retry
-            try:
-                async with self.client.stream("GET", url) as r:
-                    r.raise_for_status()
-                    async with aiofiles.open(path, "w") as fp:
+            retries = (1, 3, 7)
+            self._log("info", "Fetching CC URLs for {domain} from Common Crawl index: {url}",
+                      params={"domain": domain, "url": url}, tag="URL_SEED")
+            for i, d in enumerate(retries+(-1,)):  # last -1 means don't retry
+                try:
+                    cache.begin_refresh()
+                    pending = []
+                    async with self.client.stream("GET", url) as r:
+                        r.raise_for_status()
                         async for line in r.aiter_lines():
                             rec = json.loads(line)
                             u = rec["url"]
-                            await fp.write(u+"\n")
+                            pending.append((u, ""))
+                            if len(pending) >= SEED_CACHE_BATCH:
+                                cache.add(pending)
+                                pending = []
                             if _match(u, pattern):
                                 yield u
-                return
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 503 and i < len(retries):
-                    self._log("warning", "Common Crawl API returned 503 for {domain}. Retrying in {delay}s.",
-                              params={"domain": domain, "delay": retries[i]}, tag="URL_SEED")
-                    await asyncio.sleep(retries[i])
-                    continue
-                self._log("error", "HTTP error fetching CC index for {domain}: {error}",
-                          params={"domain": domain, "error": str(e)}, tag="URL_SEED")
-                raise
-            except Exception as e:
-                self._log("error", "Error fetching CC index for {domain}: {error}",
-                          params={"domain": domain, "error": str(e)}, tag="URL_SEED")
-                raise
+                    cache.add(pending)
+                    await asyncio.to_thread(cache.commit, url)
+                    return
+                except httpx.HTTPStatusError as e:
+                    cache.rollback()
+                    if e.response.status_code == 503 and i < len(retries):
+                        self._log("warning", "Common Crawl API returned 503 for {domain}. Retrying in {delay}s.",
+                                  params={"domain": domain, "delay": retries[i]}, tag="URL_SEED")
+                        await asyncio.sleep(retries[i])
+                        continue
+                    self._log("error", "HTTP error fetching CC index for {domain}: {error}",
+                              params={"domain": domain, "error": str(e)}, tag="URL_SEED")
+                    raise
+                except Exception as e:
+                    self._log("error", "Error fetching CC index for {domain}: {error}",
+                              params={"domain": domain, "error": str(e)}, tag="URL_SEED")
+                    raise
+        finally:
+            # Uncommitted (interrupted or failed) fetches leave the old listing
+            cache.rollback()
+            cache.close()
 
     # ─────────────────────────────── Sitemaps
     async def _from_sitemaps(self, domain: str, pattern: str, force: bool = False):
@@ -895,26 +940,37 @@ class AsyncUrlSeeder:
         cache_ttl_hours = getattr(self, '_cache_ttl_hours', 24)
         validate_lastmod = getattr(self, '_validate_sitemap_lastmod', True)
 
-        # Cache file path (new format: .json instead of .jsonl)
         host = re.sub(r'^https?://', '', domain).rstrip('/')
         host_safe = re.sub('[/?#]+', '_', host)
         digest = hashlib.md5(pattern.encode()).hexdigest()[:8]
-        cache_path = self.cache_dir / f"sitemap_{host_safe}_{digest}.json"
 
-        # Check for old .jsonl format and delete it
-        old_cache_path = self.cache_dir / f"sitemap_{host_safe}_{digest}.jsonl"
-        if old_cache_path.exists():
-            try:
-                old_cache_path.unlink()
+        # Delete cache files of the older JSON/JSONL formats
+        for suffix in (".json", ".jsonl"):
+            old_cache_path = self.cache_dir / f"sitemap_{host_safe}_{digest}{suffix}"
+            if _remove_legacy_cache(old_cache_path):
                 self._log("info", "Deleted old cache format: {p}",
                           params={"p": str(old_cache_path)}, tag="URL_SEED")
-            except Exception:
-                pass
+
+        # One listing per host; the pattern is applied on read
+        cache = SeedCache(str(self.cache_dir / f"sitemap_{host_safe}.db"))
+        try:
+            async for u in self._from_sitemaps_cached(cache, domain, host, pattern, force):
+                yield u
+        finally:
+            # Uncommitted (interrupted or empty) refreshes leave the old listing
+            cache.rollback()
+            cache.close()
+
+    async def _from_sitemaps_cached(
+        self, cache: SeedCache, domain: str, host: str, pattern: str, force: bool
+    ):
+        cache_ttl_hours = getattr(self, '_cache_ttl_hours', 24)
+        validate_lastmod = getattr(self, '_validate_sitemap_lastmod', True)
 
         # Step 1: Find sitemap URL and get lastmod (needed for validation)
         sitemap_url = None
         sitemap_lastmod = None
-        sitemap_content = None
+        sitemap_entries = None
 
         schemes = ('https', 'http')
         for scheme in schemes:
@@ -923,48 +979,73 @@ class AsyncUrlSeeder:
                 resolved = await self._resolve_head(sm)
                 if resolved:
                     sitemap_url = resolved
-                    # Fetch sitemap content to get lastmod
-                    try:
-                        r = await self.client.get(sitemap_url, timeout=15, follow_redirects=True)
-                        if 200 <= r.status_code < 300:
-                            sitemap_content = r.content
-                            sitemap_lastmod = _parse_sitemap_lastmod(sitemap_content)
-                    except Exception:
-                        pass
+                    # Read the sitemap's entries to get lastmod
+                    read = await self._read_sitemap(sitemap_url)
+                    if read is not None:
+                        sitemap_entries, sitemap_lastmod = read
                     break
             if sitemap_url:
                 break
 
         # Step 2: Check cache validity (skip if force=True)
-        if not force and cache_path.exists():
-            if _is_cache_valid(cache_path, cache_ttl_hours, validate_lastmod, sitemap_lastmod):
+        if not force and cache.header() is not None:
+            if cache.is_valid(cache_ttl_hours, validate_lastmod, sitemap_lastmod):
                 self._log("info", "Loading sitemap URLs from valid cache: {p}",
-                          params={"p": str(cache_path)}, tag="URL_SEED")
-                cached_urls = _read_cache(cache_path)
-                for url in cached_urls:
-                    if _match(url, pattern):
-                        yield url
+                          params={"p": cache.path}, tag="URL_SEED")
+                for url in _query_seed_cache(cache, pattern):
+                    yield url
                 return
             else:
                 self._log("info", "Cache invalid/expired, refetching sitemap for {d}",
                           params={"d": domain}, tag="URL_SEED")
 
-        # Step 3: Fetch fresh URLs
-        discovered_urls = []
+        # Step 3: Fetch fresh URLs. Sub-sitemaps of an index whose <lastmod> is
+        # unchanged since the cached listing are served from the cache.
+        cached_parts = {} if force or cache.header() is None else cache.parts()
+        listed_parts = {
+            loc: lastmod
+            for kind, loc, lastmod in (sitemap_entries or [])
+            if kind == "sitemap"
+        }
+        unchanged = {
+            loc for loc, lastmod in listed_parts.items()
+            if lastmod and cached_parts.get(loc) == lastmod
+        }
+        cache.begin_refresh(unchanged)
+        pending = []
+
+        def record(u: str, part: str):
+            pending.append((u, part))
+            if len(pending) >= SEED_CACHE_BATCH:
+                cache.add(pending)
+                pending.clear()
 
-        if sitemap_url and sitemap_content:
+        if sitemap_url and sitemap_entries is not None:
             self._log("info", "Found sitemap at {url}", params={"url": sitemap_url}, tag="URL_SEED")
-
-            # Parse sitemap (reuse content we already fetched)
-            async for u in self._iter_sitemap_content(sitemap_url, sitemap_content):
-                discovered_urls.append(u)
+            if unchanged:
+                self._log("info", "Reusing {count} unchanged sub-sitemaps from cache",
+                          params={"count": len(unchanged)}, tag="URL_SEED")
+                for part in unchanged:
+                    for u in _query_seed_cache(cache, pattern, part):
+                        yield u
+
+            # Expand the entries we already read
+            failed: Set[str] = set()
+            async for part, u in self._expand_sitemap(
+                sitemap_url, _aiter(sitemap_entries), skip=unchanged, failed=failed
+            ):
+                record(u, part)
                 if _match(u, pattern):
                     yield u
+            # Parts that failed are left unrecorded, so the next refresh reads them again
+            for loc, lastmod in listed_parts.items():
+                if loc not in unchanged and loc not in failed:
+                    cache.set_part(loc, lastmod)
         elif sitemap_url:
             # We have a sitemap URL but no content (fetch failed earlier), try again
             self._log("info", "Found sitemap at {url}", params={"url": sitemap_url}, tag="URL_SEED")
             async for u in self._iter_sitemap(sitemap_url):
-                discovered_urls.append(u)
+                record(u, "")
                 if _match(u, pattern):
                     yield u
         else:
@@ -978,7 +1059,7 @@ class AsyncUrlSeeder:
                                      if l.lower().startswith("sitemap:")]
                     for sm in sitemap_lines:
                         async for u in self._iter_sitemap(sm):
-                            discovered_urls.append(u)
+                            record(u, "")
                             if _match(u, pattern):
                                 yield u
                 else:
@@ -990,292 +1071,184 @@ class AsyncUrlSeeder:
                           params={"d": domain, "e": str(e)}, tag="URL_SEED")
                 return
 
-        # Step 4: Write to cache (FALLBACK: if write fails, URLs still yielded above)
-        if discovered_urls:
-            _write_cache(cache_path, discovered_urls, sitemap_url or "", sitemap_lastmod)
+        # Step 4: Commit to cache (FALLBACK: if write fails, URLs still yielded above)
+        try:
+            cache.add(pending)
+            count = await asyncio.to_thread(cache.commit, sitemap_url or "", sitemap_lastmod)
+        except Exception:
+            return  # Fail silently - cache is optional
+        if count:
             self._log("info", "Cached {count} URLs for {d}",
-                      params={"count": len(discovered_urls), "d": domain}, tag="URL_SEED")
-
-    async def _iter_sitemap_content(self, url: str, content: bytes):
-        """Parse sitemap from already-fetched content."""
-        data = gzip.decompress(content) if url.endswith(".gz") else content
-        base_url = url
-
-        def _normalize_loc(raw: Optional[str]) -> Optional[str]:
-            if not raw:
-                return None
-            cleaned = raw.strip().replace("\u200b", "").replace("\ufeff", "")
-            normalized = urljoin(base_url, cleaned)
-            if not normalized:
-                return None
-            return normalized
-
-        # Detect if this is a sitemap index
-        is_sitemap_index = False
-        sub_sitemaps = []
-        regular_urls = []
-
-        if LXML:
-            try:
-                parser = etree.XMLParser(recover=True)
-                root = etree.fromstring(data, parser=parser)
-                sitemap_loc_nodes = root.xpath("//*[local-name()='sitemap']/*[local-name()='loc']")
-                url_loc_nodes = root.xpath("//*[local-name()='url']/*[local-name()='loc']")
-
-                if sitemap_loc_nodes:
-                    is_sitemap_index = True
-                    for sitemap_elem in sitemap_loc_nodes:
-                        loc = _normalize_loc(sitemap_elem.text)
-                        if loc:
-                            sub_sitemaps.append(loc)
-
-                if not is_sitemap_index:
-                    for loc_elem in url_loc_nodes:
-                        loc = _normalize_loc(loc_elem.text)
-                        if loc:
-                            regular_urls.append(loc)
-            except Exception as e:
-                self._log("error", "LXML parsing error for sitemap {url}: {error}",
-                          params={"url": url, "error": str(e)}, tag="URL_SEED")
-                return
-        else:
-            import xml.etree.ElementTree as ET
-            try:
-                root = ET.fromstring(data)
-                for elem in root.iter():
-                    if '}' in elem.tag:
-                        elem.tag = elem.tag.split('}')[1]
-
-                sitemaps = root.findall('.//sitemap')
-                url_entries = root.findall('.//url')
-
-                if sitemaps:
-                    is_sitemap_index = True
-                    for sitemap in sitemaps:
-                        loc_elem = sitemap.find('loc')
-                        loc = _normalize_loc(loc_elem.text if loc_elem is not None else None)
-                        if loc:
-                            sub_sitemaps.append(loc)
-
-                if not is_sitemap_index:
-                    for url_elem in url_entries:
-                        loc_elem = url_elem.find('loc')
-                        loc = _normalize_loc(loc_elem.text if loc_elem is not None else None)
-                        if loc:
-                            regular_urls.append(loc)
-            except Exception as e:
-                self._log("error", "ElementTree parsing error for sitemap {url}: {error}",
-                          params={"url": url, "error": str(e)}, tag="URL_SEED")
-                return
+                      params={"count": count, "d": domain}, tag="URL_SEED")
 
-        # Process based on type
-        if is_sitemap_index and sub_sitemaps:
-            self._log("info", "Processing sitemap index with {count} sub-sitemaps",
-                      params={"count": len(sub_sitemaps)}, tag="URL_SEED")
-
-            queue_size = min(50000, len(sub_sitemaps) * 1000)
-            result_queue = asyncio.Queue(maxsize=queue_size)
-            completed_count = 0
-            total_sitemaps = len(sub_sitemaps)
-
-            async def process_subsitemap(sitemap_url: str):
-                try:
-                    async for u in self._iter_sitemap(sitemap_url):
-                        await result_queue.put(u)
-                except Exception as e:
-                    self._log("error", "Error processing sub-sitemap {url}: {error}",
-                              params={"url": sitemap_url, "error": str(e)}, tag="URL_SEED")
-                finally:
-                    await result_queue.put(None)
-
-            tasks = [asyncio.create_task(process_subsitemap(sm)) for sm in sub_sitemaps]
+    async def _read_sitemap(
+        self, url: str
+    ) -> Optional[Tuple[List[Tuple[str, str, Optional[str]]], Optional[str]]]:
+        """
+        Stream ``url`` and return its entries and most recent lastmod, or None if it cannot be read.
 
-            while completed_count < total_sitemaps:
-                item = await result_queue.get()
-                if item is None:
-                    completed_count += 1
-                else:
-                    yield item
+        Only the entry strings are kept, not the document.
+        """
+        parser = _SitemapParser()
+        entries = [entry async for entry in self._sitemap_entries(url, parser)]
+        if parser.lastmod is None and not entries:
+            return None
+        return entries, parser.lastmod
 
-            await asyncio.gather(*tasks, return_exceptions=True)
-        else:
-            for u in regular_urls:
-                yield u
+    async def _sitemap_entries(
+        self,
+        url: str,
+        parser: Optional[_SitemapParser] = None,
+        failed: Optional[Set[str]] = None,
+    ) -> AsyncIterator[Tuple[str, str, Optional[str]]]:
+        """
+        Download ``url`` in chunks and yield its ``(kind, loc, lastmod)`` entries as they arrive.
 
-    async def _iter_sitemap(self, url: str):
+        Locations are stripped of stray whitespace and zero-width characters
+        and resolved against the final (redirected) URL. Errors are logged
+        and end the stream early; ``url`` is then added to ``failed``.
+        """
+        parser = parser or _SitemapParser()
+        sitemap_count = url_count = 0
         try:
-            r = await self.client.get(url, timeout=15, follow_redirects=True)
-            r.raise_for_status()
+            async with self.client.stream("GET", url, timeout=15, follow_redirects=True) as r:
+                r.raise_for_status()
+                base_url = str(r.url)
+
+                def _normalize(entries):
+                    for kind, raw, lastmod in entries:
+                        cleaned = raw.strip().replace("\u200b", "").replace("\ufeff", "")
+                        loc = urljoin(base_url, cleaned) if cleaned else None
+                        if loc:
+                            yield kind, loc, lastmod
+
+                async for chunk in r.aiter_bytes(SITEMAP_CHUNK_SIZE):
+                    for entry in _normalize(parser.feed(chunk)):
+                        if entry[0] == "sitemap":
+                            sitemap_count += 1
+                        else:
+                            url_count += 1
+                        yield entry
+                for entry in _normalize(parser.close()):
+                    if entry[0] == "sitemap":
+                        sitemap_count += 1
+                    else:
+                        url_count += 1
+                    yield entry
         except httpx.HTTPStatusError as e:
+            if failed is not None:
+                failed.add(url)
             self._log("warning", "Failed to fetch sitemap {url}: HTTP {status_code}",
                       params={"url": url, "status_code": e.response.status_code}, tag="URL_SEED")
             return
         except httpx.RequestError as e:
+            if failed is not None:
+                failed.add(url)
             self._log("warning", "Network error fetching sitemap {url}: {error}",
                       params={"url": url, "error": str(e)}, tag="URL_SEED")
             return
+        except (zlib.error, SyntaxError) as e:
+            if failed is not None:
+                failed.add(url)
+            # lxml's XMLSyntaxError and ElementTree's ParseError are SyntaxErrors
+            self._log("error", "Parsing error for sitemap {url}: {error}",
+                      params={"url": url, "error": str(e)}, tag="URL_SEED")
+            return
         except Exception as e:
+            if failed is not None:
+                failed.add(url)
             self._log("error", "Unexpected error fetching sitemap {url}: {error}",
                       params={"url": url, "error": str(e)}, tag="URL_SEED")
             return
 
-        data = gzip.decompress(r.content) if url.endswith(".gz") else r.content
-        base_url = str(r.url)
-
-        def _normalize_loc(raw: Optional[str]) -> Optional[str]:
-            if not raw:
-                return None
-            cleaned = raw.strip().replace("\u200b", "").replace("\ufeff", "")
-            normalized = urljoin(base_url, cleaned)
-            if not normalized:
-                return None
-            return normalized
+        self._log(
+            "debug",
+            "Parsed sitemap {url}: {sitemap_count} sitemap entries, {url_count} url entries discovered",
+            params={"url": url, "sitemap_count": sitemap_count, "url_count": url_count},
+            tag="URL_SEED",
+        )
+        if not sitemap_count and not url_count:
+            self._log(
+                "warning",
+                "No <loc> entries found inside <url> tags for sitemap {url}. The sitemap might be empty or use an unexpected structure.",
+                params={"url": url},
+                tag="URL_SEED",
+            )
 
-        # Detect if this is a sitemap index by checking for <sitemapindex> or presence of <sitemap> elements
-        is_sitemap_index = False
-        sub_sitemaps = []
-        regular_urls = []
+    async def _expand_sitemap(
+        self,
+        url: str,
+        entries: AsyncIterable[Tuple[str, str, Optional[str]]],
+        skip: Iterable[str] = (),
+        failed: Optional[Set[str]] = None,
+    ):
+        """
+        Yield ``(part, url)`` for the pages of a sitemap's entries, following sitemap indexes.
+
+        ``part`` is the sub-sitemap a page was found in, or "" for pages listed
+        directly. Page entries are yielded as they arrive. Each sub-sitemap not
+        in ``skip`` is processed in parallel as soon as its entry is read, with
+        results passed through a bounded queue to prevent RAM issues.
+        Sub-sitemaps that could not be read in full, at any nesting level,
+        are added to ``failed`` under their entry in ``entries``.
+        """
+        result_queue: asyncio.Queue = asyncio.Queue(maxsize=SITEMAP_QUEUE_SIZE)
+        tasks = []
+        completed_count = 0
 
-        # Use lxml for XML parsing if available, as it's generally more robust
-        if LXML:
+        async def process_subsitemap(sitemap_url: str):
+            nested_failed: Set[str] = set()
             try:
-                # Use XML parser for sitemaps, not HTML parser
-                parser = etree.XMLParser(recover=True)
-                root = etree.fromstring(data, parser=parser)
-                # Namespace-agnostic lookups using local-name() so we honor custom or missing namespaces
-                sitemap_loc_nodes = root.xpath("//*[local-name()='sitemap']/*[local-name()='loc']")
-                url_loc_nodes = root.xpath("//*[local-name()='url']/*[local-name()='loc']")
-
                 self._log(
-                    "debug",
-                    "Parsed sitemap {url}: {sitemap_count} sitemap entries, {url_count} url entries discovered",
-                    params={
-                        "url": url,
-                        "sitemap_count": len(sitemap_loc_nodes),
-                        "url_count": len(url_loc_nodes),
-                    },
-                    tag="URL_SEED",
-                )
-
-                # Check for sitemap index entries
-                if sitemap_loc_nodes:
-                    is_sitemap_index = True
-                    for sitemap_elem in sitemap_loc_nodes:
-                        loc = _normalize_loc(sitemap_elem.text)
-                        if loc:
-                            sub_sitemaps.append(loc)
-
-                # If not a sitemap index, get regular URLs
-                if not is_sitemap_index:
-                    for loc_elem in url_loc_nodes:
-                        loc = _normalize_loc(loc_elem.text)
-                        if loc:
-                            regular_urls.append(loc)
-                    if not regular_urls:
-                        self._log(
-                            "warning",
-                            "No <loc> entries found inside <url> tags for sitemap {url}. The sitemap might be empty or use an unexpected structure.",
-                            params={"url": url},
-                            tag="URL_SEED",
-                        )
-            except Exception as e:
-                self._log("error", "LXML parsing error for sitemap {url}: {error}",
-                          params={"url": url, "error": str(e)}, tag="URL_SEED")
-                return
-        else:  # Fallback to xml.etree.ElementTree
-            import xml.etree.ElementTree as ET
-            try:
-                # Parse the XML
-                root = ET.fromstring(data)
-                # Remove namespace from tags for easier processing
-                for elem in root.iter():
-                    if '}' in elem.tag:
-                        elem.tag = elem.tag.split('}')[1]
-
-                # Check for sitemap index entries
-                sitemaps = root.findall('.//sitemap')
-                url_entries = root.findall('.//url')
-                self._log(
-                    "debug",
-                    "ElementTree parsed sitemap {url}: {sitemap_count} sitemap entries, {url_count} url entries discovered",
-                    params={
-                        "url": url,
-                        "sitemap_count": len(sitemaps),
-                        "url_count": len(url_entries),
-                    },
-                    tag="URL_SEED",
-                )
-                if sitemaps:
-                    is_sitemap_index = True
-                    for sitemap in sitemaps:
-                        loc_elem = sitemap.find('loc')
-                        loc = _normalize_loc(loc_elem.text if loc_elem is not None else None)
-                        if loc:
-                            sub_sitemaps.append(loc)
-
-                # If not a sitemap index, get regular URLs
-                if not is_sitemap_index:
-                    for url_elem in url_entries:
-                        loc_elem = url_elem.find('loc')
-                        loc = _normalize_loc(loc_elem.text if loc_elem is not None else None)
-                        if loc:
-                            regular_urls.append(loc)
-                    if not regular_urls:
-                        self._log(
-                            "warning",
-                            "No <loc> entries found inside <url> tags for sitemap {url}. The sitemap might be empty or use an unexpected structure.",
-                            params={"url": url},
-                            tag="URL_SEED",
-                        )
+                    "debug", "Processing sub-sitemap: {url}", params={"url": sitemap_url}, tag="URL_SEED")
+                # Recursively process sub-sitemap
+                async for u in self._iter_sitemap(sitemap_url, nested_failed):
+                    await result_queue.put((sitemap_url, u))  # Will block if queue is full
+                if nested_failed and failed is not None:
+                    failed.add(sitemap_url)
             except Exception as e:
-                self._log("error", "ElementTree parsing error for sitemap {url}: {error}",
-                          params={"url": url, "error": str(e)}, tag="URL_SEED")
-                return
-
-        # Process based on type
-        if is_sitemap_index and sub_sitemaps:
-            self._log("info", "Processing sitemap index with {count} sub-sitemaps in parallel",
-                      params={"count": len(sub_sitemaps)}, tag="URL_SEED")
-
-            # Create a bounded queue for results to prevent RAM issues
-            # For sitemap indexes, use a larger queue as we expect many URLs
-            queue_size = min(50000, len(sub_sitemaps) * 1000)  # Estimate 1000 URLs per sitemap
-            result_queue = asyncio.Queue(maxsize=queue_size)
-            completed_count = 0
-            total_sitemaps = len(sub_sitemaps)
-
-            async def process_subsitemap(sitemap_url: str):
-                try:
-                    self._log(
-                        "debug", "Processing sub-sitemap: {url}", params={"url": sitemap_url}, tag="URL_SEED")
-                    # Recursively process sub-sitemap
-                    async for u in self._iter_sitemap(sitemap_url):
-                        await result_queue.put(u)  # Will block if queue is full
-                except Exception as e:
-                    self._log("error", "Error processing sub-sitemap {url}: {error}",
-                              params={"url": sitemap_url, "error": str(e)}, tag="URL_SEED")
-                finally:
-                    # Put sentinel to signal completion
-                    await result_queue.put(None)
+                if failed is not None:
+                    failed.add(sitemap_url)
+                self._log("error", "Error processing sub-sitemap {url}: {error}",
+                          params={"url": sitemap_url, "error": str(e)}, tag="URL_SEED")
+            finally:
+                # Put sentinel to signal completion
+                await result_queue.put(None)
 
-            # Start all tasks
-            tasks = [asyncio.create_task(process_subsitemap(sm))
-                     for sm in sub_sitemaps]
+        try:
+            async for kind, loc, _ in entries:
+                if kind == "url":
+                    yield "", loc
+                elif loc not in skip:
+                    tasks.append(asyncio.create_task(process_subsitemap(loc)))
+                # Pass on what the sub-sitemaps found so far
+                while not result_queue.empty():
+                    item = result_queue.get_nowait()
+                    if item is None:
+                        completed_count += 1
+                    else:
+                        yield item
 
+            if tasks:
+                self._log("info", "Processing sitemap index with {count} sub-sitemaps in parallel",
+                          params={"count": len(tasks)}, tag="URL_SEED")
             # Yield results as they come in
-            while completed_count < total_sitemaps:
+            while completed_count < len(tasks):
                 item = await result_queue.get()
                 if item is None:
                     completed_count += 1
                 else:
                     yield item
-
-            # Ensure all tasks are done
+        finally:
+            # Stop sub-sitemaps still running if the caller stopped early
+            for task in tasks:
+                task.cancel()
             await asyncio.gather(*tasks, return_exceptions=True)
-        else:
-            # Regular sitemap - yield URLs directly
-            for u in regular_urls:
-                yield u
+
+    async def _iter_sitemap(self, url: str, failed: Optional[Set[str]] = None):
+        entries = self._sitemap_entries(url, failed=failed)
+        async for _, u in self._expand_sitemap(url, entries, failed=failed):
+            yield u
 
     # ─────────────────────────────── validate helpers
     async def _validate(self, url: str, res_list: List[Dict[str, Any]], live: bool,
@@ -1701,46 +1674,21 @@ class AsyncUrlSeeder:
         return False
     
     def _calculate_bm25_score(self, query: str, documents: List[str]) -> List[float]:
-        """Calculate BM25 scores for documents against a query."""
-        if not HAS_BM25:
-            self._log(
-                "warning", "rank_bm25 not installed. Returning zero scores.", tag="URL_SEED")
-            return [0.0] * len(documents)
-
+        """Calculate BM25 scores for documents against a query, normalized to 0-1."""
         if not query or not documents:
             return [0.0] * len(documents)
 
-        # Tokenize query and documents (simple whitespace tokenization)
-        # For production, consider using a proper tokenizer
-        query_tokens = query.lower().split()
-        tokenized_docs = [doc.lower().split() for doc in documents]
+        query_tokens = tokenize(query)
+        tokenized_docs = [tokenize(doc) for doc in documents]
 
         # Handle edge case where all documents are empty
         if all(len(doc) == 0 for doc in tokenized_docs):
             return [0.0] * len(documents)
 
-        # Create BM25 instance and calculate scores
         try:
-            from rank_bm25 import BM25Okapi
-            bm25 = BM25Okapi(tokenized_docs)
-            scores = bm25.get_scores(query_tokens)
-
-            # Normalize scores to 0-1 range
-            # BM25 can return negative scores, so we need to handle the full range
-            if len(scores) == 0:
-                return []
-            
-            min_score = min(scores)
-            max_score = max(scores)
-            
-            # If all scores are the same, return 0.5 for all
-            if max_score == min_score:
-                return [0.5] * len(scores)
-            
-            # Normalize to 0-1 range using min-max normalization
-            normalized_scores = [(score - min_score) / (max_score - min_score) for score in scores]
-
-            return normalized_scores
+            scores = BM25Index(tokenized_docs).get_scores(query_tokens)
+            # BM25 can return negative scores, so normalize over the full range
+            return normalize_scores(scores)
         except Exception as e:
             self._log("error", "Error calculating BM25 scores: {error}",
                       params={"error": str(e)}, tag="URL_SEED")
@@ -4,7 +4,7 @@ import re
 import sys
 import time
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 import json
 import asyncio
 
@@ -18,12 +18,16 @@ from .models import (
     CrawlResultContainer,
     RunManyReturn
 )
-from .async_database import async_db_manager
+from .async_database import CACHED_CONTENT_FIELDS, async_db_manager
 from .chunking_strategy import *  # noqa: F403
 from .chunking_strategy import IdentityChunking
 from .content_filter_strategy import *  # noqa: F403
 from .extraction_strategy import *  # noqa: F403
-from .extraction_strategy import NoExtractionStrategy
+from .extraction_strategy import (
+    NoExtractionStrategy,
+    JsonElementExtractionStrategy,
+    JsonLxmlExtractionStrategy,
+)
 from .async_crawler_strategy import (
     AsyncCrawlerStrategy,
     AsyncPlaywrightCrawlerStrategy,
@@ -38,9 +42,17 @@ from .deep_crawling import DeepCrawlDecorator
 from .async_logger import AsyncLogger, AsyncLoggerBase
 from .async_configs import BrowserConfig, CrawlerRunConfig, ProxyConfig, SeedingConfig, DomainMapperConfig
 from .async_dispatcher import *  # noqa: F403
-from .async_dispatcher import BaseDispatcher, MemoryAdaptiveDispatcher, RateLimiter
+from .async_dispatcher import (
+    BaseDispatcher,
+    MemoryAdaptiveDispatcher,
+    RateLimiter,
+    UrlSource,
+    iter_url_source,
+)
 from .async_url_seeder import AsyncUrlSeeder
 from .domain_mapper import DomainMapper
+from .processing_pool import HTMLProcessingPool, scrape_and_generate_markdown
+from .html_document import DocumentCache
 
 from .utils import (
     sanitize_input_encode,
@@ -48,10 +60,14 @@ from .utils import (
     fast_format_html,
     get_error_context,
     RobotsParser,
-    preprocess_html_for_schema,
     compute_head_fingerprint,
 )
-from .cache_validator import CacheValidator, CacheValidationResult
+from .cache_validator import (
+    CacheValidator,
+    CacheValidationResult,
+    ValidationResult,
+    build_conditional_headers,
+)
 from .antibot_detector import is_blocked, effective_status
 
 
@@ -120,6 +136,7 @@ class AsyncWebCrawler:
             os.getenv("CRAWL4_AI_BASE_DIRECTORY", Path.home())),
         thread_safe: bool = False,
         logger: AsyncLoggerBase = None,
+        cpu_workers: int = 0,
         **kwargs,
     ):
         """
@@ -130,6 +147,9 @@ class AsyncWebCrawler:
             config: Configuration object for browser settings. Default BrowserConfig()
             base_directory: Base directory for storing cache
             thread_safe: Whether to use thread-safe operations
+            cpu_workers: Run scraping and markdown generation in a process pool of this
+                         many workers instead of on the event loop. 0 disables the pool
+                         (default), a negative value sizes it to the number of CPU cores.
             **kwargs: Additional arguments for backwards compatibility
         """
         # Handle browser configuration
@@ -156,6 +176,12 @@ class AsyncWebCrawler:
         # Thread safety setup
         self._lock = asyncio.Lock() if thread_safe else None
 
+        # Optional CPU worker pool for scraping + markdown generation
+        self._processing_pool: Optional[HTMLProcessingPool] = (
+            HTMLProcessingPool(cpu_workers if cpu_workers > 0 else None)
+            if cpu_workers else None
+        )
+
         # Initialize directories
         self.crawl4ai_folder = os.path.join(base_directory, ".crawl4ai")
         os.makedirs(self.crawl4ai_folder, exist_ok=True)
@@ -193,8 +219,12 @@ class AsyncWebCrawler:
         This method will:
         1. Clean up browser resources
         2. Close any open pages and contexts
+        3. Write any cache rows still buffered
         """
         await self.crawler_strategy.__aexit__(None, None, None)
+        await async_db_manager.aflush_writes()
+        if self._processing_pool is not None:
+            self._processing_pool.shutdown(wait=False)
 
     async def __aenter__(self):
         return await self.start()
@@ -266,62 +296,105 @@ class AsyncWebCrawler:
                 # Initialize processing variables
                 async_response: AsyncCrawlResponse = None
                 cached_result: CrawlResult = None
+                # Stale entry being revalidated with a conditional request
+                revalidation_target: CrawlResult = None
+                conditional_headers = None
                 screenshot_data = None
                 pdf_data = None
                 extracted_content = None
+                cached_fields = self._cached_fields(config)
                 start_time = time.perf_counter()
 
                 # Try to get cached result if appropriate
                 if cache_context.should_read():
-                    cached_result = await async_db_manager.aget_cached_url(url)
+                    cached_result = await async_db_manager.aget_cached_url(
+                        url, fields=cached_fields
+                    )
 
                 # Smart Cache: Validate cache freshness if enabled
+                validation = (config._cache_verdicts or {}).get(url)
                 if cached_result and config.check_cache_freshness:
-                    cache_metadata = await async_db_manager.aget_cache_metadata(url)
-                    if cache_metadata:
-                        async with CacheValidator(timeout=config.cache_validation_timeout) as validator:
-                            validation = await validator.validate(
-                                url=url,
-                                stored_etag=cache_metadata.get("etag"),
-                                stored_last_modified=cache_metadata.get("last_modified"),
-                                stored_head_fingerprint=cache_metadata.get("head_fingerprint"),
-                            )
-
-                        if validation.status == CacheValidationResult.FRESH:
-                            cached_result.cache_status = "hit_validated"
-                            self.logger.info(
-                                message="Cache validated: {reason}",
-                                tag="CACHE",
-                                params={"reason": validation.reason}
-                            )
-                            # Update metadata if we got new values
-                            if validation.new_etag or validation.new_last_modified:
-                                await async_db_manager.aupdate_cache_metadata(
+                    if validation is None:
+                        cache_metadata = await async_db_manager.aget_cache_metadata(url)
+                        if cache_metadata:
+                            async with CacheValidator(timeout=config.cache_validation_timeout) as validator:
+                                validation = await validator.validate(
                                     url=url,
-                                    etag=validation.new_etag,
-                                    last_modified=validation.new_last_modified,
-                                    head_fingerprint=validation.new_head_fingerprint,
+                                    stored_etag=cache_metadata.get("etag"),
+                                    stored_last_modified=cache_metadata.get("last_modified"),
+                                    stored_head_fingerprint=cache_metadata.get("head_fingerprint"),
                                 )
-                        elif validation.status == CacheValidationResult.ERROR:
-                            cached_result.cache_status = "hit_fallback"
-                            self.logger.warning(
-                                message="Cache validation failed, using cached: {reason}",
-                                tag="CACHE",
-                                params={"reason": validation.reason}
-                            )
-                        else:
-                            # STALE or UNKNOWN - force recrawl
-                            self.logger.info(
-                                message="Cache stale: {reason}",
-                                tag="CACHE",
-                                params={"reason": validation.reason}
+
+                    if validation is None:
+                        # Nothing to validate against, serve the entry as is
+                        cached_result.cache_status = "hit"
+                    elif validation.status == CacheValidationResult.FRESH:
+                        cached_result.cache_status = "hit_validated"
+                        self.logger.info(
+                            message="Cache validated: {reason}",
+                            tag="CACHE",
+                            params={"reason": validation.reason}
+                        )
+                        # Update metadata if we got new values
+                        if validation.new_etag or validation.new_last_modified:
+                            await async_db_manager.aupdate_cache_metadata(
+                                url=url,
+                                etag=validation.new_etag,
+                                last_modified=validation.new_last_modified,
+                                head_fingerprint=validation.new_head_fingerprint,
                             )
-                            cached_result = None
+                    elif validation.status == CacheValidationResult.ERROR:
+                        cached_result.cache_status = "hit_fallback"
+                        self.logger.warning(
+                            message="Cache validation failed, using cached: {reason}",
+                            tag="CACHE",
+                            params={"reason": validation.reason}
+                        )
+                    else:
+                        # STALE or UNKNOWN - force recrawl
+                        self.logger.info(
+                            message="Cache stale: {reason}",
+                            tag="CACHE",
+                            params={"reason": validation.reason}
+                        )
+                        cached_result = None
+                elif cached_result and config.revalidate_cache:
+                    cache_metadata = await async_db_manager.aget_cache_metadata(url) or {}
+                    cached_at = cache_metadata.get("cached_at") or 0
+                    if (
+                        config.cache_max_age is not None
+                        and time.time() - cached_at < config.cache_max_age
+                    ):
+                        cached_result.cache_status = "hit"
+                    else:
+                        # Stale: re-request it conditionally. A 304 keeps the
+                        # cached result, anything else replaces it.
+                        conditional_headers = build_conditional_headers(
+                            cache_metadata.get("etag"),
+                            cache_metadata.get("last_modified"),
+                        )
+                        if (
+                            conditional_headers
+                            and self.crawler_strategy.supports_conditional_requests
+                            and cached_result.html
+                            and not (config.screenshot and not cached_result.screenshot)
+                            and not (config.pdf and not cached_result.pdf)
+                        ):
+                            revalidation_target = cached_result
+                        self.logger.info(
+                            message="Cache stale, {action}",
+                            tag="CACHE",
+                            params={
+                                "action": "revalidating" if revalidation_target else "recrawling"
+                            },
+                        )
+                        cached_result = None
                 elif cached_result:
                     cached_result.cache_status = "hit"
 
                 if cached_result:
                     html = sanitize_input_encode(cached_result.html)
+                    has_content = self._has_cached_content(cached_result, config)
                     extracted_content = sanitize_input_encode(
                         cached_result.extracted_content or ""
                     )
@@ -342,7 +415,7 @@ class AsyncWebCrawler:
 
                     self.logger.url_status(
                         url=cache_context.display_url,
-                        success=bool(html),
+                        success=has_content,
                         timing=time.perf_counter() - start_time,
                         tag="FETCH",
                     )
@@ -377,7 +450,7 @@ class AsyncWebCrawler:
                             config.proxy_config = next_proxy
 
                 # Fetch fresh content if needed
-                if not cached_result or not html:
+                if not cached_result or not has_content:
                     from urllib.parse import urlparse
 
                     # Check robots.txt if enabled (once, before any attempts)
@@ -475,9 +548,14 @@ class AsyncWebCrawler:
                                         raise TimeoutError(
                                             f"Fetch budget of {_total_timeout} ms exhausted "
                                             f"before attempt {_attempt + 1}/{_max_attempts}")
+                                _crawl_kwargs = (
+                                    {"conditional_headers": conditional_headers}
+                                    if revalidation_target else {}
+                                )
                                 try:
                                     async_response = await asyncio.wait_for(
-                                        self.crawler_strategy.crawl(url, config=config),
+                                        self.crawler_strategy.crawl(
+                                            url, config=config, **_crawl_kwargs),
                                         timeout=_remaining,
                                     )
                                 except asyncio.TimeoutError:
@@ -488,6 +566,11 @@ class AsyncWebCrawler:
                                         f"fetch budget ({_remaining:.1f}s remained for "
                                         f"attempt {_attempt + 1}/{_max_attempts})") from None
 
+                                if revalidation_target and async_response.status_code == 304:
+                                    _crawl_stats["resolved_by"] = "proxy" if _proxy else "direct"
+                                    _done = True
+                                    break
+
                                 html = sanitize_input_encode(async_response.html)
                                 screenshot_data = async_response.screenshot
                                 pdf_data = async_response.pdf_data
@@ -578,12 +661,31 @@ class AsyncWebCrawler:
                                 # If this is the only proxy and only attempt, re-raise
                                 # so the caller gets the real error (not a silent swallow).
                                 # But if there are more proxies or retries to try, continue.
-                                if len(_proxy_list) <= 1 and _max_attempts <= 1:
+                                # A failed revalidation falls back to the cached
+                                # entry below instead.
+                                if len(_proxy_list) <= 1 and _max_attempts <= 1 and not revalidation_target:
                                     raise
 
                     # Restore original proxy_config
                     config.proxy_config = _original_proxy_config
 
+                    if revalidation_target and async_response and async_response.status_code == 304:
+                        # Not modified: restart the entry's age and serve it
+                        response_headers = {
+                            k.lower(): v
+                            for k, v in (async_response.response_headers or {}).items()
+                        }
+                        await async_db_manager.aupdate_cache_metadata(
+                            url=url,
+                            etag=response_headers.get("etag"),
+                            last_modified=response_headers.get("last-modified"),
+                            cached_at=time.time(),
+                        )
+                        revalidation_target.cache_status = "hit_validated"
+                        return self._replay_cached_result(
+                            url, revalidation_target, config, cache_context, start_time
+                        )
+
                     # --- Fallback fetch function (last resort after all retries+proxies exhausted) ---
                     # Invoke fallback when: (a) crawl_result exists but is blocked, OR
                     # (b) crawl_result is None because all proxies threw exceptions (browser crash, timeout).
@@ -716,6 +818,18 @@ class AsyncWebCrawler:
                         tag="COMPLETE",
                     )
 
+                    if revalidation_target and not crawl_result.success:
+                        # Keep serving the stale copy rather than caching a failure
+                        self.logger.warning(
+                            message="Cache revalidation failed, using cached: {reason}",
+                            tag="CACHE",
+                            params={"reason": crawl_result.error_message},
+                        )
+                        revalidation_target.cache_status = "hit_fallback"
+                        return self._replay_cached_result(
+                            url, revalidation_target, config, cache_context, start_time
+                        )
+
                     # Update cache if appropriate
                     if cache_context.should_write() and not bool(cached_result):
                         await async_db_manager.acache_url(crawl_result)
@@ -723,21 +837,9 @@ class AsyncWebCrawler:
                     return CrawlResultContainer(crawl_result)
 
                 else:
-                    self.logger.url_status(
-                        url=cache_context.display_url,
-                        success=True,
-                        timing=time.perf_counter() - start_time,
-                        tag="COMPLETE"
+                    return self._replay_cached_result(
+                        url, cached_result, config, cache_context, start_time
                     )
-                    # Same binary-download awareness as the live-fetch path
-                    # — a cached PDF/archive should replay as success.
-                    cached_result.success = bool(html) or bool(getattr(cached_result, "downloaded_files", None))
-                    cached_result.session_id = getattr(
-                        config, "session_id", None)
-                    # For raw: URLs, don't fall back to the raw HTML string as redirected_url
-                    is_raw_url = url.startswith("raw:") or url.startswith("raw://")
-                    cached_result.redirected_url = cached_result.redirected_url or (None if is_raw_url else url)
-                    return CrawlResultContainer(cached_result)
 
             except Exception as e:
                 error_context = get_error_context(sys.exc_info())
@@ -761,6 +863,57 @@ class AsyncWebCrawler:
                     )
                 )
 
+    def _replay_cached_result(
+        self,
+        url: str,
+        cached_result: CrawlResult,
+        config: CrawlerRunConfig,
+        cache_context: CacheContext,
+        start_time: float,
+    ) -> CrawlResultContainer:
+        """Finish a result served from the cache instead of a fresh fetch."""
+        self.logger.url_status(
+            url=cache_context.display_url,
+            success=True,
+            timing=time.perf_counter() - start_time,
+            tag="COMPLETE"
+        )
+        # Same binary-download awareness as the live-fetch path
+        # — a cached PDF/archive should replay as success.
+        cached_result.success = self._has_cached_content(cached_result, config) or bool(
+            getattr(cached_result, "downloaded_files", None)
+        )
+        cached_result.session_id = getattr(
+            config, "session_id", None)
+        # For raw: URLs, don't fall back to the raw HTML string as redirected_url
+        is_raw_url = url.startswith("raw:") or url.startswith("raw://")
+        cached_result.redirected_url = cached_result.redirected_url or (None if is_raw_url else url)
+        return CrawlResultContainer(cached_result)
+
+    @staticmethod
+    def _cached_fields(config: CrawlerRunConfig) -> Optional[List[str]]:
+        """Content fields to load for a cache hit, None for all of them."""
+        if config.cache_fields is not None:
+            fields = set(config.cache_fields)
+            if config.screenshot:
+                fields.add("screenshot")
+            return [field for field in CACHED_CONTENT_FIELDS if field in fields]
+        if config.screenshot:
+            return None
+        # The base64 screenshot is the largest payload; only read it when
+        # this run asks for one
+        return [field for field in CACHED_CONTENT_FIELDS if field != "screenshot"]
+
+    @staticmethod
+    def _has_cached_content(cached_result: CrawlResult, config: CrawlerRunConfig) -> bool:
+        """
+        Whether a cache hit is usable: its html for a full load, any of the
+        requested fields for a ``cache_fields`` projection.
+        """
+        if config.cache_fields is None:
+            return bool(sanitize_input_encode(cached_result.html))
+        return any(getattr(cached_result, field, None) for field in config.cache_fields)
+
     async def aprocess_html(
         self,
         url: str,
@@ -825,16 +978,28 @@ class AsyncWebCrawler:
             # add keys from kwargs to params that doesn't exist in params
             params.update({k: v for k, v in kwargs.items()
                           if k not in params.keys()})
+            # One parse per distinct HTML string, shared by every stage below.
+            # The scraper only borrows the raw HTML parse when extraction will
+            # read the same tree later; otherwise a private parse is cheaper
+            # than parse + clone.
+            document_cache = DocumentCache()
+            if not extracted_content and isinstance(config.extraction_strategy, JsonLxmlExtractionStrategy):
+                params["document_cache"] = document_cache
+
+            markdown_generator: Optional[MarkdownGenerationStrategy] = (
+                config.markdown_generator or DefaultMarkdownGenerator()
+            )
 
             ################################
-            # Scraping Strategy Execution  #
+            # Scraping + Markdown          #
             ################################
-            result: ScrapingResult = scraping_strategy.scrap(
-                url, html, **params)
-
-            if result is None:
-                raise ValueError(
-                    f"Process HTML, Failed to extract content from the website: {url}"
+            if self._processing_pool is not None:
+                result, markdown_result, fit_html = await self._processing_pool.run(
+                    scraping_strategy, markdown_generator, url, html, params, self.logger
+                )
+            else:
+                result, markdown_result, fit_html = scrape_and_generate_markdown(
+                    scraping_strategy, markdown_generator, url, html, params, self.logger
                 )
 
         except InvalidCSSSelectorError as e:
@@ -854,77 +1019,11 @@ class AsyncWebCrawler:
             metadata = result.get("metadata", {})
         else:
             cleaned_html = sanitize_input_encode(result.cleaned_html)
-            # media = result.media.model_dump()
-            # tables = media.pop("tables", [])
-            # links = result.links.model_dump()
             media = result.media.model_dump() if hasattr(result.media, 'model_dump') else result.media
             tables = media.pop("tables", []) if isinstance(media, dict) else []
             links = result.links.model_dump() if hasattr(result.links, 'model_dump') else result.links
             metadata = result.metadata
 
-        fit_html = preprocess_html_for_schema(html_content=html, text_threshold= 500, max_size= 300_000)
-
-        ################################
-        # Generate Markdown            #
-        ################################
-        markdown_generator: Optional[MarkdownGenerationStrategy] = (
-            config.markdown_generator or DefaultMarkdownGenerator()
-        )
-
-        # --- SELECT HTML SOURCE BASED ON CONTENT_SOURCE ---
-        # Get the desired source from the generator config, default to 'cleaned_html'
-        selected_html_source = getattr(markdown_generator, 'content_source', 'cleaned_html')
-
-        # Define the source selection logic using dict dispatch
-        html_source_selector = {
-            "raw_html": lambda: html,  # The original raw HTML
-            "cleaned_html": lambda: cleaned_html,  # The HTML after scraping strategy
-            "fit_html": lambda: fit_html,  # The HTML after preprocessing for schema
-        }
-
-        markdown_input_html = cleaned_html  # Default to cleaned_html
-
-        try:
-            # Get the appropriate lambda function, default to returning cleaned_html if key not found
-            source_lambda = html_source_selector.get(selected_html_source, lambda: cleaned_html)
-            # Execute the lambda to get the selected HTML
-            markdown_input_html = source_lambda()
-
-            # Log which source is being used (optional, but helpful for debugging)
-            # if self.logger and verbose:
-            #     actual_source_used = selected_html_source if selected_html_source in html_source_selector else 'cleaned_html (default)'
-            #     self.logger.debug(f"Using '{actual_source_used}' as source for Markdown generation for {url}", tag="MARKDOWN_SRC")
-
-        except Exception as e:
-            # Handle potential errors, especially from preprocess_html_for_schema
-            if self.logger:
-                self.logger.warning(
-                    f"Error getting/processing '{selected_html_source}' for markdown source: {e}. Falling back to cleaned_html.",
-                    tag="MARKDOWN_SRC"
-                )
-            # Ensure markdown_input_html is still the default cleaned_html in case of error
-            markdown_input_html = cleaned_html
-        # --- END: HTML SOURCE SELECTION ---
-
-        # Uncomment if by default we want to use PruningContentFilter
-        # if not config.content_filter and not markdown_generator.content_filter:
-        #     markdown_generator.content_filter = PruningContentFilter()
-
-        # Extract <base href> from raw HTML before it gets stripped by cleaning.
-        # This ensures relative URLs resolve correctly even with cleaned_html.
-        base_url = params.get("base_url") or params.get("redirected_url") or url
-        base_tag_match = re.search(r'<base\s[^>]*href\s*=\s*["\']([^"\']+)["\']', html, re.IGNORECASE)
-        if base_tag_match:
-            base_url = base_tag_match.group(1)
-
-        markdown_result: MarkdownGenerationResult = (
-            markdown_generator.generate_markdown(
-                input_html=markdown_input_html,
-                base_url=base_url
-                # html2text_options=kwargs.get('html2text', {})
-            )
-        )
-
         # Log processing completion — reflect actual content outcome
         self.logger.url_status(
             url=_url,
@@ -976,13 +1075,20 @@ class AsyncWebCrawler:
             sections = chunking.chunk(content)
             # extracted_content = config.extraction_strategy.run(_url, sections)
 
+            # JSON element strategies can reuse the page's parsed tree
+            extraction_kwargs = (
+                {"document_cache": document_cache}
+                if isinstance(config.extraction_strategy, JsonElementExtractionStrategy)
+                else {}
+            )
+
             # Use async version if available for better parallelism
             if hasattr(config.extraction_strategy, 'arun'):
-                extracted_content = await config.extraction_strategy.arun(_url, sections)
+                extracted_content = await config.extraction_strategy.arun(_url, sections, **extraction_kwargs)
             else:
                 # Fallback to sync version run in thread pool to avoid blocking
                 extracted_content = await asyncio.to_thread(
-                    config.extraction_strategy.run, url, sections
+                    config.extraction_strategy.run, url, sections, **extraction_kwargs
                 )
                 
             extracted_content = json.dumps(
@@ -1021,7 +1127,7 @@ class AsyncWebCrawler:
 
     async def arun_many(
         self,
-        urls: List[str],
+        urls: UrlSource,
         config: Optional[Union[CrawlerRunConfig, List[CrawlerRunConfig]]] = None,
         dispatcher: Optional[BaseDispatcher] = None,
         # Legacy parameters maintained for backwards compatibility
@@ -1042,7 +1148,10 @@ class AsyncWebCrawler:
         Runs the crawler for multiple URLs concurrently using a configurable dispatcher strategy.
 
         Args:
-        urls: List of URLs to crawl
+        urls: URLs to crawl. A list, or any sync or async iterable (a generator
+            over a file, ``AsyncUrlSeeder`` output, ...); items may also be dicts
+            with a "url" key. Iterables are read lazily with bounded read-ahead,
+            so streaming over them keeps memory flat.
         config: Configuration object(s) controlling crawl behavior. Can be:
             - Single CrawlerRunConfig: Used for all URLs
             - List[CrawlerRunConfig]: Configs with url_matcher for URL-specific settings
@@ -1081,7 +1190,7 @@ class AsyncWebCrawler:
         if getattr(primary_cfg, "deep_crawl_strategy", None):
             if primary_cfg.stream:
                 async def _deep_crawl_stream():
-                    for url in urls:
+                    async for url in iter_url_source(urls):
                         result = await self.arun(url, config=primary_cfg)
                         if isinstance(result, list):
                             for r in result:
@@ -1092,7 +1201,7 @@ class AsyncWebCrawler:
                 return _deep_crawl_stream()
             else:
                 all_results = []
-                for url in urls:
+                async for url in iter_url_source(urls):
                     result = await self.arun(url, config=primary_cfg)
                     if isinstance(result, list):
                         all_results.extend(result)
@@ -1131,6 +1240,16 @@ class AsyncWebCrawler:
                 or task_result.result
             )
 
+        # Validate cached entries in bulk up front instead of one by one in arun.
+        # Lazy inputs are not materialized for this; arun validates those itself.
+        if (
+            isinstance(config, CrawlerRunConfig)
+            and config.check_cache_freshness
+            and isinstance(urls, (list, tuple))
+        ):
+            config = config.clone()
+            config._cache_verdicts = await self._prevalidate_cache(urls, config)
+
         # Handle stream setting - use first config's stream setting if config is a list
         if isinstance(config, list):
             stream = config[0].stream if config else False
@@ -1156,12 +1275,13 @@ class AsyncWebCrawler:
 
         if stream:
             async def result_transformer():
+                results = dispatcher.run_urls_stream(crawler=self, urls=urls, config=config)
                 try:
-                    async for task_result in dispatcher.run_urls_stream(
-                        crawler=self, urls=urls, config=config
-                    ):
+                    async for task_result in results:
                         yield transform_result(task_result)
                 finally:
+                    # Stop the dispatcher's crawls when the caller stops early
+                    await results.aclose()
                     # Auto-release session after streaming completes
                     await maybe_release_session()
 
@@ -1174,6 +1294,39 @@ class AsyncWebCrawler:
                 # Auto-release session after batch completes
                 await maybe_release_session()
 
+    async def _prevalidate_cache(
+        self, urls: List[str], config: CrawlerRunConfig
+    ) -> Dict[str, ValidationResult]:
+        """
+        Run ``CacheValidator.validate_many`` over the cached subset of ``urls``.
+
+        ``arun_many`` sets the verdicts on its own copy of the config, so
+        they only live as long as the call. ``arun`` uses them to skip its
+        own per-URL metadata query and validation request.
+        """
+        verdicts: Dict[str, ValidationResult] = {}
+        cache_mode = config.cache_mode or CacheMode.ENABLED
+        readable = [
+            url for url in (item["url"] if isinstance(item, dict) else item for item in urls)
+            if CacheContext(url, cache_mode, False).should_read()
+        ]
+        if not readable:
+            return verdicts
+        metadata = await async_db_manager.aget_cache_metadata_many(readable)
+        if not metadata:
+            return verdicts
+        start = time.perf_counter()
+        async with CacheValidator(timeout=config.cache_validation_timeout) as validator:
+            async for url, validation in validator.validate_many(readable, metadata=metadata):
+                if url in metadata:
+                    verdicts[url] = validation
+        self.logger.info(
+            message="Validated {count} cached URLs in {timing:.2f}s",
+            tag="CACHE",
+            params={"count": len(metadata), "timing": time.perf_counter() - start},
+        )
+        return verdicts
+
     async def aseed_urls(
         self,
         domain_or_domains: Union[str, List[str]],
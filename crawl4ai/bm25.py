@@ -0,0 +1,235 @@
+"""
+BM25 ranking shared by the URL seeder, the relevance filters and the adaptive crawler.
+
+``BM25Index`` keeps the corpus as a term-major sparse matrix held in NumPy
+arrays (the CSC layout: postings of each term stored contiguously), so
+scoring a query touches only the postings of its terms and scores every
+document in a few vectorized operations. Documents can be added
+incrementally; the matrix is rebuilt lazily before the next query. Scores
+match ``rank_bm25.BM25Okapi`` for the same parameters.
+"""
+
+import math
+import re
+from itertools import chain
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def tokenize(
+    text: str,
+    strip_punctuation: bool = False,
+    min_length: int = 1,
+    stem: Optional[Callable[[str], str]] = None,
+) -> List[str]:
+    """
+    Lowercase ``text`` and split it on whitespace.
+
+    Args:
+        text: Text to tokenize.
+        strip_punctuation: Replace punctuation with spaces before splitting.
+        min_length: Drop tokens shorter than this.
+        stem: Optional stemmer applied to every token (e.g. ``stemmer.stemWord``).
+    """
+    text = text.lower()
+    if strip_punctuation:
+        text = _PUNCTUATION.sub(" ", text)
+    tokens = text.split()
+    if min_length > 1:
+        tokens = [t for t in tokens if len(t) >= min_length]
+    if stem is not None:
+        tokens = [stem(t) for t in tokens]
+    return tokens
+
+
+def bm25_tf(tf, doc_len, avgdl: float, k1: float, b: float):
+    """Saturated term frequency of BM25; accepts scalars or NumPy arrays."""
+    return tf * (k1 + 1) / (tf + k1 * (1 - b + b * doc_len / avgdl))
+
+
+def normalize_scores(scores: Sequence[float]) -> List[float]:
+    """Min-max normalize to 0-1; identical scores all become 0.5."""
+    scores = np.asarray(scores, dtype=np.float64)
+    if scores.size == 0:
+        return []
+    low, high = scores.min(), scores.max()
+    if high == low:
+        return [0.5] * len(scores)
+    return ((scores - low) / (high - low)).tolist()
+
+
+class BM25Index:
+    """
+    Okapi BM25 over a growing corpus of tokenized documents.
+
+    Args:
+        documents: Optional initial tokenized documents.
+        k1: Term frequency saturation.
+        b: Document length normalization.
+        epsilon: Terms in more than half of the documents get a negative IDF;
+            it is replaced with ``epsilon`` times the average IDF.
+    """
+
+    def __init__(
+        self,
+        documents: Iterable[List[str]] = (),
+        k1: float = 1.5,
+        b: float = 0.75,
+        epsilon: float = 0.25,
+    ):
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+        self.vocabulary: Dict[str, int] = {}
+        self._doc_len = np.zeros(0, dtype=np.int64)
+        # Uncompiled (term, doc, tf) triples from add()
+        self._pending: List[np.ndarray] = []
+        self._terms = np.zeros(0, dtype=np.int64)
+        self._docs = np.zeros(0, dtype=np.int64)
+        self._tfs = np.zeros(0, dtype=np.float64)
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._idf = np.zeros(0, dtype=np.float64)
+        self._dirty = False
+        self.add(documents)
+
+    def __len__(self) -> int:
+        return len(self._doc_len)
+
+    @property
+    def avgdl(self) -> float:
+        return float(self._doc_len.mean()) if len(self._doc_len) else 0.0
+
+    def add(self, documents: Iterable[List[str]]) -> None:
+        """Append tokenized documents; they get the next document ids."""
+        documents = list(documents)
+        if not documents:
+            return
+        self._dirty = True
+        lengths = np.fromiter(map(len, documents), dtype=np.int64, count=len(documents))
+        first_doc = len(self._doc_len)
+        self._doc_len = np.concatenate([self._doc_len, lengths])
+        tokens = list(chain.from_iterable(documents))
+        if not tokens:
+            return
+        vocabulary = self.vocabulary
+        for term in set(tokens).difference(vocabulary):
+            vocabulary[term] = len(vocabulary)
+        terms = np.fromiter(map(vocabulary.__getitem__, tokens), dtype=np.int64, count=len(tokens))
+        docs = np.repeat(np.arange(len(documents), dtype=np.int64), lengths)
+        # Count each (term, doc) pair in one pass; keys come out term-major, so
+        # merging the chunks in _compile is a merge of sorted runs
+        keys, tfs = np.unique(terms * len(documents) + docs, return_counts=True)
+        self._pending.append(
+            np.stack([keys // len(documents), keys % len(documents) + first_doc, tfs])
+        )
+
+    def _compile(self) -> None:
+        if not self._dirty:
+            return
+        self._dirty = False
+        if self._pending:
+            added = np.concatenate(self._pending, axis=1)
+            self._pending = []
+            terms = np.concatenate([self._terms, added[0]])
+            docs = np.concatenate([self._docs, added[1]])
+            tfs = np.concatenate([self._tfs, added[2].astype(np.float64)])
+            order = np.argsort(terms, kind="stable")
+            self._terms, self._docs, self._tfs = terms[order], docs[order], tfs[order]
+        df = np.bincount(self._terms, minlength=len(self.vocabulary))
+        self._indptr = np.concatenate([[0], np.cumsum(df)])
+
+        n = len(self)
+        idf = np.log(n - df + 0.5) - np.log(df + 0.5)
+        if len(idf):
+            idf[idf < 0] = self.epsilon * idf.mean()
+        self._idf = idf
+
+    def document_frequency(self, term: str) -> int:
+        """Number of documents containing ``term``."""
+        self._compile()
+        tid = self.vocabulary.get(term)
+        return 0 if tid is None else int(self._indptr[tid + 1] - self._indptr[tid])
+
+    def get_scores(self, query: List[str]) -> np.ndarray:
+        """BM25 score of every document for a tokenized query."""
+        return self.get_batch_scores([query])[0]
+
+    def get_batch_scores(self, queries: Sequence[List[str]]) -> np.ndarray:
+        """Scores of every document for each tokenized query, shape (queries, documents)."""
+        self._compile()
+        scores = np.zeros((len(queries), len(self)), dtype=np.float64)
+        if not len(self) or self.avgdl == 0:
+            return scores
+        # Query-term weights: repeated query terms count repeatedly
+        weights: Dict[int, np.ndarray] = {}
+        for q, query in enumerate(queries):
+            for token in query:
+                tid = self.vocabulary.get(token)
+                if tid is not None:
+                    weights.setdefault(tid, np.zeros(len(queries)))[q] += 1
+        for tid, weight in weights.items():
+            start, end = self._indptr[tid], self._indptr[tid + 1]
+            docs = self._docs[start:end]
+            contribution = self._idf[tid] * bm25_tf(
+                self._tfs[start:end], self._doc_len[docs], self.avgdl, self.k1, self.b
+            )
+            scores[:, docs] += weight[:, None] * contribution
+        return scores
+
+    # ── persistence ──────────────────────────────────────────────────────────
+    def save(self, path: str) -> None:
+        """Write the index to an ``.npz`` file."""
+        self._compile()
+        terms = sorted(self.vocabulary, key=self.vocabulary.__getitem__)
+        np.savez_compressed(
+            path,
+            params=np.array([self.k1, self.b, self.epsilon]),
+            vocabulary=np.array(terms, dtype=str),
+            doc_len=self._doc_len,
+            terms=self._terms,
+            docs=self._docs,
+            tfs=self._tfs,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "BM25Index":
+        """Read an index written by ``save``."""
+        with np.load(path, allow_pickle=False) as data:
+            k1, b, epsilon = data["params"].tolist()
+            index = cls(k1=k1, b=b, epsilon=epsilon)
+            index.vocabulary = {term: i for i, term in enumerate(data["vocabulary"].tolist())}
+            index._doc_len = data["doc_len"]
+            index._terms = data["terms"]
+            index._docs = data["docs"]
+            index._tfs = data["tfs"]
+        index._dirty = True
+        index._compile()
+        return index
+
+
+def bm25_score(
+    document: List[str],
+    query: List[str],
+    avgdl: float,
+    k1: float = 1.2,
+    b: float = 0.75,
+) -> float:
+    """
+    Score one document without corpus statistics.
+
+    Used where documents arrive one at a time (e.g. per-URL filters): the
+    average document length is a fixed estimate and the IDF is approximated
+    from the term frequency.
+    """
+    tf: Dict[str, int] = {}
+    for term in document:
+        tf[term] = tf.get(term, 0) + 1
+    score = 0.0
+    for term in set(query):
+        term_freq = tf.get(term, 0)
+        idf = math.log((1 + 1) / (term_freq + 0.5) + 1)
+        score += idf * bm25_tf(term_freq, len(document), avgdl, k1, b)
+    return score
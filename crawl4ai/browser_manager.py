@@ -1,6 +1,7 @@
 import asyncio
 import time
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
 import os
 import sys
 import shutil
@@ -582,6 +583,197 @@ async def clone_runtime_state(
 
 
 
+class PagePool:
+    """
+    Ready pages per context signature.
+
+    ``acquire`` hands out an idle page when there is one and refills the pool
+    in the background, so a crawl does not wait for ``context.new_page()``.
+    ``release`` resets a used page (storage, headers, viewport, about:blank)
+    and keeps it for the next crawl. The pool owns up to ``size`` open pages
+    per signature, handed out or idle; pages idle for longer than
+    ``max_idle`` seconds are closed and not replaced until the next acquire.
+
+    Args:
+        size: Pages owned per signature.
+        max_idle: Seconds an idle page is kept.
+        clear_storage: Clear localStorage and sessionStorage on release.
+        viewport: Viewport size restored on release; None leaves it as is.
+        prepare: Coroutine function run on every new page (stealth).
+        logger: Logger for refill and reset failures.
+    """
+
+    RESET_TIMEOUT_S = 5.0
+
+    def __init__(
+        self,
+        size: int,
+        max_idle: float = 60.0,
+        clear_storage: bool = True,
+        viewport: Optional[Dict[str, int]] = None,
+        prepare: Optional[Callable[[Any], Awaitable[None]]] = None,
+        logger=None,
+    ):
+        self.size = size
+        self.max_idle = max_idle
+        self.clear_storage = clear_storage
+        self.viewport = viewport
+        self.prepare = prepare
+        self.logger = logger
+        self._idle: Dict[str, Deque[Tuple[Any, float]]] = {}
+        self._owned: Dict[str, Set[Any]] = {}
+        self._contexts: Dict[str, BrowserContext] = {}
+        self._refills: Dict[str, asyncio.Task] = {}
+
+    async def _new_page(self, context: BrowserContext):
+        page = await context.new_page()
+        if self.prepare is not None:
+            await self.prepare(page)
+        return page
+
+    async def acquire(self, sig: str, context: BrowserContext, returnable: bool = True):
+        """
+        Return a ready page of ``context``.
+
+        Pages that will not come back through ``release`` (session pages) are
+        taken with ``returnable=False`` and leave the pool for good.
+        """
+        if self._contexts.get(sig) is not context:
+            self.discard(sig)
+            self._contexts[sig] = context
+        self._expire()
+
+        page = None
+        idle = self._idle.get(sig)
+        while idle:
+            candidate, _ = idle.popleft()
+            if not candidate.is_closed():
+                page = candidate
+                break
+        if page is None:
+            page = await self._new_page(context)
+            if returnable:
+                self._owned.setdefault(sig, set()).add(page)
+        if not returnable:
+            self._owned.get(sig, set()).discard(page)
+
+        task = self._refills.get(sig)
+        if task is None or task.done():
+            self._refills[sig] = asyncio.create_task(self._refill(sig, context))
+        return page
+
+    async def _refill(self, sig: str, context: BrowserContext) -> None:
+        try:
+            while self._contexts.get(sig) is context:
+                owned = self._owned.setdefault(sig, set())
+                owned.difference_update([p for p in owned if p.is_closed()])
+                if len(owned) >= self.size:
+                    return
+                page = await self._new_page(context)
+                if self._contexts.get(sig) is not context:
+                    # Discarded while the page was being created
+                    await self._close_page(page)
+                    return
+                self._owned[sig].add(page)
+                self._idle.setdefault(sig, deque()).append((page, time.monotonic()))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if self.logger:
+                self.logger.debug(
+                    message="Page pool refill failed: {error}",
+                    tag="BROWSER",
+                    params={"error": str(e)},
+                )
+
+    async def release(self, page, reusable: bool = True) -> bool:
+        """
+        Reset ``page`` and return it to the pool.
+
+        Returns False when the page is not kept; the caller closes it.
+        """
+        sig = next((sig for sig, owned in self._owned.items() if page in owned), None)
+        if sig is None:
+            return False
+        owned = self._owned[sig]
+        if (
+            not reusable
+            or page.is_closed()
+            or sig not in self._contexts
+            or len(owned) > self.size
+        ):
+            owned.discard(page)
+            return False
+        try:
+            await asyncio.wait_for(self._reset(page), self.RESET_TIMEOUT_S)
+        except Exception as e:
+            owned.discard(page)
+            if self.logger:
+                self.logger.debug(
+                    message="Page pool reset failed: {error}",
+                    tag="BROWSER",
+                    params={"error": str(e)},
+                )
+            return False
+        if sig not in self._contexts:
+            # Discarded during the reset
+            return False
+        self._idle.setdefault(sig, deque()).append((page, time.monotonic()))
+        return True
+
+    async def _reset(self, page) -> None:
+        if self.clear_storage:
+            try:
+                await page.evaluate(
+                    "() => { try { localStorage.clear(); sessionStorage.clear(); } catch (e) {} }"
+                )
+            except Exception:
+                pass
+        await page.set_extra_http_headers({})
+        if self.viewport and page.viewport_size != self.viewport:
+            await page.set_viewport_size(self.viewport)
+        await page.goto("about:blank")
+
+    def _expire(self) -> None:
+        deadline = time.monotonic() - self.max_idle
+        for sig, idle in self._idle.items():
+            while idle and idle[0][1] < deadline:
+                page, _ = idle.popleft()
+                self._owned.get(sig, set()).discard(page)
+                asyncio.create_task(self._close_page(page))
+
+    def discard(self, sig: str) -> None:
+        """Forget the pages of ``sig``; they close with their context."""
+        task = self._refills.pop(sig, None)
+        if task is not None:
+            task.cancel()
+        self._contexts.pop(sig, None)
+        self._idle.pop(sig, None)
+        self._owned.pop(sig, None)
+
+    def idle_count(self, sig: str) -> int:
+        return len(self._idle.get(sig, ()))
+
+    async def close(self) -> None:
+        """Stop refilling and close every idle page."""
+        for task in self._refills.values():
+            task.cancel()
+        pages = [page for idle in self._idle.values() for page, _ in idle]
+        self._refills.clear()
+        self._contexts.clear()
+        self._idle.clear()
+        self._owned.clear()
+        for page in pages:
+            await self._close_page(page)
+
+    @staticmethod
+    async def _close_page(page) -> None:
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+
 class _CDPConnectionCache:
     """
     Class-level cache for Playwright + CDP browser connections.
@@ -737,10 +929,14 @@ class BrowserManager:
 
         # Context lifecycle tracking for LRU eviction
         self._context_refcounts = {}    # sig -> int  (active crawls using this context)
-        self._context_last_used = {}    # sig -> float (monotonic timestamp for LRU)
+        self._context_last_used = {}    # sig -> float (monotonic timestamp), least recent first
         self._page_to_sig = {}          # page -> sig  (for decrement lookup on release)
         self._max_contexts = 20         # LRU eviction threshold
 
+        # Contexts being created, so concurrent requests for one signature
+        # share a single creation while other signatures build in parallel
+        self._context_creations: Dict[str, asyncio.Future] = {}
+
         # Serialize context.new_page() across concurrent tasks to avoid races
         # when using a shared persistent context (context.pages may be empty
         # for all racers). Prevents 'Target page/context closed' errors.
@@ -764,6 +960,21 @@ class BrowserManager:
             from .browser_adapter import StealthAdapter
             self._stealth_adapter = StealthAdapter()
 
+        # Warm pages per context signature (see PagePool)
+        self._page_pool: Optional[PagePool] = None
+        if self.config.page_pool_size > 0:
+            self._page_pool = PagePool(
+                size=self.config.page_pool_size,
+                max_idle=self.config.page_pool_max_idle,
+                clear_storage=self.config.page_pool_clear_storage,
+                viewport={
+                    "width": self.config.viewport_width,
+                    "height": self.config.viewport_height,
+                },
+                prepare=self._apply_stealth_to_page,
+                logger=self.logger,
+            )
+
         # Initialize ManagedBrowser if needed
         if self.config.use_managed_browser:
             self.managed_browser = ManagedBrowser(
@@ -1457,14 +1668,12 @@ class BrowserManager:
         if len(self.contexts_by_config) <= self._max_contexts:
             return None
 
-        # Sort candidates by last-used timestamp (oldest first)
-        candidates = sorted(
-            self._context_last_used.items(),
-            key=lambda item: item[1],
-        )
-        for evict_sig, _ in candidates:
+        # _context_last_used is kept in least-recently-used order, so the
+        # first idle signature is the one to evict
+        for evict_sig in self._context_last_used:
             if self._context_refcounts.get(evict_sig, 0) == 0:
                 ctx = self.contexts_by_config.pop(evict_sig, None)
+                self._discard_pooled_pages(evict_sig)
                 self._context_refcounts.pop(evict_sig, None)
                 self._context_last_used.pop(evict_sig, None)
                 # Clean up stale page->sig mappings for evicted context
@@ -1491,6 +1700,93 @@ class BrowserManager:
                         params={"error": str(e)}
                     )
 
+    def _touch_context_locked(self, sig: str) -> None:
+        """Move ``sig`` to the most recently used end. Hold self._contexts_lock."""
+        self._context_last_used.pop(sig, None)
+        self._context_last_used[sig] = time.monotonic()
+
+    async def _acquire_context(self, sig: str, crawlerRunConfig: CrawlerRunConfig) -> BrowserContext:
+        """
+        Return the context for ``sig`` with its refcount incremented, creating it if needed.
+
+        The lock is only held for bookkeeping. The first request for a new
+        signature creates the context; concurrent requests for the same
+        signature wait for that creation, and other signatures are created
+        in parallel. If the creation fails, every waiter gets its exception.
+        """
+        while True:
+            async with self._contexts_lock:
+                context = self.contexts_by_config.get(sig)
+                if context is not None:
+                    # Increment refcount INSIDE lock before releasing
+                    self._context_refcounts[sig] = self._context_refcounts.get(sig, 0) + 1
+                    self._touch_context_locked(sig)
+                    return context
+                creation = self._context_creations.get(sig)
+                if creation is None:
+                    creation = asyncio.get_running_loop().create_future()
+                    self._context_creations[sig] = creation
+                    break
+            # Another task is creating this context; take a reference once it is cached
+            await asyncio.shield(creation)
+
+        try:
+            context = await self.create_browser_context(crawlerRunConfig)
+            await self.setup_context(context, crawlerRunConfig)
+        except BaseException as e:
+            async with self._contexts_lock:
+                self._context_creations.pop(sig, None)
+            if isinstance(e, Exception):
+                creation.set_exception(e)
+                creation.exception()  # retrieved here; waiters re-raise it
+            else:
+                # Cancelled: waiters retry and one of them creates the context
+                creation.set_result(None)
+            raise
+
+        async with self._contexts_lock:
+            self._context_creations.pop(sig, None)
+            self.contexts_by_config[sig] = context
+            self._context_refcounts[sig] = 1
+            self._touch_context_locked(sig)
+            to_close = self._evict_lru_context_locked()
+        creation.set_result(context)
+
+        # Close evicted context OUTSIDE lock
+        if to_close is not None:
+            try:
+                await to_close.close()
+            except Exception:
+                pass
+        return context
+
+    async def _new_page_for_signature(
+        self, context: BrowserContext, sig: str, crawlerRunConfig: CrawlerRunConfig
+    ):
+        """
+        Open a page of the cached context ``sig``, from the page pool when enabled.
+
+        The caller has already counted the page in the context's refcount; the
+        count is undone if no page can be opened.
+        """
+        try:
+            if self._page_pool is not None:
+                page = await self._page_pool.acquire(
+                    sig, context, returnable=not crawlerRunConfig.session_id
+                )
+            else:
+                page = await context.new_page()
+                await self._apply_stealth_to_page(page)
+        except Exception:
+            async with self._contexts_lock:
+                if sig in self._context_refcounts:
+                    self._context_refcounts[sig] = max(
+                        0, self._context_refcounts[sig] - 1
+                    )
+            raise
+        self._page_to_sig[page] = sig
+        return page
+
     async def _get_page_by_target_id(self, context: BrowserContext, target_id: str):
         """
         Get an existing page by its CDP target ID.
@@ -1574,43 +1870,12 @@ class BrowserManager:
             # context reuse for multiple URLs with the same config (e.g., batch/deep crawls).
             if self.config.create_isolated_context:
                 config_signature = self._make_config_signature(crawlerRunConfig)
-                to_close = None
-
-                async with self._contexts_lock:
-                    if config_signature in self.contexts_by_config:
-                        context = self.contexts_by_config[config_signature]
-                    else:
-                        context = await self.create_browser_context(crawlerRunConfig)
-                        await self.setup_context(context, crawlerRunConfig)
-                        self.contexts_by_config[config_signature] = context
-                        self._context_refcounts[config_signature] = 0
-                        to_close = self._evict_lru_context_locked()
-
-                    # Increment refcount INSIDE lock before releasing
-                    self._context_refcounts[config_signature] = (
-                        self._context_refcounts.get(config_signature, 0) + 1
-                    )
-                    self._context_last_used[config_signature] = time.monotonic()
-
-                # Close evicted context OUTSIDE lock
-                if to_close is not None:
-                    try:
-                        await to_close.close()
-                    except Exception:
-                        pass
+                context = await self._acquire_context(config_signature, crawlerRunConfig)
 
-                # Always create a new page for each crawl (isolation for navigation)
-                try:
-                    page = await context.new_page()
-                except Exception:
-                    async with self._contexts_lock:
-                        if config_signature in self._context_refcounts:
-                            self._context_refcounts[config_signature] = max(
-                                0, self._context_refcounts[config_signature] - 1
-                            )
-                    raise
-                await self._apply_stealth_to_page(page)
-                self._page_to_sig[page] = config_signature
+                # Always use a fresh or reset page for each crawl (isolation for navigation)
+                page = await self._new_page_for_signature(
+                    context, config_signature, crawlerRunConfig
+                )
             elif self.config.storage_state:
                 tmp_context = await self.create_browser_context(crawlerRunConfig)
                 ctx = self.default_context        # default context, one window only
@@ -1673,44 +1938,12 @@ class BrowserManager:
         else:
             # Otherwise, check if we have an existing context for this config
             config_signature = self._make_config_signature(crawlerRunConfig)
-            to_close = None
-
-            async with self._contexts_lock:
-                if config_signature in self.contexts_by_config:
-                    context = self.contexts_by_config[config_signature]
-                else:
-                    # Create and setup a new context
-                    context = await self.create_browser_context(crawlerRunConfig)
-                    await self.setup_context(context, crawlerRunConfig)
-                    self.contexts_by_config[config_signature] = context
-                    self._context_refcounts[config_signature] = 0
-                    to_close = self._evict_lru_context_locked()
-
-                # Increment refcount INSIDE lock before releasing
-                self._context_refcounts[config_signature] = (
-                    self._context_refcounts.get(config_signature, 0) + 1
-                )
-                self._context_last_used[config_signature] = time.monotonic()
+            context = await self._acquire_context(config_signature, crawlerRunConfig)
 
-            # Close evicted context OUTSIDE lock
-            if to_close is not None:
-                try:
-                    await to_close.close()
-                except Exception:
-                    pass
-
-            # Create a new page from the chosen context
-            try:
-                page = await context.new_page()
-            except Exception:
-                async with self._contexts_lock:
-                    if config_signature in self._context_refcounts:
-                        self._context_refcounts[config_signature] = max(
-                            0, self._context_refcounts[config_signature] - 1
-                        )
-                raise
-            await self._apply_stealth_to_page(page)
-            self._page_to_sig[page] = config_signature
+            # Take a page from the chosen context
+            page = await self._new_page_for_signature(
+                context, config_signature, crawlerRunConfig
+            )
 
         # If a session_id is specified, store this session so we can reuse later
         if crawlerRunConfig.session_id:
@@ -1747,6 +1980,7 @@ class BrowserManager:
                     if not self.config.use_managed_browser:
                         if self._context_refcounts.get(sig, 0) == 0:
                             self.contexts_by_config.pop(sig, None)
+                            self._discard_pooled_pages(sig)
                             self._context_refcounts.pop(sig, None)
                             self._context_last_used.pop(sig, None)
                             should_close_context = True
@@ -1784,6 +2018,24 @@ class BrowserManager:
         if sig is not None and refcount == 0:
             await self._maybe_cleanup_old_browser(sig)
 
+    async def recycle_page(self, page, reusable: bool = True) -> bool:
+        """
+        Return a crawled page to the page pool instead of closing it.
+
+        Call after ``release_page_with_context``. Returns True if the pool
+        kept the page; otherwise the caller closes it as before. ``reusable``
+        is False when the crawl left state on the page that a reset does not
+        undo (event listeners, downloads).
+        """
+        if self._page_pool is None:
+            return False
+        return await self._page_pool.release(page, reusable)
+
+    def _discard_pooled_pages(self, sig: str) -> None:
+        """Drop the pooled pages of a context that is being closed."""
+        if self._page_pool is not None:
+            self._page_pool.discard(sig)
+
     def _should_recycle(self) -> bool:
         """Check if page threshold reached for browser recycling."""
         limit = self.config.max_pages_before_recycle
@@ -1887,6 +2139,7 @@ class BrowserManager:
                         for sig in stuck_sigs:
                             async with self._contexts_lock:
                                 context = self.contexts_by_config.pop(sig, None)
+                                self._discard_pooled_pages(sig)
                                 self._context_refcounts.pop(sig, None)
                                 self._context_last_used.pop(sig, None)
                             if context is not None:
@@ -1901,6 +2154,7 @@ class BrowserManager:
         for sig in idle_sigs:
             async with self._contexts_lock:
                 context = self.contexts_by_config.pop(sig, None)
+                self._discard_pooled_pages(sig)
                 self._context_refcounts.pop(sig, None)
                 self._context_last_used.pop(sig, None)
             if context is not None:
@@ -1934,6 +2188,7 @@ class BrowserManager:
             # Remove context from tracking
             async with self._contexts_lock:
                 context = self.contexts_by_config.pop(sig, None)
+                self._discard_pooled_pages(sig)
                 self._context_refcounts.pop(sig, None)
                 self._context_last_used.pop(sig, None)
 
@@ -1975,6 +2230,9 @@ class BrowserManager:
 
     async def close(self):
         """Close all browser resources and clean up."""
+        if self._page_pool is not None:
+            await self._page_pool.close()
+
         # Cached CDP path: only clean up this instance's sessions/contexts,
         # then release the shared connection reference.
         if self._using_cached_cdp:
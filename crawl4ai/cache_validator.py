@@ -13,10 +13,13 @@ Validation Strategy:
 5. Otherwise → cache is STALE, need full recrawl
 """
 
+import asyncio
 import httpx
+from collections import Counter, deque
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import AsyncIterator, Dict, Iterable, Optional, Tuple
 from enum import Enum
+from urllib.parse import urlparse
 
 from .utils import compute_head_fingerprint
 
@@ -29,6 +32,19 @@ class CacheValidationResult(Enum):
     ERROR = "error"       # Request failed, use cache as fallback
 
 
+def build_conditional_headers(
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> Dict[str, str]:
+    """Request headers that let the server answer 304 for unchanged content."""
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
 @dataclass
 class ValidationResult:
     """Detailed result of a cache validation attempt."""
@@ -57,16 +73,24 @@ class CacheValidator:
        - Catches changes even without server support for conditional requests
     """
 
-    def __init__(self, timeout: float = 10.0, user_agent: Optional[str] = None):
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        user_agent: Optional[str] = None,
+        max_connections: int = 100,
+    ):
         """
         Initialize the cache validator.
 
         Args:
             timeout: Request timeout in seconds
             user_agent: Custom User-Agent string (optional)
+            max_connections: Size of the pooled connection set, all of which
+                are kept alive between requests
         """
         self.timeout = timeout
         self.user_agent = user_agent or "Mozilla/5.0 (compatible; Crawl4AI/1.0)"
+        self.max_connections = max_connections
         self._client: Optional[httpx.AsyncClient] = None
 
     async def _get_client(self) -> httpx.AsyncClient:
@@ -76,7 +100,11 @@ class CacheValidator:
                 http2=True,
                 timeout=self.timeout,
                 follow_redirects=True,
-                headers={"User-Agent": self.user_agent}
+                headers={"User-Agent": self.user_agent},
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
             )
         return self._client
 
@@ -101,12 +129,7 @@ class CacheValidator:
         """
         client = await self._get_client()
 
-        # Build conditional request headers
-        headers = {}
-        if stored_etag:
-            headers["If-None-Match"] = stored_etag
-        if stored_last_modified:
-            headers["If-Modified-Since"] = stored_last_modified
+        headers = build_conditional_headers(stored_etag, stored_last_modified)
 
         try:
             # Step 1: Try HEAD request with conditional headers
@@ -200,6 +223,116 @@ class CacheValidator:
                 reason=f"Validation error: {str(e)}"
             )
 
+    async def validate_many(
+        self,
+        urls: Iterable[str],
+        metadata: Optional[Dict[str, Dict]] = None,
+        db_manager=None,
+        per_host_concurrency: int = 4,
+        max_concurrency: int = 64,
+    ) -> AsyncIterator[Tuple[str, ValidationResult]]:
+        """
+        Validate many cached URLs, yielding verdicts as they complete.
+
+        Metadata for all URLs is read in bulk, then ``max_concurrency``
+        workers validate them. A worker stays on one host until that host has
+        ``per_host_concurrency`` requests in flight, so requests to a host
+        share its pooled (HTTP/2 multiplexed) connection instead of opening
+        connections to every host at once.
+
+        Args:
+            urls: URLs to validate; duplicates are validated once
+            metadata: Mapping of URL to cache metadata as returned by
+                ``AsyncDatabaseManager.aget_cache_metadata_many``. Read from
+                ``db_manager`` when omitted.
+            db_manager: Database manager to read metadata from; defaults to
+                the shared crawl cache
+            per_host_concurrency: Maximum requests in flight per host
+            max_concurrency: Maximum requests in flight overall
+
+        Yields:
+            (url, ValidationResult) pairs in completion order. URLs without a
+            cached entry yield UNKNOWN immediately.
+        """
+        urls = list(dict.fromkeys(urls))
+        if metadata is None:
+            if db_manager is None:
+                from .async_database import async_db_manager as db_manager
+            metadata = await db_manager.aget_cache_metadata_many(urls)
+
+        pending: Dict[str, deque] = {}
+        for url in urls:
+            entry = metadata.get(url)
+            if not entry:
+                yield url, ValidationResult(
+                    status=CacheValidationResult.UNKNOWN,
+                    reason="No cached entry"
+                )
+                continue
+            pending.setdefault(urlparse(url).netloc, deque()).append((url, entry))
+
+        total = sum(len(queue) for queue in pending.values())
+        if not total:
+            return
+
+        # Hosts with queued URLs and a free slot; warm hosts go to the front
+        ready = deque(pending)
+        queued = set(pending)
+        in_flight: Counter = Counter()
+        unscheduled = total
+        condition = asyncio.Condition()
+        results: asyncio.Queue = asyncio.Queue()
+
+        async def worker():
+            nonlocal unscheduled
+            while True:
+                async with condition:
+                    while not ready:
+                        if not unscheduled:
+                            return
+                        await condition.wait()
+                    host = ready.popleft()
+                    queued.discard(host)
+                    url, entry = pending[host].popleft()
+                    unscheduled -= 1
+                    in_flight[host] += 1
+                    if pending[host] and in_flight[host] < per_host_concurrency:
+                        ready.appendleft(host)
+                        queued.add(host)
+                    if not unscheduled:
+                        condition.notify_all()
+                try:
+                    verdict = await self.validate(
+                        url,
+                        stored_etag=entry.get("etag"),
+                        stored_last_modified=entry.get("last_modified"),
+                        stored_head_fingerprint=entry.get("head_fingerprint"),
+                    )
+                except Exception as e:
+                    verdict = ValidationResult(
+                        status=CacheValidationResult.ERROR,
+                        reason=f"Validation error: {str(e)}"
+                    )
+                results.put_nowait((url, verdict))
+                async with condition:
+                    in_flight[host] -= 1
+                    if pending[host] and host not in queued:
+                        ready.appendleft(host)
+                        queued.add(host)
+                        condition.notify()
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(max(1, min(max_concurrency, total)))
+        ]
+        try:
+            for _ in range(total):
+                yield await results.get()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
     async def _fetch_head(self, url: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
         Fetch only the <head> section of a page.
@@ -3,9 +3,10 @@ import re
 import time
 from bs4 import BeautifulSoup, Tag
 from typing import List, Tuple, Dict, Optional
-from rank_bm25 import BM25Okapi
 from collections import deque
 from bs4 import NavigableString, Comment
+from lxml import etree
+from lxml import html as lhtml
 
 from .utils import (
     clean_tokens,
@@ -16,6 +17,7 @@ from .utils import (
     extract_xml_data,
     merge_chunks,
 )
+from .bm25 import BM25Index, tokenize
 from .types import LLMConfig
 from .config import DEFAULT_PROVIDER, OVERLAP_RATE, WORD_TOKEN_RATE
 from abc import ABC, abstractmethod
@@ -30,6 +32,324 @@ from concurrent.futures import ThreadPoolExecutor
 from .async_logger import AsyncLogger, LogLevel, LogColor
 
 
+
+
+class _LxmlSoupView:
+    """
+    Read BeautifulSoup semantics off an lxml tree.
+
+    The lxml engines of ``PruningContentFilter`` and ``BM25ContentFilter``
+    must score and emit exactly what the BeautifulSoup engines do, so this
+    mirrors what the ``"lxml"`` soup builder and the ``"minimal"`` formatter
+    do on top of the same libxml2 parse: all-whitespace strings collapse to
+    ``" "``/``"\\n"`` outside ``<pre>``/``<textarea>``, ``get_text()`` only
+    counts strings of the node's own container type (``<template>``,
+    ``<rt>``, ... hold their own string types), multi-valued attributes are
+    whitespace-normalized and attributes serialize sorted.
+
+    Elements are never removed from the tree. Callers pass a ``skip`` set of
+    elements that the soup would have decomposed; their tails stay separate
+    strings, just as the soup keeps the surrounding NavigableStrings apart.
+    """
+
+    _ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+    _CDATA_CONTAINING_TAGS = frozenset({"script", "style"})
+    _CHARSET_RE = re.compile(r"((^|;)\s*charset=)([^;]*)", re.M)
+    _OUTPUT_ENCODING = "utf-8"
+    # libxml2 stores a bare boolean attribute (``<input checked>``) in the tree
+    # as ``checked="checked"`` but hands ``""`` to the soup builder.
+    _BOOLEAN_ATTRIBUTES = frozenset({
+        "checked", "compact", "declare", "defer", "disabled", "ismap", "multiple",
+        "nohref", "noresize", "noshade", "nowrap", "readonly", "selected",
+    })
+    _EXPLICIT_BOOLEAN_RE = re.compile(
+        r"\b(%s)\s*=\s*[\"']?\1\b" % "|".join(sorted(_BOOLEAN_ATTRIBUTES)), re.I
+    )
+
+    def __init__(self):
+        builder = BeautifulSoup("", "lxml").builder
+        self.string_containers = frozenset(builder.string_containers)
+        self.preserve_whitespace_tags = frozenset(builder.preserve_whitespace_tags)
+        self.void_tags = frozenset(builder.empty_element_tags or ())
+        self.cdata_list_attributes = builder.cdata_list_attributes or {}
+
+    @staticmethod
+    def parse(html: str):
+        """Parse the way BeautifulSoup's lxml builder feeds libxml2."""
+        if html and html[0] == "\N{BYTE ORDER MARK}":
+            html = html[1:]
+        parser = lhtml.HTMLParser(recover=True)
+        parser.feed(html)
+        return parser.close()
+
+    def is_exact(self, html: str) -> bool:
+        """
+        False when the tree cannot tell ``checked="checked"`` from a bare
+        ``checked``; such documents must go through BeautifulSoup.
+        """
+        return self._EXPLICIT_BOOLEAN_RE.search(html) is None
+
+    @staticmethod
+    def find(root, tag: str):
+        """First element named ``tag`` in document order, like ``soup.find``."""
+        return next(root.iter(tag), None)
+
+    def collapse(self, text: str, in_pre: bool) -> str:
+        """Whitespace-only strings collapse outside pre/textarea."""
+        if in_pre or text.strip(self._ASCII_SPACES):
+            return text
+        return "\n" if "\n" in text else " "
+
+    @staticmethod
+    def is_tag(node) -> bool:
+        return isinstance(node.tag, str)
+
+    def attributes(self, el) -> List[Tuple[str, object]]:
+        """Attributes as the soup stores them (multi-valued ones as lists)."""
+        multi = self.cdata_list_attributes
+        universal = multi.get("*", ())
+        specific = multi.get(el.tag, ())
+        attributes = []
+        for key, value in el.attrib.items():
+            if key in universal or key in specific:
+                value = value.split()
+            elif value == key and key in self._BOOLEAN_ATTRIBUTES:
+                value = ""
+            attributes.append((key, value))
+        return attributes
+
+    def class_list(self, el) -> List[str]:
+        return el.get("class", "").split()
+
+    def _context(self, el):
+        """(container, in_pre) for strings whose parent is ``el``."""
+        container = None
+        in_pre = False
+        node = el
+        while node is not None:
+            tag = node.tag
+            if container is None and tag in self.string_containers:
+                container = tag
+            if tag in self.preserve_whitespace_tags:
+                in_pre = True
+            node = node.getparent()
+        return container, in_pre
+
+    def _child_context(self, child, container, in_pre):
+        tag = child.tag
+        if tag in self.string_containers:
+            container = tag
+        return container, in_pre or tag in self.preserve_whitespace_tags
+
+    def strings(self, el, skip=(), interesting=None):
+        """
+        Yield ``el``'s strings in document order, like ``Tag._all_strings``.
+
+        Args:
+            el: Element to walk.
+            skip: Elements the soup would have decomposed.
+            interesting: Container type to keep; defaults to ``el``'s own
+                         (``None`` for ordinary tags).
+        """
+        if interesting is None:
+            interesting = el.tag if el.tag in self.string_containers else None
+        container, in_pre = self._context(el)
+        stack = [(el, container, in_pre)]
+        while stack:
+            node, container, in_pre = stack.pop()
+            if isinstance(node, str):
+                if container == interesting:
+                    yield self.collapse(node, in_pre)
+                continue
+            pending = []
+            if node.text is not None:
+                pending.append((node.text, container, in_pre))
+            for child in node:
+                if child not in skip and self.is_tag(child):
+                    pending.append((child,) + self._child_context(child, container, in_pre))
+                if child.tail is not None:
+                    pending.append((child.tail, container, in_pre))
+            stack.extend(reversed(pending))
+
+    def get_text(self, el, skip=(), strip: bool = False) -> str:
+        if strip:
+            return "".join(s.strip() for s in self.strings(el, skip) if s.strip())
+        return "".join(self.strings(el, skip))
+
+    def contents(self, el, skip=(), keep_comments: bool = True):
+        """``el.contents``: strings, comments and child elements in order."""
+        items = []
+        if el.text is not None:
+            items.append(el.text)
+        for child in el:
+            if child not in skip and (keep_comments or child.tag is not etree.Comment):
+                items.append(child)
+            if child.tail is not None:
+                items.append(child.tail)
+        return items
+
+    def string(self, el, skip=(), keep_comments: bool = True) -> Optional[str]:
+        """``Tag.string``: the only child string, following single-child chains."""
+        while True:
+            items = self.contents(el, skip, keep_comments)
+            if len(items) != 1:
+                return None
+            item = items[0]
+            if isinstance(item, str):
+                return self.collapse(item, self._context(el)[1])
+            if not self.is_tag(item):
+                return self._special_text(item)
+            el = item
+
+    @staticmethod
+    def _special_text(node) -> str:
+        """String value of a comment or processing instruction."""
+        if node.tag is etree.ProcessingInstruction:
+            return f"{node.target} {node.text or ''}"
+        return node.text or ""
+
+    def _escape(self, text: str) -> str:
+        return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+    def _attribute_value(self, el, key: str, value) -> str:
+        if isinstance(value, list):
+            return " ".join(value)
+        if el.tag == "meta":
+            if key == "charset":
+                return self._OUTPUT_ENCODING
+            http_equiv = el.get("http-equiv")
+            if key == "content" and el.get("charset") is None and http_equiv is not None and http_equiv.lower() == "content-type":
+                return self._CHARSET_RE.sub(lambda m: m.group(1) + self._OUTPUT_ENCODING, value)
+        return value
+
+    def _start_tag(self, el) -> str:
+        parts = ["<", el.tag]
+        for key, value in sorted(self.attributes(el), key=lambda kv: kv[0]):
+            value = self._escape(self._attribute_value(el, key, value))
+            quote = '"'
+            if '"' in value:
+                if "'" in value:
+                    value = value.replace('"', "&quot;")
+                else:
+                    quote = "'"
+            parts.append(f" {key}={quote}{value}{quote}")
+        return "".join(parts)
+
+    def _render(self, stack, skip, keep_comments: bool) -> str:
+        out = []
+        while stack:
+            node, in_pre = stack.pop()
+            if isinstance(node, str):
+                out.append(node)
+                continue
+            if not self.is_tag(node):
+                if node.tag is etree.Comment:
+                    out.append(f"<!--{node.text or ''}-->")
+                else:
+                    out.append(f"<?{self._special_text(node)}>")
+                continue
+            in_pre = in_pre or node.tag in self.preserve_whitespace_tags
+            items = self.contents(node, skip, keep_comments)
+            if not items and node.tag in self.void_tags:
+                out.append(self._start_tag(node) + "/>")
+                continue
+            out.append(self._start_tag(node) + ">")
+            stack.append((f"</{node.tag}>", in_pre))
+            stack.extend(reversed(self._pending(node, items, in_pre)))
+        return "".join(out)
+
+    def _pending(self, el, items, in_pre):
+        raw = el.tag in self._CDATA_CONTAINING_TAGS
+        pending = []
+        for item in items:
+            if isinstance(item, str):
+                text = self.collapse(item, in_pre)
+                pending.append((text if raw else self._escape(text), in_pre))
+            else:
+                pending.append((item, in_pre))
+        return pending
+
+    def decode(self, el, skip=(), keep_comments: bool = True) -> str:
+        """``str(tag)`` under the minimal formatter."""
+        parent = el.getparent()
+        in_pre = self._context(parent)[1] if parent is not None else False
+        return self._render([(el, in_pre)], skip, keep_comments)
+
+    def decode_contents(self, el, skip=(), keep_comments: bool = True) -> str:
+        """``tag.encode_contents().decode()`` under the minimal formatter."""
+        in_pre = self._context(el)[1]
+        items = self.contents(el, skip, keep_comments)
+        return self._render(list(reversed(self._pending(el, items, in_pre))), skip, keep_comments)
+
+    def _escaped_len(self, text: str) -> int:
+        return len(text) + 4 * text.count("&") + 3 * (text.count("<") + text.count(">"))
+
+    def measure(self, root, skip=()) -> Dict[object, Tuple[int, int, int]]:
+        """
+        Per-element ``(text_len, space_count, inner_len)`` in one pass.
+
+        ``text_len`` is ``len(get_text(strip=True))`` and ``space_count`` its
+        number of ``" "`` characters, both for ordinary (non-container) tags;
+        ``inner_len`` is ``len(decode_contents(keep_comments=False))``.
+        Container tags (``<template>`` etc.) get ``text_len``/``space_count``
+        of 0 here and must use ``get_text`` directly.
+        """
+        stats = {}
+        container, in_pre = self._context(root)
+        stack = [(root, container, in_pre, False)]
+        while stack:
+            el, container, in_pre, done = stack.pop()
+            if not done:
+                stack.append((el, container, in_pre, True))
+                for child in el:
+                    if child not in skip and self.is_tag(child):
+                        stack.append((child,) + self._child_context(child, container, in_pre) + (False,))
+                continue
+
+            raw = el.tag in self._CDATA_CONTAINING_TAGS
+            text_len = spaces = inner_len = 0
+            segments = [el.text] if el.text is not None else []
+            for child in el:
+                if child not in skip:
+                    if self.is_tag(child):
+                        child_text, child_spaces, _ = stats[child]
+                        text_len += child_text
+                        spaces += child_spaces
+                        inner_len += self._outer_len(child, stats)
+                    elif child.tag is etree.ProcessingInstruction:
+                        inner_len += len(self._special_text(child)) + 3
+                if child.tail is not None:
+                    segments.append(child.tail)
+            for segment in segments:
+                stripped = segment.strip()
+                if container is None and stripped:
+                    text_len += len(stripped)
+                    spaces += stripped.count(" ")
+                segment = self.collapse(segment, in_pre)
+                inner_len += len(segment) if raw else self._escaped_len(segment)
+            if container is not None:
+                text_len = spaces = 0
+            stats[el] = (text_len, spaces, inner_len)
+        return stats
+
+    def _outer_len(self, el, stats) -> int:
+        inner_len = stats[el][2]
+        start_len = len(self._start_tag(el))
+        if inner_len == 0 and el.tag in self.void_tags and el.text is None and len(el) == 0:
+            return start_len + 2
+        return start_len + 1 + inner_len + len(el.tag) + 3
+
+
+_soup_view = None
+
+
+def _get_soup_view() -> _LxmlSoupView:
+    global _soup_view
+    if _soup_view is None:
+        _soup_view = _LxmlSoupView()
+    return _soup_view
+
+
 class RelevantContentFilter(ABC):
     """Abstract base class for content filtering strategies"""
 
@@ -158,6 +478,43 @@ class RelevantContentFilter(ABC):
 
         return " ".join(filter(None, query_parts))
 
+    def _extract_page_query_lxml(self, root, body) -> str:
+        """lxml counterpart of ``extract_page_query``"""
+        if self.user_query:
+            return self.user_query
+
+        view = _get_soup_view()
+        query_parts = []
+
+        # Title
+        title = view.find(root, "title")
+        if title is not None:
+            title = view.string(title)
+            if title:
+                query_parts.append(title)
+
+        h1 = view.find(root, "h1")
+        if h1 is not None:
+            query_parts.append(view.get_text(h1))
+
+        # Meta tags
+        temp = ""
+        for meta_name in ["keywords", "description"]:
+            meta = next((m for m in root.iter("meta") if m.get("name") == meta_name), None)
+            if meta is not None and meta.get("content"):
+                query_parts.append(meta.get("content"))
+                temp += meta.get("content")
+
+        # If still empty, grab first significant paragraph
+        if not temp:
+            for p in body.iter("p"):
+                text = view.get_text(p)
+                if len(text) > 150:
+                    query_parts.append(text[:150])
+                    break
+
+        return " ".join(filter(None, query_parts))
+
     def extract_text_chunks(
         self, body: Tag, min_word_threshold: int = None
     ) -> List[Tuple[str, str]]:
@@ -166,11 +523,34 @@ class RelevantContentFilter(ABC):
         Returns list of tuples (text, tag_name) for classification.
 
         Args:
-            body: BeautifulSoup Tag object representing the body element
+            body: BeautifulSoup Tag object representing the body element, or an
+                  lxml element (comments then count as strings, as in the soup)
 
         Returns:
             List of (text, tag_name) tuples
         """
+        if isinstance(body, etree._Element):
+            view = _get_soup_view()
+
+            def tag_name(element):
+                return element.tag
+
+            def children_of(element):
+                return [
+                    child if isinstance(child, str) or view.is_tag(child) else view._special_text(child)
+                    for child in view.contents(element)
+                ]
+        else:
+
+            def tag_name(element):
+                return element.name
+
+            def children_of(element):
+                return [
+                    child for child in element.children
+                    if isinstance(child, (Tag, NavigableString))
+                ]
+
         # Tags to ignore - inline elements that shouldn't break text flow
         INLINE_TAGS = {
             "a",
@@ -216,8 +596,9 @@ class RelevantContentFilter(ABC):
 
         def should_break_chunk(tag: Tag) -> bool:
             """Determine if a tag should cause a break in the current text chunk"""
-            return tag.name not in INLINE_TAGS and not (
-                tag.name == "p" and len(current_text) == 0
+            name = tag_name(tag)
+            return name not in INLINE_TAGS and not (
+                name == "p" and len(current_text) == 0
             )
 
         # Use deque for efficient push/pop operations
@@ -232,20 +613,20 @@ class RelevantContentFilter(ABC):
                     text = " ".join("".join(current_text).split())
                     if text:
                         tag_type = (
-                            "header" if element.name in HEADER_TAGS else "content"
+                            "header" if tag_name(element) in HEADER_TAGS else "content"
                         )
                         chunks.append((chunk_index, text, tag_type, element))
                         chunk_index += 1
                     current_text = []
                 continue
 
-            if isinstance(element, NavigableString):
+            if isinstance(element, str):
                 if str(element).strip():
                     current_text.append(str(element).strip())
                 continue
 
             # Pre-allocate children to avoid multiple list operations
-            children = list(element.children)
+            children = children_of(element)
             if not children:
                 continue
 
@@ -254,8 +635,7 @@ class RelevantContentFilter(ABC):
 
             # Add children in reverse order for correct processing
             for child in reversed(children):
-                if isinstance(child, (Tag, NavigableString)):
-                    stack.append((child, False))
+                stack.append((child, False))
 
         # Handle any remaining text
         if current_text:
@@ -328,6 +708,8 @@ class RelevantContentFilter(ABC):
 
     def clean_element(self, tag: Tag) -> str:
         """Common method for cleaning HTML elements with minimal overhead"""
+        if isinstance(tag, etree._Element):
+            return self._clean_element_lxml(tag)
         if not tag or not isinstance(tag, Tag):
             return ""
 
@@ -377,6 +759,44 @@ class RelevantContentFilter(ABC):
         except Exception:
             return str(tag)  # Fallback to original if anything fails
 
+    def _clean_element_lxml(self, tag) -> str:
+        """lxml counterpart of ``clean_element``, rendering exactly what the soup path does"""
+        view = _get_soup_view()
+        unwanted_tags = {"script", "style", "aside", "form", "iframe", "noscript"}
+        unwanted_attrs = {
+            "style",
+            "onclick",
+            "onmouseover",
+            "align",
+            "bgcolor",
+            "class",
+            "id",
+        }
+
+        builder = []
+        stack = [tag]
+        while stack:
+            elem = stack.pop()
+            if isinstance(elem, str):
+                builder.append(elem.strip())
+                continue
+            if not view.is_tag(elem):
+                builder.append(view._special_text(elem).strip())
+                continue
+            if elem.tag in unwanted_tags:
+                continue
+
+            builder.append(f"<{elem.tag}")
+            for key, value in view.attributes(elem):
+                if key not in unwanted_attrs:
+                    builder.append(f' {key}="{value}"')
+            builder.append(">")
+
+            stack.append(f"</{elem.tag}>")
+            stack.extend(reversed(view.contents(elem)))
+
+        return "".join(builder)
+
 
 class BM25ContentFilter(RelevantContentFilter):
     """
@@ -406,6 +826,7 @@ class BM25ContentFilter(RelevantContentFilter):
         bm25_threshold: float = 1.0,
         language: str = "english",
         use_stemming: bool = True,
+        engine: str = "lxml",
     ):
         """
         Initializes the BM25ContentFilter class, if not provided, falls back to page metadata.
@@ -418,10 +839,13 @@ class BM25ContentFilter(RelevantContentFilter):
             bm25_threshold (float): BM25 threshold for filtering (default: 1.0).
             language (str): Language for stemming (default: 'english').
             use_stemming (bool): Whether to apply stemming (default: True).
+            engine (str): "lxml" (default) walks the lxml tree directly; "bs4" runs the
+                original BeautifulSoup implementation. Both return identical output.
         """
         super().__init__(user_query=user_query)
         self.bm25_threshold = bm25_threshold
         self.use_stemming = use_stemming
+        self.engine = engine
         self.priority_tags = {
             "h1": 5.0,
             "h2": 4.0,
@@ -455,15 +879,25 @@ class BM25ContentFilter(RelevantContentFilter):
         if not html or not isinstance(html, str):
             return []
 
-        soup = BeautifulSoup(html, "lxml")
+        view = _get_soup_view()
+        if self.engine == "lxml" and view.is_exact(html):
+            root = view.parse(html)
+            if root is None or view.find(root, "body") is None:
+                root = view.parse(f"<body>{html}</body>")
+            body = view.find(root, "body") if root is not None else None
+            if body is None:
+                return []
+            query = self._extract_page_query_lxml(root, body)
+        else:
+            soup = BeautifulSoup(html, "lxml")
 
-        # Check if body is present
-        if not soup.body:
-            # Wrap in body tag if missing
-            soup = BeautifulSoup(f"<body>{html}</body>", "lxml")
-        body = soup.find("body")
+            # Check if body is present
+            if not soup.body:
+                # Wrap in body tag if missing
+                soup = BeautifulSoup(f"<body>{html}</body>", "lxml")
+            body = soup.find("body")
 
-        query = self.extract_page_query(soup, body)
+            query = self.extract_page_query(soup, body)
 
         if not query:
             return []
@@ -475,42 +909,21 @@ class BM25ContentFilter(RelevantContentFilter):
             return []
 
         # Tokenize corpus
-        # tokenized_corpus = [chunk.lower().split() for _, chunk, _, _ in candidates]
-        # tokenized_query = query.lower().split()
-
-        # tokenized_corpus = [[ps.stem(word) for word in chunk.lower().split()]
-        #                 for _, chunk, _, _ in candidates]
-        # tokenized_query = [ps.stem(word) for word in query.lower().split()]
-
-        if self.use_stemming:
-            tokenized_corpus = [
-                [self.stemmer.stemWord(word) for word in chunk.lower().split()]
-                for _, chunk, _, _ in candidates
-            ]
-            tokenized_query = [
-                self.stemmer.stemWord(word) for word in query.lower().split()
-            ]
-        else:
-            tokenized_corpus = [
-                chunk.lower().split() for _, chunk, _, _ in candidates
-            ]
-            tokenized_query = query.lower().split()
-
-        # tokenized_corpus = [[self.stemmer.stemWord(word) for word in tokenize_text(chunk.lower())]
-        #            for _, chunk, _, _ in candidates]
-        # tokenized_query = [self.stemmer.stemWord(word) for word in tokenize_text(query.lower())]
+        stem = self.stemmer.stemWord if self.use_stemming else None
+        tokenized_corpus = [tokenize(chunk, stem=stem) for _, chunk, _, _ in candidates]
+        tokenized_query = tokenize(query, stem=stem)
 
         # Clean from stop words and noise
         tokenized_corpus = [clean_tokens(tokens) for tokens in tokenized_corpus]
         tokenized_query = clean_tokens(tokenized_query)
 
-        bm25 = BM25Okapi(tokenized_corpus)
-        scores = bm25.get_scores(tokenized_query)
+        scores = BM25Index(tokenized_corpus).get_scores(tokenized_query)
 
         # Adjust scores with tag weights
         adjusted_candidates = []
         for score, (index, chunk, tag_type, tag) in zip(scores, candidates):
-            tag_weight = self.priority_tags.get(tag.name, 1.0)
+            tag_name = tag.tag if isinstance(tag, etree._Element) else tag.name
+            tag_weight = self.priority_tags.get(tag_name, 1.0)
             adjusted_score = score * tag_weight
             adjusted_candidates.append((adjusted_score, index, chunk, tag))
 
@@ -568,6 +981,7 @@ class PruningContentFilter(RelevantContentFilter):
         threshold: float = 0.48,
         preserve_classes: list = None,
         preserve_tags: list = None,
+        engine: str = "lxml",
     ):
         """
         Initializes the PruningContentFilter class, if not provided, falls back to page metadata.
@@ -582,8 +996,11 @@ class PruningContentFilter(RelevantContentFilter):
             threshold (float): Fixed threshold value (default: 0.48).
             preserve_classes (list): CSS class names to always keep regardless of score (optional).
             preserve_tags (list): HTML tag names to always keep regardless of score (optional).
+            engine (str): "lxml" (default) walks the lxml tree directly; "bs4" runs the
+                original BeautifulSoup implementation. Both return identical output.
         """
         super().__init__(None)
+        self.engine = engine
         self.min_word_threshold = min_word_threshold
         self.threshold_type = threshold_type
         self.threshold = threshold
@@ -655,6 +1072,9 @@ class PruningContentFilter(RelevantContentFilter):
         if not html or not isinstance(html, str):
             return []
 
+        if self.engine == "lxml" and _get_soup_view().is_exact(html):
+            return self._filter_content_lxml(html)
+
         soup = BeautifulSoup(html, "lxml")
         if not soup.body:
             soup = BeautifulSoup(f"<body>{html}</body>", "lxml")
@@ -677,6 +1097,39 @@ class PruningContentFilter(RelevantContentFilter):
 
         return content_blocks
 
+    def _filter_content_lxml(self, html: str) -> List[str]:
+        """
+        lxml engine of ``filter_content``.
+
+        Walks the lxml tree without building a soup. Excluded and pruned
+        elements go into a skip set instead of being decomposed, and text and
+        markup lengths for every node come from a single bottom-up pass.
+        """
+        view = _get_soup_view()
+        root = view.parse(html)
+        if root is None or view.find(root, "body") is None:
+            root = view.parse(f"<body>{html}</body>")
+        body = view.find(root, "body") if root is not None else None
+        if body is None:
+            return []
+
+        skip = set(root.iter(*self.excluded_tags))
+        if body in skip:
+            return []
+        stats = view.measure(body, skip)
+        self._prune_tree_lxml(body, view, stats, skip)
+        if body in skip:
+            return []
+
+        content_blocks = []
+        for element in body:
+            if element in skip or not view.is_tag(element):
+                continue
+            if view.get_text(element, skip, strip=True):
+                content_blocks.append(view.decode(element, skip, keep_comments=False))
+
+        return content_blocks
+
     def _remove_comments(self, soup):
         """Removes HTML comments"""
         for element in soup(string=lambda string: isinstance(string, Comment)):
@@ -690,6 +1143,10 @@ class PruningContentFilter(RelevantContentFilter):
 
     def _is_preserved(self, node):
         """Check if a node matches the preserve whitelist."""
+        if isinstance(node, etree._Element):
+            if self.preserve_tags and node.tag in self.preserve_tags:
+                return True
+            return bool(self.preserve_classes and self.preserve_classes.intersection(node.get("class", "").split()))
         if self.preserve_tags and node.name in self.preserve_tags:
             return True
         if self.preserve_classes and "class" in getattr(node, "attrs", {}):
@@ -728,38 +1185,86 @@ class PruningContentFilter(RelevantContentFilter):
             "link_text_len": link_text_len,
         }
 
-        score = self._compute_composite_score(metrics, text_len, tag_len, link_text_len)
-
-        if self.threshold_type == "fixed":
-            should_remove = score < self.threshold
-        else:  # dynamic
-            tag_importance = self.tag_importance.get(node.name, 0.7)
-            text_ratio = text_len / tag_len if tag_len > 0 else 0
-            link_ratio = link_text_len / text_len if text_len > 0 else 1
-
-            threshold = self.threshold  # base threshold
-            if tag_importance > 1:
-                threshold *= 0.8
-            if text_ratio > 0.4:
-                threshold *= 0.9
-            if link_ratio > 0.6:
-                threshold *= 1.2
-
-            should_remove = score < threshold
-
-        if should_remove:
+        if self._should_remove(metrics, text_len, tag_len, link_text_len):
             node.decompose()
         else:
             children = [child for child in node.children if hasattr(child, "name")]
             for child in children:
                 self._prune_tree(child)
 
+    def _prune_tree_lxml(self, node, view, stats, skip):
+        """
+        lxml counterpart of ``_prune_tree``. Removed nodes are added to ``skip``.
+
+        Args:
+            node: The lxml element from which the pruning starts.
+            view (_LxmlSoupView): Soup-compatible accessors for the tree.
+            stats (dict): ``view.measure`` output for the intact tree.
+            skip (set): Elements already excluded; pruned ones are added.
+        """
+        if self._is_preserved(node):
+            return
+
+        text_len, spaces, tag_len = stats[node]
+        if node.tag in view.string_containers:
+            text = view.get_text(node, skip, strip=True)
+            text_len, spaces = len(text), text.count(" ")
+        link_text_len = sum(
+            len(s.strip())
+            for s in (
+                view.string(a, skip, keep_comments=False)
+                for a in node
+                if a.tag == "a" and a not in skip
+            )
+            if s
+        )
+
+        metrics = {
+            "node": node,
+            "tag_name": node.tag,
+            "text_len": text_len,
+            "tag_len": tag_len,
+            "link_text_len": link_text_len,
+            "word_count": spaces + 1,
+        }
+
+        if self._should_remove(metrics, text_len, tag_len, link_text_len):
+            skip.add(node)
+        else:
+            for child in node:
+                if child not in skip and view.is_tag(child):
+                    self._prune_tree_lxml(child, view, stats, skip)
+
+    def _should_remove(self, metrics, text_len, tag_len, link_text_len):
+        """Applies the fixed or dynamic threshold to the node's composite score"""
+        score = self._compute_composite_score(metrics, text_len, tag_len, link_text_len)
+
+        if self.threshold_type == "fixed":
+            return score < self.threshold
+
+        # dynamic
+        tag_importance = self.tag_importance.get(metrics["tag_name"], 0.7)
+        text_ratio = text_len / tag_len if tag_len > 0 else 0
+        link_ratio = link_text_len / text_len if text_len > 0 else 1
+
+        threshold = self.threshold  # base threshold
+        if tag_importance > 1:
+            threshold *= 0.8
+        if text_ratio > 0.4:
+            threshold *= 0.9
+        if link_ratio > 0.6:
+            threshold *= 1.2
+
+        return score < threshold
+
     def _compute_composite_score(self, metrics, text_len, tag_len, link_text_len):
         """Computes the composite score"""
         if self.min_word_threshold:
-            # Get raw text from metrics node - avoid extra processing
-            text = metrics["node"].get_text(strip=True)
-            word_count = text.count(" ") + 1
+            word_count = metrics.get("word_count")
+            if word_count is None:
+                # Get raw text from metrics node - avoid extra processing
+                text = metrics["node"].get_text(strip=True)
+                word_count = text.count(" ") + 1
             if word_count < self.min_word_threshold:
                 return -1.0  # Guaranteed removal
         score = 0.0
@@ -794,14 +1299,16 @@ class PruningContentFilter(RelevantContentFilter):
     def _compute_class_id_weight(self, node):
         """Computes the class ID weight"""
         class_id_score = 0
-        if "class" in node.attrs:
-            classes = " ".join(node["class"])
-            if self.negative_patterns.match(classes):
-                class_id_score -= 0.5
-        if "id" in node.attrs:
-            element_id = node["id"]
-            if self.negative_patterns.match(element_id):
-                class_id_score -= 0.5
+        if isinstance(node, Tag):
+            classes = " ".join(node["class"]) if "class" in node.attrs else None
+            element_id = node.get("id")
+        else:
+            classes = " ".join(node.get("class").split()) if "class" in node.attrib else None
+            element_id = node.get("id")
+        if classes is not None and self.negative_patterns.match(classes):
+            class_id_score -= 0.5
+        if element_id is not None and self.negative_patterns.match(element_id):
+            class_id_score -= 0.5
         return class_id_score
 
 
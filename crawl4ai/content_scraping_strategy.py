@@ -176,6 +176,13 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
         self.DIMENSION_REGEX = re.compile(r"(\d+)(\D*)")
         self.BASE64_PATTERN = re.compile(r'data:image/[^;]+;base64,([^"]+)')
 
+    def __getstate__(self):
+        # Loggers hold locks and console handles; drop them so the strategy
+        # can be shipped to a processing worker.
+        state = self.__dict__.copy()
+        state["logger"] = None
+        return state
+
     def _log(self, level, message, tag="SCRAPE", **kwargs):
         """Helper method to safely use logger."""
         if self.logger:
@@ -693,11 +700,17 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
 
         # Malformed/nested <noscript> makes libxml2 swallow the rest of the
         # document. Must be removed before parsing — see strip_noscript().
-        html = strip_noscript(html)
+        stripped = strip_noscript(html)
 
         success = True
         try:
-            doc = lhtml.document_fromstring(html)
+            # Reuse the page's shared parse when the HTML needed no stripping;
+            # the tree is mutated below, so work on a clone of it.
+            document_cache = kwargs.get("document_cache")
+            if document_cache is not None and stripped is html:
+                doc = document_cache.get(html).clone()
+            else:
+                doc = lhtml.document_fromstring(stripped)
             # Match BeautifulSoup's behavior of using body or full doc
             # body = doc.xpath('//body')[0] if doc.xpath('//body') else doc
             body = doc
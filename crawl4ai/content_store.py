@@ -0,0 +1,507 @@
+"""
+Content-addressed storage backends for the crawl cache.
+
+``AsyncDatabaseManager`` keeps large payloads (html, cleaned html, markdown,
+extracted content, screenshots) out of the ``crawled_data`` table and stores
+only their content hash there. Two backends hold the payloads themselves:
+
+- ``FileContentStore``: one file per hash under a directory per content type.
+  This is the historical layout and the default.
+- ``PackContentStore``: compressed blobs appended to a few large segment files,
+  with a SQLite index mapping each hash to ``(segment, offset, length)``.
+  Millions of cached pages cost a handful of files instead of millions of
+  inodes, and unreferenced blobs are reclaimed by ``compact()``.
+
+Both stores are content-addressed: storing the same content twice writes it
+once and returns the same hash. With a ``ContentCompressor`` both write text
+payloads as zstd frames, optionally with a dictionary trained per domain.
+Frames are recognized by their magic number on read, so uncompressed content
+written earlier stays readable.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import aiofiles
+
+from .utils import ensure_content_dirs, generate_content_hash
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+CONTENT_STORE_BACKENDS = ("files", "pack")
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Screenshots are base64 PNG/JPEG and do not shrink any further
+COMPRESSED_CONTENT_TYPES = frozenset({"html", "cleaned", "markdown", "extracted"})
+
+
+class ContentCompressor:
+    """
+    zstd compression for cached text payloads.
+
+    Payloads of the types in ``COMPRESSED_CONTENT_TYPES`` are written as zstd
+    frames. If a dictionary was trained for the payload's domain it is used,
+    and its id is recorded in the frame header so ``decompress`` can find it
+    again. Dictionaries are stored as ``<domain>.zdict`` in ``dictionary_dir``.
+
+    Args:
+        level: zstd compression level.
+        dictionary_dir: Directory for trained dictionaries; None disables them.
+
+    Raises:
+        ImportError: If the ``zstandard`` package is not installed.
+    """
+
+    def __init__(self, level: int = 3, dictionary_dir: Optional[str] = None):
+        if not HAS_ZSTD:
+            raise ImportError(
+                "Cache compression requires the 'zstandard' package: pip install zstandard"
+            )
+        self.level = level
+        self.dictionary_dir = dictionary_dir
+        self._by_domain: Dict[str, "zstandard.ZstdCompressionDict"] = {}
+        self._by_id: Dict[int, "zstandard.ZstdCompressionDict"] = {}
+        if dictionary_dir:
+            os.makedirs(dictionary_dir, exist_ok=True)
+            self._load_dictionaries()
+
+    def _load_dictionaries(self):
+        for name in os.listdir(self.dictionary_dir):
+            if name.endswith(".zdict"):
+                with open(os.path.join(self.dictionary_dir, name), "rb") as f:
+                    self._register(name[: -len(".zdict")], f.read())
+
+    def _register(self, domain: str, data: bytes) -> int:
+        dictionary = zstandard.ZstdCompressionDict(data)
+        self._by_domain[domain] = dictionary
+        self._by_id[dictionary.dict_id()] = dictionary
+        return dictionary.dict_id()
+
+    @property
+    def domains(self) -> List[str]:
+        """Domains that have a trained dictionary."""
+        return sorted(self._by_domain)
+
+    def compress(self, content: str, content_type: str, domain: Optional[str] = None) -> Optional[bytes]:
+        """Return a zstd frame for ``content``, or None if the type is stored raw."""
+        if content_type not in COMPRESSED_CONTENT_TYPES:
+            return None
+        dictionary = self._by_domain.get(domain) if domain else None
+        compressor = zstandard.ZstdCompressor(level=self.level, dict_data=dictionary)
+        return compressor.compress(content.encode("utf-8"))
+
+    def decompress(self, data: bytes) -> str:
+        """Decode a zstd frame written by ``compress``."""
+        dict_id = zstandard.get_frame_parameters(data).dict_id
+        dictionary = self._by_id.get(dict_id) if dict_id else None
+        if dict_id and dictionary is None and self.dictionary_dir:
+            # Trained by another process after this one started
+            self._load_dictionaries()
+            dictionary = self._by_id.get(dict_id)
+        if dict_id and dictionary is None:
+            raise ValueError(f"zstd dictionary {dict_id} is not available")
+        return zstandard.ZstdDecompressor(dict_data=dictionary).decompress(data).decode("utf-8")
+
+    def train(self, domain: str, samples: List[str], dict_size: int = 112640) -> int:
+        """
+        Train a dictionary for ``domain`` and use it for new payloads.
+
+        Args:
+            domain: Host name the dictionary applies to.
+            samples: Representative payloads (cached pages of the domain).
+            dict_size: Target dictionary size in bytes.
+
+        Returns:
+            The id of the new dictionary.
+        """
+        trained = zstandard.train_dictionary(
+            dict_size, [sample.encode("utf-8") for sample in samples if sample]
+        )
+        data = trained.as_bytes()
+        if self.dictionary_dir:
+            path = os.path.join(self.dictionary_dir, f"{domain}.zdict")
+            with open(path + ".tmp", "wb") as f:
+                f.write(data)
+            os.replace(path + ".tmp", path)
+        return self._register(domain, data)
+
+
+def decode_payload(data: bytes, compressor: Optional[ContentCompressor] = None) -> str:
+    """
+    Decode a stored payload: zstd frames are decompressed, anything else is
+    read as UTF-8 text with universal newlines, as the text-mode file store
+    always returned it.
+    """
+    if data.startswith(ZSTD_MAGIC):
+        if compressor is None:
+            compressor = ContentCompressor()
+        return compressor.decompress(data)
+    text = data.decode("utf-8")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+class FileContentStore:
+    """
+    One file per content hash, grouped in a directory per content type.
+
+    Args:
+        base_directory: Directory that holds the per-type content directories.
+        logger: Optional logger for load failures.
+        compressor: Optional zstd compressor for new text payloads.
+        decompressor: Decodes zstd payloads on load; defaults to
+            ``compressor``. Pass one that knows the trained dictionaries to
+            read compressed content while writing it uncompressed.
+    """
+
+    def __init__(
+        self,
+        base_directory: str,
+        logger=None,
+        compressor: Optional[ContentCompressor] = None,
+        decompressor: Optional[ContentCompressor] = None,
+    ):
+        self.content_paths = ensure_content_dirs(base_directory)
+        self.logger = logger
+        self.compressor = compressor
+        self.decompressor = decompressor or compressor
+
+    async def store(self, content: str, content_type: str, domain: Optional[str] = None) -> str:
+        """Store content and return its hash. Empty content is not stored."""
+        if not content:
+            return ""
+
+        content_hash = generate_content_hash(content)
+        file_path = os.path.join(self.content_paths[content_type], content_hash)
+
+        # Only write if file doesn't exist
+        if not os.path.exists(file_path):
+            data = self.compressor.compress(content, content_type, domain) if self.compressor else None
+            if data is None:
+                async with aiofiles.open(file_path, "w", encoding="utf-8") as f:
+                    await f.write(content)
+            else:
+                async with aiofiles.open(file_path, "wb") as f:
+                    await f.write(data)
+
+        return content_hash
+
+    async def store_many(
+        self, items: Iterable[Tuple[str, str]], domain: Optional[str] = None
+    ) -> List[str]:
+        """Store ``(content, content_type)`` pairs and return their hashes."""
+        return [await self.store(content, content_type, domain) for content, content_type in items]
+
+    async def load(self, content_hash: str, content_type: str) -> Optional[str]:
+        """Load content by hash, or None if it is missing."""
+        if not content_hash:
+            return None
+
+        file_path = os.path.join(self.content_paths[content_type], content_hash)
+        try:
+            async with aiofiles.open(file_path, "rb") as f:
+                return decode_payload(await f.read(), self.decompressor)
+        except Exception:
+            if self.logger:
+                self.logger.error(
+                    message="Failed to load content: {file_path}",
+                    tag="ERROR",
+                    force_verbose=True,
+                    params={"file_path": file_path},
+                )
+            return None
+
+
+class PackContentStore:
+    """
+    Append-only pack files with a SQLite offset index.
+
+    Blobs are compressed (zstd through ``compressor`` when given, zlib
+    otherwise) and appended to the active segment
+    (``segment-000001.pack``, ...). A new segment is started once the active
+    one reaches ``segment_size`` bytes. The index (``index.db``) records where
+    each hash lives, so a lookup is one indexed query and one ``read``.
+
+    Writes append the bytes first and record them in the index second; a crash
+    in between leaves unindexed bytes that the next ``compact()`` reclaims.
+    ``store_many`` records all the payloads of a result in one commit. Reads
+    take no lock: each thread queries the WAL index through its own
+    connection, so they run alongside each other and alongside writes.
+
+    Args:
+        directory: Directory holding the segments and the index.
+        segment_size: Size in bytes after which a new segment is started.
+        compression_level: zlib level used for new blobs.
+        compressor: zstd compressor; used instead of zlib when given.
+        decompressor: Decodes zstd blobs; defaults to ``compressor``.
+    """
+
+    CODEC_RAW = 0
+    CODEC_ZLIB = 1
+    CODEC_ZSTD = 2
+
+    def __init__(
+        self,
+        directory: str,
+        segment_size: int = 256 * 1024 * 1024,
+        compression_level: int = 6,
+        compressor: Optional[ContentCompressor] = None,
+        decompressor: Optional[ContentCompressor] = None,
+    ):
+        self.directory = directory
+        self.segment_size = segment_size
+        self.compression_level = compression_level
+        self.compressor = compressor
+        self.decompressor = decompressor or compressor
+        os.makedirs(directory, exist_ok=True)
+        # Serializes writes and compaction; reads do not take it
+        self._lock = threading.Lock()
+        self._index_path = os.path.join(directory, "index.db")
+        self._db = sqlite3.connect(self._index_path, check_same_thread=False)
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS blobs (
+                hash TEXT PRIMARY KEY,
+                segment INTEGER NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                codec INTEGER NOT NULL
+            )
+            """
+        )
+        self._db.commit()
+        segments = self._segments()
+        self._active = segments[-1] if segments else 1
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"segment-{segment:06d}.pack")
+
+    def _segments(self):
+        return sorted(
+            int(name[len("segment-"):-len(".pack")])
+            for name in os.listdir(self.directory)
+            if name.startswith("segment-") and name.endswith(".pack")
+        )
+
+    def _encode(self, content: str, content_type: str, domain: Optional[str]):
+        if self.compressor is not None:
+            packed = self.compressor.compress(content, content_type, domain)
+            if packed is not None:
+                return packed, self.CODEC_ZSTD
+        data = content.encode("utf-8")
+        packed = zlib.compress(data, self.compression_level)
+        if len(packed) < len(data):
+            return packed, self.CODEC_ZLIB
+        return data, self.CODEC_RAW
+
+    def _decode(self, data: bytes, codec: int) -> str:
+        if codec == self.CODEC_ZSTD:
+            return decode_payload(data, self.decompressor)
+        if codec == self.CODEC_ZLIB:
+            data = zlib.decompress(data)
+        return data.decode("utf-8")
+
+    def _append(self, data: bytes):
+        """Append to the active segment, rolling over when it is full."""
+        path = self._segment_path(self._active)
+        if os.path.exists(path) and os.path.getsize(path) >= self.segment_size:
+            self._active += 1
+            path = self._segment_path(self._active)
+        with open(path, "ab") as f:
+            offset = f.tell()
+            f.write(data)
+        return self._active, offset
+
+    def _reader(self) -> sqlite3.Connection:
+        """This thread's index connection for reads."""
+        reader = getattr(self._local, "reader", None)
+        if reader is None:
+            reader = sqlite3.connect(self._index_path, check_same_thread=False)
+            self._local.reader = reader
+            self._readers.append(reader)
+        return reader
+
+    def _locate(self, content_hash: str):
+        rows = self._reader().execute(
+            "SELECT segment, offset, length, codec FROM blobs WHERE hash = ?",
+            (content_hash,),
+        ).fetchall()
+        return rows[0] if rows else None
+
+    def _put_many(self, items: List[Tuple[str, str, str, Optional[str]]]):
+        with self._lock:
+            rows = []
+            seen = set()
+            for content_hash, content, content_type, domain in items:
+                if content_hash in seen or self._db.execute(
+                    "SELECT 1 FROM blobs WHERE hash = ?", (content_hash,)
+                ).fetchone():
+                    continue
+                seen.add(content_hash)
+                data, codec = self._encode(content, content_type, domain)
+                segment, offset = self._append(data)
+                rows.append((content_hash, segment, offset, len(data), codec))
+            if rows:
+                self._db.executemany(
+                    "INSERT INTO blobs (hash, segment, offset, length, codec) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._db.commit()
+
+    def _get(self, content_hash: str) -> Optional[str]:
+        # Compaction deletes a segment only after the index points at the new
+        # copies, so a segment that vanished since the lookup means the blob
+        # moved: look it up again.
+        for _ in range(2):
+            row = self._locate(content_hash)
+            if row is None:
+                return None
+            segment, offset, length, codec = row
+            try:
+                with open(self._segment_path(segment), "rb") as f:
+                    f.seek(offset)
+                    data = f.read(length)
+            except FileNotFoundError:
+                continue
+            return self._decode(data, codec)
+        return None
+
+    def contains(self, content_hash: str) -> bool:
+        """Return True if a blob with this hash is stored."""
+        return self._locate(content_hash) is not None
+
+    async def store(self, content: str, content_type: str, domain: Optional[str] = None) -> str:
+        """Store content and return its hash. Empty content is not stored."""
+        if not content:
+            return ""
+        return (await self.store_many([(content, content_type)], domain))[0]
+
+    async def store_many(
+        self, items: Iterable[Tuple[str, str]], domain: Optional[str] = None
+    ) -> List[str]:
+        """
+        Store ``(content, content_type)`` pairs with a single index commit and
+        return their hashes ("" for empty content).
+        """
+        hashes = []
+        pending = []
+        for content, content_type in items:
+            content_hash = generate_content_hash(content) if content else ""
+            hashes.append(content_hash)
+            if content_hash:
+                pending.append((content_hash, content, content_type, domain))
+        if pending:
+            await asyncio.to_thread(self._put_many, pending)
+        return hashes
+
+    async def load(self, content_hash: str, content_type: str) -> Optional[str]:
+        """Load content by hash, or None if it is missing."""
+        if not content_hash:
+            return None
+        return await asyncio.to_thread(self._get, content_hash)
+
+    def compact(self, live_hashes: Iterable[str]) -> Dict[str, int]:
+        """
+        Drop blobs whose hash is not in ``live_hashes`` and rewrite the
+        segments so their space is returned to the filesystem.
+
+        Live blobs are copied into fresh segments; the old segment files are
+        deleted once the index points at the new copies.
+
+        Returns:
+            Dict with ``removed`` (blobs dropped) and ``reclaimed_bytes``.
+        """
+        live = set(live_hashes)
+        with self._lock:
+            old_segments = self._segments()
+            before = sum(os.path.getsize(self._segment_path(s)) for s in old_segments)
+            rows = self._db.execute(
+                "SELECT hash, segment, offset, length FROM blobs ORDER BY segment, offset"
+            ).fetchall()
+            dead = [(h,) for h, _, _, _ in rows if h not in live]
+            self._db.executemany("DELETE FROM blobs WHERE hash = ?", dead)
+
+            self._active = (old_segments[-1] + 1) if old_segments else 1
+            relocated = []
+            handles = {}
+            try:
+                for content_hash, segment, offset, length in rows:
+                    if content_hash not in live:
+                        continue
+                    source = handles.get(segment)
+                    if source is None:
+                        source = handles[segment] = open(self._segment_path(segment), "rb")
+                    source.seek(offset)
+                    new_segment, new_offset = self._append(source.read(length))
+                    relocated.append((new_segment, new_offset, content_hash))
+            finally:
+                for handle in handles.values():
+                    handle.close()
+            self._db.executemany(
+                "UPDATE blobs SET segment = ?, offset = ? WHERE hash = ?", relocated
+            )
+            self._db.commit()
+
+            for segment in old_segments:
+                os.remove(self._segment_path(segment))
+            after = sum(os.path.getsize(self._segment_path(s)) for s in self._segments())
+
+        return {"removed": len(dead), "reclaimed_bytes": before - after}
+
+    async def acompact(self, live_hashes: Iterable[str]) -> Dict[str, int]:
+        """Async wrapper around ``compact``."""
+        return await asyncio.to_thread(self.compact, live_hashes)
+
+    def close(self):
+        """Close the index connections."""
+        with self._lock:
+            self._db.close()
+            for reader in self._readers:
+                reader.close()
+            self._readers.clear()
+
+
+def create_content_store(
+    backend: str,
+    base_directory: str,
+    logger=None,
+    compressor: Optional[ContentCompressor] = None,
+    decompressor: Optional[ContentCompressor] = None,
+):
+    """
+    Build the content store named by ``backend``.
+
+    Args:
+        backend: ``"files"`` for one file per hash, ``"pack"`` for pack files.
+        base_directory: The crawl4ai base directory (the one holding the db).
+        logger: Optional logger passed to stores that log.
+        compressor: Optional zstd compressor for text payloads.
+        decompressor: Decodes zstd payloads; defaults to ``compressor``.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if backend == "files":
+        return FileContentStore(
+            base_directory, logger=logger, compressor=compressor, decompressor=decompressor
+        )
+    if backend == "pack":
+        return PackContentStore(
+            os.path.join(base_directory, "content_packs"),
+            compressor=compressor,
+            decompressor=decompressor,
+        )
+    raise ValueError(
+        f"Unknown content store '{backend}', expected one of {CONTENT_STORE_BACKENDS}"
+    )
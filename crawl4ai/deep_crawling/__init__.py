@@ -3,12 +3,15 @@ from .base_strategy import DeepCrawlDecorator, DeepCrawlStrategy
 from .bfs_strategy import BFSDeepCrawlStrategy
 from .bff_strategy import BestFirstCrawlingStrategy
 from .dfs_strategy import DFSDeepCrawlStrategy
+from .crawl_state import apply_state_delta
+from .url_store import URLStore, MemoryURLStore, BloomURLStore, SQLiteURLStore
 from .filters import (
     FilterChain,
     ContentTypeFilter,
     DomainFilter,
     URLFilter,
     URLPatternFilter,
+    URLBatch,
     FilterStats,
     ContentRelevanceFilter,
     SEOFilter
@@ -29,11 +32,17 @@ __all__ = [
     "BFSDeepCrawlStrategy",
     "BestFirstCrawlingStrategy",
     "DFSDeepCrawlStrategy",
+    "apply_state_delta",
+    "URLStore",
+    "MemoryURLStore",
+    "BloomURLStore",
+    "SQLiteURLStore",
     "FilterChain",
     "ContentTypeFilter",
     "DomainFilter",
     "URLFilter",
     "URLPatternFilter",
+    "URLBatch",
     "FilterStats",
     "ContentRelevanceFilter",
     "SEOFilter",
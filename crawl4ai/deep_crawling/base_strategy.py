@@ -1,10 +1,28 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, Optional, Set, List, Dict
+from typing import AsyncGenerator, Optional, Set, List, Dict, Sequence
 from functools import wraps
 from contextvars import ContextVar
+from urllib.parse import ParseResult
+
+import numpy as np
+
 from ..types import AsyncWebCrawler, CrawlerRunConfig, CrawlResult, RunManyReturn
+from .filters import URLBatch
+
+
+def _url_format_error(parsed: Optional[ParseResult]) -> Optional[str]:
+    """Why a parsed URL cannot be crawled, or None if it can."""
+    if parsed is None:
+        return "Unparseable URL"
+    if not parsed.scheme or not parsed.netloc:
+        return "Missing scheme or netloc"
+    if parsed.scheme not in ("http", "https"):
+        return "Invalid scheme"
+    if "." not in parsed.netloc:
+        return "Invalid domain"
+    return None
 
 
 class DeepCrawlDecorator:
@@ -50,6 +68,7 @@ class DeepCrawlStrategy(ABC):
       - arun: Main entry point that returns an async generator of CrawlResults.
       - shutdown: Clean up resources.
       - can_process_url: Validate a URL and decide whether to process it.
+      - can_process_urls: Batch form of can_process_url.
       - _process_links: Extract and process links from a CrawlResult.
     """
 
@@ -128,6 +147,25 @@ class DeepCrawlStrategy(ABC):
         """
         pass
 
+    async def can_process_urls(self, urls: List[str], depth: int) -> Sequence[bool]:
+        """
+        Batch form of can_process_url, one boolean per URL.
+
+        The default calls can_process_url per URL; strategies override it to
+        parse each URL once and filter the whole batch together.
+        """
+        return [await self.can_process_url(url, depth) for url in urls]
+
+    def _url_format_mask(self, batch: URLBatch) -> np.ndarray:
+        """Format check of can_process_url over a batch, logging invalid URLs."""
+        valid = np.ones(len(batch), dtype=bool)
+        for i, (url, parsed) in enumerate(zip(batch.urls, batch.parsed)):
+            error = _url_format_error(parsed)
+            if error:
+                self.logger.warning(f"Invalid URL: {url}, error: {error}")
+                valid[i] = False
+        return valid
+
     @abstractmethod
     async def link_discovery(
         self,
@@ -142,7 +180,7 @@ class DeepCrawlStrategy(ABC):
         Extract and process links from the given crawl result.
         
         This method should:
-          - Validate each extracted URL using can_process_url.
+          - Validate the extracted URLs using can_process_urls.
           - Optionally score URLs.
           - Append valid URLs (and their parent references) to the next_level list.
           - Update the depths dictionary with the new depth for each URL.
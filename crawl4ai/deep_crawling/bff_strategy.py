@@ -5,10 +5,15 @@ from datetime import datetime
 from typing import AsyncGenerator, Optional, Set, Dict, List, Tuple, Any, Callable, Awaitable, Union
 from urllib.parse import urlparse
 
+import numpy as np
+
 from ..models import TraversalStats
-from .filters import FilterChain
+from .filters import FilterChain, URLBatch
 from .scorers import URLScorer
 from . import DeepCrawlStrategy
+from .base_strategy import _url_format_error
+from .crawl_state import StateCheckpointer
+from .url_store import MemoryURLStore, URLStore
 
 from ..types import AsyncWebCrawler, CrawlerRunConfig, CrawlResult, RunManyReturn
 from ..utils import normalize_url_for_deep_crawl
@@ -32,6 +37,10 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
       - _arun_best_first: Core generator that uses a priority queue to yield CrawlResults.
       - can_process_url: Validates URLs and applies filtering (inherited behavior).
       - link_discovery: Extracts and validates links from a CrawlResult.
+
+    ``state_interval`` and ``incremental_state`` throttle the states sent to
+    ``on_state_change`` as in :class:`BFSDeepCrawlStrategy`, and ``url_store``
+    holds the visited set and URL depths the same way.
     """
     def __init__(
         self,
@@ -47,6 +56,9 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         on_state_change: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
         # Optional cancellation callback - checked before each URL is processed
         should_cancel: Optional[Callable[[], Union[bool, Awaitable[bool]]]] = None,
+        state_interval: int = 1,
+        incremental_state: bool = False,
+        url_store: Optional[URLStore] = None,
     ):
         self.max_depth = max_depth
         self.filter_chain = filter_chain
@@ -69,8 +81,13 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         self._on_state_change = on_state_change
         self._should_cancel = should_cancel
         self._last_state: Optional[Dict[str, Any]] = None
-        # Shadow list for queue items (only used when on_state_change is set)
-        self._queue_shadow: Optional[List[Tuple[float, int, str, Optional[str]]]] = None
+        # Shadow of the queue items in insertion order (only used when
+        # on_state_change is set); a dict so removal is O(1)
+        self._queue_shadow: Optional[Dict[Tuple[float, int, str, Optional[str]], None]] = None
+        self.state_interval = state_interval
+        self.incremental_state = incremental_state
+        self.url_store = url_store or MemoryURLStore()
+        self._checkpointer: Optional[StateCheckpointer] = None
 
     async def can_process_url(self, url: str, depth: int) -> bool:
         """
@@ -78,15 +95,11 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         For the starting URL (depth 0), filtering is bypassed.
         """
         try:
-            parsed = urlparse(url)
-            if not parsed.scheme or not parsed.netloc:
-                raise ValueError("Missing scheme or netloc")
-            if parsed.scheme not in ("http", "https"):
-                raise ValueError("Invalid scheme")
-            if "." not in parsed.netloc:
-                raise ValueError("Invalid domain")
+            error = _url_format_error(urlparse(url))
         except Exception as e:
-            self.logger.warning(f"Invalid URL: {url}, error: {e}")
+            error = e
+        if error:
+            self.logger.warning(f"Invalid URL: {url}, error: {error}")
             return False
 
         if depth != 0 and not await self.filter_chain.apply(url):
@@ -94,6 +107,23 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
 
         return True
 
+    async def can_process_urls(self, urls: List[str], depth: int) -> np.ndarray:
+        """
+        Batch form of can_process_url: parses each URL once and runs the
+        filter chain over the whole batch.
+        """
+        if type(self).can_process_url is not BestFirstCrawlingStrategy.can_process_url:
+            # A subclass customised the per-URL check
+            return np.array(await super().can_process_urls(urls, depth), dtype=bool)
+
+        batch = URLBatch(urls)
+        allowed = self._url_format_mask(batch)
+        if depth != 0:
+            indices = np.flatnonzero(allowed)
+            if len(indices):
+                allowed[indices] = await self.filter_chain.apply_many(batch.subset(indices))
+        return allowed
+
     def cancel(self) -> None:
         """
         Cancel the crawl. Thread-safe, can be called from any context.
@@ -173,17 +203,18 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
             links += result.links.get("external", [])
 
         # If we have more links than remaining capacity, limit how many we'll process
-        valid_links = []
+        candidates = []
         for link in links:
             url = link.get("href")
             base_url = normalize_url_for_deep_crawl(url, source_url)
-            if base_url in visited:
-                continue
-            if not await self.can_process_url(base_url, new_depth):
-                self.stats.urls_skipped += 1
-                continue
-                
-            valid_links.append(base_url)
+            if base_url not in visited:
+                candidates.append(base_url)
+        candidates = list(dict.fromkeys(candidates))
+
+        # Validate and filter the whole page at once
+        allowed = await self.can_process_urls(candidates, new_depth)
+        valid_links = [url for url, ok in zip(candidates, allowed) if ok]
+        self.stats.urls_skipped += len(candidates) - len(valid_links)
             
         # Record the new depths and add to next_links
         for url in valid_links:
@@ -208,9 +239,10 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
 
         # Conditional state initialization for resume support
+        state = self._resume_state or None
+        visited = self.url_store.open_set("visited", state)
+        depths = self.url_store.open_map("depths", state)
         if self._resume_state:
-            visited = set(self._resume_state.get("visited", []))
-            depths = dict(self._resume_state.get("depths", {}))
             self._pages_crawled = self._resume_state.get("pages_crawled", 0)
             # Restore queue from saved items
             queue_items = self._resume_state.get("queue_items", [])
@@ -218,19 +250,43 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
                 await queue.put((item["score"], item["depth"], item["url"], item["parent_url"]))
             # Initialize shadow list if callback is set
             if self._on_state_change:
-                self._queue_shadow = [
-                    (item["score"], item["depth"], item["url"], item["parent_url"])
+                self._queue_shadow = {
+                    (item["score"], item["depth"], item["url"], item["parent_url"]): None
                     for item in queue_items
-                ]
+                }
         else:
             # Original initialization
             initial_score = self.url_scorer.score(start_url) if self.url_scorer else 0
             await queue.put((-initial_score, 0, start_url, None))
-            visited: Set[str] = set()
-            depths: Dict[str, int] = {start_url: 0}
+            depths[start_url] = 0
             # Initialize shadow list if callback is set
             if self._on_state_change:
-                self._queue_shadow = [(-initial_score, 0, start_url, None)]
+                self._queue_shadow = {(-initial_score, 0, start_url, None): None}
+
+        checkpoints: Optional[StateCheckpointer] = None
+        if self._on_state_change:
+            checkpoints = StateCheckpointer(
+                self._on_state_change,
+                "best_first",
+                "queue_items",
+                interval=self.state_interval,
+                incremental=self.incremental_state,
+            )
+            visited = checkpoints.track("visited", visited)
+        self._checkpointer = checkpoints
+
+        def snapshot() -> Dict[str, Any]:
+            return {
+                "strategy_type": "best_first",
+                **self.url_store.export_set("visited", visited),
+                "queue_items": [
+                    {"score": s, "depth": d, "url": u, "parent_url": p}
+                    for s, d, u, p in self._queue_shadow
+                ],
+                **self.url_store.export_map("depths", depths),
+                "pages_crawled": self._pages_crawled,
+                "cancelled": self._cancel_event.is_set(),
+            }
 
         while not queue.empty() and not self._cancel_event.is_set():
             # Stop if we've reached the max pages limit
@@ -258,11 +314,9 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
                     break
                 item = await queue.get()
                 # Remove from shadow list if tracking
-                if self._on_state_change and self._queue_shadow is not None:
-                    try:
-                        self._queue_shadow.remove(item)
-                    except ValueError:
-                        pass  # Item may have been removed already
+                if checkpoints:
+                    self._queue_shadow.pop(item, None)
+                    checkpoints.frontier_remove(item[2])
                 score, depth, url, parent_url = item
                 if url in visited:
                     continue
@@ -312,9 +366,12 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
                     new_links: List[Tuple[str, Optional[str]]] = []
                     await self.link_discovery(result, url, depth, visited, new_links, depths)
                     
-                    for new_url, new_parent in new_links:
+                    new_scores = (
+                        self.url_scorer.score_many([new_url for new_url, _ in new_links]).tolist()
+                        if self.url_scorer else [0] * len(new_links)
+                    )
+                    for (new_url, new_parent), new_score in zip(new_links, new_scores):
                         new_depth = depths.get(new_url, depth + 1)
-                        new_score = self.url_scorer.score(new_url) if self.url_scorer else 0
                         # Skip URLs with scores below the threshold
                         if new_score < self.score_threshold:
                             self.logger.debug(
@@ -325,40 +382,27 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
                         queue_item = (-new_score, new_depth, new_url, new_parent)
                         await queue.put(queue_item)
                         # Add to shadow list if tracking
-                        if self._on_state_change and self._queue_shadow is not None:
-                            self._queue_shadow.append(queue_item)
+                        if checkpoints:
+                            self._queue_shadow[queue_item] = None
+                            checkpoints.frontier_add(
+                                {"score": -new_score, "depth": new_depth, "url": new_url, "parent_url": new_parent},
+                                new_depth,
+                            )
 
                     # Capture state after EACH URL processed (if callback set)
-                    if self._on_state_change and self._queue_shadow is not None:
-                        state = {
-                            "strategy_type": "best_first",
-                            "visited": list(visited),
-                            "queue_items": [
-                                {"score": s, "depth": d, "url": u, "parent_url": p}
-                                for s, d, u, p in self._queue_shadow
-                            ],
-                            "depths": depths,
-                            "pages_crawled": self._pages_crawled,
-                            "cancelled": self._cancel_event.is_set(),
-                        }
-                        self._last_state = state
-                        await self._on_state_change(state)
-
-        # Final state update if cancelled
-        if self._cancel_event.is_set() and self._on_state_change and self._queue_shadow is not None:
-            state = {
-                "strategy_type": "best_first",
-                "visited": list(visited),
-                "queue_items": [
-                    {"score": s, "depth": d, "url": u, "parent_url": p}
-                    for s, d, u, p in self._queue_shadow
-                ],
-                "depths": depths,
-                "pages_crawled": self._pages_crawled,
-                "cancelled": True,
-            }
-            self._last_state = state
-            await self._on_state_change(state)
+                    if checkpoints:
+                        await checkpoints.page_done(
+                            snapshot, self._pages_crawled, self._cancel_event.is_set()
+                        )
+                        self._last_state = checkpoints.last_full_state
+
+        if checkpoints:
+            # Final state update if cancelled
+            if self._cancel_event.is_set():
+                await checkpoints.report(snapshot, self._pages_crawled, True, full=True)
+            elif checkpoints.pages_since_report:
+                await checkpoints.report(snapshot, self._pages_crawled, False)
+            self._last_state = checkpoints.last_full_state
 
     async def _arun_batch(
         self,
@@ -421,9 +465,12 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         Export current crawl state for external persistence.
 
         Note: This returns the last captured state. For real-time state,
-        use the on_state_change callback.
+        use the on_state_change callback. With ``incremental_state`` a full
+        state of the current progress is built instead.
 
         Returns:
             Dict with strategy state, or None if no state captured yet.
         """
+        if self._checkpointer is not None and self.incremental_state:
+            return self._checkpointer.current_state()
         return self._last_state
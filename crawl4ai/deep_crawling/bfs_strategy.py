@@ -1,14 +1,21 @@
 # bfs_deep_crawl_strategy.py
 import asyncio
+import heapq
+import itertools
 import logging
 from datetime import datetime
-from typing import AsyncGenerator, Optional, Set, Dict, List, Tuple, Any, Callable, Awaitable, Union
+from typing import AsyncGenerator, Optional, Set, Dict, List, Tuple, Any, Callable, Awaitable, Union, Iterable, Mapping, Sequence
 from urllib.parse import urlparse
 
+import numpy as np
+
 from ..models import TraversalStats
-from .filters import FilterChain
+from .filters import FilterChain, URLBatch
 from .scorers import URLScorer
 from . import DeepCrawlStrategy  
+from .base_strategy import _url_format_error
+from .crawl_state import StateCheckpointer
+from .url_store import MemoryURLStore, URLStore
 from ..types import AsyncWebCrawler, CrawlerRunConfig, CrawlResult
 from ..utils import normalize_url_for_deep_crawl, efficient_normalize_url_for_deep_crawl
 from math import inf as infinity
@@ -21,7 +28,25 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
       - arun: Main entry point; splits execution into batch or stream modes.
       - link_discovery: Extracts, filters, and (if needed) scores the outgoing URLs.
       - can_process_url: Validates URL format and applies the filter chain.
+
+    With ``continuous=True`` there are no level barriers: a single running
+    ``arun_many`` is fed from a frontier ordered by depth, and the links of a
+    page are queued as soon as it completes, so one slow page no longer holds
+    back the next level.
+
+    ``on_state_change`` receives a full state after every processed page by
+    default. ``state_interval`` thins that out to every N pages, and
+    ``incremental_state`` sends only the changes after the first full state
+    (fold them with ``apply_state_delta``), keeping checkpoints of large
+    crawls O(1) per page.
+
+    ``url_store`` holds the visited set and URL depths; the default keeps
+    them in memory. See :mod:`crawl4ai.deep_crawling.url_store` for compact
+    and on-disk stores for very large crawls.
     """
+    _state_type = "bfs"
+    _frontier_state_key = "pending"
+
     def __init__(
         self,
         max_depth: int,
@@ -36,6 +61,10 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         on_state_change: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
         # Optional cancellation callback - checked before each URL is processed
         should_cancel: Optional[Callable[[], Union[bool, Awaitable[bool]]]] = None,
+        continuous: bool = False,
+        state_interval: int = 1,
+        incremental_state: bool = False,
+        url_store: Optional[URLStore] = None,
     ):
         self.max_depth = max_depth
         self.filter_chain = filter_chain
@@ -58,6 +87,11 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         self._on_state_change = on_state_change
         self._should_cancel = should_cancel
         self._last_state: Optional[Dict[str, Any]] = None
+        self.continuous = continuous
+        self.state_interval = state_interval
+        self.incremental_state = incremental_state
+        self.url_store = url_store or MemoryURLStore()
+        self._checkpointer: Optional[StateCheckpointer] = None
 
     async def can_process_url(self, url: str, depth: int) -> bool:
         """
@@ -65,15 +99,11 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         For the start URL (depth 0) filtering is bypassed.
         """
         try:
-            parsed = urlparse(url)
-            if not parsed.scheme or not parsed.netloc:
-                raise ValueError("Missing scheme or netloc")
-            if parsed.scheme not in ("http", "https"):
-                raise ValueError("Invalid scheme")
-            if "." not in parsed.netloc:
-                raise ValueError("Invalid domain")
+            error = _url_format_error(urlparse(url))
         except Exception as e:
-            self.logger.warning(f"Invalid URL: {url}, error: {e}")
+            error = e
+        if error:
+            self.logger.warning(f"Invalid URL: {url}, error: {error}")
             return False
 
         if depth != 0 and not await self.filter_chain.apply(url):
@@ -81,6 +111,23 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
 
         return True
 
+    async def can_process_urls(self, urls: List[str], depth: int) -> np.ndarray:
+        """
+        Batch form of can_process_url: parses each URL once and runs the
+        filter chain over the whole batch.
+        """
+        if type(self).can_process_url is not BFSDeepCrawlStrategy.can_process_url:
+            # A subclass customised the per-URL check
+            return np.array(await super().can_process_urls(urls, depth), dtype=bool)
+
+        batch = URLBatch(urls)
+        allowed = self._url_format_mask(batch)
+        if depth != 0:
+            indices = np.flatnonzero(allowed)
+            if len(indices):
+                allowed[indices] = await self.filter_chain.apply_many(batch.subset(indices))
+        return allowed
+
     def cancel(self) -> None:
         """
         Cancel the crawl. Thread-safe, can be called from any context.
@@ -160,26 +207,27 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         if self.include_external:
             links += result.links.get("external", [])
 
-        valid_links = []
-        
-        # First collect all valid links
+        # Collect the page's new URLs, once each
+        candidates = []
         for link in links:
             url = link.get("href")
             # Strip URL fragments to avoid duplicate crawling
-            # base_url = url.split('#')[0] if url else url
             base_url = normalize_url_for_deep_crawl(url, source_url)
-            if base_url in visited:
-                continue
-            if not await self.can_process_url(base_url, next_depth):
-                self.stats.urls_skipped += 1
-                continue
+            if base_url not in visited:
+                candidates.append(base_url)
+        candidates = list(dict.fromkeys(candidates))
 
-            # Score the URL if a scorer is provided
-            score = self.url_scorer.score(base_url) if self.url_scorer else 0
-            
+        # Validate, filter and score the whole page at once
+        allowed = await self.can_process_urls(candidates, next_depth)
+        accepted = [url for url, ok in zip(candidates, allowed) if ok]
+        self.stats.urls_skipped += len(candidates) - len(accepted)
+        scores = self.url_scorer.score_many(accepted).tolist() if self.url_scorer else [0] * len(accepted)
+
+        valid_links = []
+        for base_url, score in zip(accepted, scores):
             # Skip URLs with scores below the threshold
             if score < self.score_threshold:
-                self.logger.debug(f"URL {url} skipped: score {score} below threshold {self.score_threshold}")
+                self.logger.debug(f"URL {base_url} skipped: score {score} below threshold {self.score_threshold}")
                 self.stats.urls_skipped += 1
                 continue
 
@@ -214,26 +262,32 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         Batch (non-streaming) mode:
         Processes one BFS level at a time, then yields all the results.
         """
+        if self.continuous:
+            return [result async for result in self._arun_continuous(start_url, crawler, config)]
+
         # Reset cancel event for strategy reuse
         self._cancel_event = asyncio.Event()
 
         # Conditional state initialization for resume support
-        if self._resume_state:
-            visited = set(self._resume_state.get("visited", []))
-            current_level = [
-                (item["url"], item["parent_url"])
-                for item in self._resume_state.get("pending", [])
-            ]
-            depths = dict(self._resume_state.get("depths", {}))
-            self._pages_crawled = self._resume_state.get("pages_crawled", 0)
-        else:
-            # Original initialization
-            visited: Set[str] = set()
-            # current_level holds tuples: (url, parent_url)
-            current_level: List[Tuple[str, Optional[str]]] = [(start_url, None)]
-            depths: Dict[str, int] = {start_url: 0}
+        visited, depths = self._open_url_store(start_url)
+        # Levels hold tuples: (url, parent_url)
+        level_names, current_level, next_level = self._open_levels(start_url)
 
         results: List[CrawlResult] = []
+        checkpoints = self._start_checkpoints()
+        if checkpoints:
+            visited = self._track_state_sets(checkpoints, visited)
+            checkpoints.track_frontier(current_level)
+
+        def snapshot(pending=None) -> Dict[str, Any]:
+            return {
+                "strategy_type": "bfs",
+                **self.url_store.export_set("visited", visited),
+                **self.url_store.export_queue("pending", next_level if pending is None else pending),
+                **self.url_store.export_map("depths", depths),
+                "pages_crawled": self._pages_crawled,
+                "cancelled": self._cancel_event.is_set(),
+            }
 
         while current_level and not self._cancel_event.is_set():
             # Check if we've already reached max_pages before starting a new level
@@ -246,8 +300,11 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
                 self.logger.info("Crawl cancelled by user")
                 break
 
-            next_level: List[Tuple[str, Optional[str]]] = []
-            urls = [url for url, _ in current_level]
+            next_level = self.url_store.open_queue(level_names[1])
+            if checkpoints:
+                checkpoints.frontier_clear()
+            urls = self._level_urls(current_level)
+            parents = self._parent_index(current_level)
 
             # Clone the config to disable deep crawling recursion and enforce batch mode.
             batch_config = config.clone(deep_crawl_strategy=None, stream=False)
@@ -258,8 +315,7 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
                 depth = depths.get(url, 0)
                 result.metadata = result.metadata or {}
                 result.metadata["depth"] = depth
-                parent_url = next((parent for (u, parent) in current_level if u == url), None)
-                result.metadata["parent_url"] = parent_url
+                result.metadata["parent_url"] = parents.get(url)
                 results.append(result)
 
                 # Only discover links from successful crawls
@@ -268,35 +324,24 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
                     self._pages_crawled += 1
 
                     # Link discovery will handle the max pages limit internally
+                    discovered = len(next_level)
                     await self.link_discovery(result, url, depth, visited, next_level, depths)
 
                     # Capture state after EACH URL processed (if callback set)
-                    if self._on_state_change:
-                        state = {
-                            "strategy_type": "bfs",
-                            "visited": list(visited),
-                            "pending": [{"url": u, "parent_url": p} for u, p in next_level],
-                            "depths": depths,
-                            "pages_crawled": self._pages_crawled,
-                            "cancelled": self._cancel_event.is_set(),
-                        }
-                        self._last_state = state
-                        await self._on_state_change(state)
+                    if checkpoints:
+                        for u, p in next_level[discovered:]:
+                            checkpoints.frontier_add({"url": u, "parent_url": p}, depths[u])
+                        await self._checkpoint(checkpoints, snapshot)
 
             current_level = next_level
+            level_names.reverse()
 
-        # Final state update if cancelled
-        if self._cancel_event.is_set() and self._on_state_change:
-            state = {
-                "strategy_type": "bfs",
-                "visited": list(visited),
-                "pending": [{"url": u, "parent_url": p} for u, p in current_level],
-                "depths": depths,
-                "pages_crawled": self._pages_crawled,
-                "cancelled": True,
-            }
-            self._last_state = state
-            await self._on_state_change(state)
+        if checkpoints:
+            # Final state update if cancelled
+            if self._cancel_event.is_set():
+                await self._checkpoint(checkpoints, lambda: snapshot(current_level), final=True)
+            else:
+                await self._flush_checkpoint(checkpoints, snapshot)
 
         return results
 
@@ -310,23 +355,32 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         Streaming mode:
         Processes one BFS level at a time and yields results immediately as they arrive.
         """
+        if self.continuous:
+            async for result in self._arun_continuous(start_url, crawler, config):
+                yield result
+            return
+
         # Reset cancel event for strategy reuse
         self._cancel_event = asyncio.Event()
 
         # Conditional state initialization for resume support
-        if self._resume_state:
-            visited = set(self._resume_state.get("visited", []))
-            current_level = [
-                (item["url"], item["parent_url"])
-                for item in self._resume_state.get("pending", [])
-            ]
-            depths = dict(self._resume_state.get("depths", {}))
-            self._pages_crawled = self._resume_state.get("pages_crawled", 0)
-        else:
-            # Original initialization
-            visited: Set[str] = set()
-            current_level: List[Tuple[str, Optional[str]]] = [(start_url, None)]
-            depths: Dict[str, int] = {start_url: 0}
+        visited, depths = self._open_url_store(start_url)
+        level_names, current_level, next_level = self._open_levels(start_url)
+
+        checkpoints = self._start_checkpoints()
+        if checkpoints:
+            visited = self._track_state_sets(checkpoints, visited)
+            checkpoints.track_frontier(current_level)
+
+        def snapshot(pending=None) -> Dict[str, Any]:
+            return {
+                "strategy_type": "bfs",
+                **self.url_store.export_set("visited", visited),
+                **self.url_store.export_queue("pending", next_level if pending is None else pending),
+                **self.url_store.export_map("depths", depths),
+                "pages_crawled": self._pages_crawled,
+                "cancelled": self._cancel_event.is_set(),
+            }
 
         while current_level and not self._cancel_event.is_set():
             # Check external cancellation callback before processing this level
@@ -334,9 +388,12 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
                 self.logger.info("Crawl cancelled by user")
                 break
 
-            next_level: List[Tuple[str, Optional[str]]] = []
-            urls = [url for url, _ in current_level]
-            visited.update(urls)
+            next_level = self.url_store.open_queue(level_names[1])
+            if checkpoints:
+                checkpoints.frontier_clear()
+            visited.update(self._level_urls(current_level))
+            urls = self._level_urls(current_level)
+            parents = self._parent_index(current_level)
 
             stream_config = config.clone(deep_crawl_strategy=None, stream=True)
             stream_gen = await crawler.arun_many(urls=urls, config=stream_config)
@@ -348,8 +405,7 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
                 depth = depths.get(url, 0)
                 result.metadata = result.metadata or {}
                 result.metadata["depth"] = depth
-                parent_url = next((parent for (u, parent) in current_level if u == url), None)
-                result.metadata["parent_url"] = parent_url
+                result.metadata["parent_url"] = parents.get(url)
                 
                 # Count only successful crawls
                 if result.success:
@@ -365,40 +421,240 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
                 # Only discover links from successful crawls
                 if result.success:
                     # Link discovery will handle the max pages limit internally
+                    discovered = len(next_level)
                     await self.link_discovery(result, url, depth, visited, next_level, depths)
 
                     # Capture state after EACH URL processed (if callback set)
-                    if self._on_state_change:
-                        state = {
-                            "strategy_type": "bfs",
-                            "visited": list(visited),
-                            "pending": [{"url": u, "parent_url": p} for u, p in next_level],
-                            "depths": depths,
-                            "pages_crawled": self._pages_crawled,
-                            "cancelled": self._cancel_event.is_set(),
-                        }
-                        self._last_state = state
-                        await self._on_state_change(state)
+                    if checkpoints:
+                        for u, p in next_level[discovered:]:
+                            checkpoints.frontier_add({"url": u, "parent_url": p}, depths[u])
+                        await self._checkpoint(checkpoints, snapshot)
 
             # If we didn't get results back (e.g. due to errors), avoid getting stuck in an infinite loop
             # by considering these URLs as visited but not counting them toward the max_pages limit
-            if results_count == 0 and urls:
-                self.logger.warning(f"No results returned for {len(urls)} URLs, marking as visited")
+            if results_count == 0 and current_level:
+                self.logger.warning(f"No results returned for {len(current_level)} URLs, marking as visited")
 
             current_level = next_level
+            level_names.reverse()
 
-        # Final state update if cancelled
-        if self._cancel_event.is_set() and self._on_state_change:
-            state = {
-                "strategy_type": "bfs",
-                "visited": list(visited),
-                "pending": [{"url": u, "parent_url": p} for u, p in current_level],
-                "depths": depths,
-                "pages_crawled": self._pages_crawled,
-                "cancelled": True,
-            }
-            self._last_state = state
-            await self._on_state_change(state)
+        if checkpoints:
+            # Final state update if cancelled
+            if self._cancel_event.is_set():
+                await self._checkpoint(checkpoints, lambda: snapshot(current_level), final=True)
+            else:
+                await self._flush_checkpoint(checkpoints, snapshot)
+
+    def _open_levels(self, start_url: str) -> Tuple[List[str], Sequence, Sequence]:
+        """
+        Queue names and the current and next levels from ``url_store``; the
+        current level is restored from ``resume_state`` if set.
+
+        Levels alternate between two queues: each level clears the queue of
+        the one before the current.
+        """
+        level_names = ["level_a", "level_b"]
+        state = self._resume_state or None
+        current_level = self.url_store.open_queue(level_names[0], state, key="pending")
+        if state:
+            self._pages_crawled = state.get("pages_crawled", 0)
+        else:
+            current_level.append((start_url, None))
+        next_level = self.url_store.open_queue(level_names[1])
+        return level_names, current_level, next_level
+
+    @staticmethod
+    def _level_urls(level: Sequence) -> Iterable[str]:
+        """URLs of a level; lazy for levels held by a URL store."""
+        if isinstance(level, list):
+            return [url for url, _ in level]
+        return level.urls()
+
+    @staticmethod
+    def _parent_index(level: Sequence) -> Mapping[str, Optional[str]]:
+        """Parent of each URL of a level; the first entry wins for duplicates."""
+        if not isinstance(level, list):
+            return level.parents
+        parents: Dict[str, Optional[str]] = {}
+        for url, parent in level:
+            parents.setdefault(url, parent)
+        return parents
+
+    def _open_url_store(self, start_url: str) -> Tuple[Set[str], Dict[str, int]]:
+        """Visited set and depths from ``url_store``, restored from ``resume_state`` if set."""
+        state = self._resume_state or None
+        visited = self.url_store.open_set("visited", state)
+        depths = self.url_store.open_map("depths", state)
+        if state is None:
+            depths[start_url] = 0
+        return visited, depths
+
+    def _start_checkpoints(self) -> Optional[StateCheckpointer]:
+        """State checkpointer for a new run, or None without ``on_state_change``."""
+        self._checkpointer = None
+        if self._on_state_change:
+            self._checkpointer = StateCheckpointer(
+                self._on_state_change,
+                self._state_type,
+                self._frontier_state_key,
+                interval=self.state_interval,
+                incremental=self.incremental_state,
+            )
+        return self._checkpointer
+
+    def _track_state_sets(self, checkpoints: StateCheckpointer, visited: Set[str]) -> Set[str]:
+        """Register the growing sets of the state; returns the visited set to use."""
+        return checkpoints.track("visited", visited)
+
+    async def _checkpoint(
+        self,
+        checkpoints: StateCheckpointer,
+        snapshot: Callable[[], Dict[str, Any]],
+        final: bool = False,
+    ) -> None:
+        """Count a processed page, or with ``final`` report a full state now."""
+        if final:
+            await checkpoints.report(snapshot, self._pages_crawled, self._cancel_event.is_set(), full=True)
+        else:
+            await checkpoints.page_done(snapshot, self._pages_crawled, self._cancel_event.is_set())
+        self._last_state = checkpoints.last_full_state
+
+    async def _flush_checkpoint(
+        self, checkpoints: StateCheckpointer, snapshot: Callable[[], Dict[str, Any]]
+    ) -> None:
+        """Report pages processed since the last report when the crawl ends."""
+        if checkpoints.pages_since_report:
+            await checkpoints.report(snapshot, self._pages_crawled, self._cancel_event.is_set())
+            self._last_state = checkpoints.last_full_state
+
+    def _frontier_key(self, depth: int, seq: int) -> Tuple[int, int]:
+        """Frontier order of continuous mode: shallowest first, then discovery order."""
+        return (depth, seq)
+
+    def _load_frontier(self, start_url: str) -> Tuple[Set[str], List[Tuple[str, Optional[str], int]], Dict[str, int]]:
+        """Visited set, frontier items ``(url, parent_url, depth)`` and depths to start from."""
+        visited, depths = self._open_url_store(start_url)
+        if self._resume_state:
+            items = [
+                (item["url"], item["parent_url"], depths.get(item["url"], 0))
+                for item in self._resume_state.get("pending", [])
+            ]
+            self._pages_crawled = self._resume_state.get("pages_crawled", 0)
+            return visited, items, depths
+        visited.add(start_url)
+        return visited, [(start_url, None, 0)], depths
+
+    def _frontier_item(self, url: str, parent: Optional[str], depth: int) -> Dict[str, Any]:
+        """A frontier entry as it appears in the state."""
+        return {"url": url, "parent_url": parent}
+
+    def _frontier_state(
+        self,
+        visited: Set[str],
+        pending: List[Tuple[str, Optional[str], int]],
+        depths: Dict[str, int],
+    ) -> Dict[str, Any]:
+        """Resumable state of continuous mode; ``pending`` is in crawl order."""
+        return {
+            "strategy_type": "bfs",
+            **self.url_store.export_set("visited", visited),
+            "pending": [self._frontier_item(u, p, d) for u, p, d in pending],
+            **self.url_store.export_map("depths", depths),
+            "pages_crawled": self._pages_crawled,
+            "cancelled": self._cancel_event.is_set(),
+        }
+
+    async def _arun_continuous(
+        self,
+        start_url: str,
+        crawler: AsyncWebCrawler,
+        config: CrawlerRunConfig,
+    ) -> AsyncGenerator[CrawlResult, None]:
+        """
+        Continuous mode, shared by batch and stream:
+        Feeds one running ``arun_many`` from the frontier and yields results as
+        they arrive. Links found on a page join the frontier immediately. No
+        more URLs are handed out while successes plus in-flight crawls would
+        exceed ``max_pages``.
+        """
+        # Reset cancel event for strategy reuse
+        self._cancel_event = asyncio.Event()
+
+        visited, items, depths = self._load_frontier(start_url)
+        frontier: List[Tuple[Tuple[int, int], str, Optional[str], int]] = []
+        counter = itertools.count()
+        # URLs handed to the dispatcher and not returned yet: url -> (parent, depth)
+        in_flight: Dict[str, Tuple[Optional[str], int]] = {}
+        wake = asyncio.Event()
+        checkpoints = self._start_checkpoints()
+        if checkpoints:
+            visited = self._track_state_sets(checkpoints, visited)
+
+        def push(url: str, parent: Optional[str], depth: int) -> None:
+            heapq.heappush(frontier, (self._frontier_key(depth, next(counter)), url, parent, depth))
+            if checkpoints:
+                checkpoints.frontier_add(self._frontier_item(url, parent, depth), depth)
+
+        def snapshot() -> Dict[str, Any]:
+            queued = [(u, p, d) for _, u, p, d in sorted(frontier)]
+            pending = [(u, p, d) for u, (p, d) in in_flight.items()] + queued
+            return self._frontier_state(visited, pending, depths)
+
+        for url, parent, depth in items:
+            push(url, parent, depth)
+
+        async def feed():
+            while True:
+                if frontier and self._pages_crawled + len(in_flight) < self.max_pages:
+                    if await self._check_cancellation():
+                        self.logger.info("Crawl cancelled by user")
+                        return
+                    _, url, parent, depth = heapq.heappop(frontier)
+                    if depth > self.max_depth:
+                        if checkpoints:
+                            checkpoints.frontier_remove(url)
+                        continue
+                    in_flight[url] = (parent, depth)
+                    yield url
+                    continue
+                if not in_flight:
+                    return
+                wake.clear()
+                await wake.wait()
+
+        stream_config = config.clone(deep_crawl_strategy=None, stream=True)
+        stream_gen = await crawler.arun_many(urls=feed(), config=stream_config)
+        try:
+            async for result in stream_gen:
+                url = result.url
+                parent, depth = in_flight.pop(url, (None, depths.get(url, 0)))
+                if checkpoints:
+                    checkpoints.frontier_remove(url)
+                result.metadata = result.metadata or {}
+                result.metadata["depth"] = depth
+                result.metadata["parent_url"] = parent
+
+                if result.success:
+                    self._pages_crawled += 1
+                    new_links: List[Tuple[str, Optional[str]]] = []
+                    await self.link_discovery(result, url, depth, visited, new_links, depths)
+                    for new_url, new_parent in new_links:
+                        push(new_url, new_parent, depths.get(new_url, depth + 1))
+
+                    if checkpoints:
+                        await self._checkpoint(checkpoints, snapshot)
+                wake.set()
+                yield result
+        finally:
+            if hasattr(stream_gen, "aclose"):
+                await stream_gen.aclose()
+
+        if checkpoints:
+            # Final state update if cancelled
+            if self._cancel_event.is_set():
+                await self._checkpoint(checkpoints, snapshot, final=True)
+            else:
+                await self._flush_checkpoint(checkpoints, snapshot)
 
     async def shutdown(self) -> None:
         """
@@ -412,9 +668,12 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         Export current crawl state for external persistence.
 
         Note: This returns the last captured state. For real-time state,
-        use the on_state_change callback.
+        use the on_state_change callback. With ``incremental_state`` a full
+        state of the current progress is built instead.
 
         Returns:
             Dict with strategy state, or None if no state captured yet.
         """
+        if self._checkpointer is not None and self.incremental_state:
+            return self._checkpointer.current_state()
         return self._last_state
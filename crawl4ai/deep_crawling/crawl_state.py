@@ -0,0 +1,202 @@
+"""
+Throttled and incremental reporting of deep crawl state.
+
+A strategy with ``on_state_change`` reports its resumable state after crawled
+pages. A full snapshot lists every visited URL and the whole frontier, so
+sending one per page makes a crawl of N pages O(N^2). ``StateCheckpointer``
+sends one every ``state_interval`` pages and, with ``incremental_state``,
+sends only what changed since the previous report once the first full
+snapshot is out. ``apply_state_delta`` folds such a delta back into a full
+state that ``resume_state`` accepts.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+
+class TrackedSet(set):
+    """Set that remembers the members added since the last ``drain``."""
+
+    def __init__(self, iterable: Iterable = ()):
+        super().__init__(iterable)
+        self._added: List[Any] = []
+
+    def add(self, item) -> None:
+        if item not in self:
+            super().add(item)
+            self._added.append(item)
+
+    def update(self, *iterables) -> None:
+        for iterable in iterables:
+            for item in iterable:
+                self.add(item)
+
+    def drain(self) -> List[Any]:
+        added, self._added = self._added, []
+        return added
+
+
+class StateCheckpointer:
+    """
+    Decides when and in what form a strategy reports its state.
+
+    The strategy registers its growing sets with ``track`` and reports
+    frontier changes with ``frontier_add``, ``frontier_remove`` and
+    ``frontier_clear``; these only cost anything in incremental mode.
+    ``page_done`` is called after each processed page with a callable that
+    builds the full state, which only runs when a full snapshot is due.
+
+    Args:
+        callback: The strategy's ``on_state_change``.
+        strategy_type: ``strategy_type`` of the reported states.
+        frontier_key: State key of the frontier list ("pending", "stack" or
+            "queue_items"); its items are dicts with a "url" key.
+        interval: Report after every ``interval`` processed pages.
+        incremental: Report deltas after the first full snapshot.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[Dict[str, Any]], Awaitable[None]],
+        strategy_type: str,
+        frontier_key: str,
+        interval: int = 1,
+        incremental: bool = False,
+    ):
+        self.callback = callback
+        self.strategy_type = strategy_type
+        self.frontier_key = frontier_key
+        self.interval = max(1, interval)
+        self.incremental = incremental
+        self.last_full_state: Optional[Dict[str, Any]] = None
+        self.snapshot: Optional[Callable[[], Dict[str, Any]]] = None
+        self._sets: Dict[str, TrackedSet] = {}
+        self._pages = 0
+        self._full_sent = False
+        self._depths: Dict[str, int] = {}
+        self._added: Dict[str, Dict[str, Any]] = {}
+        self._removed: Dict[str, None] = {}
+        self._cleared = False
+        self._frontier_tracked = True
+
+    def track(self, name: str, values: Set[str]) -> Set[str]:
+        """
+        Return the set to use for state key ``name``, tracked in incremental mode.
+
+        Only in-memory sets are tracked; sets of other URL stores appear in full
+        snapshots only.
+        """
+        if not self.incremental or not isinstance(values, set):
+            return values
+        tracked = values if isinstance(values, TrackedSet) else TrackedSet(values)
+        self._sets[name] = tracked
+        return tracked
+
+    def track_frontier(self, values: Any) -> None:
+        """
+        Track frontier changes in incremental mode only if the frontier is a
+        list; frontiers held by a URL store appear in full snapshots only.
+        """
+        self._frontier_tracked = isinstance(values, list)
+
+    def frontier_add(self, item: Dict[str, Any], depth: int) -> None:
+        if self.incremental and self._frontier_tracked:
+            self._removed.pop(item["url"], None)
+            self._added[item["url"]] = item
+            self._depths[item["url"]] = depth
+
+    def frontier_remove(self, url: str) -> None:
+        if self.incremental and self._frontier_tracked:
+            self._added.pop(url, None)
+            self._removed[url] = None
+
+    def frontier_clear(self) -> None:
+        if self.incremental and self._frontier_tracked:
+            self._added.clear()
+            self._removed.clear()
+            self._cleared = True
+
+    @property
+    def pages_since_report(self) -> int:
+        return self._pages
+
+    async def page_done(
+        self, snapshot: Callable[[], Dict[str, Any]], pages_crawled: int, cancelled: bool
+    ) -> Optional[Dict[str, Any]]:
+        """Count a processed page and report the state if one is due."""
+        self.snapshot = snapshot
+        self._pages += 1
+        if self._pages < self.interval:
+            return None
+        return await self.report(snapshot, pages_crawled, cancelled)
+
+    async def report(
+        self,
+        snapshot: Callable[[], Dict[str, Any]],
+        pages_crawled: int,
+        cancelled: bool,
+        full: bool = False,
+    ) -> Dict[str, Any]:
+        """Report the state now; ``full`` forces a full snapshot."""
+        self.snapshot = snapshot
+        self._pages = 0
+        if self.incremental and self._full_sent and not full:
+            state = {
+                "strategy_type": self.strategy_type,
+                "incremental": True,
+                "sets": {name: values.drain() for name, values in self._sets.items()},
+                "depths": self._depths,
+                "frontier_key": self.frontier_key,
+                "frontier_cleared": self._cleared,
+                "frontier_added": list(self._added.values()),
+                "frontier_removed": list(self._removed),
+                "pages_crawled": pages_crawled,
+                "cancelled": cancelled,
+            }
+        else:
+            state = snapshot()
+            for values in self._sets.values():
+                values.drain()
+            self._full_sent = True
+            self.last_full_state = state
+        self._depths = {}
+        self._added = {}
+        self._removed = {}
+        self._cleared = False
+        await self.callback(state)
+        return state
+
+    def current_state(self) -> Optional[Dict[str, Any]]:
+        """Full state for ``export_state``: the last snapshot, or a fresh one after deltas."""
+        if self.incremental and self.snapshot is not None:
+            return self.snapshot()
+        return self.last_full_state
+
+
+def apply_state_delta(state: Optional[Dict[str, Any]], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fold a state reported by ``on_state_change`` into the full state before it.
+
+    Full states are returned unchanged, so every reported state can be passed
+    through this to keep an up-to-date ``resume_state``.
+
+    Raises:
+        ValueError: If ``delta`` is incremental and there is no state to apply it to.
+    """
+    if not delta.get("incremental"):
+        return delta
+    if state is None:
+        raise ValueError("An incremental state needs the full state it follows")
+
+    merged = dict(state)
+    for name, added in delta["sets"].items():
+        merged[name] = list(state.get(name, [])) + added
+    merged["depths"] = {**state.get("depths", {}), **delta["depths"]}
+
+    key = delta["frontier_key"]
+    frontier = [] if delta["frontier_cleared"] else state.get(key, [])
+    removed = set(delta["frontier_removed"]) | {item["url"] for item in delta["frontier_added"]}
+    merged[key] = [item for item in frontier if item["url"] not in removed] + delta["frontier_added"]
+
+    for name in ("strategy_type", "pages_crawled", "cancelled"):
+        merged[name] = delta[name]
+    return merged
@@ -1,6 +1,8 @@
 # dfs_deep_crawl_strategy.py
 import asyncio
-from typing import AsyncGenerator, Optional, Set, Dict, List, Tuple
+from typing import Any, AsyncGenerator, Optional, Set, Dict, List, Tuple
+
+from .crawl_state import StateCheckpointer
 
 from ..models import CrawlResult
 from .bfs_strategy import BFSDeepCrawlStrategy  # noqa
@@ -15,7 +17,13 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
     but walk the graph with a stack so we fully explore one branch before hopping to the
     next. DFS also keeps its own ``_dfs_seen`` set so we can drop duplicate links at
     discovery time without accidentally marking them as “already crawled”.
+
+    With ``continuous=True`` the frontier hands out the deepest URL first
+    (earliest discovered among equals) to a single running ``arun_many``, so
+    several branches are explored at once instead of one page at a time.
     """
+    _state_type = "dfs"
+    _frontier_state_key = "stack"
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -23,7 +31,58 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
 
     def _reset_seen(self, start_url: str) -> None:
         """Start each crawl with a clean dedupe set seeded with the root URL."""
-        self._dfs_seen = {start_url}
+        self._dfs_seen = self.url_store.open_set("dfs_seen")
+        self._dfs_seen.add(start_url)
+
+    def _frontier_key(self, depth: int, seq: int) -> Tuple[int, int]:
+        """Deepest first, then discovery order, approximating a stack under concurrency."""
+        return (-depth, seq)
+
+    def _load_frontier(self, start_url: str):
+        visited, depths = self._open_url_store(start_url)
+        if self._resume_state:
+            self._dfs_seen = self.url_store.open_set("dfs_seen", self._resume_state)
+            self._pages_crawled = self._resume_state.get("pages_crawled", 0)
+            # The top of the saved stack is crawled first
+            items = [
+                (item["url"], item["parent_url"], item["depth"])
+                for item in reversed(self._resume_state.get("stack", []))
+            ]
+            return visited, items, depths
+        self._reset_seen(start_url)
+        visited.add(start_url)
+        return visited, [(start_url, None, 0)], depths
+
+    def _track_state_sets(self, checkpoints: StateCheckpointer, visited: Set[str]) -> Set[str]:
+        self._dfs_seen = checkpoints.track("dfs_seen", self._dfs_seen)
+        return checkpoints.track("visited", visited)
+
+    def _frontier_item(self, url: str, parent: Optional[str], depth: int) -> Dict[str, Any]:
+        return {"url": url, "parent_url": parent, "depth": depth}
+
+    def _stack_state(self, visited, stack, depths) -> Dict[str, Any]:
+        """Resumable state of the level-by-level traversal."""
+        return {
+            "strategy_type": "dfs",
+            **self.url_store.export_set("visited", visited),
+            "stack": [self._frontier_item(u, p, d) for u, p, d in stack],
+            **self.url_store.export_map("depths", depths),
+            "pages_crawled": self._pages_crawled,
+            **self.url_store.export_set("dfs_seen", self._dfs_seen),
+            "cancelled": self._cancel_event.is_set(),
+        }
+
+    def _frontier_state(self, visited, pending, depths) -> Dict[str, Any]:
+        return {
+            "strategy_type": "dfs",
+            **self.url_store.export_set("visited", visited),
+            # Stack order: the next URL to crawl is last
+            "stack": [self._frontier_item(u, p, d) for u, p, d in reversed(pending)],
+            **self.url_store.export_map("depths", depths),
+            "pages_crawled": self._pages_crawled,
+            **self.url_store.export_set("dfs_seen", self._dfs_seen),
+            "cancelled": self._cancel_event.is_set(),
+        }
 
     async def _arun_batch(
         self,
@@ -39,29 +98,35 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
         in control of traversal. Every successful page bumps ``_pages_crawled`` and
         seeds new stack items discovered via :meth:`link_discovery`.
         """
+        if self.continuous:
+            return [result async for result in self._arun_continuous(start_url, crawler, config)]
+
         # Reset cancel event for strategy reuse
         self._cancel_event = asyncio.Event()
 
         # Conditional state initialization for resume support
+        visited, depths = self._open_url_store(start_url)
         if self._resume_state:
-            visited = set(self._resume_state.get("visited", []))
             stack = [
                 (item["url"], item["parent_url"], item["depth"])
                 for item in self._resume_state.get("stack", [])
             ]
-            depths = dict(self._resume_state.get("depths", {}))
             self._pages_crawled = self._resume_state.get("pages_crawled", 0)
-            self._dfs_seen = set(self._resume_state.get("dfs_seen", []))
+            self._dfs_seen = self.url_store.open_set("dfs_seen", self._resume_state)
             results: List[CrawlResult] = []
         else:
-            # Original initialization
-            visited: Set[str] = set()
             # Stack items: (url, parent_url, depth)
             stack: List[Tuple[str, Optional[str], int]] = [(start_url, None, 0)]
-            depths: Dict[str, int] = {start_url: 0}
             results: List[CrawlResult] = []
             self._reset_seen(start_url)
 
+        checkpoints = self._start_checkpoints()
+        if checkpoints:
+            visited = self._track_state_sets(checkpoints, visited)
+
+        def snapshot() -> Dict[str, Any]:
+            return self._stack_state(visited, stack, depths)
+
         while stack and not self._cancel_event.is_set():
             # Check external cancellation callback before processing this URL
             if await self._check_cancellation():
@@ -69,6 +134,8 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
                 break
 
             url, parent, depth = stack.pop()
+            if checkpoints:
+                checkpoints.frontier_remove(url)
             if url in visited or depth > self.max_depth:
                 continue
             visited.add(url)
@@ -101,40 +168,19 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
                     for new_url, new_parent in reversed(new_links):
                         new_depth = depths.get(new_url, depth + 1)
                         stack.append((new_url, new_parent, new_depth))
+                        if checkpoints:
+                            checkpoints.frontier_add(self._frontier_item(new_url, new_parent, new_depth), new_depth)
 
                     # Capture state after each URL processed (if callback set)
-                    if self._on_state_change:
-                        state = {
-                            "strategy_type": "dfs",
-                            "visited": list(visited),
-                            "stack": [
-                                {"url": u, "parent_url": p, "depth": d}
-                                for u, p, d in stack
-                            ],
-                            "depths": depths,
-                            "pages_crawled": self._pages_crawled,
-                            "dfs_seen": list(self._dfs_seen),
-                            "cancelled": self._cancel_event.is_set(),
-                        }
-                        self._last_state = state
-                        await self._on_state_change(state)
-
-        # Final state update if cancelled
-        if self._cancel_event.is_set() and self._on_state_change:
-            state = {
-                "strategy_type": "dfs",
-                "visited": list(visited),
-                "stack": [
-                    {"url": u, "parent_url": p, "depth": d}
-                    for u, p, d in stack
-                ],
-                "depths": depths,
-                "pages_crawled": self._pages_crawled,
-                "dfs_seen": list(self._dfs_seen),
-                "cancelled": True,
-            }
-            self._last_state = state
-            await self._on_state_change(state)
+                    if checkpoints:
+                        await self._checkpoint(checkpoints, snapshot)
+
+        if checkpoints:
+            # Final state update if cancelled
+            if self._cancel_event.is_set():
+                await self._checkpoint(checkpoints, snapshot, final=True)
+            else:
+                await self._flush_checkpoint(checkpoints, snapshot)
 
         return results
 
@@ -151,26 +197,34 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
         yielded before we even look at the next stack entry. Successful crawls
         still feed :meth:`link_discovery`, keeping DFS order intact.
         """
+        if self.continuous:
+            async for result in self._arun_continuous(start_url, crawler, config):
+                yield result
+            return
+
         # Reset cancel event for strategy reuse
         self._cancel_event = asyncio.Event()
 
         # Conditional state initialization for resume support
+        visited, depths = self._open_url_store(start_url)
         if self._resume_state:
-            visited = set(self._resume_state.get("visited", []))
             stack = [
                 (item["url"], item["parent_url"], item["depth"])
                 for item in self._resume_state.get("stack", [])
             ]
-            depths = dict(self._resume_state.get("depths", {}))
             self._pages_crawled = self._resume_state.get("pages_crawled", 0)
-            self._dfs_seen = set(self._resume_state.get("dfs_seen", []))
+            self._dfs_seen = self.url_store.open_set("dfs_seen", self._resume_state)
         else:
-            # Original initialization
-            visited: Set[str] = set()
             stack: List[Tuple[str, Optional[str], int]] = [(start_url, None, 0)]
-            depths: Dict[str, int] = {start_url: 0}
             self._reset_seen(start_url)
 
+        checkpoints = self._start_checkpoints()
+        if checkpoints:
+            visited = self._track_state_sets(checkpoints, visited)
+
+        def snapshot() -> Dict[str, Any]:
+            return self._stack_state(visited, stack, depths)
+
         while stack and not self._cancel_event.is_set():
             # Check external cancellation callback before processing this URL
             if await self._check_cancellation():
@@ -178,6 +232,8 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
                 break
 
             url, parent, depth = stack.pop()
+            if checkpoints:
+                checkpoints.frontier_remove(url)
             if url in visited or depth > self.max_depth:
                 continue
             visited.add(url)
@@ -206,40 +262,19 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
                     for new_url, new_parent in reversed(new_links):
                         new_depth = depths.get(new_url, depth + 1)
                         stack.append((new_url, new_parent, new_depth))
+                        if checkpoints:
+                            checkpoints.frontier_add(self._frontier_item(new_url, new_parent, new_depth), new_depth)
 
                     # Capture state after each URL processed (if callback set)
-                    if self._on_state_change:
-                        state = {
-                            "strategy_type": "dfs",
-                            "visited": list(visited),
-                            "stack": [
-                                {"url": u, "parent_url": p, "depth": d}
-                                for u, p, d in stack
-                            ],
-                            "depths": depths,
-                            "pages_crawled": self._pages_crawled,
-                            "dfs_seen": list(self._dfs_seen),
-                            "cancelled": self._cancel_event.is_set(),
-                        }
-                        self._last_state = state
-                        await self._on_state_change(state)
-
-        # Final state update if cancelled
-        if self._cancel_event.is_set() and self._on_state_change:
-            state = {
-                "strategy_type": "dfs",
-                "visited": list(visited),
-                "stack": [
-                    {"url": u, "parent_url": p, "depth": d}
-                    for u, p, d in stack
-                ],
-                "depths": depths,
-                "pages_crawled": self._pages_crawled,
-                "dfs_seen": list(self._dfs_seen),
-                "cancelled": True,
-            }
-            self._last_state = state
-            await self._on_state_change(state)
+                    if checkpoints:
+                        await self._checkpoint(checkpoints, snapshot)
+
+        if checkpoints:
+            # Final state update if cancelled
+            if self._cancel_event.is_set():
+                await self._checkpoint(checkpoints, snapshot, final=True)
+            else:
+                await self._flush_checkpoint(checkpoints, snapshot)
 
     async def link_discovery(
         self,
@@ -289,22 +324,24 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
             links += result.links.get("external", [])
 
         seen = self._dfs_seen
-        valid_links: List[Tuple[str, float]] = []
-
+        candidates: List[str] = []
         for link in links:
             raw_url = link.get("href")
             if not raw_url:
                 continue
 
             normalized_url = normalize_url_for_deep_crawl(raw_url, source_url)
-            if not normalized_url or normalized_url in seen:
-                continue
+            if normalized_url and normalized_url not in seen:
+                candidates.append(normalized_url)
+        candidates = list(dict.fromkeys(candidates))
 
-            if not await self.can_process_url(normalized_url, next_depth):
-                self.stats.urls_skipped += 1
-                continue
+        allowed = await self.can_process_urls(candidates, next_depth)
+        accepted = [url for url, ok in zip(candidates, allowed) if ok]
+        self.stats.urls_skipped += len(candidates) - len(accepted)
+        scores = self.url_scorer.score_many(accepted).tolist() if self.url_scorer else [0] * len(accepted)
 
-            score = self.url_scorer.score(normalized_url) if self.url_scorer else 0
+        valid_links: List[Tuple[str, float]] = []
+        for normalized_url, score in zip(accepted, scores):
             if score < self.score_threshold:
                 self.logger.debug(
                     f"URL {normalized_url} skipped: score {score} below threshold {self.score_threshold}"
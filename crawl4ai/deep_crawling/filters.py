@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Pattern, Set, Union
-from urllib.parse import urlparse
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Pattern, Set, Union
+from urllib.parse import ParseResult, urlparse
 from array import array
 import re
 import logging
@@ -8,13 +8,144 @@ from functools import lru_cache
 import fnmatch
 from dataclasses import dataclass
 import weakref
-import math
-from collections import defaultdict
 from typing import Dict
+from ..bm25 import bm25_score, tokenize
 from ..utils import HeadPeekr
 import asyncio
 import inspect
 
+import numpy as np
+
+
+def _parse(url: str) -> Optional[ParseResult]:
+    try:
+        return urlparse(url)
+    except ValueError:
+        return None
+
+
+def _map_distinct(values: List[Any], fn: Callable[[Any], Any], dtype) -> np.ndarray:
+    """``fn`` of every value as an array, calling ``fn`` once per distinct value"""
+    results = {}
+    for value in values:
+        if value not in results:
+            results[value] = fn(value)
+    return np.fromiter((results[v] for v in values), dtype=dtype, count=len(values))
+
+
+def _trie_regex(strings: Iterable[str], terminal: str = "") -> str:
+    """
+    Regex source matching any of ``strings``, with shared prefixes factored
+    into a trie so the cost of a match attempt depends on the text, not on
+    the number of strings. ``terminal`` is appended where a string ends.
+    Longer strings are tried first.
+    """
+    trie = {}
+    for string in strings:
+        node = trie
+        for ch in string:
+            node = node.setdefault(ch, {})
+        node[None] = True
+
+    def emit(node) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(
+            (item for item in node.items() if item[0] is not None), key=lambda item: item[0]
+        )]
+        if None in node:
+            branches.append(terminal)
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return emit(trie)
+
+
+# fnmatch wildcards, including "[...]" sets the way fnmatch.translate reads them
+_GLOB_WILDCARDS = re.compile(r"\[!?\]?[^\]]*\]|[*?\[\]]")
+
+
+def _glob_literal(glob: str) -> str:
+    """Longest literal run of a glob: a substring every URL it matches contains"""
+    return max(_GLOB_WILDCARDS.split(glob), key=len)
+
+
+def _combine_regexes(regexes: List[Pattern]) -> List[Pattern]:
+    """
+    Merge regexes into one alternation where that keeps each one's meaning:
+    same flags, no named groups and no backreferences. Matching the result
+    with ``match``/``search`` equals trying every regex in turn.
+    """
+    default_flags = re.compile("").flags
+    plain, kept = [], []
+    for regex in regexes:
+        if (
+            isinstance(regex.pattern, str)
+            and regex.flags == default_flags
+            and not regex.groupindex
+            and not re.search(r"\\(?:[1-9]|g<)|\(\?P=|\(\?\(", regex.pattern)
+        ):
+            plain.append(regex)
+        else:
+            kept.append(regex)
+    if len(plain) > 1:
+        try:
+            plain = [re.compile("|".join(f"(?:{r.pattern})" for r in plain))]
+        except (re.error, RecursionError):
+            pass
+    return plain + kept
+
+
+class URLBatch:
+    """URLs parsed once and shared by the filters and scorers applied to them"""
+
+    __slots__ = ("urls", "_parsed", "_columns")
+
+    def __init__(self, urls: Iterable[str]):
+        self.urls = urls if isinstance(urls, list) else list(urls)
+        self._parsed = None
+        self._columns = {}
+
+    @classmethod
+    def of(cls, urls: Union["URLBatch", Iterable[str]]) -> "URLBatch":
+        return urls if isinstance(urls, URLBatch) else cls(urls)
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    @property
+    def parsed(self) -> List[Optional[ParseResult]]:
+        """``urlparse`` of every URL; None where the URL cannot be parsed"""
+        if self._parsed is None:
+            self._parsed = [_parse(url) for url in self.urls]
+        return self._parsed
+
+    @property
+    def paths(self) -> List[str]:
+        """Path of every URL; "" where the URL cannot be parsed"""
+        paths = self._columns.get("path")
+        if paths is None:
+            paths = self._columns["path"] = [p.path if p else "" for p in self.parsed]
+        return paths
+
+    def column(self, key: str, fn: Callable[[str], Any]) -> List[Any]:
+        """``fn(url)`` for every URL, computed once per batch and shared under ``key``"""
+        values = self._columns.get(key)
+        if values is None:
+            values = self._columns[key] = [fn(url) for url in self.urls]
+        return values
+
+    def subset(self, indices: np.ndarray) -> "URLBatch":
+        """The URLs at ``indices``, keeping what was already computed for them"""
+        batch = URLBatch([self.urls[i] for i in indices])
+        if self._parsed is not None:
+            batch._parsed = [self._parsed[i] for i in indices]
+        batch._columns = {
+            key: [values[i] for i in indices] for key, values in self._columns.items()
+        }
+        return batch
+
+
+async def _gather_mask(results: List[Awaitable[bool]]) -> np.ndarray:
+    return np.array(await asyncio.gather(*results), dtype=bool)
+
 
 @dataclass
 class FilterStats:
@@ -59,12 +190,33 @@ class URLFilter(ABC):
     def apply(self, url: str) -> bool:
         pass
 
+    def apply_many(
+        self, urls: Union[URLBatch, Iterable[str]]
+    ) -> Union[np.ndarray, Awaitable[np.ndarray]]:
+        """
+        Apply the filter to many URLs, returning one boolean per URL.
+
+        Subclasses override this to share work across the batch; the default
+        calls ``apply`` per URL and returns an awaitable when ``apply`` is async.
+        """
+        batch = URLBatch.of(urls)
+        results = [self.apply(url) for url in batch.urls]
+        if results and inspect.isawaitable(results[0]):
+            return _gather_mask(results)
+        return np.array(results, dtype=bool)
+
     def _update_stats(self, passed: bool):
         # Use direct array index for speed
         self.stats._counters[0] += 1  # total
         self.stats._counters[1] += passed  # passed
         self.stats._counters[2] += not passed  # rejected
 
+    def _update_stats_many(self, passed: np.ndarray):
+        total, accepted = len(passed), int(np.count_nonzero(passed))
+        self.stats._counters[0] += total
+        self.stats._counters[1] += accepted
+        self.stats._counters[2] += total - accepted
+
 
 class FilterChain:
     """Optimized filter chain"""
@@ -115,6 +267,45 @@ class FilterChain:
         self.stats._counters[1] += 1  # Passed
         return True
 
+    async def apply_many(self, urls: Union[URLBatch, Iterable[str]]) -> np.ndarray:
+        """
+        Batch form of ``apply``: one boolean per URL, in order.
+
+        Each sync filter sees only the URLs every earlier sync filter passed,
+        and async filters run concurrently on the URLs all sync filters passed,
+        so filters and stats see the same URLs as with ``apply``.
+        """
+        batch = URLBatch.of(urls)
+        passed = np.ones(len(batch), dtype=bool)
+        self.stats._counters[0] += len(batch)
+
+        async_filters = []
+        for f in self.filters:
+            if inspect.iscoroutinefunction(f.apply):
+                async_filters.append(f)
+                continue
+            indices = np.flatnonzero(passed)
+            if not len(indices):
+                break
+            result = f.apply_many(batch.subset(indices) if len(indices) < len(batch) else batch)
+            if inspect.isawaitable(result):
+                result = await result
+            passed[indices[~result]] = False
+            self.stats._counters[2] += int(np.count_nonzero(~result))  # Sync rejected
+
+        indices = np.flatnonzero(passed)
+        if async_filters and len(indices):
+            remaining = batch.subset(indices) if len(indices) < len(batch) else batch
+            results = np.stack(
+                await asyncio.gather(*(f.apply_many(remaining) for f in async_filters))
+            )
+            # Count how many filters rejected
+            self.stats._counters[2] += int(np.count_nonzero(~results))
+            passed[indices[~results.all(axis=0)]] = False
+
+        self.stats._counters[1] += int(np.count_nonzero(passed))  # Passed
+        return passed
+
 
 class URLPatternFilter(URLFilter):
     """Pattern filter balancing speed and completeness"""
@@ -127,7 +318,15 @@ class URLPatternFilter(URLFilter):
         "_simple_prefixes",
         "_domain_patterns",
         "_path_patterns",
+        "_path_literals",
         "_reverse",
+        # Compiled from the above by _compile_matchers
+        "_domain_regexes",
+        "_prefix_regex",
+        "_path_prefix_regex",
+        "_literal_regex",
+        "_literal_candidates",
+        "_unindexed_regexes",
     )
 
     PATTERN_TYPES = {
@@ -157,10 +356,12 @@ class URLPatternFilter(URLFilter):
         self._simple_prefixes = set()
         self._domain_patterns = []
         self._path_patterns = []
+        self._path_literals = []
 
         for pattern in patterns:
             pattern_type = self._categorize_pattern(pattern)
             self._add_pattern(pattern, pattern_type)
+        self._compile_matchers()
 
     def _categorize_pattern(self, pattern: str) -> int:
         """Categorize pattern for specialized handling"""
@@ -190,6 +391,7 @@ class URLPatternFilter(URLFilter):
                 pattern.startswith("^") or pattern.endswith("$") or "\\d" in pattern
             ):
                 self._path_patterns.append(re.compile(pattern))
+                self._path_literals.append("")
                 return
         elif pattern_type == self.PATTERN_TYPES["SUFFIX"]:
             self._simple_suffixes.add(pattern[2:])
@@ -198,6 +400,7 @@ class URLPatternFilter(URLFilter):
         elif pattern_type == self.PATTERN_TYPES["DOMAIN"]:
             self._domain_patterns.append(re.compile(pattern.replace("*.", r"[^/]+\.")))
         else:
+            literal = ""
             if isinstance(pattern, str):
                 # Handle complex glob patterns
                 if "**" in pattern:
@@ -209,52 +412,99 @@ class URLPatternFilter(URLFilter):
                         lambda m: f'({"|".join(m.group(1).split(","))})',
                         pattern,
                     )
+                literal = _glob_literal(pattern)
                 pattern = fnmatch.translate(pattern)
             self._path_patterns.append(
                 pattern if isinstance(pattern, Pattern) else re.compile(pattern)
             )
-
-    @lru_cache(maxsize=10000)
-    def apply(self, url: str) -> bool:
-        url_path = urlparse(url).path
-
+            self._path_literals.append(literal)
+
+    def _compile_matchers(self):
+        """
+        Compile the patterns so a URL is checked in a few regex calls
+        whatever the number of patterns:
+
+        - prefixes become one trie regex each for absolute and path prefixes
+        - every glob is indexed by its longest literal; a trie regex finds the
+          literals present in the URL and only the globs owning one are
+          searched, merged into one alternation per literal
+        - domain patterns, regexes and globs without a literal are merged into
+          alternations
+        """
+        self._domain_regexes = _combine_regexes(self._domain_patterns)
+
+        # Prefixes must be followed by the end of the string, "/", "?" or "#"
+        boundary = r"(?=[/?#]|\Z)"
+        absolute = [p for p in self._simple_prefixes if "://" in p]
+        relative = [p for p in self._simple_prefixes if "://" not in p]
+        self._prefix_regex = re.compile(_trie_regex(absolute, boundary)) if absolute else None
+        self._path_prefix_regex = re.compile(_trie_regex(relative, boundary)) if relative else None
+
+        by_literal, unindexed = {}, []
+        for index, (regex, literal) in enumerate(zip(self._path_patterns, self._path_literals)):
+            if literal:
+                by_literal.setdefault(literal, []).append(index)
+            else:
+                unindexed.append(regex)
+        self._unindexed_regexes = _combine_regexes(unindexed)
+        self._literal_regex = None
+        self._literal_candidates = {}
+        if by_literal:
+            # At each position the trie regex reports the longest literal
+            # starting there; shorter literals at that position are its prefixes
+            self._literal_regex = re.compile(f"(?=({_trie_regex(by_literal)}))")
+            self._literal_candidates = {
+                literal: _combine_regexes([
+                    self._path_patterns[index]
+                    for end in range(1, len(literal) + 1)
+                    for index in by_literal.get(literal[:end], ())
+                ])
+                for literal in by_literal
+            }
+
+    def _matches(self, url: str, url_path: str) -> bool:
         # Quick suffix check (*.html)
         if self._simple_suffixes:
             if url_path.split("/")[-1].split(".")[-1] in self._simple_suffixes:
-                result = True
-                self._update_stats(result)
-                return not result if self._reverse else result
+                return True
 
         # Domain check
-        if self._domain_patterns:
-            for pattern in self._domain_patterns:
-                if pattern.match(url):
-                    result = True
-                    self._update_stats(result)
-                    return not result if self._reverse else result
+        for regex in self._domain_regexes:
+            if regex.match(url):
+                return True
 
         # Prefix check (/foo/* or https://domain/foo/*)
-        if self._simple_prefixes:
-            for prefix in self._simple_prefixes:
-                # Use url_path for path-only prefixes, full URL for absolute prefixes
-                match_against = url if '://' in prefix else url_path
-                if match_against.startswith(prefix):
-                    if len(match_against) == len(prefix) or match_against[len(prefix)] in ['/', '?', '#']:
-                        result = True
-                        self._update_stats(result)
-                        return not result if self._reverse else result
+        if self._prefix_regex is not None and self._prefix_regex.match(url):
+            return True
+        if self._path_prefix_regex is not None and self._path_prefix_regex.match(url_path):
+            return True
 
         # Complex patterns
-        if self._path_patterns:
-            if any(p.search(url) for p in self._path_patterns):
-                result = True
-                self._update_stats(result)
-                return not result if self._reverse else result
+        for regex in self._unindexed_regexes:
+            if regex.search(url):
+                return True
+        if self._literal_regex is not None:
+            for literal in set(self._literal_regex.findall(url)):
+                for regex in self._literal_candidates[literal]:
+                    if regex.search(url):
+                        return True
+
+        return False
 
-        result = False
+    @lru_cache(maxsize=10000)
+    def apply(self, url: str) -> bool:
+        result = self._matches(url, urlparse(url).path)
         self._update_stats(result)
         return not result if self._reverse else result
 
+    def apply_many(self, urls: Union[URLBatch, Iterable[str]]) -> np.ndarray:
+        batch = URLBatch.of(urls)
+        result = np.fromiter(
+            map(self._matches, batch.urls, batch.paths), dtype=bool, count=len(batch)
+        )
+        self._update_stats_many(result)
+        return ~result if self._reverse else result
+
 
 class ContentTypeFilter(URLFilter):
     """Optimized content type filter using fast lookups"""
@@ -421,6 +671,18 @@ class ContentTypeFilter(URLFilter):
         self._update_stats(result)
         return result
 
+    def apply_many(self, urls: Union[URLBatch, Iterable[str]]) -> np.ndarray:
+        batch = URLBatch.of(urls)
+        if not self._check_extension:
+            result = np.ones(len(batch), dtype=bool)
+        else:
+            extensions = batch.column("extension", self._extract_extension)
+            result = _map_distinct(
+                extensions, lambda ext: not ext or ext in self._ext_map, bool
+            )
+        self._update_stats_many(result)
+        return result
+
 
 class DomainFilter(URLFilter):
     """Optimized domain filter with fast lookups and caching"""
@@ -468,36 +730,46 @@ class DomainFilter(URLFilter):
         match = DomainFilter._DOMAIN_REGEX.search(url)
         return match.group(1).lower() if match else ""
 
-    def apply(self, url: str) -> bool:
-        """Optimized domain checking with early returns"""
-        # Skip processing if no filters
-        if not self._blocked_domains and self._allowed_domains is None:
-            self._update_stats(True)
-            return True
-
-        domain = self._extract_domain(url)
-
+    def _domain_allowed(self, domain: str) -> bool:
         # Check for blocked domains, including subdomains
         for blocked in self._blocked_domains:
             if self._is_subdomain(domain, blocked):
-                self._update_stats(False)
                 return False
 
         # If no allowed domains specified, accept all non-blocked
         if self._allowed_domains is None:
-            self._update_stats(True)
             return True
 
         # Check if domain matches any allowed domain (including subdomains)
         for allowed in self._allowed_domains:
             if self._is_subdomain(domain, allowed):
-                self._update_stats(True)
                 return True
 
         # No matches found
-        self._update_stats(False)
         return False
 
+    def apply(self, url: str) -> bool:
+        """Optimized domain checking with early returns"""
+        # Skip processing if no filters
+        if not self._blocked_domains and self._allowed_domains is None:
+            self._update_stats(True)
+            return True
+
+        result = self._domain_allowed(self._extract_domain(url))
+        self._update_stats(result)
+        return result
+
+    def apply_many(self, urls: Union[URLBatch, Iterable[str]]) -> np.ndarray:
+        """Check each distinct domain of the batch once"""
+        batch = URLBatch.of(urls)
+        if not self._blocked_domains and self._allowed_domains is None:
+            result = np.ones(len(batch), dtype=bool)
+        else:
+            domains = batch.column("domain", self._extract_domain)
+            result = _map_distinct(domains, self._domain_allowed, bool)
+        self._update_stats_many(result)
+        return result
+
 
 class ContentRelevanceFilter(URLFilter):
     """BM25-based relevance filter using head section content"""
@@ -554,28 +826,11 @@ class ContentRelevanceFilter(URLFilter):
 
     def _tokenize(self, text: str) -> List[str]:
         """Fast case-insensitive tokenization"""
-        return text.lower().split()
+        return tokenize(text)
 
     def _bm25(self, document: str) -> float:
-        """Optimized BM25 implementation for head sections"""
-        doc_terms = self._tokenize(document)
-        doc_len = len(doc_terms)
-        tf = defaultdict(int)
-
-        for term in doc_terms:
-            tf[term] += 1
-
-        score = 0.0
-        for term in set(self.query_terms):
-            term_freq = tf[term]
-            idf = math.log((1 + 1) / (term_freq + 0.5) + 1)  # Simplified IDF
-            numerator = term_freq * (self.k1 + 1)
-            denominator = term_freq + self.k1 * (
-                1 - self.b + self.b * (doc_len / self.avgdl)
-            )
-            score += idf * (numerator / denominator)
-
-        return score
+        """BM25 for head sections, scored against the empirical average length"""
+        return bm25_score(self._tokenize(document), self.query_terms, self.avgdl, self.k1, self.b)
 
 
 class SEOFilter(URLFilter):
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional, Union
 from dataclasses import dataclass
 from urllib.parse import urlparse, unquote
 import re
@@ -8,6 +8,10 @@ from functools import lru_cache
 from array import array
 import ctypes
 import platform
+
+import numpy as np
+
+from .filters import URLBatch, _map_distinct
 PLATFORM = platform.system()
 
 # Pre-computed scores for common year differences
@@ -44,6 +48,17 @@ class ScoringStats:
         if self._max_score is not None:
             if score > self._max_score:
                 self._max_score = score
+
+    def update_many(self, scores: np.ndarray) -> None:
+        """Record a batch of scores at once"""
+        if not len(scores):
+            return
+        self._urls_scored += len(scores)
+        self._total_score += float(scores.sum())
+        if self._min_score is not None:
+            self._min_score = min(self._min_score, float(scores.min()))
+        if self._max_score is not None:
+            self._max_score = max(self._max_score, float(scores.max()))
                 
     def get_average(self) -> float:
         """Direct calculation instead of property"""
@@ -78,6 +93,23 @@ class URLScorer(ABC):
         score = self._calculate_score(url) * self._weight
         self._stats.update(score)
         return score
+
+    def _calculate_scores(self, batch: URLBatch) -> np.ndarray:
+        """Raw scores of a batch; override to share work across its URLs."""
+        return np.fromiter(
+            map(self._calculate_score, batch.urls), dtype=np.float64, count=len(batch)
+        )
+
+    def score_many(self, urls: Union[URLBatch, Iterable[str]]) -> np.ndarray:
+        """Weighted scores of many URLs, in order."""
+        batch = URLBatch.of(urls)
+        cls = type(self)
+        if cls.score is not URLScorer.score and cls._calculate_scores is URLScorer._calculate_scores:
+            # A subclass customised score() only
+            return np.fromiter(map(self.score, batch.urls), dtype=np.float64, count=len(batch))
+        scores = self._calculate_scores(batch) * self._weight
+        self._stats.update_many(scores)
+        return scores
     
     @property
     def stats(self):
@@ -112,7 +144,6 @@ class CompositeScorer(URLScorer):
         self._weights_array = array('f', [s.weight for s in scorers])
         self._score_array = array('f', [0.0] * len(scorers))
 
-    @lru_cache(maxsize=10000)
     def _calculate_score(self, url: str) -> float:
         """Calculate combined score from all scoring strategies.
         
@@ -157,6 +188,17 @@ class CompositeScorer(URLScorer):
         self.stats.update(score)
         return score
 
+    def _calculate_scores(self, batch: URLBatch) -> np.ndarray:
+        """Combined scores of a batch, one vector per scoring strategy."""
+        if not self._scorers:
+            return np.zeros(len(batch))
+        # Like _calculate_score, keep each weighted score at float32 precision
+        scores = np.stack([scorer.score_many(batch) for scorer in self._scorers])
+        total = scores.astype(np.float32).astype(np.float64).sum(axis=0)
+        if self._normalize:
+            return total / len(self._scorers)
+        return total
+
 class KeywordRelevanceScorer(URLScorer):
     __slots__ = ('_weight', '_stats', '_keywords', '_case_sensitive')
     
@@ -227,13 +269,22 @@ class PathDepthScorer(URLScorer):
             
         return depth
 
-    @lru_cache(maxsize=10000)  # Cache the whole calculation
-    def _calculate_score(self, url: str) -> float:
+    @classmethod
+    def _url_depth(cls, url: str) -> int:
         pos = url.find('/', url.find('://') + 3)
         if pos == -1:
-            depth = 0
-        else:
-            depth = self._quick_depth(url[pos:])
+            return 0
+        return cls._quick_depth(url[pos:])
+
+    def _calculate_scores(self, batch: URLBatch) -> np.ndarray:
+        depths = np.fromiter(map(self._url_depth, batch.urls), dtype=np.int64, count=len(batch))
+        distance = np.abs(depths - self._optimal_depth)
+        lookup = np.array(_SCORE_LOOKUP)[np.minimum(distance, len(_SCORE_LOOKUP) - 1)]
+        return np.where(distance < len(_SCORE_LOOKUP), lookup, 1.0 / (1.0 + distance))
+
+    @lru_cache(maxsize=10000)  # Cache the whole calculation
+    def _calculate_score(self, url: str) -> float:
+        depth = self._url_depth(url)
             
         # Use lookup table for common distances
         distance = depth - self._optimal_depth
@@ -411,6 +462,22 @@ class FreshnessScorer(URLScorer):
         # Fallback calculation for older content
         return max(0.1, 1.0 - year_diff * 0.1)
 
+    def _calculate_scores(self, batch: URLBatch) -> np.ndarray:
+        # -1 marks URLs without a year
+        years = np.fromiter(
+            (year if year is not None else -1 for year in map(self._extract_year, batch.urls)),
+            dtype=np.int64,
+            count=len(batch),
+        )
+        year_diff = self._current_year - years
+        table = np.array(_FRESHNESS_SCORES)
+        scores = np.where(
+            year_diff < len(table),
+            table[np.minimum(year_diff, len(table) - 1)],
+            np.maximum(0.1, 1.0 - year_diff * 0.1),
+        )
+        return np.where(years < 0, 0.5, scores)
+
 class DomainAuthorityScorer(URLScorer):
     __slots__ = ('_weight', '_domain_weights', '_default_weight', '_top_domains')
     
@@ -508,12 +575,18 @@ class DomainAuthorityScorer(URLScorer):
         Returns:
             Authority score between 0.0 and 1.0 * weight
         """
-        domain = self._extract_domain(url)
-        
+        return self._domain_score(self._extract_domain(url))
+
+    def _domain_score(self, domain: str) -> float:
         # Fast path: check top domains first
         score = self._top_domains.get(domain)
         if score is not None:
             return score
             
         # Regular path: check all domains
-        return self._domain_weights.get(domain, self._default_weight)
\ No newline at end of file
+        return self._domain_weights.get(domain, self._default_weight)
+
+    def _calculate_scores(self, batch: URLBatch) -> np.ndarray:
+        """Score each distinct domain of the batch once"""
+        domains = batch.column("authority_domain", self._extract_domain)
+        return _map_distinct(domains, self._domain_score, np.float64)
\ No newline at end of file
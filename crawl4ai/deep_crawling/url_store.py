@@ -0,0 +1,530 @@
+"""
+Storage for the visited sets and depth maps of deep crawls.
+
+The strategies keep every URL they have seen, and the depth it was found
+at, for the whole crawl. In memory that is a few hundred bytes per URL,
+gigabytes for a multi-million page site. A ``URLStore`` passed as
+``url_store`` decides where they live:
+
+- ``MemoryURLStore``: Python sets and dicts. The default.
+- ``BloomURLStore``: visited sets in a fixed-size bloom filter of about two
+  bytes per URL. Membership has a small false positive rate, so a few new
+  URLs may be taken as already seen and skipped.
+- ``SQLiteURLStore``: sets, depth maps and the pending URLs of each BFS
+  level in an SQLite file. The state reported to ``on_state_change``
+  references the file instead of listing its URLs, so snapshots stay small
+  and a crawl resumes from the file.
+
+Queues (``open_queue``) hold the levels of ``BFSDeepCrawlStrategy``, which
+can reach millions of URLs on a large site. The frontiers of continuous
+BFS, DFS and best-first crawls stay in memory: they are popped one URL at a
+time in priority or stack order, which these FIFO queues do not provide.
+Set ``max_pages`` to bound them.
+"""
+
+import base64
+import hashlib
+import math
+import os
+import sqlite3
+import tempfile
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, MutableMapping, MutableSet, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class URLStore(ABC):
+    """
+    Creates and exports the URL sets and depth maps of a crawl's state.
+
+    Each set or map is identified by its state key ("visited", "dfs_seen",
+    "depths"). ``open_set`` and ``open_map`` start an empty one, or restore it
+    from a state reported earlier when ``state`` is given; ``export_set`` and
+    ``export_map`` return the state entries describing it.
+
+    Queues of ``(url, parent_url)`` pairs work the same way through
+    ``open_queue`` and ``export_queue``; they are lists unless a store
+    overrides them.
+    """
+
+    @abstractmethod
+    def open_set(self, name: str, state: Optional[Dict[str, Any]] = None) -> MutableSet:
+        pass
+
+    @abstractmethod
+    def open_map(self, name: str, state: Optional[Dict[str, Any]] = None) -> MutableMapping:
+        pass
+
+    @abstractmethod
+    def export_set(self, name: str, values: MutableSet) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def export_map(self, name: str, values: MutableMapping) -> Dict[str, Any]:
+        pass
+
+    def open_queue(
+        self, name: str, state: Optional[Dict[str, Any]] = None, key: Optional[str] = None
+    ) -> List[Tuple[str, Optional[str]]]:
+        """
+        Start an empty queue, or restore the one a state lists under ``key``
+        (``name`` by default).
+        """
+        if not state:
+            return []
+        return [(item["url"], item["parent_url"]) for item in state.get(key or name, [])]
+
+    def export_queue(self, key: str, values: Iterable[Tuple[str, Optional[str]]]) -> Dict[str, Any]:
+        """State entries describing a queue under ``key``."""
+        return {key: [{"url": url, "parent_url": parent} for url, parent in values]}
+
+    def close(self) -> None:
+        """Release the resources held by the store."""
+
+
+class MemoryURLStore(URLStore):
+    """Plain sets and dicts; states list every URL."""
+
+    def open_set(self, name, state=None):
+        return set(state.get(name, [])) if state else set()
+
+    def open_map(self, name, state=None):
+        return dict(state.get(name, {})) if state else {}
+
+    def export_set(self, name, values):
+        return {name: list(values)}
+
+    def export_map(self, name, values):
+        return {name: values}
+
+
+class BloomFilter(MutableSet):
+    """
+    Set of strings in a bit array, sized for ``capacity`` members at the given
+    false positive rate.
+
+    Members cannot be listed or removed, and ``len`` counts the additions that
+    changed the filter. Positions come from blake2b, so a filter written by
+    ``to_state`` reads back the same in any process.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        capacity = max(1, capacity)
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self._count = 0
+
+    def _positions(self, item: str) -> Iterator[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def __contains__(self, item) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def add(self, item: str) -> None:
+        bits = self.bits
+        changed = False
+        for pos in self._positions(item):
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                bits[pos >> 3] |= mask
+                changed = True
+        self._count += changed
+
+    def update(self, *iterables: Iterable[str]) -> None:
+        for iterable in iterables:
+            for item in iterable:
+                self.add(item)
+
+    def discard(self, item) -> None:
+        raise TypeError("Members cannot be removed from a bloom filter")
+
+    def __iter__(self):
+        raise TypeError("A bloom filter cannot list its members")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "hash_count": self.hash_count,
+            "count": self._count,
+            "bits": base64.b64encode(bytes(self.bits)).decode("ascii"),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "BloomFilter":
+        bloom = cls.__new__(cls)
+        bloom.size = state["size"]
+        bloom.hash_count = state["hash_count"]
+        bloom._count = state["count"]
+        bloom.bits = bytearray(base64.b64decode(state["bits"]))
+        return bloom
+
+
+class BloomURLStore(URLStore):
+    """
+    Visited sets in bloom filters; depth maps stay dicts.
+
+    States carry each filter as ``<name>_bloom`` next to an empty ``<name>``
+    list. Incremental state reports do not include filter changes, so resume
+    from a full state.
+
+    Args:
+        capacity: Expected number of URLs per set.
+        error_rate: False positive rate at ``capacity`` URLs.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+
+    def open_set(self, name, state=None):
+        if state and state.get(f"{name}_bloom"):
+            bloom = BloomFilter.from_state(state[f"{name}_bloom"])
+        else:
+            bloom = BloomFilter(self.capacity, self.error_rate)
+        if state:
+            # States written by other stores list their URLs
+            bloom.update(state.get(name, []))
+        return bloom
+
+    def open_map(self, name, state=None):
+        return dict(state.get(name, {})) if state else {}
+
+    def export_set(self, name, values):
+        if isinstance(values, BloomFilter):
+            return {name: [], f"{name}_bloom": values.to_state()}
+        return {name: list(values)}
+
+    def export_map(self, name, values):
+        return {name: values}
+
+
+class _SQLiteSet(MutableSet):
+    def __init__(self, store: "SQLiteURLStore", name: str):
+        self._store = store
+        self._db = store._db
+        self.name = name
+        self._len = self._db.execute(
+            "SELECT COUNT(*) FROM urls WHERE name = ?", (name,)
+        ).fetchone()[0]
+
+    def __contains__(self, url) -> bool:
+        return self._db.execute(
+            "SELECT 1 FROM urls WHERE name = ? AND url = ?", (self.name, url)
+        ).fetchone() is not None
+
+    def add(self, url: str) -> None:
+        cursor = self._db.execute(
+            "INSERT OR IGNORE INTO urls (name, url) VALUES (?, ?)", (self.name, url)
+        )
+        if cursor.rowcount:
+            self._len += 1
+
+    def update(self, *iterables: Iterable[str]) -> None:
+        for iterable in iterables:
+            for url in iterable:
+                self.add(url)
+
+    def discard(self, url) -> None:
+        cursor = self._db.execute(
+            "DELETE FROM urls WHERE name = ? AND url = ?", (self.name, url)
+        )
+        if cursor.rowcount:
+            self._len -= 1
+
+    def __iter__(self):
+        for (url,) in self._db.execute("SELECT url FROM urls WHERE name = ?", (self.name,)):
+            yield url
+
+    def __len__(self) -> int:
+        return self._len
+
+
+class _SQLiteMap(MutableMapping):
+    def __init__(self, store: "SQLiteURLStore", name: str):
+        self._store = store
+        self._db = store._db
+        self.name = name
+        self._len = self._db.execute(
+            "SELECT COUNT(*) FROM depths WHERE name = ?", (name,)
+        ).fetchone()[0]
+
+    def get(self, url, default=None):
+        row = self._db.execute(
+            "SELECT value FROM depths WHERE name = ? AND url = ?", (self.name, url)
+        ).fetchone()
+        return default if row is None else row[0]
+
+    def __getitem__(self, url) -> int:
+        value = self.get(url)
+        if value is None:
+            raise KeyError(url)
+        return value
+
+    def __setitem__(self, url: str, value: int) -> None:
+        if url not in self:
+            self._len += 1
+        self._db.execute(
+            "INSERT OR REPLACE INTO depths (name, url, value) VALUES (?, ?, ?)",
+            (self.name, url, value),
+        )
+
+    def __delitem__(self, url) -> None:
+        cursor = self._db.execute(
+            "DELETE FROM depths WHERE name = ? AND url = ?", (self.name, url)
+        )
+        if not cursor.rowcount:
+            raise KeyError(url)
+        self._len -= 1
+
+    def __contains__(self, url) -> bool:
+        return self.get(url) is not None
+
+    def __iter__(self):
+        for (url,) in self._db.execute("SELECT url FROM depths WHERE name = ?", (self.name,)):
+            yield url
+
+    def __len__(self) -> int:
+        return self._len
+
+
+class _SQLiteParents(Mapping):
+    """Parent of each URL of a queue; the first entry wins for duplicates."""
+
+    def __init__(self, queue: "_SQLiteQueue"):
+        self._queue = queue
+
+    def __getitem__(self, url) -> Optional[str]:
+        row = self._queue._db.execute(
+            "SELECT parent FROM queue WHERE name = ? AND url = ? ORDER BY seq LIMIT 1",
+            (self._queue.name, url),
+        ).fetchone()
+        if row is None:
+            raise KeyError(url)
+        return row[0]
+
+    def __iter__(self):
+        return iter(dict.fromkeys(self._queue.urls()))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class _SQLiteQueue(Sequence):
+    """``(url, parent_url)`` pairs in insertion order; ``seq`` is the index."""
+
+    BATCH_SIZE = 1000
+
+    def __init__(self, store: "SQLiteURLStore", name: str):
+        self._db = store._db
+        self.name = name
+        self._len = self._db.execute(
+            "SELECT COUNT(*) FROM queue WHERE name = ?", (name,)
+        ).fetchone()[0]
+        self.parents = _SQLiteParents(self)
+
+    def append(self, item: Tuple[str, Optional[str]]) -> None:
+        url, parent = item
+        self._db.execute(
+            "INSERT INTO queue (name, seq, url, parent) VALUES (?, ?, ?, ?)",
+            (self.name, self._len, url, parent),
+        )
+        self._len += 1
+
+    def extend(self, items: Iterable[Tuple[str, Optional[str]]]) -> None:
+        for item in items:
+            self.append(item)
+
+    def _rows(self, start: int, stop: int) -> List[Tuple[str, Optional[str]]]:
+        return [
+            tuple(row) for row in self._db.execute(
+                "SELECT url, parent FROM queue WHERE name = ? AND seq >= ? AND seq < ? ORDER BY seq",
+                (self.name, start, stop),
+            )
+        ]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            rows = self._rows(start, stop) if start < stop else []
+            return rows if step == 1 else rows[::step]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError(index)
+        return self._rows(index, index + 1)[0]
+
+    def __iter__(self):
+        # Read in batches so no cursor stays open across the caller's writes
+        for start in range(0, self._len, self.BATCH_SIZE):
+            yield from self._rows(start, start + self.BATCH_SIZE)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def urls(self) -> Iterator[str]:
+        return (url for url, _ in self)
+
+
+class SQLiteURLStore(URLStore):
+    """
+    Sets, depth maps and queues in an SQLite file.
+
+    States carry ``<name>_store`` with the file path next to an empty
+    ``<name>`` entry, and for queues ``<name>_queue``, the queue's name in
+    the file. Changes are committed only when a state is exported, so
+    after a crash the file matches the last reported state; ``close`` drops
+    the changes made since. Resuming from a reported state continues from
+    the referenced file's contents, copied in when the store is on another
+    ``path``; starting a new crawl clears them.
+
+    Args:
+        path: Database file. By default a temporary file, deleted by
+            ``close``; pass a path to resume after the store was closed.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self._temporary = path is None
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="crawl4ai-urls-", suffix=".db")
+            os.close(fd)
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS urls (
+                name TEXT NOT NULL,
+                url TEXT NOT NULL,
+                PRIMARY KEY (name, url)
+            ) WITHOUT ROWID
+            """
+        )
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS queue (
+                name TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                url TEXT NOT NULL,
+                parent TEXT,
+                PRIMARY KEY (name, seq)
+            ) WITHOUT ROWID
+            """
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS queue_url ON queue (name, url)")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS depths (
+                name TEXT NOT NULL,
+                url TEXT NOT NULL,
+                value INTEGER NOT NULL,
+                PRIMARY KEY (name, url)
+            ) WITHOUT ROWID
+            """
+        )
+        self._db.commit()
+
+    def flush(self) -> None:
+        """Commit the changes made since the last export."""
+        self._db.commit()
+
+    # Columns of each table after "name"
+    _COLUMNS = {"urls": "url", "depths": "url, value", "queue": "seq, url, parent"}
+
+    def _restore(self, table: str, name: str, source: str, source_name: str) -> None:
+        """Replace the rows of ``name`` with those of ``source_name`` in the file ``source``."""
+        same_file = os.path.abspath(source) == os.path.abspath(self.path)
+        if same_file and source_name == name:
+            return
+        if not same_file and not os.path.exists(source):
+            raise FileNotFoundError(
+                f"URL store {source!r} referenced by the resume state does not exist"
+            )
+        self.flush()
+        schema = "main" if same_file else "source"
+        if not same_file:
+            self._db.execute("ATTACH DATABASE ? AS source", (source,))
+        try:
+            columns = self._COLUMNS[table]
+            self._db.execute(f"DELETE FROM {table} WHERE name = ?", (name,))
+            self._db.execute(
+                f"INSERT INTO {table} (name, {columns})"
+                f" SELECT ?, {columns} FROM {schema}.{table} WHERE name = ?",
+                (name, source_name),
+            )
+            self.flush()
+        finally:
+            if not same_file:
+                self._db.execute("DETACH DATABASE source")
+
+    def open_set(self, name, state=None):
+        if state is None:
+            self._db.execute("DELETE FROM urls WHERE name = ?", (name,))
+            self.flush()
+        elif state.get(f"{name}_store"):
+            self._restore("urls", name, state[f"{name}_store"], name)
+        values = _SQLiteSet(self, name)
+        if state:
+            # States written by other stores list their URLs
+            values.update(state.get(name, []))
+        return values
+
+    def open_map(self, name, state=None):
+        if state is None:
+            self._db.execute("DELETE FROM depths WHERE name = ?", (name,))
+            self.flush()
+        elif state.get(f"{name}_store"):
+            self._restore("depths", name, state[f"{name}_store"], name)
+        values = _SQLiteMap(self, name)
+        if state:
+            values.update(state.get(name, {}))
+        return values
+
+    def export_set(self, name, values):
+        if isinstance(values, _SQLiteSet):
+            self.flush()
+            return {name: [], f"{name}_store": self.path}
+        return {name: list(values)}
+
+    def export_map(self, name, values):
+        if isinstance(values, _SQLiteMap):
+            self.flush()
+            return {name: {}, f"{name}_store": self.path}
+        return {name: values}
+
+    def open_queue(self, name, state=None, key=None):
+        key = key or name
+        if state and state.get(f"{key}_store"):
+            self._restore("queue", name, state[f"{key}_store"], state.get(f"{key}_queue", key))
+        else:
+            self._db.execute("DELETE FROM queue WHERE name = ?", (name,))
+        values = _SQLiteQueue(self, name)
+        if state:
+            # States written by other stores list their queue
+            values.extend((item["url"], item["parent_url"]) for item in state.get(key, []))
+        self.flush()
+        return values
+
+    def export_queue(self, key, values):
+        if isinstance(values, _SQLiteQueue):
+            self.flush()
+            return {key: [], f"{key}_store": self.path, f"{key}_queue": values.name}
+        return super().export_queue(key, values)
+
+    def close(self) -> None:
+        self._db.close()
+        if self._temporary:
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(self.path + suffix)
+                except FileNotFoundError:
+                    pass
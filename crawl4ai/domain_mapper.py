@@ -37,12 +37,6 @@ try:
 except ImportError:
     LXML = False
 
-try:
-    import rank_bm25
-    HAS_BM25 = True
-except ImportError:
-    HAS_BM25 = False
-
 from .async_logger import AsyncLoggerBase, AsyncLogger
 from .async_url_seeder import AsyncUrlSeeder, _parse_head
 from .utils import (
@@ -1053,7 +1047,7 @@ class DomainMapper:
         self, results: List[Dict[str, Any]], config: "DomainMapperConfig"
     ) -> List[Dict[str, Any]]:
         """Apply BM25 scoring to results with head data."""
-        if not HAS_BM25 or not config.query:
+        if not config.query:
             return results
 
         seeder = await self._get_seeder()
@@ -1065,6 +1065,7 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
 
     Abstract Methods:
         _parse_html(html_content): Parses raw HTML into a structured format (e.g., BeautifulSoup or lxml).
+        _parse_document(document): Same, from a shared `ParsedHTML` (defaults to `_parse_html`).
         _get_base_elements(parsed_html, selector): Retrieves base elements using a selector.
         _get_elements(element, selector): Retrieves child elements using a selector.
         _get_element_text(element): Extracts text content from an element.
@@ -1101,12 +1102,18 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
             html_content (str): The raw HTML content to parse and extract.
             *q: Additional positional arguments.
             **kwargs: Additional keyword arguments for custom extraction.
+                document_cache (DocumentCache): Optional per-page cache; when given,
+                    the parse of `html_content` is shared with other pipeline stages.
 
         Returns:
             List[Dict[str, Any]]: A list of extracted items, each represented as a dictionary.
         """
 
-        parsed_html = self._parse_html(html_content)
+        document_cache = kwargs.get("document_cache")
+        if document_cache is not None:
+            parsed_html = self._parse_document(document_cache.get(html_content))
+        else:
+            parsed_html = self._parse_html(html_content)
         base_elements = self._get_base_elements(
             parsed_html, self.schema["baseSelector"]
         )
@@ -1135,6 +1142,10 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
         """Parse HTML content into appropriate format"""
         pass
 
+    def _parse_document(self, document):
+        """Get a parsed tree from a shared `ParsedHTML`. Defaults to a private parse."""
+        return self._parse_html(document.html)
+
     @abstractmethod
     def _get_base_elements(self, parsed_html, selector: str):
         """Get all base elements using the selector"""
@@ -2016,6 +2027,10 @@ class JsonCssExtractionStrategy(JsonElementExtractionStrategy):
         # return BeautifulSoup(html_content, "html.parser")
         return BeautifulSoup(html_content, "lxml")
 
+    def _parse_document(self, document):
+        # BeautifulSoup is the explicit fallback; the soup is read-only here
+        return document.soup()
+
     def _get_base_elements(self, parsed_html, selector: str):
         return parsed_html.select(selector)
 
@@ -2082,6 +2097,13 @@ class JsonLxmlExtractionStrategy(JsonElementExtractionStrategy):
                     print(f"Critical error parsing HTML: {e2}")
                 # Create minimal document as fallback
                 return self.etree.Element("html")
+
+    def _parse_document(self, document):
+        """Use the page's shared lxml tree; extraction never mutates it"""
+        try:
+            return document.tree
+        except Exception:
+            return self._parse_html(document.html)
     
     def _optimize_selector(self, selector_str):
         """Optimize common selector patterns for better performance"""
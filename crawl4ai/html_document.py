@@ -0,0 +1,69 @@
+"""
+Parse-once HTML documents shared across the aprocess_html pipeline.
+
+A single page used to be parsed by the scraping strategy, again by the
+extraction strategy and again by anything else that needed a tree. A
+``DocumentCache`` lives for one ``aprocess_html`` call and hands out one
+``ParsedHTML`` per distinct HTML string, so every stage that needs a tree of
+the same string shares a single lxml parse. Stages that mutate the tree take a
+``clone()``, which is a deepcopy and costs a fraction of a re-parse.
+BeautifulSoup is only built on explicit request through ``soup()``.
+"""
+
+import copy
+from typing import Dict
+
+from bs4 import BeautifulSoup
+from lxml import html as lhtml
+
+
+class ParsedHTML:
+    """
+    An HTML string with its lazily-built lxml tree.
+
+    The tree is parsed with ``lxml.html.document_fromstring``, the same parser
+    ``LXMLWebScrapingStrategy`` uses, so fragments are wrapped in
+    ``<html><body>`` exactly as the scraper sees them.
+
+    Args:
+        html: The HTML string.
+    """
+
+    def __init__(self, html: str):
+        self.html = html
+        self._tree = None
+        self._soup = None
+
+    @property
+    def tree(self):
+        """The shared lxml tree. Treat it as read-only; use ``clone()`` to mutate."""
+        if self._tree is None:
+            self._tree = lhtml.document_fromstring(self.html)
+        return self._tree
+
+    def clone(self):
+        """Return a private deep copy of the tree that the caller may mutate."""
+        return copy.deepcopy(self.tree)
+
+    def soup(self) -> BeautifulSoup:
+        """BeautifulSoup fallback for consumers that have no lxml path."""
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, "lxml")
+        return self._soup
+
+
+class DocumentCache:
+    """Per-page registry mapping HTML strings to their ``ParsedHTML``."""
+
+    def __init__(self):
+        self._documents: Dict[str, ParsedHTML] = {}
+
+    def get(self, html: str) -> ParsedHTML:
+        """Return the ``ParsedHTML`` for ``html``, creating it on first use."""
+        document = self._documents.get(html)
+        if document is None:
+            document = self._documents[html] = ParsedHTML(html)
+        return document
+
+    def __len__(self) -> int:
+        return len(self._documents)
@@ -7,7 +7,7 @@ from tqdm import tqdm
 import time
 import psutil
 import numpy as np
-from rank_bm25 import BM25Okapi
+from crawl4ai.bm25 import BM25Index
 from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
@@ -288,7 +288,7 @@ Wrap your response in <index>...</index> tags.
                     self.logger.info(
                         f"Building BM25 index with {len(existing_facts)} cached facts."
                     )
-                    self.bm25_index = BM25Okapi(existing_tokens)
+                    self.bm25_index = BM25Index(existing_tokens)
                     self.tokenized_facts = existing_facts
                     with open(self.bm25_index_file, "wb") as f:
                         pickle.dump(
@@ -362,7 +362,7 @@ Wrap your response in <index>...</index> tags.
         self.logger.info(
             f"Building BM25 index with {len(all_facts)} total facts (old + new)."
         )
-        self.bm25_index = BM25Okapi(all_tokens)
+        self.bm25_index = BM25Index(all_tokens)
         self.tokenized_facts = all_facts
 
         # 4) Save the updated BM25 index to disk
@@ -0,0 +1,150 @@
+"""
+In-process L1 tier in front of the SQLite crawl cache.
+
+``AsyncDatabaseManager.aget_cached_url`` answers repeated requests for the same
+URL from here without touching SQLite or the content store. Entries are
+bounded by a byte budget (least recently used entries are evicted first) and
+expire after a TTL. The tier only sees lookups the crawler already decided to
+make, so ``CacheMode`` and ``CacheContext.should_read`` apply unchanged.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+from .models import CrawlResult
+
+
+def estimate_result_size(result: CrawlResult) -> int:
+    """Approximate in-memory footprint of a cached result, in characters."""
+    size = 0
+    for field in ("html", "cleaned_html", "extracted_content", "screenshot"):
+        value = getattr(result, field, None)
+        if value:
+            size += len(value)
+    # Rows read back from SQLite carry markdown as a plain string
+    markdown = result._markdown
+    if isinstance(markdown, str):
+        size += len(markdown)
+    elif markdown is not None:
+        for part in (
+            markdown.raw_markdown,
+            markdown.markdown_with_citations,
+            markdown.references_markdown,
+            markdown.fit_markdown,
+            markdown.fit_html,
+        ):
+            size += len(part or "")
+    # Links, media and metadata are small next to the page, count a flat share
+    return size + 1024
+
+
+class MemoryCache:
+    """
+    Size-aware LRU of ``CrawlResult`` objects with a TTL.
+
+    ``get`` returns a deep copy so callers can annotate the result (cache
+    status, redirected URL, ...) without changing the cached entry. Results
+    read with a field projection remember which content fields they carry,
+    and only serve lookups asking for a subset of those.
+
+    Args:
+        max_bytes: Byte budget for all entries; 0 disables the tier.
+        ttl: Seconds an entry stays valid.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, ttl: float = 300.0):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, int, CrawlResult, Optional[FrozenSet[str]]]]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._entries
+
+    def get(self, url: str, fields: Optional[Iterable[str]] = None) -> Optional[CrawlResult]:
+        """
+        Return a copy of the cached result, or None on a miss or expiry.
+
+        Args:
+            url: The cached URL.
+            fields: Content fields the caller needs; None means all of them.
+        """
+        if not self.enabled:
+            return None
+        entry = self._entries.get(url)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, _, result, loaded = entry
+        if loaded is not None and (fields is None or not loaded.issuperset(fields)):
+            self.misses += 1
+            return None
+        if expires_at < time.monotonic():
+            self.invalidate(url)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(url)
+        self.hits += 1
+        return result.model_copy(deep=True)
+
+    def put(self, url: str, result: CrawlResult, fields: Optional[Iterable[str]] = None):
+        """
+        Cache a result, evicting least recently used entries over budget.
+
+        Args:
+            url: The cached URL.
+            result: The result to keep a copy of.
+            fields: Content fields ``result`` was loaded with; None means all.
+        """
+        if not self.enabled:
+            return
+        size = estimate_result_size(result)
+        if size > self.max_bytes:
+            return
+        loaded = None if fields is None else frozenset(fields)
+        entry = self._entries.get(url)
+        if entry is not None and loaded is not None and (entry[3] is None or entry[3] >= loaded):
+            # Keep the entry that already covers more fields
+            return
+        self.invalidate(url)
+        self._entries[url] = (time.monotonic() + self.ttl, size, result.model_copy(deep=True), loaded)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            _, (_, evicted_size, _, _) = self._entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+            self.evictions += 1
+
+    def invalidate(self, url: str):
+        """Drop the entry for ``url`` if present."""
+        entry = self._entries.pop(url, None)
+        if entry is not None:
+            self.total_bytes -= entry[1]
+
+    def clear(self):
+        """Drop all entries. Counters are kept."""
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and current occupancy."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+        }
@@ -159,6 +159,70 @@ async def backup_database(db_path: str) -> str:
         raise e
 
 
+async def compress_content_store(db_path: Optional[str] = None) -> int:
+    """
+    Rewrite the uncompressed files of the file content store as zstd frames.
+
+    Files that are already compressed are left alone, so the migration can be
+    re-run safely. Pages of a domain with a trained dictionary are compressed
+    with it. Each file is replaced atomically.
+
+    Returns:
+        Number of files compressed.
+    """
+    from urllib.parse import urlparse
+    from .content_store import (
+        COMPRESSED_CONTENT_TYPES,
+        ZSTD_MAGIC,
+        ContentCompressor,
+        FileContentStore,
+    )
+
+    if db_path is None:
+        db_path = os.path.join(Path.home(), ".crawl4ai", "crawl4ai.db")
+    base_dir = os.path.dirname(db_path)
+    compressor = ContentCompressor(dictionary_dir=os.path.join(base_dir, "zstd_dictionaries"))
+    store = FileContentStore(base_dir)
+
+    # Map content hashes to the domain they were cached for
+    domains = {}
+    if os.path.exists(db_path):
+        async with aiosqlite.connect(db_path) as db:
+            async with db.execute(
+                """SELECT url, html, cleaned_html, markdown, extracted_content
+                   FROM crawled_data"""
+            ) as cursor:
+                async for url, *hashes in cursor:
+                    domain = urlparse(url).hostname
+                    for content_hash in hashes:
+                        if content_hash:
+                            domains.setdefault(content_hash, domain)
+
+    logger.info("Compressing cached content...", tag="INIT")
+    compressed = 0
+    for content_type in sorted(COMPRESSED_CONTENT_TYPES):
+        directory = store.content_paths[content_type]
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            if name.endswith(".tmp") or not os.path.isfile(path):
+                continue
+            async with aiofiles.open(path, "rb") as f:
+                data = await f.read()
+            if data.startswith(ZSTD_MAGIC):
+                continue
+            # Decode the way the text-mode store read it back
+            content = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+            async with aiofiles.open(path + ".tmp", "wb") as f:
+                await f.write(compressor.compress(content, content_type, domains.get(name)))
+            os.replace(path + ".tmp", path)
+            compressed += 1
+            if compressed % 1000 == 0:
+                logger.info(f"Compressed {compressed} files...", tag="INIT")
+
+    logger.success(f"Compression completed. {compressed} files compressed.", tag="COMPLETE")
+    return compressed
+
+
 async def run_migration(db_path: Optional[str] = None):
     """Run database migration"""
     if db_path is None:
@@ -185,9 +249,17 @@ def main():
         description="Migrate Crawl4AI database to file-based storage"
     )
     parser.add_argument("--db-path", help="Custom database path")
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Compress existing cached content with zstd (requires zstandard)",
+    )
     args = parser.parse_args()
 
-    asyncio.run(run_migration(args.db_path))
+    if args.compress:
+        asyncio.run(compress_content_store(args.db_path))
+    else:
+        asyncio.run(run_migration(args.db_path))
 
 
 if __name__ == "__main__":
@@ -18,6 +18,7 @@ class DomainState:
     last_request_time: float = 0
     current_delay: float = 0
     fail_count: int = 0
+    retry_after_until: float = 0
 
 
 @dataclass
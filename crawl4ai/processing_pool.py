@@ -0,0 +1,168 @@
+"""
+CPU worker pool for HTML post-processing.
+
+Scraping (lxml) and markdown generation (html2text) are pure CPU work. Run on
+the event loop they block every other in-flight crawl, including the CDP
+traffic of the browsers. This module holds the post-processing pipeline used by
+``AsyncWebCrawler.aprocess_html`` and an opt-in process pool that runs it in
+worker processes, shipping raw HTML out and ``ScrapingResult`` +
+``MarkdownGenerationResult`` back.
+"""
+
+import asyncio
+import os
+import pickle
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from .markdown_generation_strategy import MarkdownGenerationStrategy
+from .models import MarkdownGenerationResult
+from .utils import preprocess_html_for_schema
+
+BASE_TAG_PATTERN = re.compile(r'<base\s[^>]*href\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+
+
+def scrape_and_generate_markdown(
+    scraping_strategy,
+    markdown_generator: MarkdownGenerationStrategy,
+    url: str,
+    html: str,
+    params: Dict[str, Any],
+    logger=None,
+) -> Tuple[Any, MarkdownGenerationResult, str]:
+    """
+    Run the scraping strategy and the markdown generator over raw HTML.
+
+    Args:
+        scraping_strategy: Content scraping strategy to run.
+        markdown_generator: Markdown generation strategy to run.
+        url: The URL being processed.
+        html: Raw HTML content.
+        params: Keyword arguments forwarded to ``scraping_strategy.scrap``.
+        logger: Optional logger for non-fatal warnings.
+
+    Returns:
+        Tuple of (scraping result, markdown result, fit_html). The scraping
+        result is a ``ScrapingResult`` or, for legacy strategies, a dict.
+
+    Raises:
+        ValueError: If the scraping strategy returns no result.
+    """
+    result = scraping_strategy.scrap(url, html, **params)
+    if result is None:
+        raise ValueError(
+            f"Process HTML, Failed to extract content from the website: {url}"
+        )
+
+    if isinstance(result, dict):
+        cleaned_html = result.get("cleaned_html", "")
+    else:
+        cleaned_html = result.cleaned_html
+
+    fit_html = preprocess_html_for_schema(html_content=html, text_threshold=500, max_size=300_000)
+
+    # Select the HTML source based on the generator's content_source
+    selected_html_source = getattr(markdown_generator, 'content_source', 'cleaned_html')
+    html_source_selector = {
+        "raw_html": lambda: html,
+        "cleaned_html": lambda: cleaned_html,
+        "fit_html": lambda: fit_html,
+    }
+    try:
+        markdown_input_html = html_source_selector.get(selected_html_source, lambda: cleaned_html)()
+    except Exception as e:
+        if logger:
+            logger.warning(
+                f"Error getting/processing '{selected_html_source}' for markdown source: {e}. Falling back to cleaned_html.",
+                tag="MARKDOWN_SRC"
+            )
+        markdown_input_html = cleaned_html
+
+    # Extract <base href> from raw HTML before it gets stripped by cleaning.
+    # This ensures relative URLs resolve correctly even with cleaned_html.
+    base_url = params.get("base_url") or params.get("redirected_url") or url
+    base_tag_match = BASE_TAG_PATTERN.search(html)
+    if base_tag_match:
+        base_url = base_tag_match.group(1)
+
+    markdown_result = markdown_generator.generate_markdown(
+        input_html=markdown_input_html,
+        base_url=base_url,
+    )
+    return result, markdown_result, fit_html
+
+
+def _run_pickled(payload: bytes) -> Tuple[Any, MarkdownGenerationResult, str]:
+    """Worker entry point: unpickle the arguments of ``scrape_and_generate_markdown`` and run it."""
+    return scrape_and_generate_markdown(*pickle.loads(payload))
+
+
+class HTMLProcessingPool:
+    """
+    Process pool that runs ``scrape_and_generate_markdown`` off the event loop.
+
+    Workers are spawned lazily on first use. When a strategy or a param cannot
+    be pickled (hooks, clients, locks) the page is processed inline on the
+    event loop instead, so enabling the pool never changes results.
+
+    Args:
+        max_workers: Number of worker processes. ``None`` or a value below 1
+                     sizes the pool to the number of CPU cores.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        if not max_workers or max_workers < 1:
+            max_workers = os.cpu_count() or 1
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._inline_reasons = set()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def run(
+        self,
+        scraping_strategy,
+        markdown_generator: MarkdownGenerationStrategy,
+        url: str,
+        html: str,
+        params: Dict[str, Any],
+        logger=None,
+    ) -> Tuple[Any, MarkdownGenerationResult, str]:
+        """Run the post-processing pipeline in a worker process, or inline if it cannot be pickled."""
+        # Parsed trees cannot come back from the worker, so sharing them
+        # across the process boundary would only add a clone; cache verdicts
+        # are crawl bookkeeping, not scraping input.
+        shipped = {
+            k: v for k, v in params.items() if k not in ("document_cache", "_cache_verdicts")
+        }
+        try:
+            payload = pickle.dumps((scraping_strategy, markdown_generator, url, html, shipped))
+        except Exception as e:
+            self._log_inline(str(e), logger)
+            return scrape_and_generate_markdown(
+                scraping_strategy, markdown_generator, url, html, params, logger
+            )
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), _run_pickled, payload)
+
+    def _log_inline(self, reason: str, logger) -> None:
+        """Log once per distinct reason that pages are processed inline."""
+        if logger is None or reason in self._inline_reasons:
+            return
+        self._inline_reasons.add(reason)
+        logger.warning(
+            message="Processing HTML in-process, arguments cannot be sent to the CPU workers: {reason}",
+            tag="POOL",
+            params={"reason": reason},
+        )
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes. The pool restarts on next use."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
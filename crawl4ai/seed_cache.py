@@ -0,0 +1,259 @@
+"""
+Indexed on-disk cache of the seed URLs found by ``AsyncUrlSeeder``.
+
+Each cached listing (the sitemap URLs or the Common Crawl URLs of one domain)
+is one SQLite file:
+
+- ``header``: a single row with the listing's age, source URL, newest
+  ``<lastmod>`` and URL count. Checking whether the cache is still valid reads
+  only this row.
+- ``urls``: the URLs, keyed by their canonical form (no scheme, no leading
+  ``www.``). A pattern with a literal prefix such as ``example.com/blog/*`` is
+  answered with a range scan of that key instead of reading every URL, and
+  results are streamed in batches.
+- ``parts``: the sub-sitemaps of a sitemap index with their ``<lastmod>``.
+  Every URL records the part it came from, so a refresh re-downloads only
+  the sub-sitemaps whose ``<lastmod>`` changed and keeps the URLs of the
+  others.
+
+A refresh is staged in temporary tables private to the connection while the
+sitemaps download, and applied to the listing in one short transaction by
+``commit``. An interrupted refresh leaves the previous listing intact, and
+concurrent refreshes of the same listing never hold its write lock while
+waiting on the network.
+"""
+
+import os
+import sqlite3
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+SEED_CACHE_VERSION = 2
+
+# Largest code point; as UTF-8 it sorts after every other character
+_PREFIX_END = "\U0010ffff"
+
+
+def canonical_url(url: str) -> str:
+    """``url`` without its scheme and leading ``www.``, the key of the ``urls`` table."""
+    canon = url.split("://", 1)[-1]
+    return canon[4:] if canon.startswith("www.") else canon
+
+
+class SeedCache:
+    """
+    Seed URLs of one domain from one source, in an SQLite file.
+
+    Args:
+        path: Database file; created if missing.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Autocommit: the only transaction on the listing is the one in commit()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS header (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                version INTEGER NOT NULL,
+                created_at TEXT NOT NULL,
+                source_url TEXT,
+                lastmod TEXT,
+                url_count INTEGER NOT NULL
+            )
+            """
+        )
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS urls (
+                canon TEXT NOT NULL,
+                url TEXT NOT NULL,
+                part TEXT NOT NULL,
+                PRIMARY KEY (canon, url, part)
+            ) WITHOUT ROWID
+            """
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS urls_part ON urls (part)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS parts (part TEXT PRIMARY KEY, lastmod TEXT)"
+        )
+        # Staging area of a refresh
+        self._db.execute("CREATE TEMP TABLE keep_parts (part TEXT PRIMARY KEY)")
+        self._db.execute(
+            "CREATE TEMP TABLE new_urls (canon TEXT NOT NULL, url TEXT NOT NULL, part TEXT NOT NULL)"
+        )
+        self._db.execute("CREATE TEMP TABLE new_parts (part TEXT PRIMARY KEY, lastmod TEXT)")
+
+    # ── reading ──────────────────────────────────────────────────────────────
+    def header(self) -> Optional[Dict[str, object]]:
+        """The listing's header, or None if nothing was committed yet."""
+        row = self._db.execute(
+            "SELECT version, created_at, source_url, lastmod, url_count FROM header"
+        ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("version", "created_at", "source_url", "lastmod", "url_count"), row))
+
+    def is_valid(
+        self,
+        ttl_hours: int = 0,
+        validate_lastmod: bool = False,
+        current_lastmod: Optional[str] = None,
+    ) -> bool:
+        """
+        Check the header only.
+
+        Returns False (invalid) if:
+        - Nothing was committed, or the format version changed
+        - The listing is empty (likely a failed fetch)
+        - TTL expired (if ttl_hours > 0)
+        - Sitemap lastmod is newer than the cached one (if validate_lastmod=True)
+        """
+        header = self.header()
+        if header is None or header["version"] != SEED_CACHE_VERSION:
+            return False
+        if not header["url_count"]:
+            return False
+        if ttl_hours > 0:
+            try:
+                created_at = datetime.fromisoformat(str(header["created_at"]))
+            except ValueError:
+                return False
+            age_hours = (datetime.now(timezone.utc) - created_at).total_seconds() / 3600
+            if age_hours > ttl_hours:
+                return False
+        if validate_lastmod and current_lastmod:
+            cached_lastmod = header["lastmod"]
+            if cached_lastmod and current_lastmod > cached_lastmod:
+                return False
+        return True
+
+    def query(
+        self, prefix: str = "", part: Optional[str] = None, batch_size: int = 1000
+    ) -> Iterator[str]:
+        """
+        Stream the URLs whose canonical form starts with ``prefix``.
+
+        ``part`` restricts the result to the URLs of one sub-sitemap.
+        """
+        sql = "SELECT url FROM urls"
+        clauses, params = [], []
+        if prefix:
+            clauses.append("canon >= ? AND canon < ?")
+            params += [prefix, prefix + _PREFIX_END]
+        if part is not None:
+            clauses.append("part = ?")
+            params.append(part)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        cursor = self._db.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for (url,) in rows:
+                yield url
+
+    def parts(self) -> Dict[str, Optional[str]]:
+        """Sub-sitemaps of the committed listing and their ``<lastmod>``."""
+        return dict(self._db.execute("SELECT part, lastmod FROM parts"))
+
+    # ── writing ──────────────────────────────────────────────────────────────
+    def begin_refresh(self, keep: Iterable[str] = ()) -> None:
+        """
+        Start rebuilding the listing, keeping only the sub-sitemaps in ``keep``.
+
+        The URLs of every other part, including those listed directly, are
+        dropped by ``commit``; until then the listing is unchanged.
+        """
+        self._clear_staging()
+        self._db.executemany(
+            "INSERT OR IGNORE INTO keep_parts (part) VALUES (?)", ((part,) for part in keep)
+        )
+
+    def add(self, entries: Iterable[Tuple[str, str]]) -> None:
+        """Stage ``(url, part)`` pairs; part is "" for URLs listed directly."""
+        self._db.execute("BEGIN")
+        self._db.executemany(
+            "INSERT INTO new_urls (canon, url, part) VALUES (?, ?, ?)",
+            ((canonical_url(url), url, part) for url, part in entries),
+        )
+        self._db.execute("COMMIT")
+
+    def set_part(self, part: str, lastmod: Optional[str]) -> None:
+        """Record the ``<lastmod>`` of a sub-sitemap that was read in full."""
+        self._db.execute(
+            "INSERT OR REPLACE INTO new_parts (part, lastmod) VALUES (?, ?)", (part, lastmod)
+        )
+
+    def commit(self, source_url: str = "", lastmod: Optional[str] = None) -> int:
+        """Apply the staged refresh and write the header. Returns the URL count."""
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            self._db.execute("DELETE FROM urls WHERE part NOT IN (SELECT part FROM keep_parts)")
+            self._db.execute("DELETE FROM parts WHERE part NOT IN (SELECT part FROM keep_parts)")
+            self._db.execute(
+                "INSERT OR IGNORE INTO urls (canon, url, part) SELECT canon, url, part FROM new_urls"
+            )
+            self._db.execute("INSERT OR REPLACE INTO parts SELECT part, lastmod FROM new_parts")
+            url_count = self._db.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
+            self._db.execute(
+                "INSERT OR REPLACE INTO header (id, version, created_at, source_url, lastmod, url_count)"
+                " VALUES (0, ?, ?, ?, ?, ?)",
+                (
+                    SEED_CACHE_VERSION,
+                    datetime.now(timezone.utc).isoformat(),
+                    source_url,
+                    lastmod,
+                    url_count,
+                ),
+            )
+            self._db.execute("COMMIT")
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._clear_staging()
+        return url_count
+
+    def rollback(self) -> None:
+        """Discard the staged refresh."""
+        self._clear_staging()
+
+    def _clear_staging(self) -> None:
+        self._db.execute("DELETE FROM keep_parts")
+        self._db.execute("DELETE FROM new_urls")
+        self._db.execute("DELETE FROM new_parts")
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def pattern_prefix(pattern: str) -> str:
+    """
+    Canonical-form prefix shared by every URL that ``pattern`` can match.
+
+    Seed patterns are matched against the URL with and without its scheme and
+    leading ``www.`` (see ``AsyncUrlSeeder``), so the literal part of the
+    pattern before its first wildcard is reduced the same way. When that
+    reduction is ambiguous (the literal part stops inside ``https://`` or
+    ``www.``) the empty prefix, meaning all URLs, is returned.
+    """
+    literal = pattern
+    for i, ch in enumerate(pattern):
+        if ch in "*?[":
+            literal = pattern[:i]
+            break
+    if "://" in literal:
+        literal = literal.split("://", 1)[1]
+    elif any(scheme.startswith(literal) for scheme in ("http://", "https://")):
+        return ""
+    if literal.startswith("www."):
+        return literal[4:]
+    if "www.".startswith(literal):
+        return ""
+    return literal
+
@@ -35,6 +35,12 @@ class TableExtractionStrategy(ABC):
         """
         self.verbose = kwargs.get("verbose", False)
         self.logger = kwargs.get("logger", None)
+
+    def __getstate__(self):
+        # Loggers are not picklable; workers run without one.
+        state = self.__dict__.copy()
+        state["logger"] = None
+        return state
     
     @abstractmethod
     def extract_tables(self, element: etree.Element, **kwargs) -> List[Dict[str, Any]]:
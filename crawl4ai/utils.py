@@ -364,6 +364,26 @@ class RobotsParser:
             
         return parser.can_fetch(user_agent, url)
 
+    def crawl_delay(self, url: str, user_agent: str = "*") -> Optional[float]:
+        """
+        Crawl-delay from the cached robots.txt of the URL's domain.
+
+        Only consults rules ``can_fetch`` already cached; never fetches.
+
+        Returns:
+            Seconds between requests, or None if robots.txt sets none.
+        """
+        domain = urlparse(url).netloc
+        if not domain:
+            return None
+        rules, _ = self._get_cached_rules(domain)
+        if not rules:
+            return None
+        parser = RobotFileParser()
+        parser.parse(rules.splitlines())
+        delay = parser.crawl_delay(user_agent or "*")
+        return float(delay) if delay is not None else None
+
     def clear_cache(self):
         """Clear all cached robots.txt entries"""
         with sqlite3.connect(self.db_path) as conn:
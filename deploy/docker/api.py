@@ -397,7 +397,8 @@ async def handle_markdown_request(
             config=CrawlerRunConfig(
                 markdown_generator=md_generator,
                 scraping_strategy=LXMLWebScrapingStrategy(),
-                cache_mode=cache_mode
+                cache_mode=cache_mode,
+                cache_fields=["markdown"],
             )
         )
 
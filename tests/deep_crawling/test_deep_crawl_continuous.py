@@ -0,0 +1,179 @@
+"""
+Test Suite: Continuous Frontier Deep Crawling
+
+Tests that verify:
+1. A slow page does not hold back the next depth level
+2. max_depth and max_pages are respected without level barriers
+3. Results carry depth and parent metadata in batch and stream mode
+4. DFS continuous mode crawls the whole graph
+5. Closing the stream stops feeding the dispatcher
+
+A fake site is served through a real MemoryAdaptiveDispatcher; no browser or
+network required.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Dict, List
+
+import pytest
+
+from crawl4ai import CrawlerRunConfig, MemoryAdaptiveDispatcher
+from crawl4ai.deep_crawling import BFSDeepCrawlStrategy, DFSDeepCrawlStrategy
+
+
+ROOT = "https://site.test/"
+
+
+class FakeSite:
+    """Serves a link graph; ``slow`` pages take ``delay`` seconds."""
+
+    def __init__(self, graph: Dict[str, List[str]], slow=(), delay=0.3):
+        self.graph = graph
+        self.slow = set(slow)
+        self.delay = delay
+        self.started: Dict[str, float] = {}
+        self.finished: Dict[str, float] = {}
+
+    async def arun(self, url, config=None, session_id=None):
+        self.started[url] = time.monotonic()
+        await asyncio.sleep(self.delay if url in self.slow else 0.01)
+        self.finished[url] = time.monotonic()
+        links = [{"href": ROOT + path} for path in self.graph.get(url[len(ROOT):], [])]
+        return SimpleNamespace(
+            url=url, success=True, status_code=200, error_message="", metadata={},
+            links={"internal": links, "external": []},
+        )
+
+    async def arun_many(self, urls, config):
+        dispatcher = MemoryAdaptiveDispatcher(max_session_permit=4, check_interval=0.01)
+        stream = dispatcher.run_urls_stream(urls, self, config)
+
+        async def results():
+            try:
+                async for task_result in stream:
+                    yield task_result.result
+            finally:
+                await stream.aclose()
+        return results()
+
+
+def _tree(depth, fanout, prefix=""):
+    """Paths of a complete tree, keyed by parent path."""
+    graph = {}
+    level = [prefix]
+    for _ in range(depth):
+        next_level = []
+        for parent in level:
+            children = [f"{parent}{i}/" for i in range(fanout)]
+            graph[parent] = children
+            next_level += children
+        level = next_level
+    return graph
+
+
+class TestContinuousBFS:
+
+    @pytest.mark.asyncio
+    async def test_slow_page_does_not_block_next_level(self):
+        site = FakeSite({"": ["a", "b"], "a": ["a1", "a2"]}, slow={ROOT + "b"}, delay=0.5)
+        strategy = BFSDeepCrawlStrategy(max_depth=2, continuous=True)
+
+        results = await strategy.arun(ROOT, site, CrawlerRunConfig())
+
+        assert {r.url for r in results} == {ROOT + p for p in ("", "a", "b", "a1", "a2")}
+        # Depth 2 children of "a" ran while "b" was still loading
+        assert site.finished[ROOT + "a1"] < site.finished[ROOT + "b"]
+
+    @pytest.mark.asyncio
+    async def test_metadata_and_depth_limit(self):
+        site = FakeSite(_tree(3, 2))
+        strategy = BFSDeepCrawlStrategy(max_depth=2, continuous=True)
+
+        results = await strategy.arun(ROOT, site, CrawlerRunConfig())
+
+        assert len(results) == 1 + 2 + 4
+        by_url = {r.url: r for r in results}
+        assert by_url[ROOT + "0/1/"].metadata == {"depth": 2, "parent_url": ROOT + "0/"}
+        assert by_url[ROOT].metadata["parent_url"] is None
+
+    @pytest.mark.asyncio
+    async def test_max_pages_is_never_exceeded(self):
+        site = FakeSite(_tree(3, 4))
+        strategy = BFSDeepCrawlStrategy(max_depth=3, max_pages=7, continuous=True)
+
+        results = await strategy.arun(ROOT, site, CrawlerRunConfig())
+
+        assert len(results) == 7
+        assert len(site.started) == 7
+        # Shallower pages are handed out first
+        assert all(r.metadata["depth"] <= 2 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_stream_close_stops_feeding(self):
+        site = FakeSite(_tree(4, 3))
+        strategy = BFSDeepCrawlStrategy(max_depth=4, continuous=True)
+
+        stream = await strategy.arun(ROOT, site, CrawlerRunConfig(stream=True))
+        seen = []
+        async for result in stream:
+            seen.append(result)
+            if len(seen) == 5:
+                break
+        await stream.aclose()
+        crawled = len(site.started)
+        await asyncio.sleep(0.1)
+
+        assert len(site.started) == crawled < 20
+
+    @pytest.mark.asyncio
+    async def test_state_callback_lists_pending_urls(self):
+        states = []
+
+        async def on_state_change(state):
+            states.append(state)
+
+        site = FakeSite(_tree(2, 2))
+        strategy = BFSDeepCrawlStrategy(max_depth=2, continuous=True, on_state_change=on_state_change)
+        await strategy.arun(ROOT, site, CrawlerRunConfig())
+
+        assert len(states) == 7
+        assert states[0]["strategy_type"] == "bfs"
+        assert {p["url"] for p in states[0]["pending"]} == {ROOT + "0/", ROOT + "1/"}
+        assert states[-1]["pending"] == []
+        assert states[-1]["pages_crawled"] == 7
+
+
+class TestContinuousDFS:
+
+    @pytest.mark.asyncio
+    async def test_crawls_whole_graph(self):
+        site = FakeSite(_tree(3, 2))
+        strategy = DFSDeepCrawlStrategy(max_depth=3, continuous=True)
+
+        stream = await strategy.arun(ROOT, site, CrawlerRunConfig(stream=True))
+        results = [r async for r in stream]
+
+        assert len(results) == 1 + 2 + 4 + 8
+        assert len({r.url for r in results}) == len(results)
+
+    @pytest.mark.asyncio
+    async def test_state_is_a_resumable_stack(self):
+        states = []
+
+        async def on_state_change(state):
+            states.append(state)
+
+        site = FakeSite(_tree(2, 2))
+        strategy = DFSDeepCrawlStrategy(max_depth=2, continuous=True, on_state_change=on_state_change)
+        await strategy.arun(ROOT, site, CrawlerRunConfig())
+
+        first = states[0]
+        assert first["strategy_type"] == "dfs"
+        # Next URL to crawl is on top of the stack
+        assert [item["url"] for item in first["stack"]] == [ROOT + "1/", ROOT + "0/"]
+
+        resumed = DFSDeepCrawlStrategy(max_depth=2, continuous=True, resume_state=first)
+        results = await resumed.arun(ROOT, FakeSite(_tree(2, 2)), CrawlerRunConfig())
+        assert len(results) == 6
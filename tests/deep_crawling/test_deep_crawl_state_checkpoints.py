@@ -0,0 +1,180 @@
+"""
+Test Suite: Throttled and Incremental Deep Crawl State
+
+Tests that verify:
+1. Folding incremental states gives the same states as full snapshots
+2. Deltas only carry what changed since the previous report
+3. state_interval thins out reports and flushes at the end
+4. Parents are looked up by index, not by scanning the level
+"""
+
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from crawl4ai.deep_crawling import (
+    BFSDeepCrawlStrategy,
+    BestFirstCrawlingStrategy,
+    DFSDeepCrawlStrategy,
+    apply_state_delta,
+)
+from crawl4ai.deep_crawling.scorers import KeywordRelevanceScorer
+
+
+def create_mock_config(stream=False):
+    config = MagicMock()
+    config.stream = stream
+
+    def clone_config(**kwargs):
+        new_config = MagicMock()
+        new_config.stream = kwargs.get("stream", stream)
+        new_config.clone = MagicMock(side_effect=clone_config)
+        return new_config
+
+    config.clone = MagicMock(side_effect=clone_config)
+    return config
+
+
+def create_tree_crawler(fanout: int = 3):
+    """Every page links to ``fanout`` children named after it."""
+
+    async def mock_arun_many(urls, config):
+        results = []
+        for url in urls:
+            result = MagicMock()
+            result.url = url
+            result.success = True
+            result.metadata = {}
+            result.links = {
+                "internal": [{"href": f"{url.rstrip('/')}/c{i}"} for i in range(fanout)],
+                "external": [],
+            }
+            results.append(result)
+        if config.stream:
+            async def gen():
+                for r in results:
+                    yield r
+            return gen()
+        return results
+
+    crawler = MagicMock()
+    crawler.arun_many = mock_arun_many
+    return crawler
+
+
+def _normalize(state: Dict[str, Any]) -> Dict[str, Any]:
+    state = dict(state)
+    for name in ("visited", "dfs_seen"):
+        if name in state:
+            state[name] = sorted(state[name])
+    return state
+
+
+async def _run(strategy_class, stream=False, **kwargs) -> List[Dict[str, Any]]:
+    states: List[Dict[str, Any]] = []
+
+    async def capture(state):
+        states.append(state)
+
+    if strategy_class is BestFirstCrawlingStrategy:
+        kwargs.setdefault("url_scorer", KeywordRelevanceScorer(keywords=["c1"]))
+    strategy = strategy_class(max_depth=3, max_pages=25, on_state_change=capture, **kwargs)
+    config = create_mock_config(stream=stream)
+    if stream:
+        async for _ in strategy._arun_stream("https://example.com", create_tree_crawler(), config):
+            pass
+    else:
+        await strategy._arun_batch("https://example.com", create_tree_crawler(), config)
+    return states, strategy
+
+
+STRATEGIES = [BFSDeepCrawlStrategy, DFSDeepCrawlStrategy, BestFirstCrawlingStrategy]
+
+
+class TestIncrementalState:
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy_class", STRATEGIES)
+    @pytest.mark.parametrize("stream", [False, True])
+    async def test_folded_deltas_match_full_states(self, strategy_class, stream):
+        full, _ = await _run(strategy_class, stream)
+        deltas, strategy = await _run(strategy_class, stream, incremental_state=True)
+
+        assert len(deltas) == len(full)
+        assert not deltas[0].get("incremental")
+        assert all(delta.get("incremental") for delta in deltas[1:])
+
+        state = None
+        for delta, expected in zip(deltas, full):
+            state = apply_state_delta(state, delta)
+            assert _normalize(state) == _normalize(expected)
+        # export_state builds a full state of the current progress
+        exported = strategy.export_state()
+        assert exported["pages_crawled"] == strategy._pages_crawled
+        assert set(exported["visited"]) >= set(state["visited"])
+
+    @pytest.mark.asyncio
+    async def test_deltas_stay_small(self):
+        deltas, _ = await _run(BFSDeepCrawlStrategy, incremental_state=True)
+
+        for delta in deltas[1:]:
+            assert len(delta["sets"]["visited"]) <= 3
+            assert len(delta["frontier_added"]) <= 3
+
+    @pytest.mark.asyncio
+    async def test_resume_from_folded_state(self):
+        deltas, _ = await _run(DFSDeepCrawlStrategy, incremental_state=True)
+        state = None
+        for delta in deltas[:10]:
+            state = apply_state_delta(state, delta)
+
+        crawled = []
+        crawler = create_tree_crawler()
+        original = crawler.arun_many
+
+        async def tracking(urls, config):
+            crawled.extend(urls)
+            return await original(urls, config)
+
+        crawler.arun_many = tracking
+        resumed = DFSDeepCrawlStrategy(max_depth=3, max_pages=25, resume_state=state)
+        await resumed._arun_batch("https://example.com", crawler, create_mock_config())
+
+        assert not set(crawled) & set(state["visited"])
+        assert crawled[0] == state["stack"][-1]["url"]
+
+    def test_delta_without_base_state_is_rejected(self):
+        with pytest.raises(ValueError):
+            apply_state_delta(None, {"incremental": True})
+
+
+class TestStateInterval:
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy_class", STRATEGIES)
+    async def test_reports_every_n_pages_and_at_the_end(self, strategy_class):
+        states, strategy = await _run(strategy_class, state_interval=10)
+
+        reported = [s["pages_crawled"] for s in states]
+        total = strategy._pages_crawled
+        assert reported == list(range(10, total, 10)) + [total]
+        assert strategy.export_state() is states[-1]
+
+
+class TestParentIndex:
+
+    def test_first_parent_wins(self):
+        parents = BFSDeepCrawlStrategy._parent_index(
+            [("https://a.com/x", "https://a.com/"), ("https://a.com/x", "https://a.com/y")]
+        )
+        assert parents == {"https://a.com/x": "https://a.com/"}
+
+    @pytest.mark.asyncio
+    async def test_results_carry_parent_url(self):
+        strategy = BFSDeepCrawlStrategy(max_depth=2)
+        results = await strategy._arun_batch(
+            "https://example.com", create_tree_crawler(fanout=2), create_mock_config()
+        )
+        by_url = {r.url: r for r in results}
+        assert by_url["https://example.com/c1/c0"].metadata["parent_url"] == "https://example.com/c1"
@@ -0,0 +1,278 @@
+"""
+Test Suite: Pluggable URL Stores for Deep Crawling
+
+Tests that verify:
+1. The bloom filter has no false negatives and survives a state round trip
+2. The SQLite store persists sets and depths and clears them for new crawls
+3. BFS, DFS and Best-First crawl the same pages with every store
+4. States of the SQLite store reference the file and resume from it
+5. The SQLite store holds the levels of a BFS crawl as queues in the file
+
+No browser or network required.
+"""
+
+import os
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from crawl4ai.deep_crawling import (
+    BFSDeepCrawlStrategy,
+    BestFirstCrawlingStrategy,
+    BloomURLStore,
+    DFSDeepCrawlStrategy,
+    MemoryURLStore,
+    SQLiteURLStore,
+)
+from crawl4ai.deep_crawling.url_store import BloomFilter
+
+
+def create_mock_config(stream=False):
+    config = MagicMock()
+    config.stream = stream
+
+    def clone_config(**kwargs):
+        new_config = MagicMock()
+        new_config.stream = kwargs.get("stream", stream)
+        new_config.clone = MagicMock(side_effect=clone_config)
+        return new_config
+
+    config.clone = MagicMock(side_effect=clone_config)
+    return config
+
+
+def create_tree_crawler(fanout: int = 3):
+    """Every page links to ``fanout`` children named after it."""
+
+    def page(url):
+        result = MagicMock()
+        result.url = url
+        result.success = True
+        result.metadata = {}
+        result.links = {
+            "internal": [{"href": f"{url.rstrip('/')}/c{i}"} for i in range(fanout)],
+            "external": [],
+        }
+        return result
+
+    async def mock_arun_many(urls, config):
+        if hasattr(urls, "__aiter__"):
+            # Continuous mode feeds URLs as they are handed out
+            async def feed():
+                async for url in urls:
+                    yield page(url)
+            return feed()
+        results = [page(url) for url in urls]
+        if config.stream:
+            async def gen():
+                for r in results:
+                    yield r
+            return gen()
+        return results
+
+    crawler = MagicMock()
+    crawler.arun_many = mock_arun_many
+    return crawler
+
+
+async def _crawled_urls(strategy, stream=False) -> List[str]:
+    config = create_mock_config(stream=stream)
+    crawler = create_tree_crawler()
+    if stream:
+        return [r.url async for r in await strategy.arun("https://example.com", crawler, config)]
+    return [r.url for r in await strategy.arun("https://example.com", crawler, config)]
+
+
+class TestBloomFilter:
+
+    def test_no_false_negatives_and_low_false_positive_rate(self):
+        bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+        bloom.update(f"https://a.test/{i}" for i in range(10_000))
+
+        assert all(f"https://a.test/{i}" in bloom for i in range(10_000))
+        false_positives = sum(f"https://b.test/{i}" in bloom for i in range(10_000))
+        assert false_positives < 300
+        assert len(bloom.bits) < 10_000 * 2
+
+    def test_state_round_trip(self):
+        bloom = BloomFilter(capacity=100)
+        bloom.add("https://a.test/")
+
+        restored = BloomFilter.from_state(bloom.to_state())
+        assert "https://a.test/" in restored
+        assert len(restored) == 1
+        with pytest.raises(TypeError):
+            list(restored)
+
+
+class TestSQLiteURLStore:
+
+    def test_sets_and_depths_persist_in_the_file(self, tmp_path):
+        path = str(tmp_path / "urls.db")
+        store = SQLiteURLStore(path)
+        visited = store.open_set("visited")
+        depths = store.open_map("depths")
+        visited.update(["https://a.test/", "https://a.test/x"])
+        visited.add("https://a.test/")
+        depths["https://a.test/x"] = 1
+        state = {**store.export_set("visited", visited), **store.export_map("depths", depths)}
+        store.close()
+
+        assert state == {
+            "visited": [], "visited_store": path, "depths": {}, "depths_store": path,
+        }
+        reopened = SQLiteURLStore(path)
+        visited = reopened.open_set("visited", state)
+        assert len(visited) == 2 and "https://a.test/x" in visited
+        assert reopened.open_map("depths", state).get("https://a.test/x") == 1
+        # A new crawl starts empty
+        assert len(reopened.open_set("visited")) == 0
+        reopened.close()
+
+    def test_resumes_from_states_of_other_stores(self, tmp_path):
+        store = SQLiteURLStore(str(tmp_path / "urls.db"))
+        state = {"visited": ["https://a.test/"], "depths": {"https://a.test/": 0}}
+
+        assert "https://a.test/" in store.open_set("visited", state)
+        assert store.open_map("depths", state)["https://a.test/"] == 0
+        store.close()
+
+
+    def test_resumes_from_the_file_a_state_references(self, tmp_path):
+        path = str(tmp_path / "urls.db")
+        store = SQLiteURLStore(path)
+        visited = store.open_set("visited")
+        depths = store.open_map("depths")
+        visited.add("https://a.test/x")
+        depths["https://a.test/x"] = 1
+        state = {**store.export_set("visited", visited), **store.export_map("depths", depths)}
+        store.close()
+
+        other = SQLiteURLStore()
+        assert "https://a.test/x" in other.open_set("visited", state)
+        assert other.open_map("depths", state)["https://a.test/x"] == 1
+        other.close()
+
+        missing = SQLiteURLStore()
+        with pytest.raises(FileNotFoundError):
+            missing.open_set("visited", {**state, "visited_store": str(tmp_path / "gone.db")})
+        missing.close()
+
+    def test_queues_persist_in_the_file(self, tmp_path):
+        path = str(tmp_path / "urls.db")
+        store = SQLiteURLStore(path)
+        queue = store.open_queue("level_a")
+        queue.extend([("https://a.test/x", "https://a.test/"), ("https://a.test/y", None)])
+        queue.append(("https://a.test/x", "https://a.test/y"))
+
+        assert len(queue) == 3 and queue[-1] == ("https://a.test/x", "https://a.test/y")
+        assert queue[1:] == [("https://a.test/y", None), ("https://a.test/x", "https://a.test/y")]
+        assert queue.parents.get("https://a.test/x") == "https://a.test/"
+        assert queue.parents.get("https://a.test/z") is None
+        state = store.export_queue("pending", queue)
+        assert state == {"pending": [], "pending_store": path, "pending_queue": "level_a"}
+
+        # Restored under another name in the same file, and in another file
+        assert list(store.open_queue("level_b", state, key="pending")) == list(queue)
+        store.close()
+        other = SQLiteURLStore()
+        assert list(other.open_queue("level_a", state, key="pending")) == [
+            ("https://a.test/x", "https://a.test/"),
+            ("https://a.test/y", None),
+            ("https://a.test/x", "https://a.test/y"),
+        ]
+        # A new level starts empty
+        assert len(other.open_queue("level_a")) == 0
+        other.close()
+
+    def test_temporary_file_is_deleted_on_close(self):
+        store = SQLiteURLStore()
+        store.open_set("visited").add("https://a.test/")
+        store.close()
+        assert not os.path.exists(store.path)
+
+
+class TestStrategiesWithStores:
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy_class", [
+        BFSDeepCrawlStrategy, DFSDeepCrawlStrategy, BestFirstCrawlingStrategy,
+    ])
+    @pytest.mark.parametrize("stream", [False, True])
+    async def test_every_store_crawls_the_same_pages(self, strategy_class, stream, tmp_path):
+        crawled = []
+        for store in (MemoryURLStore(), BloomURLStore(capacity=1000), SQLiteURLStore(str(tmp_path / "urls.db"))):
+            strategy = strategy_class(max_depth=2, url_store=store)
+            crawled.append(sorted(await _crawled_urls(strategy, stream)))
+            store.close()
+
+        assert len(crawled[0]) == 1 + 3 + 9
+        assert crawled[0] == crawled[1] == crawled[2]
+
+    @pytest.mark.asyncio
+    async def test_continuous_mode_uses_the_store(self, tmp_path):
+        store = SQLiteURLStore(str(tmp_path / "urls.db"))
+        strategy = BFSDeepCrawlStrategy(max_depth=2, continuous=True, url_store=store)
+
+        urls = await _crawled_urls(strategy)
+        assert len(urls) == 13
+        assert len(store.open_set("visited", {})) == 13
+        store.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("stream", [False, True])
+    async def test_bfs_levels_are_held_in_the_file(self, stream, tmp_path):
+        path = str(tmp_path / "urls.db")
+        resumed, pending = [], []
+        for store in (MemoryURLStore(), SQLiteURLStore(path)):
+            states: List[Dict[str, Any]] = []
+
+            async def capture(state):
+                states.append(state)
+                if state["pages_crawled"] >= 5:
+                    strategy.cancel()
+
+            strategy = BFSDeepCrawlStrategy(max_depth=3, url_store=store, on_state_change=capture)
+            await _crawled_urls(strategy, stream)
+            store.close()
+            state = states[-1]
+            pending.append(state["pending"])
+
+            store = SQLiteURLStore(path) if isinstance(store, SQLiteURLStore) else MemoryURLStore()
+            strategy = BFSDeepCrawlStrategy(max_depth=3, url_store=store, resume_state=state)
+            resumed.append(await _crawled_urls(strategy, stream))
+            store.close()
+
+        assert pending[0] and pending[1] == []
+        assert state["pending_store"] == path and state["pending_queue"] in ("level_a", "level_b")
+        assert resumed[1] == resumed[0]
+        assert len(resumed[0]) > 3
+
+    @pytest.mark.asyncio
+    async def test_sqlite_state_references_the_file_and_resumes(self, tmp_path):
+        path = str(tmp_path / "urls.db")
+        resumed = []
+        for store in (MemoryURLStore(), SQLiteURLStore(path)):
+            states: List[Dict[str, Any]] = []
+
+            async def capture(state):
+                states.append(state)
+
+            strategy = DFSDeepCrawlStrategy(
+                max_depth=2, max_pages=5, url_store=store, on_state_change=capture
+            )
+            await _crawled_urls(strategy)
+            store.close()
+            state = states[-1]
+
+            store = SQLiteURLStore(path) if isinstance(store, SQLiteURLStore) else MemoryURLStore()
+            strategy = DFSDeepCrawlStrategy(max_depth=2, url_store=store, resume_state=state)
+            resumed.append(await _crawled_urls(strategy))
+            store.close()
+
+        assert state["visited"] == [] and state["visited_store"] == path
+        assert state["dfs_seen_store"] == path
+        # The file matches the last reported state, not the later progress
+        assert resumed[1] == resumed[0]
+        assert len(resumed[0]) > 3
@@ -0,0 +1,81 @@
+"""Unit tests for the lazily aged task queue of MemoryAdaptiveDispatcher.
+
+No browser or network required.
+"""
+
+import asyncio
+
+import pytest
+
+from crawl4ai.async_dispatcher import AgingTaskQueue, HostScheduler, MemoryAdaptiveDispatcher
+
+
+def _drain(queue, now):
+    order = []
+    while not queue.empty():
+        order.append(queue.get_nowait(now=now)[0])
+    return order
+
+
+class TestAgingTaskQueue:
+
+    def test_fewer_retries_first_then_arrival_order(self):
+        queue = AgingTaskQueue(fairness_timeout=600)
+        queue.put("retried", "t1", retry_count=2, enqueue_time=100)
+        queue.put("a", "t2", enqueue_time=101)
+        queue.put("b", "t3", enqueue_time=102)
+        queue.put("once", "t4", retry_count=1, enqueue_time=103)
+
+        assert _drain(queue, now=110) == ["a", "b", "once", "retried"]
+
+    def test_tasks_past_fairness_timeout_jump_ahead_oldest_first(self):
+        queue = AgingTaskQueue(fairness_timeout=10)
+        queue.put("older-retried", "t0", retry_count=5, enqueue_time=-1)
+        queue.put("old-retried", "t1", retry_count=3, enqueue_time=0)
+        queue.put("fresh", "t2", enqueue_time=95)
+
+        # Both retried tasks have waited past the timeout by t=100
+        assert queue.get_nowait(now=100)[0] == "older-retried"
+        assert queue.get_nowait(now=100)[0] == "old-retried"
+        assert queue.get_nowait(now=100)[0] == "fresh"
+        with pytest.raises(asyncio.QueueEmpty):
+            queue.get_nowait(now=100)
+
+    def test_entries_taken_from_the_heap_are_skipped_in_arrival_order(self):
+        queue = AgingTaskQueue(fairness_timeout=10)
+        queue.put("retried", "t1", retry_count=1, enqueue_time=0)
+        queue.put("a", "t2", enqueue_time=1)
+        queue.put("b", "t3", enqueue_time=2)
+
+        assert queue.get_nowait(now=5)[0] == "a"
+        # "a" was the second arrival; "retried" is still the oldest
+        assert queue.get_nowait(now=50)[0] == "retried"
+        assert queue.get_nowait(now=50)[0] == "b"
+
+    def test_statistics_are_incremental(self):
+        queue = AgingTaskQueue()
+        assert queue.statistics(now=0)["total_queued"] == 0
+        queue.put("a", "t1", enqueue_time=10)
+        queue.put("b", "t2", enqueue_time=20)
+        queue.put("c", "t3", enqueue_time=30)
+        queue.get_nowait(now=40)
+
+        stats = queue.statistics(now=40)
+        assert stats == {"total_queued": 2, "highest_wait_time": 20, "avg_wait_time": 15}
+
+    def test_large_queue_drains_in_order(self):
+        queue = AgingTaskQueue(fairness_timeout=1000)
+        for i in range(100_000):
+            queue.put(f"u{i}", f"t{i}", retry_count=i % 3, enqueue_time=i * 0.001)
+        order = _drain(queue, now=200)
+        assert len(order) == 100_000
+        assert order[0] == "u0" and order[-1] == "u99998"
+
+
+class TestDispatcherQueue:
+
+    def test_dispatcher_uses_host_scheduler(self):
+        dispatcher = MemoryAdaptiveDispatcher(fairness_timeout=30)
+        assert isinstance(dispatcher.task_queue, HostScheduler)
+        assert dispatcher.task_queue.fairness_timeout == 30
+        assert dispatcher.task_queue.empty()
@@ -0,0 +1,112 @@
+"""Unit tests for the shared BM25 index.
+
+No browser or network required.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from crawl4ai import BM25ContentFilter
+from crawl4ai.async_url_seeder import AsyncUrlSeeder
+from crawl4ai.bm25 import BM25Index, bm25_score, normalize_scores, tokenize
+from crawl4ai.deep_crawling.filters import ContentRelevanceFilter
+
+
+def _corpus(n=300, seed=7):
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(120)]
+    return [
+        [rng.choice(words[: rng.randint(3, 120)]) for _ in range(rng.randint(0, 30))]
+        for _ in range(n)
+    ]
+
+
+class TestBM25Index:
+
+    def test_scores_match_rank_bm25(self):
+        BM25Okapi = pytest.importorskip("rank_bm25").BM25Okapi
+        corpus = _corpus()
+        query = ["w1", "w2", "w2", "w100", "missing"]
+        assert np.allclose(BM25Index(corpus).get_scores(query), BM25Okapi(corpus).get_scores(query))
+
+    def test_incremental_addition_matches_a_single_build(self):
+        corpus = _corpus()
+        index = BM25Index(corpus[:100])
+        index.get_scores(["w1"])
+        index.add(corpus[100:250])
+        index.add(corpus[250:])
+
+        assert len(index) == len(corpus)
+        assert index.document_frequency("w1") == sum("w1" in doc for doc in corpus)
+        assert np.allclose(index.get_scores(["w1", "w3"]), BM25Index(corpus).get_scores(["w1", "w3"]))
+
+    def test_batch_scores_stack_single_queries(self):
+        index = BM25Index(_corpus())
+        queries = [["w1"], ["w2", "w5"], [], ["missing"]]
+        batch = index.get_batch_scores(queries)
+
+        assert batch.shape == (4, len(index))
+        for row, query in zip(batch, queries):
+            assert np.allclose(row, index.get_scores(query))
+
+    def test_save_and_load(self, tmp_path):
+        index = BM25Index(_corpus(), k1=1.2, b=0.5)
+        path = str(tmp_path / "index.npz")
+        index.save(path)
+
+        loaded = BM25Index.load(path)
+        assert (loaded.k1, loaded.b) == (1.2, 0.5)
+        assert np.allclose(loaded.get_scores(["w4", "w9"]), index.get_scores(["w4", "w9"]))
+
+        loaded.add([["w4", "w4"]])
+        assert len(loaded) == len(index) + 1
+
+    def test_empty_corpus_scores_zero(self):
+        assert BM25Index().get_scores(["w1"]).shape == (0,)
+        assert BM25Index([[], []]).get_scores(["w1"]).tolist() == [0.0, 0.0]
+
+
+class TestHelpers:
+
+    def test_tokenize(self):
+        assert tokenize("Hello, World!") == ["hello,", "world!"]
+        assert tokenize("Hello, World! a an", strip_punctuation=True, min_length=3) == ["hello", "world"]
+        assert tokenize("Running Tests", stem=lambda t: t[:3]) == ["run", "tes"]
+
+    def test_normalize_scores(self):
+        assert normalize_scores([2.0, 4.0, 3.0]) == [0.0, 1.0, 0.5]
+        assert normalize_scores([1.0, 1.0]) == [0.5, 0.5]
+        assert normalize_scores([]) == []
+
+    def test_single_document_score(self):
+        assert bm25_score(["python", "tips"], ["python"], avgdl=1000) > 0
+        assert bm25_score(["java"], ["python"], avgdl=1000) == 0
+
+
+class TestCallers:
+
+    def test_seeder_scores_are_normalized(self):
+        seeder = AsyncUrlSeeder()
+        scores = seeder._calculate_bm25_score(
+            "python async", ["Python async tutorial", "cooking recipes", "python basics"]
+        )
+        assert scores[0] == 1.0 and scores[1] == 0.0 and 0 < scores[2] < 1
+        assert seeder._calculate_bm25_score("python", ["", ""]) == [0.0, 0.0]
+
+    def test_relevance_filter_uses_the_shared_scoring(self):
+        relevance = ContentRelevanceFilter(query="python tutorial", threshold=1.0)
+        document = "Python tutorial for python beginners"
+        assert relevance._bm25(document) == pytest.approx(
+            bm25_score(tokenize(document), ["python", "tutorial"], avgdl=1000, k1=1.2)
+        )
+
+    def test_content_filter_keeps_the_relevant_chunks(self):
+        html = """<html><head><title>Python asyncio</title></head><body>
+            <p>Python asyncio lets you write concurrent code with async and await syntax in Python.</p>
+            <p>The weather forecast for tomorrow shows light rain and moderate winds overall.</p>
+            <p>Local markets sell fresh bread, cheese and seasonal vegetables every weekend.</p>
+        </body></html>"""
+        chunks = BM25ContentFilter(user_query="python asyncio", bm25_threshold=0.1).filter_content(html)
+        assert len(chunks) == 1 and "asyncio" in chunks[0]
@@ -0,0 +1,106 @@
+"""Unit tests for loading only some content fields of cache hits (cache_fields).
+
+Runs AsyncHTTPCrawlerStrategy against a loopback aiohttp server and a
+throwaway SQLite cache. No browser or network required.
+"""
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from crawl4ai import async_database, async_webcrawler
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+from crawl4ai.async_database import AsyncDatabaseManager
+from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.cache_context import CacheMode
+
+
+async def _page(request):
+    paragraphs = "".join(f"<p>Cached article paragraph {i}.</p>" for i in range(20))
+    return web.Response(
+        text=f"<html><head><title>Page</title></head><body>{paragraphs}</body></html>",
+        content_type="text/html",
+    )
+
+
+@pytest_asyncio.fixture
+async def url():
+    app = web.Application()
+    app.router.add_get("/page", _page)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    yield str(server.make_url("/page"))
+    await server.close()
+
+
+@pytest_asyncio.fixture
+async def crawler(tmp_path, monkeypatch):
+    monkeypatch.setattr(async_database, "DB_PATH", str(tmp_path / "crawl4ai.db"))
+    manager = AsyncDatabaseManager(compression="none", memory_cache_bytes=0)
+    await manager.ainit_db()
+    await manager.update_db_schema()
+    monkeypatch.setattr(async_webcrawler, "async_db_manager", manager)
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy(), verbose=False) as crawler:
+        crawler.db = manager
+        yield crawler
+
+
+def _loaded_fields(manager, monkeypatch):
+    loaded = []
+    load_content = manager._load_content
+
+    async def spy(hash_value, field):
+        loaded.append(field)
+        return await load_content(hash_value, field)
+
+    monkeypatch.setattr(manager, "_load_content", spy)
+    return loaded
+
+
+class TestCacheFields:
+
+    @pytest.mark.asyncio
+    async def test_markdown_only_hit(self, url, crawler, monkeypatch):
+        await crawler.arun(url, config=CrawlerRunConfig(cache_mode=CacheMode.ENABLED))
+        loaded = _loaded_fields(crawler.db, monkeypatch)
+
+        result = await crawler.arun(
+            url, config=CrawlerRunConfig(cache_mode=CacheMode.ENABLED, cache_fields=["markdown"])
+        )
+        assert result.cache_status == "hit"
+        assert result.success
+        assert "Cached article paragraph 3" in result.markdown.raw_markdown
+        assert result.html == "" and result.cleaned_html is None
+        assert loaded == ["markdown"]
+
+    @pytest.mark.asyncio
+    async def test_default_loads_everything_but_the_screenshot(self, url, crawler, monkeypatch):
+        await crawler.arun(url, config=CrawlerRunConfig(cache_mode=CacheMode.ENABLED))
+        loaded = _loaded_fields(crawler.db, monkeypatch)
+
+        result = await crawler.arun(url, config=CrawlerRunConfig(cache_mode=CacheMode.ENABLED))
+        assert result.cache_status == "hit"
+        assert "Cached article paragraph 3" in result.html
+        assert set(loaded) <= {"html", "cleaned", "markdown", "extracted"}
+        assert "html" in loaded and "markdown" in loaded
+
+    @pytest.mark.asyncio
+    async def test_extracted_content_only_hit(self, url, crawler, monkeypatch):
+        await crawler.arun(url, config=CrawlerRunConfig(cache_mode=CacheMode.ENABLED))
+        cached = await crawler.db.aget_cached_url(url)
+        cached.extracted_content = '[{"title": "Page"}]'
+        await crawler.db.acache_url(cached)
+        loaded = _loaded_fields(crawler.db, monkeypatch)
+
+        result = await crawler.arun(
+            url,
+            config=CrawlerRunConfig(
+                cache_mode=CacheMode.ENABLED, cache_fields=["extracted_content"]
+            ),
+        )
+        assert result.cache_status == "hit"
+        assert result.success
+        assert result.extracted_content == '[{"title": "Page"}]'
+        assert loaded == ["extracted"]
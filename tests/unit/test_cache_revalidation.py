@@ -0,0 +1,146 @@
+"""Unit tests for conditional cache revalidation (revalidate_cache).
+
+Runs AsyncHTTPCrawlerStrategy against a loopback aiohttp server and a
+throwaway SQLite cache. No browser or network required.
+"""
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from crawl4ai import async_database, async_webcrawler
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy, HTTPCrawlerError
+from crawl4ai.async_database import AsyncDatabaseManager
+from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.cache_context import CacheMode
+
+
+def _page(text):
+    # Large enough that the anti-bot check does not read it as an empty page
+    paragraphs = "".join(f"<p>{text} Paragraph {i} of the article body.</p>" for i in range(20))
+    return f"<html><head><title>Page</title></head><body>{paragraphs}</body></html>"
+
+
+class Origin:
+    """Serves one page with an ETag and honours If-None-Match."""
+
+    def __init__(self):
+        self.etag = '"v1"'
+        self.body = _page("First version.")
+        self.requests = []
+        self.fail = False
+
+    async def handle(self, request):
+        self.requests.append(dict(request.headers))
+        if self.fail:
+            return web.Response(status=500)
+        if request.headers.get("If-None-Match") == self.etag:
+            return web.Response(status=304, headers={"ETag": self.etag})
+        return web.Response(text=self.body, content_type="text/html", headers={"ETag": self.etag})
+
+
+@pytest_asyncio.fixture
+async def origin():
+    origin = Origin()
+    app = web.Application()
+    app.router.add_get("/page", origin.handle)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    origin.url = str(server.make_url("/page"))
+    yield origin
+    await server.close()
+
+
+@pytest_asyncio.fixture
+async def crawler(tmp_path, monkeypatch):
+    monkeypatch.setattr(async_database, "DB_PATH", str(tmp_path / "crawl4ai.db"))
+    manager = AsyncDatabaseManager(compression="none", memory_cache_bytes=0)
+    await manager.ainit_db()
+    await manager.update_db_schema()
+    monkeypatch.setattr(async_webcrawler, "async_db_manager", manager)
+    async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy(), verbose=False) as crawler:
+        crawler.db = manager
+        yield crawler
+
+
+def _config(**kwargs):
+    return CrawlerRunConfig(cache_mode=CacheMode.ENABLED, revalidate_cache=True, verbose=False, **kwargs)
+
+
+class TestConditionalFetch:
+
+    @pytest.mark.asyncio
+    async def test_304_is_returned_not_raised(self, origin):
+        async with AsyncHTTPCrawlerStrategy() as strategy:
+            response = await strategy.crawl(
+                origin.url, CrawlerRunConfig(), conditional_headers={"If-None-Match": '"v1"'}
+            )
+        assert response.status_code == 304
+        assert response.html == ""
+        assert origin.requests[-1]["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_unsolicited_304_still_raises(self):
+        async def not_modified(request):
+            return web.Response(status=304)
+
+        app = web.Application()
+        app.router.add_get("/", not_modified)
+        server = TestServer(app, host="127.0.0.1")
+        await server.start_server()
+        try:
+            async with AsyncHTTPCrawlerStrategy() as strategy:
+                with pytest.raises(HTTPCrawlerError, match="304"):
+                    await strategy.crawl(str(server.make_url("/")), CrawlerRunConfig())
+        finally:
+            await server.close()
+
+
+class TestRevalidation:
+
+    @pytest.mark.asyncio
+    async def test_304_serves_cached_result_and_refreshes_age(self, origin, crawler):
+        first = await crawler.arun(origin.url, config=_config())
+        assert first.cache_status == "miss"
+        before = (await crawler.db.aget_cache_metadata(origin.url))["cached_at"]
+
+        second = await crawler.arun(origin.url, config=_config())
+        assert second.cache_status == "hit_validated"
+        assert second.success
+        assert "First version" in second.html
+        assert origin.requests[-1]["If-None-Match"] == '"v1"'
+        after = (await crawler.db.aget_cache_metadata(origin.url))["cached_at"]
+        assert after > before
+
+    @pytest.mark.asyncio
+    async def test_200_replaces_cached_entry(self, origin, crawler):
+        await crawler.arun(origin.url, config=_config())
+        origin.etag = '"v2"'
+        origin.body = _page("Second version.")
+
+        result = await crawler.arun(origin.url, config=_config())
+        assert result.cache_status == "miss"
+        assert "Second version" in result.html
+
+        metadata = await crawler.db.aget_cache_metadata(origin.url)
+        assert metadata["etag"] == '"v2"'
+        cached = await crawler.db.aget_cached_url(origin.url)
+        assert "Second version" in cached.html
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_is_served_without_request(self, origin, crawler):
+        await crawler.arun(origin.url, config=_config())
+        result = await crawler.arun(origin.url, config=_config(cache_max_age=3600))
+        assert result.cache_status == "hit"
+        assert len(origin.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_revalidation_falls_back_to_cache(self, origin, crawler):
+        await crawler.arun(origin.url, config=_config())
+        origin.fail = True
+
+        result = await crawler.arun(origin.url, config=_config())
+        assert result.cache_status == "hit_fallback"
+        assert "First version" in result.html
@@ -0,0 +1,191 @@
+"""Unit tests for bulk cache validation (CacheValidator.validate_many).
+
+Runs against a loopback aiohttp server and a throwaway SQLite cache. No
+browser or network required.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from crawl4ai import async_database, async_webcrawler
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+from crawl4ai.async_database import AsyncDatabaseManager
+from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.cache_context import CacheMode
+from crawl4ai.cache_validator import CacheValidationResult, CacheValidator
+from crawl4ai.models import CrawlResult, MarkdownGenerationResult
+
+
+class Origin:
+    """Answers 304 to every conditional request, tracking concurrency per host."""
+
+    def __init__(self):
+        self.in_flight = {}
+        self.peak = {}
+        self.methods = []
+
+    async def handle(self, request):
+        host = request.headers["Host"].split(":")[0]
+        self.methods.append(request.method)
+        self.in_flight[host] = self.in_flight.get(host, 0) + 1
+        self.peak[host] = max(self.peak.get(host, 0), self.in_flight[host])
+        try:
+            await asyncio.sleep(0.02)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304, headers={"ETag": '"v1"'})
+            paragraphs = "".join(f"<p>Paragraph {i} of the article body.</p>" for i in range(20))
+            return web.Response(
+                text=f"<html><head><title>Page</title></head><body>{paragraphs}</body></html>",
+                content_type="text/html",
+                headers={"ETag": '"v1"'},
+            )
+        finally:
+            self.in_flight[host] -= 1
+
+
+@pytest_asyncio.fixture
+async def origin():
+    origin = Origin()
+    app = web.Application()
+    app.router.add_route("*", "/{page}", origin.handle)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    origin.port = server.port
+    yield origin
+    await server.close()
+
+
+@pytest_asyncio.fixture
+async def manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(async_database, "DB_PATH", str(tmp_path / "crawl4ai.db"))
+    manager = AsyncDatabaseManager(compression="none", memory_cache_bytes=0)
+    await manager.ainit_db()
+    await manager.update_db_schema()
+    return manager
+
+
+def _urls(origin, count):
+    # Two host names for the same server give two independent hosts
+    return [
+        f"http://{host}:{origin.port}/p{i}"
+        for i in range(count)
+        for host in ("127.0.0.1", "localhost")
+    ]
+
+
+async def _cache(manager, urls):
+    markdown = MarkdownGenerationResult(
+        raw_markdown="cached", markdown_with_citations="cached", references_markdown=""
+    )
+    for url in urls:
+        await manager.acache_url(
+            CrawlResult(url=url, html="<p>cached</p>", success=True, markdown=markdown,
+                        response_headers={"ETag": '"v1"'})
+        )
+    await manager.aflush_writes()
+
+
+class TestBulkMetadata:
+
+    @pytest.mark.asyncio
+    async def test_reads_all_cached_urls(self, manager, monkeypatch):
+        monkeypatch.setattr(async_database, "METADATA_BATCH_SIZE", 3)
+        urls = [f"https://a.test/{i}" for i in range(7)]
+        await _cache(manager, urls)
+
+        metadata = await manager.aget_cache_metadata_many(urls + ["https://a.test/missing"])
+        assert sorted(metadata) == sorted(urls)
+        assert metadata[urls[0]]["etag"] == '"v1"'
+        assert metadata[urls[0]] == await manager.aget_cache_metadata(urls[0])
+
+
+class TestValidateMany:
+
+    @pytest.mark.asyncio
+    async def test_streams_a_verdict_per_url(self, origin, manager):
+        urls = _urls(origin, 5)
+        await _cache(manager, urls)
+        missing = f"http://127.0.0.1:{origin.port}/missing"
+
+        async with CacheValidator() as validator:
+            verdicts = {
+                url: verdict
+                async for url, verdict in validator.validate_many(urls + [missing], db_manager=manager)
+            }
+
+        assert set(verdicts) == set(urls) | {missing}
+        assert all(verdicts[url].status == CacheValidationResult.FRESH for url in urls)
+        assert verdicts[missing].status == CacheValidationResult.UNKNOWN
+        assert origin.methods == ["HEAD"] * len(urls)
+
+    @pytest.mark.asyncio
+    async def test_per_host_concurrency_is_bounded(self, origin, manager):
+        urls = _urls(origin, 12)
+        metadata = {url: {"etag": '"v1"'} for url in urls}
+
+        async with CacheValidator() as validator:
+            count = 0
+            async for _ in validator.validate_many(urls, metadata=metadata, per_host_concurrency=3):
+                count += 1
+
+        assert count == len(urls)
+        assert set(origin.peak) == {"127.0.0.1", "localhost"}
+        assert max(origin.peak.values()) <= 3
+        assert max(origin.peak.values()) > 1
+
+    @pytest.mark.asyncio
+    async def test_closing_early_cancels_workers(self, origin):
+        urls = _urls(origin, 10)
+        metadata = {url: {"etag": '"v1"'} for url in urls}
+
+        async with CacheValidator() as validator:
+            stream = validator.validate_many(urls, metadata=metadata, max_concurrency=2)
+            await stream.__anext__()
+            await stream.aclose()
+        assert len(origin.methods) < len(urls)
+
+
+class TestArunManyPrevalidation:
+
+    @pytest.mark.asyncio
+    async def test_arun_many_uses_bulk_verdicts(self, origin, manager, monkeypatch):
+        monkeypatch.setattr(async_webcrawler, "async_db_manager", manager)
+        urls = _urls(origin, 3)
+        config = CrawlerRunConfig(cache_mode=CacheMode.ENABLED, verbose=False)
+
+        async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy(), verbose=False) as crawler:
+            await crawler.arun_many(urls, config=config)
+            origin.methods.clear()
+
+            fresh_config = config.clone(check_cache_freshness=True)
+            results = await crawler.arun_many(urls, config=fresh_config)
+            assert fresh_config._cache_verdicts is None
+
+        assert {result.cache_status for result in results} == {"hit_validated"}
+        assert origin.methods == ["HEAD"] * len(urls)
+
+    @pytest.mark.asyncio
+    async def test_verdicts_do_not_outlive_the_call(self, origin, manager, monkeypatch):
+        monkeypatch.setattr(async_webcrawler, "async_db_manager", manager)
+        urls = _urls(origin, 3)
+        config = CrawlerRunConfig(cache_mode=CacheMode.ENABLED, verbose=False)
+
+        async with AsyncWebCrawler(crawler_strategy=AsyncHTTPCrawlerStrategy(), verbose=False) as crawler:
+            await crawler.arun_many(urls, config=config)
+            fresh_config = config.clone(check_cache_freshness=True)
+            stream = await crawler.arun_many(urls, config=fresh_config.clone(stream=True))
+            async for result in stream:
+                break
+            await stream.aclose()
+            origin.methods.clear()
+
+            # A later crawl validates again instead of reusing the bulk verdict
+            result = await crawler.arun(urls[-1], config=fresh_config)
+
+        assert result.cache_status == "hit_validated"
+        assert origin.methods == ["HEAD"]
@@ -0,0 +1,155 @@
+"""Unit tests for the batched write-behind buffer of AsyncDatabaseManager.
+
+Uses a throwaway SQLite database. No browser or network required.
+"""
+
+import asyncio
+
+import pytest
+
+from crawl4ai import async_database
+from crawl4ai.async_database import AsyncDatabaseManager
+from crawl4ai.models import CrawlResult, MarkdownGenerationResult
+
+
+@pytest.fixture
+def make_manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(async_database, "DB_PATH", str(tmp_path / "crawl4ai.db"))
+
+    async def _make(**kwargs):
+        manager = AsyncDatabaseManager(compression="none", **kwargs)
+        # A fresh database only gets the cache validation columns on upgrade
+        await manager.ainit_db()
+        await manager.update_db_schema()
+        return manager
+
+    return _make
+
+
+def _result(url, html="<p>cached</p>"):
+    markdown = MarkdownGenerationResult(
+        raw_markdown="cached", markdown_with_citations="cached", references_markdown=""
+    )
+    return CrawlResult(
+        url=url, html=html, success=True, markdown=markdown, response_headers={"etag": "v1"}
+    )
+
+
+async def _row_count(manager):
+    async def _count(db):
+        async with db.execute("SELECT COUNT(*) FROM crawled_data") as cursor:
+            return (await cursor.fetchone())[0]
+
+    return await manager.execute_with_retry(_count)
+
+
+class TestWriteBehind:
+
+    @pytest.mark.asyncio
+    async def test_rows_are_buffered_until_batch_is_full(self, make_manager):
+        manager = await make_manager(write_batch_size=3, write_flush_interval=60)
+        await manager.acache_url(_result("https://a.test/1"))
+        await manager.acache_url(_result("https://a.test/2"))
+        assert await _row_count(manager) == 0
+
+        await manager.acache_url(_result("https://a.test/3"))
+        assert await _row_count(manager) == 3
+
+    @pytest.mark.asyncio
+    async def test_repeated_url_is_coalesced(self, make_manager):
+        manager = await make_manager(write_batch_size=10, write_flush_interval=60)
+        await manager.acache_url(_result("https://a.test/", html="<p>old</p>"))
+        await manager.acache_url(_result("https://a.test/", html="<p>new</p>"))
+        assert len(manager._pending_writes) == 1
+
+        await manager.aflush_writes()
+        assert await _row_count(manager) == 1
+        assert (await manager.aget_cached_url("https://a.test/")).html == "<p>new</p>"
+
+    @pytest.mark.asyncio
+    async def test_reads_see_buffered_writes(self, make_manager):
+        manager = await make_manager(write_batch_size=10, write_flush_interval=60)
+        await manager.acache_url(_result("https://a.test/page"))
+
+        cached = await manager.aget_cached_url("https://a.test/page")
+        assert cached.html == "<p>cached</p>"
+        assert (await manager.aget_cache_metadata("https://a.test/page"))["etag"] == "v1"
+        assert await manager.aget_total_count() == 1
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_is_flushed_after_interval(self, make_manager):
+        manager = await make_manager(write_batch_size=10, write_flush_interval=0.05)
+        await manager.acache_url(_result("https://a.test/timer"))
+        await asyncio.sleep(0.3)
+        assert not manager._pending_writes
+        assert await _row_count(manager) == 1
+
+    @pytest.mark.asyncio
+    async def test_cleanup_flushes(self, make_manager):
+        manager = await make_manager(write_batch_size=10, write_flush_interval=60)
+        await manager.acache_url(_result("https://a.test/close"))
+        await manager.cleanup()
+        assert await _row_count(manager) == 1
+
+    @pytest.mark.asyncio
+    async def test_reads_during_a_flush_see_the_flushed_rows(self, make_manager):
+        manager = await make_manager(write_batch_size=10, write_flush_interval=60)
+        await manager.acache_url(_result("https://a.test/", html="<p>old</p>"))
+        await manager.aflush_writes()
+        await manager.acache_url(_result("https://a.test/", html="<p>new</p>"))
+
+        execute = manager.execute_with_retry
+
+        async def slow_writes(operation, *args):
+            if operation.__name__ == "_cache":
+                await asyncio.sleep(0.1)
+            return await execute(operation, *args)
+        manager.execute_with_retry = slow_writes
+
+        flush = asyncio.create_task(manager.aflush_writes())
+        await asyncio.sleep(0.01)
+        assert not manager._pending_writes
+        assert (await manager.aget_cached_url("https://a.test/")).html == "<p>new</p>"
+        await flush
+        assert (await manager.aget_cached_url("https://a.test/")).html == "<p>new</p>"
+
+    def test_script_ending_without_close_keeps_the_buffer(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(async_database, "DB_PATH", str(tmp_path / "crawl4ai.db"))
+
+        async def script():
+            manager = AsyncDatabaseManager(
+                compression="none", write_batch_size=10, write_flush_interval=60
+            )
+            await manager.ainit_db()
+            await manager.update_db_schema()
+            await manager.acache_url(_result("https://a.test/exit"))
+
+        # asyncio.run cancels the pending interval flush on the way out
+        asyncio.run(script())
+
+        async def count():
+            return await _row_count(AsyncDatabaseManager(compression="none"))
+
+        assert asyncio.run(count()) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_kept_for_the_next_flush(self, make_manager):
+        manager = await make_manager(write_batch_size=10, write_flush_interval=60)
+        await manager.acache_url(_result("https://a.test/1"))
+        await manager.acache_url(_result("https://a.test/2", html="<p>old</p>"))
+
+        execute = manager.execute_with_retry
+
+        async def failing_writes(operation, *args):
+            if operation.__name__ == "_cache":
+                raise RuntimeError("database is locked")
+            return await execute(operation, *args)
+        manager.execute_with_retry = failing_writes
+        await manager.aflush_writes()
+        assert set(manager._pending_writes) == {"https://a.test/1", "https://a.test/2"}
+
+        manager.execute_with_retry = execute
+        await manager.acache_url(_result("https://a.test/2", html="<p>new</p>"))
+        await manager.aflush_writes()
+        assert await _row_count(manager) == 2
+        assert (await manager.aget_cached_url("https://a.test/2")).html == "<p>new</p>"
@@ -0,0 +1,61 @@
+"""Unit tests for CrawlerRunConfig.clone.
+
+No browser or network required.
+"""
+
+import time
+
+import pytest
+
+from crawl4ai import CacheMode, CrawlerRunConfig, ProxyConfig
+from crawl4ai.extraction_strategy import NoExtractionStrategy
+
+
+class TestClone:
+
+    def test_overrides_leave_the_original_untouched(self):
+        config = CrawlerRunConfig(cache_mode=CacheMode.ENABLED, page_timeout=1000)
+        clone = config.clone(stream=True, cache_mode=CacheMode.BYPASS)
+
+        assert clone.stream and clone.cache_mode == CacheMode.BYPASS
+        assert clone.page_timeout == 1000
+        assert not config.stream and config.cache_mode == CacheMode.ENABLED
+
+    def test_strategies_are_shared(self):
+        config = CrawlerRunConfig(extraction_strategy=NoExtractionStrategy())
+        clone = config.clone(stream=True)
+
+        assert clone.extraction_strategy is config.extraction_strategy
+        assert clone.scraping_strategy is config.scraping_strategy
+
+    def test_keeps_parameters_missing_from_to_dict(self):
+        def fetch(url):
+            return "<html></html>"
+
+        config = CrawlerRunConfig(base_url="https://a.test/", fallback_fetch_function=fetch)
+        for clone in (config.clone(stream=True), config.clone(excluded_tags=["nav"])):
+            assert clone.base_url == "https://a.test/"
+            assert clone.fallback_fetch_function is fetch
+
+    def test_converted_parameters_go_through_the_constructor(self):
+        config = CrawlerRunConfig()
+
+        assert config.clone(excluded_tags=None).excluded_tags == []
+        assert config.clone(link_preview_config={"include_internal": True}).link_preview_config.include_internal
+        assert isinstance(config.clone(proxy_config="http://p.test:8080").proxy_config, ProxyConfig)
+        with pytest.raises(ValueError):
+            config.clone(extraction_strategy="not a strategy")
+
+    def test_deprecated_properties_are_still_rejected(self):
+        with pytest.raises(AttributeError):
+            CrawlerRunConfig().clone(bypass_cache=True)
+
+    def test_clone_takes_microseconds(self):
+        config = CrawlerRunConfig()
+        start = time.perf_counter()
+        for _ in range(1000):
+            config.clone(deep_crawl_strategy=None, stream=True)
+        per_clone = (time.perf_counter() - start) / 1000
+
+        # Rebuilding through to_dict()/from_kwargs() took milliseconds
+        assert per_clone < 100e-6
@@ -0,0 +1,34 @@
+"""Unit tests for the deserialization type registry.
+
+No browser or network required.
+"""
+
+import importlib
+
+from crawl4ai import CacheMode, CrawlerRunConfig, PruningContentFilter
+from crawl4ai import DefaultMarkdownGenerator
+from crawl4ai import async_configs
+from crawl4ai.async_configs import Provenance
+
+
+def _payload(**params):
+    config = CrawlerRunConfig(
+        markdown_generator=DefaultMarkdownGenerator(content_filter=PruningContentFilter(threshold=0.4)),
+        cache_mode=CacheMode.BYPASS,
+        **params,
+    )
+    return config.dump()
+
+
+class TestRegistry:
+
+    def test_types_are_resolved_without_importing_per_object(self, monkeypatch):
+        async_configs._deserialize_registry()
+
+        def fail(name):
+            raise AssertionError(f"import_module({name!r}) called")
+        monkeypatch.setattr(importlib, "import_module", fail)
+
+        config = CrawlerRunConfig.load(_payload(), provenance=Provenance.UNTRUSTED)
+        assert config.markdown_generator.content_filter.threshold == 0.4
+        assert config.cache_mode == CacheMode.BYPASS
@@ -0,0 +1,135 @@
+"""Parity tests for the lxml engine of PruningContentFilter and BM25ContentFilter.
+
+The lxml engine walks the lxml tree directly instead of building a
+BeautifulSoup tree. It must return exactly what the original BeautifulSoup
+engine returns. No browser or network required.
+"""
+
+import pytest
+
+from crawl4ai import BM25ContentFilter, DefaultMarkdownGenerator, PruningContentFilter
+
+PARAGRAPH = (
+    "The quick brown fox jumps over the lazy dog while the crawler keeps "
+    "reading long paragraphs of meaningful content about foxes and dogs."
+)
+
+CORPUS = {
+    "article": f"""
+        <html><head><title>Foxes and dogs</title>
+        <meta name="description" content="All about quick foxes"></head>
+        <body>
+          <header><a href="/">Home</a></header>
+          <nav class="menu"><a href="/a">A</a> <a href="/b">B</a></nav>
+          <main><article>
+            <h1>Quick foxes</h1>
+            <p>{PARAGRAPH}</p>
+            <p>Second <a href="/x">link text</a> with <b>bold</b> &amp; <i>italic</i> words.</p>
+            <ul><li>{PARAGRAPH}</li><li><a href="/only">only a link</a></li></ul>
+          </article></main>
+          <aside>Related stuff</aside>
+          <footer>Copyright</footer>
+        </body></html>""",
+    "fragment": f"<div><p>{PARAGRAPH}</p><p>short</p></div> trailing text",
+    "comments_and_pi": f"""
+        <body><div><!-- hidden {PARAGRAPH} --><p>{PARAGRAPH}<!-- x --></p>
+        <?php echo 1 ?><p><a href="#"><!-- c -->anchor</a></p></div></body>""",
+    "containers": f"""
+        <body><div><p>{PARAGRAPH}</p>
+        <template><p>{PARAGRAPH}</p></template>
+        <ruby>漢<rp>(</rp><rt>kan</rt><rp>)</rp></ruby>
+        <script>var x = "<p>{PARAGRAPH}</p>" && 1 < 2;</script>
+        <style>p > a {{ color: red; }}</style></div>
+        <template><div>{PARAGRAPH}</div></template></body>""",
+    "whitespace": f"""
+        <body>
+          <section>   <p>   {PARAGRAPH}   </p>
+            <pre>  line one
+                 line two   </pre>
+            <textarea>   kept   </textarea>
+          </section>
+        </body>""",
+    "attributes": f"""
+        <body><div id="main" class="  post   body " data-x='say "hi"' title="it's &quot;both&quot;">
+          <a href="/a?x=1&amp;y=2" rel="nofollow  noopener" class="btn">{PARAGRAPH}</a>
+          <p lang=en hidden>{PARAGRAPH} &lt;tag&gt; &copy; &nbsp; caf&eacute;</p>
+          <input type="checkbox" checked><select multiple><option selected>One</option></select>
+          <img src="a.png" alt="x"><br><hr class="sep">
+          <meta charset="latin-1"><meta http-equiv="Content-Type" content="text/html; charset=latin-1">
+          <td headers="a b">cell</td>
+        </div></body>""",
+    "negative_classes": f"""
+        <body>
+          <div class="sidebar"><p>{PARAGRAPH}</p></div>
+          <div id="comments"><p>{PARAGRAPH}</p></div>
+          <div class="content keep"><p>{PARAGRAPH}</p></div>
+          <span>tiny</span>
+        </body>""",
+    "nested": "<body>" + "<div>" * 30 + f"<p>{PARAGRAPH}</p>" + "</div>" * 30
+    + "".join(f"<div><p>{PARAGRAPH} {i}</p><a href='/{i}'>more</a></div>" for i in range(20))
+    + "</body>",
+    "tables": f"""
+        <body><table><thead><tr><th>Fox</th><th>Dog</th></tr></thead>
+        <tbody><tr><td>{PARAGRAPH}</td><td><code>x &lt; y</code></td></tr></tbody></table>
+        <dl><dt>Term</dt><dd>{PARAGRAPH}</dd></dl><blockquote>{PARAGRAPH}</blockquote></body>""",
+    "bom_and_unclosed": f"﻿<p>{PARAGRAPH}<p>{PARAGRAPH}<div><span>{PARAGRAPH}",
+    "comment_only": "<!-- nothing here -->",
+    "whitespace_only": "   \n  ",
+}
+
+PRUNING_CONFIGS = [
+    {},
+    {"min_word_threshold": 5},
+    {"threshold_type": "dynamic", "threshold": 0.45},
+    {"threshold": 0.6, "preserve_classes": ["keep"], "preserve_tags": ["pre", "span"]},
+]
+
+BM25_CONFIGS = [
+    {},
+    {"user_query": "quick fox dog"},
+    {"user_query": "crawler paragraphs", "use_stemming": False, "bm25_threshold": 0.5},
+]
+
+
+@pytest.mark.parametrize("name", sorted(CORPUS))
+@pytest.mark.parametrize("config", PRUNING_CONFIGS)
+def test_pruning_engines_match(name, config):
+    html = CORPUS[name]
+    expected = PruningContentFilter(engine="bs4", **config).filter_content(html)
+    assert PruningContentFilter(engine="lxml", **config).filter_content(html) == expected
+
+
+@pytest.mark.parametrize("name", sorted(CORPUS))
+@pytest.mark.parametrize("config", BM25_CONFIGS)
+def test_bm25_engines_match(name, config):
+    html = CORPUS[name]
+    for min_word_threshold in (None, 3):
+        expected = BM25ContentFilter(engine="bs4", **config).filter_content(html, min_word_threshold)
+        actual = BM25ContentFilter(engine="lxml", **config).filter_content(html, min_word_threshold)
+        assert actual == expected
+
+
+@pytest.mark.parametrize("content_filter", [PruningContentFilter, BM25ContentFilter])
+def test_fit_markdown_matches(content_filter):
+    html = CORPUS["article"]
+    results = [
+        DefaultMarkdownGenerator(content_filter=content_filter(engine=engine)).generate_markdown(
+            html, base_url="https://example.com"
+        )
+        for engine in ("bs4", "lxml")
+    ]
+    assert results[0].fit_markdown
+    assert results[0].fit_markdown == results[1].fit_markdown
+    assert results[0].fit_html == results[1].fit_html
+
+
+def test_lxml_is_default_engine():
+    assert PruningContentFilter().engine == "lxml"
+    assert BM25ContentFilter().engine == "lxml"
+
+
+def test_explicit_boolean_attribute_falls_back_to_soup():
+    html = f'<body><div><input checked="checked"><p>{PARAGRAPH}</p></div></body>'
+    expected = PruningContentFilter(engine="bs4", preserve_tags=["input"]).filter_content(html)
+    assert PruningContentFilter(engine="lxml", preserve_tags=["input"]).filter_content(html) == expected
+    assert 'checked="checked"' in expected[0]
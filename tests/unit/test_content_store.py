@@ -0,0 +1,253 @@
+"""Unit tests for the cache content stores (file-per-hash and pack files).
+
+No browser or network required.
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from crawl4ai import async_database
+from crawl4ai.async_database import AsyncDatabaseManager
+from crawl4ai.content_store import (
+    FileContentStore,
+    PackContentStore,
+    create_content_store,
+)
+from crawl4ai.models import CrawlResult, MarkdownGenerationResult
+
+HTML = "<html><body>" + "<p>cached paragraph</p>" * 200 + "</body></html>"
+
+
+def _result(url):
+    markdown = MarkdownGenerationResult(
+        raw_markdown="cached", markdown_with_citations="cached", references_markdown=""
+    )
+    return CrawlResult(url=url, html=HTML, success=True, markdown=markdown)
+
+
+class TestPackContentStore:
+
+    @pytest.mark.asyncio
+    async def test_round_trip_and_dedup(self, tmp_path):
+        store = PackContentStore(str(tmp_path))
+        first = await store.store(HTML, "html")
+        second = await store.store(HTML, "cleaned")
+        assert first == second
+        assert await store.load(first, "html") == HTML
+        assert await store.load("missing", "html") is None
+        assert await store.store("", "html") == ""
+        # One blob, compressed below its raw size, in a single segment
+        assert os.listdir(tmp_path).count("segment-000001.pack") == 1
+        assert os.path.getsize(tmp_path / "segment-000001.pack") < len(HTML)
+
+    @pytest.mark.asyncio
+    async def test_segments_roll_over_and_survive_reopen(self, tmp_path):
+        store = PackContentStore(str(tmp_path), segment_size=16)
+        hashes = [await store.store(f"page {i} " + "x" * 100, "html") for i in range(5)]
+        store.close()
+
+        reopened = PackContentStore(str(tmp_path), segment_size=16)
+        assert len([n for n in os.listdir(tmp_path) if n.endswith(".pack")]) == 5
+        for i, content_hash in enumerate(hashes):
+            assert await reopened.load(content_hash, "html") == f"page {i} " + "x" * 100
+
+    @pytest.mark.asyncio
+    async def test_compact_drops_unreferenced_blobs(self, tmp_path):
+        store = PackContentStore(str(tmp_path), segment_size=16)
+        keep = await store.store("keep " * 50, "html")
+        drop = await store.store("drop " * 50, "html")
+
+        stats = await store.acompact({keep})
+        assert stats["removed"] == 1
+        assert stats["reclaimed_bytes"] > 0
+        assert await store.load(keep, "html") == "keep " * 50
+        assert await store.load(drop, "html") is None
+        # New writes still append after compaction
+        again = await store.store("new content", "markdown")
+        assert await store.load(again, "markdown") == "new content"
+
+    @pytest.mark.asyncio
+    async def test_store_many_commits_once(self, tmp_path):
+        store = PackContentStore(str(tmp_path))
+        commits = []
+
+        class CountingIndex:
+            def __init__(self, db):
+                self._db = db
+
+            def commit(self):
+                commits.append(1)
+                self._db.commit()
+
+            def __getattr__(self, name):
+                return getattr(self._db, name)
+
+        store._db = CountingIndex(store._db)
+        hashes = await store.store_many(
+            [(HTML, "html"), ("", "cleaned"), (HTML, "cleaned"), ("# md", "markdown")]
+        )
+        assert hashes[0] == hashes[2] and hashes[1] == ""
+        assert len(commits) == 1
+        assert await store.load(hashes[3], "markdown") == "# md"
+
+    @pytest.mark.asyncio
+    async def test_reads_do_not_wait_for_writes(self, tmp_path):
+        store = PackContentStore(str(tmp_path))
+        content_hash = await store.store(HTML, "html")
+
+        with store._lock:
+            loaded = await asyncio.wait_for(store.load(content_hash, "html"), timeout=5)
+        assert loaded == HTML
+
+    @pytest.mark.asyncio
+    async def test_read_racing_compaction_finds_the_moved_blob(self, tmp_path, monkeypatch):
+        store = PackContentStore(str(tmp_path))
+        keep = await store.store("keep " * 50, "html")
+        stale = store._locate(keep)
+        await store.acompact({keep})
+
+        locations = [stale]
+        locate = store._locate
+        monkeypatch.setattr(store, "_locate", lambda h: locations.pop() if locations else locate(h))
+        assert await store.load(keep, "html") == "keep " * 50
+
+
+class TestCompactContent:
+
+    @pytest.mark.asyncio
+    async def test_store_during_compaction_keeps_its_payload(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(async_database, "DB_PATH", str(tmp_path / "crawl4ai.db"))
+        manager = AsyncDatabaseManager(
+            compression="none", content_store="pack", write_batch_size=10, write_flush_interval=60
+        )
+        await manager.ainit_db()
+        await manager.update_db_schema()
+        # The payload is still in the pack but no row references it any more
+        await manager.acache_url(_result("https://a.test/old"))
+        await manager.aflush_writes()
+        await manager.aclear_db()
+
+        store = manager.content_store
+        compact = store.acompact
+        caching = []
+
+        async def acompact(live):
+            # A crawl caches the same page while the live set is being built
+            caching.append(asyncio.create_task(manager.acache_url(_result("https://a.test/new"))))
+            await asyncio.wait(caching, timeout=0.5)
+            return await compact(live)
+
+        monkeypatch.setattr(store, "acompact", acompact)
+        await manager.acompact_content()
+        await caching[0]
+
+        cached = await manager.aget_cached_url("https://a.test/new")
+        assert cached.html == HTML
+
+
+class TestFileContentStore:
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, tmp_path):
+        store = FileContentStore(str(tmp_path))
+        content_hash = await store.store(HTML, "html")
+        assert os.path.exists(os.path.join(store.content_paths["html"], content_hash))
+        assert await store.load(content_hash, "html") == HTML
+
+
+def test_unknown_backend_is_rejected(tmp_path):
+    assert isinstance(create_content_store("pack", str(tmp_path)), PackContentStore)
+    with pytest.raises(ValueError):
+        create_content_store("tape", str(tmp_path))
+
+
+class TestCompression:
+
+    @pytest.fixture
+    def compressor(self, tmp_path):
+        pytest.importorskip("zstandard")
+        from crawl4ai.content_store import ContentCompressor
+
+        return ContentCompressor(dictionary_dir=str(tmp_path / "dicts"))
+
+    @pytest.mark.asyncio
+    async def test_file_store_compresses_text_fields(self, tmp_path, compressor):
+        from crawl4ai.content_store import ZSTD_MAGIC
+
+        store = FileContentStore(str(tmp_path), compressor=compressor)
+        html_hash = await store.store(HTML, "html")
+        shot_hash = await store.store("iVBORw0KGgo=", "screenshots")
+
+        with open(os.path.join(store.content_paths["html"], html_hash), "rb") as f:
+            data = f.read()
+        assert data.startswith(ZSTD_MAGIC) and len(data) < len(HTML)
+        with open(os.path.join(store.content_paths["screenshots"], shot_hash), "rb") as f:
+            assert f.read() == b"iVBORw0KGgo="
+        assert await store.load(html_hash, "html") == HTML
+        assert await store.load(shot_hash, "screenshots") == "iVBORw0KGgo="
+
+    @pytest.mark.asyncio
+    async def test_uncompressed_files_stay_readable(self, tmp_path, compressor):
+        content_hash = await FileContentStore(str(tmp_path)).store(HTML, "html")
+        assert await FileContentStore(str(tmp_path), compressor=compressor).load(content_hash, "html") == HTML
+
+    @pytest.mark.asyncio
+    async def test_domain_dictionary(self, tmp_path, compressor):
+        from crawl4ai.content_store import ContentCompressor
+
+        samples = [
+            f"<html><head><title>Docs {i}</title></head><body><nav>home docs api</nav>"
+            f"<main><h1>Section {i}</h1><p>{'lorem ipsum ' * (i % 7 + 3)}</p></main></body></html>"
+            for i in range(300)
+        ]
+        dict_id = compressor.train("docs.example.com", samples, dict_size=4096)
+        page = samples[5].replace("Section 5", "Section 999")
+        with_dict = compressor.compress(page, "html", "docs.example.com")
+        without = compressor.compress(page, "html")
+        assert len(with_dict) < len(without)
+
+        store = PackContentStore(str(tmp_path / "packs"), compressor=compressor)
+        content_hash = await store.store(page, "html", "docs.example.com")
+        assert await store.load(content_hash, "html") == page
+
+        # A fresh compressor picks the saved dictionary up from disk
+        reloaded = ContentCompressor(dictionary_dir=str(tmp_path / "dicts"))
+        assert reloaded.domains == ["docs.example.com"]
+        assert reloaded.decompress(with_dict) == page
+        assert dict_id
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["files", "pack"])
+    async def test_dictionary_frames_read_back_uncompressed(
+        self, tmp_path, monkeypatch, compressor, backend
+    ):
+        monkeypatch.setattr(async_database, "DB_PATH", str(tmp_path / "crawl4ai.db"))
+        writer = AsyncDatabaseManager(compression="zstd", content_store=backend)
+        await writer.ainit_db()
+        await writer.update_db_schema()
+        samples = [
+            f"<html><body><nav>home docs api</nav><h1>Section {i}</h1>"
+            f"<p>{'lorem ipsum ' * (i % 7 + 3)}</p></body></html>"
+            for i in range(300)
+        ]
+        writer.compressor.train("docs.example.com", samples, dict_size=4096)
+        page = samples[5]
+        await writer.acache_url(_result("https://docs.example.com/5").model_copy(update={"html": page}))
+        await writer.aflush_writes()
+
+        reader = AsyncDatabaseManager(compression="none", content_store=backend)
+        assert reader.compressor is None
+        cached = await reader.aget_cached_url("https://docs.example.com/5")
+        assert cached.html == page
+
+    def test_compression_is_opt_in(self, tmp_path, monkeypatch, compressor):
+        monkeypatch.setattr(async_database, "DB_PATH", str(tmp_path / "crawl4ai.db"))
+        monkeypatch.delenv("CRAWL4_AI_CACHE_COMPRESSION", raising=False)
+        manager = AsyncDatabaseManager()
+        assert manager.compression == "none" and manager.compressor is None
+
+        monkeypatch.setenv("CRAWL4_AI_CACHE_COMPRESSION", "zstd")
+        assert AsyncDatabaseManager().compressor is not None
+        assert AsyncDatabaseManager(compression="zstd").compressor is not None
@@ -0,0 +1,96 @@
+"""Unit tests for per-signature browser context creation in BrowserManager.
+
+Uses fake contexts. No browser or network required.
+"""
+
+import asyncio
+
+import pytest
+
+from crawl4ai import BrowserConfig, CrawlerRunConfig
+from crawl4ai.browser_manager import BrowserManager
+
+
+class FakeContext:
+    def __init__(self, name):
+        self.name = name
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def _manager(delay=0.05, fail=()):
+    manager = BrowserManager(BrowserConfig())
+    manager.created = []
+    manager.running = 0
+    manager.max_running = 0
+
+    async def create_browser_context(config):
+        manager.running += 1
+        manager.max_running = max(manager.max_running, manager.running)
+        try:
+            await asyncio.sleep(delay)
+            if config.locale in fail:
+                raise RuntimeError(f"cannot create {config.locale}")
+            manager.created.append(config.locale)
+            return FakeContext(config.locale)
+        finally:
+            manager.running -= 1
+
+    async def setup_context(context, config):
+        pass
+
+    manager.create_browser_context = create_browser_context
+    manager.setup_context = setup_context
+    return manager
+
+
+async def _acquire(manager, locale):
+    config = CrawlerRunConfig(locale=locale)
+    return await manager._acquire_context(manager._make_config_signature(config), config)
+
+
+class TestContextCreation:
+
+    @pytest.mark.asyncio
+    async def test_different_signatures_are_created_in_parallel(self):
+        manager = _manager()
+        contexts = await asyncio.gather(*(_acquire(manager, f"l{i}") for i in range(10)))
+
+        assert manager.max_running == 10
+        assert sorted(c.name for c in contexts) == sorted(f"l{i}" for i in range(10))
+
+    @pytest.mark.asyncio
+    async def test_same_signature_is_created_once(self):
+        manager = _manager()
+        contexts = await asyncio.gather(*(_acquire(manager, "en-US") for _ in range(5)))
+
+        assert manager.created == ["en-US"]
+        assert all(c is contexts[0] for c in contexts)
+        sig = next(iter(manager.contexts_by_config))
+        assert manager._context_refcounts[sig] == 5
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_waiter_and_is_retried(self):
+        manager = _manager(fail={"xx"})
+        results = await asyncio.gather(
+            *(_acquire(manager, "xx") for _ in range(3)), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert not manager.contexts_by_config and not manager._context_creations
+        assert manager.max_running == 1
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_idle_context_is_evicted(self):
+        manager = _manager(delay=0)
+        manager._max_contexts = 2
+        first = await _acquire(manager, "a")
+        await _acquire(manager, "b")
+        await _acquire(manager, "a")  # "b" is now least recently used
+        manager._context_refcounts = {sig: 0 for sig in manager._context_refcounts}
+
+        await _acquire(manager, "c")
+        assert sorted(c.name for c in manager.contexts_by_config.values()) == ["a", "c"]
+        assert not first.closed
@@ -0,0 +1,228 @@
+"""Unit tests for the host-aware scheduler of MemoryAdaptiveDispatcher.
+
+A fake crawler stands in for AsyncWebCrawler. No browser or network required.
+"""
+
+import asyncio
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from crawl4ai import CrawlerRunConfig, MemoryAdaptiveDispatcher, RateLimiter
+from crawl4ai.async_dispatcher import HostScheduler, parse_retry_after
+
+
+def _drain(scheduler, now):
+    urls = []
+    while True:
+        try:
+            urls.append(scheduler.get_nowait(now=now)[0])
+        except asyncio.QueueEmpty:
+            return urls
+
+
+class TestHostScheduler:
+
+    def test_throttled_host_does_not_block_other_hosts(self):
+        limiter = RateLimiter(base_delay=(10, 10))
+        scheduler = HostScheduler(rate_limiter=limiter)
+        for i in range(3):
+            scheduler.put(f"https://slow.test/{i}", f"s{i}")
+        for i in range(3):
+            scheduler.put(f"https://fast{i}.test/", f"f{i}")
+
+        now = time.time()
+        # One URL per host; slow.test waits out its 10s delay
+        assert _drain(scheduler, now) == [
+            "https://slow.test/0", "https://fast0.test/", "https://fast1.test/", "https://fast2.test/",
+        ]
+        assert len(scheduler) == 2
+        assert 9 < scheduler.next_ready_in(now) < 11
+        assert scheduler.get_nowait(now=now + 10.5)[0] == "https://slow.test/1"
+
+    def test_max_per_host_waits_for_release(self):
+        scheduler = HostScheduler(max_per_host=2)
+        for i in range(4):
+            scheduler.put(f"https://a.test/{i}", f"t{i}")
+        scheduler.put("https://b.test/", "b")
+
+        assert sorted(_drain(scheduler, 0)) == ["https://a.test/0", "https://a.test/1", "https://b.test/"]
+        scheduler.release("https://a.test/0")
+        assert _drain(scheduler, 0) == ["https://a.test/2"]
+        scheduler.release("https://a.test/1")
+        scheduler.release("https://a.test/2")
+        assert _drain(scheduler, 0) == ["https://a.test/3"]
+        assert scheduler.empty()
+
+    def test_crawl_delay_spaces_dispatches(self):
+        scheduler = HostScheduler()
+        scheduler.set_crawl_delay("https://a.test/", 5)
+        for i in range(3):
+            scheduler.put(f"https://a.test/{i}", f"t{i}")
+
+        assert _drain(scheduler, 100) == ["https://a.test/0"]
+        assert _drain(scheduler, 104) == []
+        assert _drain(scheduler, 105) == ["https://a.test/1"]
+        assert scheduler.has_crawl_delay("https://a.test/other")
+
+    def test_backoff_after_scheduling_is_honoured(self):
+        limiter = RateLimiter(base_delay=(0, 0))
+        scheduler = HostScheduler(rate_limiter=limiter)
+        scheduler.put("https://a.test/0", "t0")
+        scheduler.put("https://a.test/1", "t1")
+        assert scheduler.get_nowait()[0] == "https://a.test/0"
+
+        limiter.update_delay("https://a.test/0", 429, retry_after=30)
+        with pytest.raises(asyncio.QueueEmpty):
+            scheduler.get_nowait()
+        assert scheduler.next_ready_in() > 25
+
+    def test_taken_entries_are_not_kept(self):
+        scheduler = HostScheduler()
+        for i in range(10_000):
+            scheduler.put(f"https://h{i % 7}.test/{i}", f"t{i}")
+            url = scheduler.get_nowait()[0]
+            scheduler.release(url)
+        assert len(scheduler) == 0 and len(scheduler._arrivals) == 0
+
+        # A host that stays throttled does not pin the entries taken after it
+        limiter = RateLimiter(base_delay=(0, 0))
+        scheduler = HostScheduler(max_per_host=1, rate_limiter=limiter)
+        scheduler.put("https://busy.test/0", "b0")
+        scheduler.put("https://busy.test/1", "b1")
+        scheduler.get_nowait()
+        for i in range(10_000):
+            scheduler.put(f"https://h{i % 7}.test/{i}", f"t{i}")
+            scheduler.release(scheduler.get_nowait()[0])
+        assert len(scheduler) == 1 and len(scheduler._arrivals) < 100
+        assert scheduler.statistics()["total_queued"] == 1
+
+
+class TestRetryAfter:
+
+    def test_parses_seconds_and_http_dates(self):
+        assert parse_retry_after("120") == 120
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        at = datetime.now(timezone.utc) + timedelta(seconds=60)
+        assert 55 < parse_retry_after(format_datetime(at, usegmt=True)) <= 60
+
+    def test_rate_limit_response_sets_retry_after_until(self):
+        limiter = RateLimiter(max_delay=60)
+        limiter.update_delay("https://a.test/", 503, retry_after=600)
+        # Capped at max_delay
+        assert 55 < limiter.ready_time("a.test") - time.time() <= 60
+
+
+class FakeCrawler:
+    """Answers 429 with Retry-After for one host, 200 for all others."""
+
+    def __init__(self, throttled_host):
+        self.throttled_host = throttled_host
+        self.in_flight = 0
+        self.peak = 0
+        self.crawled = []
+        self.robots_parser = None
+        self.browser_config = SimpleNamespace(user_agent="test")
+
+    async def arun(self, url, config=None, session_id=None):
+        self.crawled.append(url)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.02)
+        finally:
+            self.in_flight -= 1
+        if self.throttled_host in url:
+            return SimpleNamespace(
+                success=False, status_code=429, error_message="Too Many Requests",
+                url=url, response_headers={"retry-after": "30"},
+            )
+        return SimpleNamespace(
+            success=True, status_code=200, error_message="", url=url, response_headers={}
+        )
+
+
+class TestDispatcher:
+
+    @pytest.mark.asyncio
+    async def test_throttled_host_does_not_idle_slots(self):
+        crawler = FakeCrawler("slow.test")
+        urls = [f"https://slow.test/{i}" for i in range(5)]
+        urls += [f"https://fast{i % 10}.test/{i}" for i in range(40)]
+        dispatcher = MemoryAdaptiveDispatcher(
+            max_session_permit=4,
+            check_interval=0.01,
+            rate_limiter=RateLimiter(base_delay=(0, 0)),
+        )
+
+        start = time.monotonic()
+        stream = dispatcher.run_urls_stream(urls, crawler, CrawlerRunConfig())
+        fast = 0
+        async for result in stream:
+            fast += "fast" in result.url
+            if fast == 40:
+                break
+        await stream.aclose()
+
+        # The 40 fast URLs finish while slow.test sits out its Retry-After
+        assert time.monotonic() - start < 5
+        assert crawler.peak == 4
+        assert crawler.crawled.count("https://slow.test/1") == 0
+
+    @pytest.mark.asyncio
+    async def test_retry_after_holds_back_the_host(self):
+        crawler = FakeCrawler("slow.test")
+        urls = ["https://slow.test/0", "https://slow.test/1"]
+        urls += [f"https://fast{i}.test/" for i in range(8)]
+        dispatcher = MemoryAdaptiveDispatcher(
+            max_session_permit=2,
+            check_interval=0.01,
+            rate_limiter=RateLimiter(base_delay=(0, 0)),
+        )
+
+        stream = dispatcher.run_urls_stream(urls, crawler, CrawlerRunConfig())
+        seen = []
+        async for result in stream:
+            seen.append(result.url)
+            if len(seen) == 9:
+                break
+        await stream.aclose()
+
+        # The second slow.test URL waits out the 30s Retry-After
+        assert "https://slow.test/1" not in crawler.crawled
+        assert all(f"https://fast{i}.test/" in seen for i in range(8))
+
+    @pytest.mark.asyncio
+    async def test_max_per_host(self):
+        crawler = FakeCrawler("none")
+        dispatcher = MemoryAdaptiveDispatcher(
+            max_session_permit=8, check_interval=0.01, max_per_host=2
+        )
+        results = await dispatcher.run_urls(
+            [f"https://a.test/{i}" for i in range(10)], crawler, CrawlerRunConfig()
+        )
+        assert len(results) == 10
+        assert crawler.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_robots_crawl_delay_is_applied(self):
+        crawler = FakeCrawler("none")
+        crawler.robots_parser = SimpleNamespace(crawl_delay=lambda url, user_agent: 0.2)
+        dispatcher = MemoryAdaptiveDispatcher(
+            max_session_permit=4, check_interval=0.01, max_per_host=1
+        )
+        config = CrawlerRunConfig(check_robots_txt=True)
+
+        start = time.monotonic()
+        results = await dispatcher.run_urls(
+            [f"https://a.test/{i}" for i in range(3)], crawler, config
+        )
+        assert len(results) == 3
+        # The delay is learnt after the first crawl, then spaces the other two
+        assert time.monotonic() - start >= 0.2
+        assert crawler.peak == 1
+        assert dispatcher.task_queue.has_crawl_delay("https://a.test/")
@@ -0,0 +1,81 @@
+"""Unit tests for the shared parsed-document cache used by aprocess_html.
+
+Stages that receive a DocumentCache must produce the same output as when they
+parse on their own. No browser or network required.
+"""
+
+from crawl4ai import JsonCssExtractionStrategy, JsonLxmlExtractionStrategy, LXMLWebScrapingStrategy
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.html_document import DocumentCache, ParsedHTML
+
+HTML = """
+<html><head><title>Shop</title></head>
+<body>
+  <div class="product"><h2>Widget</h2><span class="price">$10</span><a href="/w">more</a></div>
+  <div class="product"><h2>Gadget</h2><span class="price">$20</span><a href="/g">more</a></div>
+  <p>Plenty of words in this paragraph so the scraper keeps it around for output.</p>
+</body></html>
+"""
+
+SCHEMA = {
+    "name": "products",
+    "baseSelector": "div.product",
+    "fields": [
+        {"name": "title", "selector": "h2", "type": "text"},
+        {"name": "price", "selector": ".price", "type": "text"},
+        {"name": "link", "selector": "a", "type": "attribute", "attribute": "href"},
+    ],
+}
+
+
+def _params():
+    params = CrawlerRunConfig().__dict__.copy()
+    params.pop("url", None)
+    return params
+
+
+class TestParsedHTML:
+
+    def test_tree_is_parsed_once(self):
+        document = ParsedHTML(HTML)
+        assert document.tree is document.tree
+
+    def test_clone_is_independent(self):
+        document = ParsedHTML(HTML)
+        clone = document.clone()
+        for el in clone.xpath("//div"):
+            el.getparent().remove(el)
+        assert len(document.tree.xpath("//div")) == 2
+
+    def test_cache_returns_same_document_per_string(self):
+        cache = DocumentCache()
+        assert cache.get(HTML) is cache.get(HTML)
+        cache.get("<p>other</p>")
+        assert len(cache) == 2
+
+
+class TestSharedParseParity:
+
+    def test_scraper_output_unchanged(self):
+        strategy = LXMLWebScrapingStrategy()
+        private = strategy.scrap("https://shop.example", HTML, **_params())
+        cache = DocumentCache()
+        shared = strategy.scrap("https://shop.example", HTML, document_cache=cache, **_params())
+
+        assert shared.cleaned_html == private.cleaned_html
+        assert shared.links == private.links
+        # The shared tree was parsed once and left intact for later stages
+        assert len(cache.get(HTML).tree.xpath("//div[@class='product']")) == 2
+
+    def test_scraper_skips_cache_when_noscript_is_stripped(self):
+        html = HTML.replace("<body>", "<body><noscript><noscript>x</noscript></noscript>")
+        cache = DocumentCache()
+        LXMLWebScrapingStrategy().scrap("https://shop.example", html, document_cache=cache, **_params())
+        assert len(cache) == 0
+
+    def test_json_extraction_unchanged(self):
+        for strategy_cls in (JsonLxmlExtractionStrategy, JsonCssExtractionStrategy):
+            private = strategy_cls(SCHEMA).run("https://shop.example", [HTML])
+            shared = strategy_cls(SCHEMA).run("https://shop.example", [HTML], document_cache=DocumentCache())
+            assert shared == private
+            assert [item["title"] for item in shared] == ["Widget", "Gadget"]
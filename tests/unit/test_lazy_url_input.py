@@ -0,0 +1,95 @@
+"""Unit tests for lazy URL input to the dispatchers.
+
+A fake crawler stands in for AsyncWebCrawler. No browser or network required.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from crawl4ai import CrawlerRunConfig, MemoryAdaptiveDispatcher, SemaphoreDispatcher
+from crawl4ai.async_dispatcher import iter_url_source
+
+
+class FakeCrawler:
+    def __init__(self):
+        self.crawled = []
+
+    async def arun(self, url, config=None, session_id=None):
+        self.crawled.append(url)
+        await asyncio.sleep(0)
+        return SimpleNamespace(success=True, status_code=200, error_message="", url=url)
+
+
+class CountingSource:
+    """Sync iterable that records how far it has been read."""
+
+    def __init__(self, count):
+        self.count = count
+        self.read = 0
+
+    def __iter__(self):
+        for i in range(self.count):
+            self.read += 1
+            yield f"https://a.test/{i}"
+
+
+def _dispatcher(**kwargs):
+    return MemoryAdaptiveDispatcher(max_session_permit=2, check_interval=0.01, **kwargs)
+
+
+class TestIterUrlSource:
+
+    @pytest.mark.asyncio
+    async def test_accepts_lists_generators_async_iterables_and_seeder_dicts(self):
+        async def agen():
+            yield "https://a.test/2"
+            yield {"url": "https://a.test/3", "status": "valid"}
+
+        collected = []
+        for source in (["https://a.test/0"], (u for u in ["https://a.test/1"]), agen()):
+            collected += [url async for url in iter_url_source(source)]
+        assert collected == [f"https://a.test/{i}" for i in range(4)]
+
+
+class TestMemoryAdaptiveDispatcher:
+
+    @pytest.mark.asyncio
+    async def test_run_urls_reads_generator_input(self):
+        results = await _dispatcher().run_urls(
+            (f"https://a.test/{i}" for i in range(25)), FakeCrawler(), CrawlerRunConfig()
+        )
+        assert sorted(r.url for r in results) == sorted(f"https://a.test/{i}" for i in range(25))
+
+    @pytest.mark.asyncio
+    async def test_stream_reads_input_with_bounded_read_ahead(self):
+        source = CountingSource(1000)
+        stream = _dispatcher(read_ahead=5).run_urls_stream(source, FakeCrawler(), CrawlerRunConfig())
+
+        first = await stream.__anext__()
+        assert first.url in ("https://a.test/0", "https://a.test/1")
+        # Only read_ahead URLs are queued beyond those already started
+        assert source.read < 20
+        await stream.aclose()
+        assert source.read < 1000
+
+    @pytest.mark.asyncio
+    async def test_stream_consumes_async_iterable(self):
+        async def urls():
+            for i in range(30):
+                yield f"https://a.test/{i}"
+
+        seen = [r.url async for r in _dispatcher().run_urls_stream(urls(), FakeCrawler(), CrawlerRunConfig())]
+        assert len(seen) == 30
+
+
+class TestSemaphoreDispatcher:
+
+    @pytest.mark.asyncio
+    async def test_run_urls_keeps_input_order(self):
+        crawler = FakeCrawler()
+        results = await SemaphoreDispatcher(semaphore_count=2).run_urls(
+            crawler, (f"https://a.test/{i}" for i in range(20)), CrawlerRunConfig()
+        )
+        assert [r.url for r in results] == [f"https://a.test/{i}" for i in range(20)]
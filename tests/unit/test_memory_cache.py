@@ -0,0 +1,131 @@
+"""Unit tests for the in-process L1 tier in front of the crawl cache.
+
+No browser or network required.
+"""
+
+import pytest
+
+from crawl4ai import async_database
+from crawl4ai.async_database import AsyncDatabaseManager
+from crawl4ai.memory_cache import MemoryCache, estimate_result_size
+from crawl4ai.models import CrawlResult, MarkdownGenerationResult
+
+
+def _result(url, html="<p>cached</p>"):
+    markdown = MarkdownGenerationResult(
+        raw_markdown="cached", markdown_with_citations="cached", references_markdown=""
+    )
+    return CrawlResult(url=url, html=html, success=True, markdown=markdown)
+
+
+class TestMemoryCache:
+
+    def test_hit_returns_independent_copy(self):
+        cache = MemoryCache()
+        cache.put("https://a.test/", _result("https://a.test/"))
+        first = cache.get("https://a.test/")
+        first.cache_status = "hit"
+        first.links["internal"] = [{"href": "/x"}]
+        second = cache.get("https://a.test/")
+        assert second.cache_status is None
+        assert second.links == {}
+        assert cache.stats()["hits"] == 2
+
+    def test_byte_budget_evicts_least_recently_used(self):
+        size = estimate_result_size(_result("https://a.test/0", html="x" * 1000))
+        cache = MemoryCache(max_bytes=size * 2)
+        for i in range(3):
+            if i == 2:
+                cache.get("https://a.test/0")  # keep 0 hot
+            cache.put(f"https://a.test/{i}", _result(f"https://a.test/{i}", html="x" * 1000))
+        assert "https://a.test/0" in cache
+        assert "https://a.test/1" not in cache
+        assert cache.stats()["evictions"] == 1
+        assert cache.total_bytes <= cache.max_bytes
+
+    def test_ttl_expiry_counts_as_miss(self):
+        cache = MemoryCache(ttl=-1)
+        cache.put("https://a.test/", _result("https://a.test/"))
+        assert cache.get("https://a.test/") is None
+        assert cache.stats()["misses"] == 1
+        assert len(cache) == 0
+
+    def test_disabled_cache_stores_nothing(self):
+        cache = MemoryCache(max_bytes=0)
+        cache.put("https://a.test/", _result("https://a.test/"))
+        assert cache.get("https://a.test/") is None
+        assert len(cache) == 0
+
+
+class TestManagerL1:
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_skip_sqlite(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(async_database, "DB_PATH", str(tmp_path / "crawl4ai.db"))
+        manager = AsyncDatabaseManager(compression="none", write_batch_size=1)
+        await manager.ainit_db()
+        await manager.update_db_schema()
+        await manager.acache_url(_result("https://a.test/"))
+
+        assert (await manager.aget_cached_url("https://a.test/")).html == "<p>cached</p>"
+
+        async def _fail(*args, **kwargs):
+            raise AssertionError("SQLite must not be queried on an L1 hit")
+
+        monkeypatch.setattr(manager, "execute_with_retry", _fail)
+        assert (await manager.aget_cached_url("https://a.test/")).html == "<p>cached</p>"
+        assert manager.memory_cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_entry(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(async_database, "DB_PATH", str(tmp_path / "crawl4ai.db"))
+        manager = AsyncDatabaseManager(compression="none", write_batch_size=10)
+        await manager.ainit_db()
+        await manager.update_db_schema()
+        await manager.acache_url(_result("https://a.test/", html="<p>old</p>"))
+        await manager.aget_cached_url("https://a.test/")
+
+        await manager.acache_url(_result("https://a.test/", html="<p>new</p>"))
+        assert (await manager.aget_cached_url("https://a.test/")).html == "<p>new</p>"
+
+
+class TestFieldProjection:
+
+    @pytest.mark.asyncio
+    async def test_projection_skips_unrequested_payloads(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(async_database, "DB_PATH", str(tmp_path / "crawl4ai.db"))
+        manager = AsyncDatabaseManager(compression="none", write_batch_size=1, memory_cache_bytes=0)
+        await manager.ainit_db()
+        await manager.update_db_schema()
+        result = _result("https://a.test/")
+        result.screenshot = "iVBORw0KGgo="
+        await manager.acache_url(result)
+
+        loaded = []
+        original = manager._load_content
+
+        async def _tracking_load(content_hash, content_type):
+            loaded.append(content_type)
+            return await original(content_hash, content_type)
+
+        monkeypatch.setattr(manager, "_load_content", _tracking_load)
+        partial = await manager.aget_cached_url("https://a.test/", fields=["markdown"])
+        assert loaded == ["markdown"]
+        assert partial.markdown == "cached"
+        assert partial.html == "" and partial.screenshot is None
+
+        full = await manager.aget_cached_url("https://a.test/")
+        assert full.html == "<p>cached</p>" and full.screenshot == "iVBORw0KGgo="
+
+    def test_l1_only_serves_covered_projections(self):
+        cache = MemoryCache()
+        cache.put("https://a.test/", _result("https://a.test/"), fields=["html", "markdown"])
+        assert cache.get("https://a.test/", fields=["markdown"]) is not None
+        assert cache.get("https://a.test/", fields=["markdown", "screenshot"]) is None
+        assert cache.get("https://a.test/") is None
+
+        cache.put("https://a.test/", _result("https://a.test/"))
+        assert cache.get("https://a.test/", fields=["screenshot"]) is not None
+        # A narrower read does not replace a full entry
+        cache.put("https://a.test/", _result("https://a.test/"), fields=["html"])
+        assert cache.get("https://a.test/") is not None
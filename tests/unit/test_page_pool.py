@@ -0,0 +1,171 @@
+"""Unit tests for the warm page pool of BrowserManager.
+
+Uses fake contexts and pages. No browser or network required.
+"""
+
+import asyncio
+
+import pytest
+
+from crawl4ai import BrowserConfig, CrawlerRunConfig
+from crawl4ai.browser_manager import BrowserManager, PagePool
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+        self.calls = []
+        self.viewport_size = {"width": 1080, "height": 600}
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+    async def evaluate(self, script):
+        self.calls.append("evaluate")
+
+    async def set_extra_http_headers(self, headers):
+        self.calls.append(("headers", headers))
+
+    async def set_viewport_size(self, size):
+        self.viewport_size = size
+        self.calls.append(("viewport", size))
+
+    async def goto(self, url):
+        self.calls.append(("goto", url))
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestPagePool:
+
+    @pytest.mark.asyncio
+    async def test_acquire_refills_in_the_background(self):
+        pool = PagePool(size=2)
+        context = FakeContext()
+
+        first = await pool.acquire("sig", context)
+        await _settle()
+        assert pool.idle_count("sig") == 1
+        assert len(context.pages) == 2
+
+        second = await pool.acquire("sig", context)
+        assert second is not first and second in context.pages
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_released_pages_are_reset_and_reused(self):
+        pool = PagePool(size=1, viewport={"width": 800, "height": 600})
+        context = FakeContext()
+
+        page = await pool.acquire("sig", context)
+        page.viewport_size = {"width": 800, "height": 4000}
+        assert await pool.release(page)
+        assert page.calls == [
+            "evaluate",
+            ("headers", {}),
+            ("viewport", {"width": 800, "height": 600}),
+            ("goto", "about:blank"),
+        ]
+        await _settle()
+
+        assert await pool.acquire("sig", context) is page
+        assert len(context.pages) == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_pool_never_owns_more_than_its_size(self):
+        pool = PagePool(size=1)
+        context = FakeContext()
+
+        pages = [await pool.acquire("sig", context) for _ in range(3)]
+        await _settle()
+        kept = [await pool.release(page) for page in pages]
+
+        assert kept.count(True) <= 1
+        assert pool.idle_count("sig") <= 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_unreusable_and_session_pages_are_not_kept(self):
+        pool = PagePool(size=2)
+        context = FakeContext()
+
+        page = await pool.acquire("sig", context)
+        assert not await pool.release(page, reusable=False)
+        session_page = await pool.acquire("sig", context, returnable=False)
+        assert not await pool.release(session_page)
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_pages_expire(self):
+        pool = PagePool(size=1, max_idle=0.0)
+        context = FakeContext()
+
+        page = await pool.acquire("sig", context)
+        assert await pool.release(page)
+
+        await pool.acquire("other", FakeContext())
+        await _settle()
+        assert page.closed
+        assert pool.idle_count("sig") == 0
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_discard_stops_refilling(self):
+        pool = PagePool(size=3)
+        context = FakeContext()
+
+        page = await pool.acquire("sig", context)
+        pool.discard("sig")
+        await _settle()
+
+        assert pool.idle_count("sig") == 0
+        assert not await pool.release(page)
+        await pool.close()
+
+
+class TestBrowserManagerPool:
+
+    @pytest.mark.asyncio
+    async def test_get_page_uses_the_pool(self):
+        manager = BrowserManager(BrowserConfig(page_pool_size=1))
+        context = FakeContext()
+
+        async def create_browser_context(config):
+            return context
+
+        async def setup_context(context, config):
+            pass
+
+        manager.create_browser_context = create_browser_context
+        manager.setup_context = setup_context
+        config = CrawlerRunConfig()
+
+        page, _ = await manager.get_page(config)
+        await manager.release_page_with_context(page)
+        assert await manager.recycle_page(page)
+
+        again, _ = await manager.get_page(config)
+        assert again is page
+        assert len(context.pages) == 1
+        await manager._page_pool.close()
+
+    def test_pool_is_disabled_by_default(self):
+        assert BrowserManager(BrowserConfig())._page_pool is None
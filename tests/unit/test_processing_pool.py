@@ -0,0 +1,99 @@
+"""Unit tests for the CPU worker pool used by aprocess_html.
+
+The pool must produce the same ScrapingResult / MarkdownGenerationResult as
+the inline path. No browser or network required.
+"""
+
+import pickle
+
+import pytest
+
+from crawl4ai import DefaultMarkdownGenerator, LXMLWebScrapingStrategy, PruningContentFilter
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_logger import AsyncLogger
+from crawl4ai.processing_pool import HTMLProcessingPool, scrape_and_generate_markdown
+
+HTML = """
+<html><head><title>Pool test</title><base href="https://example.com/docs/"></head>
+<body>
+  <nav><a href="/home">Home</a></nav>
+  <article>
+    <h1>Heading</h1>
+    <p>This paragraph has enough words to survive the default word count threshold easily.</p>
+    <p>Second paragraph links to <a href="page.html">a relative page</a> for citations.</p>
+    <table><tr><th>A</th><th>B</th></tr><tr><td>1</td><td>2</td></tr></table>
+  </article>
+</body></html>
+"""
+
+
+class EchoScraper:
+    """Picklable scraper whose output depends on a param."""
+
+    def scrap(self, url, html, **params):
+        return {"cleaned_html": params["hook"](html)}
+
+
+def _params(config):
+    params = config.__dict__.copy()
+    params.pop("url", None)
+    return params
+
+
+class TestPicklability:
+
+    def test_scraping_strategy_drops_logger(self):
+        strategy = LXMLWebScrapingStrategy(logger=AsyncLogger(verbose=False))
+        clone = pickle.loads(pickle.dumps(strategy))
+        assert clone.logger is None
+        assert strategy.logger is not None
+
+    def test_default_config_params_are_shippable(self):
+        pickle.dumps(_params(CrawlerRunConfig()))
+
+
+class TestHTMLProcessingPool:
+
+    def test_worker_count_defaults_to_cores(self):
+        assert HTMLProcessingPool().max_workers >= 1
+        assert HTMLProcessingPool(3).max_workers == 3
+
+    @pytest.mark.asyncio
+    async def test_pool_matches_inline(self):
+        config = CrawlerRunConfig(
+            markdown_generator=DefaultMarkdownGenerator(content_filter=PruningContentFilter())
+        )
+        args = (config.scraping_strategy, config.markdown_generator, "https://example.com/docs/", HTML, _params(config))
+
+        inline = scrape_and_generate_markdown(*args)
+        pool = HTMLProcessingPool(max_workers=1)
+        try:
+            offloaded = await pool.run(*args)
+        finally:
+            pool.shutdown()
+
+        assert offloaded[0].cleaned_html == inline[0].cleaned_html
+        assert offloaded[0].links == inline[0].links
+        assert offloaded[1] == inline[1]
+        assert offloaded[2] == inline[2]
+        assert "https://example.com/docs/page.html" in offloaded[1].references_markdown
+
+    @pytest.mark.asyncio
+    async def test_unpicklable_params_are_processed_inline(self):
+        class Logger:
+            def __init__(self):
+                self.warnings = []
+
+            def warning(self, message, tag, params=None):
+                self.warnings.append(message.format(**(params or {})))
+
+        logger = Logger()
+        pool = HTMLProcessingPool(max_workers=1)
+        pool._get_executor = lambda: pytest.fail("pickled arguments went to a worker")
+        for _ in range(2):
+            result, _, _ = await pool.run(
+                EchoScraper(), DefaultMarkdownGenerator(), "https://example.com/", HTML,
+                {"hook": lambda html: html.upper()}, logger,
+            )
+            assert result["cleaned_html"] == HTML.upper()
+        assert len(logger.warnings) == 1 and "in-process" in logger.warnings[0]
@@ -0,0 +1,239 @@
+"""Unit tests for the indexed seed URL cache.
+
+Uses a fake HTTP client for the seeder. No browser or network required.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from crawl4ai.async_url_seeder import AsyncUrlSeeder, _query_seed_cache
+from crawl4ai.seed_cache import SeedCache, canonical_url, pattern_prefix
+
+
+def _cache(tmp_path, urls, part=""):
+    cache = SeedCache(str(tmp_path / "seed.db"))
+    cache.begin_refresh()
+    cache.add((u, part) for u in urls)
+    cache.commit("https://example.com/sitemap.xml", "2024-01-01")
+    return cache
+
+
+class TestSeedCache:
+
+    def test_canonical_url_and_pattern_prefix(self):
+        assert canonical_url("https://www.example.com/a") == "example.com/a"
+        assert pattern_prefix("https://www.example.com/blog/*") == "example.com/blog/"
+        assert pattern_prefix("example.com/blog/*") == "example.com/blog/"
+        assert pattern_prefix("*/blog/*") == ""
+        assert pattern_prefix("http*") == ""
+        assert pattern_prefix("ww*") == ""
+
+    def test_prefix_queries_stream_the_matching_range(self, tmp_path):
+        urls = [f"https://example.com/blog/{i}" for i in range(5)] + [
+            "https://www.example.com/docs/a",
+            "http://example.com/blog-archive",
+        ]
+        cache = _cache(tmp_path, urls)
+
+        assert sorted(cache.query("example.com/blog/", batch_size=2)) == urls[:5]
+        assert list(cache.query("example.com/docs/")) == ["https://www.example.com/docs/a"]
+        assert sorted(_query_seed_cache(cache, "*example.com/blog*")) == sorted(urls[:5] + urls[6:])
+        assert list(_query_seed_cache(cache, "https://www.example.com/docs/*")) == ["https://www.example.com/docs/a"]
+        cache.close()
+
+    def test_validity_reads_the_header(self, tmp_path):
+        cache = _cache(tmp_path, ["https://example.com/a"])
+
+        assert cache.is_valid(ttl_hours=24, validate_lastmod=True, current_lastmod="2024-01-01")
+        assert not cache.is_valid(validate_lastmod=True, current_lastmod="2024-02-01")
+
+        old = (datetime.now(timezone.utc) - timedelta(hours=48)).isoformat()
+        cache._db.execute("UPDATE header SET created_at = ?", (old,))
+        assert not cache.is_valid(ttl_hours=24)
+        assert cache.is_valid()
+        cache.close()
+
+    def test_empty_listings_are_invalid(self, tmp_path):
+        cache = SeedCache(str(tmp_path / "seed.db"))
+        assert cache.header() is None and not cache.is_valid()
+        cache.begin_refresh()
+        assert cache.commit() == 0
+        assert not cache.is_valid()
+        cache.close()
+
+    def test_refresh_keeps_only_the_given_parts(self, tmp_path):
+        cache = SeedCache(str(tmp_path / "seed.db"))
+        cache.begin_refresh()
+        cache.add([("https://example.com/a", "part-a"), ("https://example.com/b", "part-b"),
+                   ("https://example.com/", "")])
+        cache.set_part("part-a", "2024-01-01")
+        cache.set_part("part-b", "2024-01-01")
+        cache.commit()
+
+        cache.begin_refresh(keep=["part-a"])
+        cache.add([("https://example.com/b2", "part-b")])
+        assert cache.commit() == 2
+        assert sorted(cache.query()) == ["https://example.com/a", "https://example.com/b2"]
+        assert cache.parts() == {"part-a": "2024-01-01"}
+        cache.close()
+
+    def test_rollback_leaves_the_previous_listing(self, tmp_path):
+        cache = _cache(tmp_path, ["https://example.com/a"])
+        cache.begin_refresh()
+        cache.add([("https://example.com/b", "")])
+        cache.rollback()
+        cache.close()
+
+        reopened = SeedCache(str(tmp_path / "seed.db"))
+        assert list(reopened.query()) == ["https://example.com/a"]
+        assert reopened.header()["url_count"] == 1
+        reopened.close()
+
+
+    def test_concurrent_refreshes_do_not_lock_each_other_out(self, tmp_path):
+        first = _cache(tmp_path, ["https://example.com/old"])
+        second = SeedCache(first.path)
+
+        first.begin_refresh()
+        first.add([("https://example.com/a", "")])
+        second.begin_refresh()
+        second.add([("https://example.com/b", "")])
+        assert list(second.query()) == ["https://example.com/old"]
+
+        assert second.commit() == 1
+        assert first.commit() == 1
+        assert list(second.query()) == ["https://example.com/a"]
+        first.close()
+        second.close()
+
+
+class DummyResponse:
+    def __init__(self, url, text, status_code=200):
+        self.url = url
+        self.status_code = status_code
+        self.headers = {}
+        self._content = text.encode("utf-8")
+
+    def raise_for_status(self):
+        return None
+
+    @property
+    def text(self):
+        return self._content.decode("utf-8")
+
+    async def aiter_bytes(self, chunk_size=None):
+        yield self._content
+
+
+class DummyAsyncClient:
+    def __init__(self, responses, failing=()):
+        self.responses = responses
+        self.failing = set(failing)
+        self.streamed = []
+
+    async def head(self, url, **kwargs):
+        return DummyResponse(url, "", 200 if url in self.responses else 404)
+
+    async def get(self, url, **kwargs):
+        if url in self.failing:
+            raise httpx.ConnectError("connection refused")
+        return DummyResponse(url, self.responses[url])
+
+    @asynccontextmanager
+    async def stream(self, method, url, **kwargs):
+        self.streamed.append(url)
+        yield await self.get(url)
+
+
+def _index(lastmods):
+    entries = "".join(
+        f"<sitemap><loc>https://example.com/{name}.xml</loc><lastmod>{lastmod}</lastmod></sitemap>"
+        for name, lastmod in lastmods.items()
+    )
+    return f"<sitemapindex>{entries}</sitemapindex>"
+
+
+def _urlset(*paths):
+    return "<urlset>" + "".join(f"<url><loc>https://example.com{p}</loc></url>" for p in paths) + "</urlset>"
+
+
+async def _seed(seeder, pattern="*"):
+    return sorted([u async for u in seeder._from_sitemaps("example.com", pattern)])
+
+
+class TestSeederCache:
+
+    @pytest.mark.asyncio
+    async def test_valid_cache_is_served_without_reading_sub_sitemaps(self, tmp_path):
+        responses = {
+            "https://example.com/sitemap.xml": _index({"a": "2024-01-01"}),
+            "https://example.com/a.xml": _urlset("/blog/1", "/docs/1"),
+        }
+        first = AsyncUrlSeeder(client=DummyAsyncClient(responses), base_directory=tmp_path)
+        assert await _seed(first) == ["https://example.com/blog/1", "https://example.com/docs/1"]
+
+        second = AsyncUrlSeeder(client=DummyAsyncClient(responses), base_directory=tmp_path)
+        assert await _seed(second, "*/blog/*") == ["https://example.com/blog/1"]
+        assert second.client.streamed == ["https://example.com/sitemap.xml"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_seeding_of_one_host(self, tmp_path):
+        responses = {
+            "https://example.com/sitemap.xml": _index({"a": "2024-01-01"}),
+            "https://example.com/a.xml": _urlset("/blog/1", "/docs/1"),
+        }
+        seeders = [
+            AsyncUrlSeeder(client=DummyAsyncClient(responses), base_directory=tmp_path) for _ in range(2)
+        ]
+        blog, docs = await asyncio.gather(_seed(seeders[0], "*/blog/*"), _seed(seeders[1], "*/docs/*"))
+
+        assert blog == ["https://example.com/blog/1"]
+        assert docs == ["https://example.com/docs/1"]
+
+    @pytest.mark.asyncio
+    async def test_only_changed_sub_sitemaps_are_downloaded_again(self, tmp_path):
+        responses = {
+            "https://example.com/sitemap.xml": _index({"a": "2024-01-01", "b": "2024-01-01"}),
+            "https://example.com/a.xml": _urlset("/a1", "/a2"),
+            "https://example.com/b.xml": _urlset("/b1"),
+        }
+        first = AsyncUrlSeeder(client=DummyAsyncClient(responses), base_directory=tmp_path)
+        assert len(await _seed(first)) == 3
+
+        responses["https://example.com/sitemap.xml"] = _index({"a": "2024-01-01", "b": "2024-02-01"})
+        responses["https://example.com/b.xml"] = _urlset("/b1", "/b2")
+        second = AsyncUrlSeeder(client=DummyAsyncClient(responses), base_directory=tmp_path)
+
+        assert await _seed(second) == [f"https://example.com/{p}" for p in ("a1", "a2", "b1", "b2")]
+        assert "https://example.com/a.xml" not in second.client.streamed
+        assert "https://example.com/b.xml" in second.client.streamed
+
+        third = AsyncUrlSeeder(client=DummyAsyncClient(responses), base_directory=tmp_path)
+        assert len(await _seed(third)) == 4
+        assert third.client.streamed == ["https://example.com/sitemap.xml"]
+
+    @pytest.mark.asyncio
+    async def test_sub_sitemaps_that_failed_are_read_again(self, tmp_path):
+        responses = {
+            "https://example.com/sitemap.xml": _index({"a": "2024-01-01", "b": "2024-01-01"}),
+            "https://example.com/a.xml": _urlset("/a1"),
+            "https://example.com/b.xml": _urlset("/b1"),
+        }
+        client = DummyAsyncClient(responses, failing=["https://example.com/b.xml"])
+        first = AsyncUrlSeeder(client=client, base_directory=tmp_path)
+        assert await _seed(first) == ["https://example.com/a1"]
+
+        # A new part refreshes the index; b's <lastmod> is unchanged, but b.xml
+        # was never read in full
+        responses["https://example.com/sitemap.xml"] = _index(
+            {"a": "2024-01-01", "b": "2024-01-01", "c": "2024-02-01"}
+        )
+        responses["https://example.com/c.xml"] = _urlset("/c1")
+        second = AsyncUrlSeeder(client=DummyAsyncClient(responses), base_directory=tmp_path)
+        assert await _seed(second) == [f"https://example.com/{p}" for p in ("a1", "b1", "c1")]
+        assert "https://example.com/a.xml" not in second.client.streamed
+        assert "https://example.com/b.xml" in second.client.streamed
@@ -1,28 +1,17 @@
-import sys
-from types import SimpleNamespace
+import gzip
+from contextlib import asynccontextmanager
 
 import pytest
 
-# Provide a lightweight stub for rank_bm25 before importing the seeder to avoid
-# optional dependency issues (e.g., incompatible wheels in CI).
-class _FakeBM25:
-    def __init__(self, corpus):
-        self._scores = [1.0] * len(corpus)
-
-    def get_scores(self, tokens):
-        return self._scores
-
-
-sys.modules.setdefault("rank_bm25", SimpleNamespace(BM25Okapi=_FakeBM25))
-
-from crawl4ai.async_url_seeder import AsyncUrlSeeder
+from crawl4ai.async_url_seeder import AsyncUrlSeeder, _SitemapParser, _parse_sitemap_lastmod
 
 
 class DummyResponse:
-    def __init__(self, request_url: str, text: str):
+    def __init__(self, request_url: str, text, chunk_size: int = 7):
         self.status_code = 200
-        self._content = text.encode("utf-8")
+        self._content = text if isinstance(text, bytes) else text.encode("utf-8")
         self.url = request_url
+        self.chunk_size = chunk_size
 
     def raise_for_status(self):
         return None
@@ -35,10 +24,16 @@ class DummyResponse:
     def text(self):
         return self._content.decode("utf-8")
 
+    async def aiter_bytes(self, chunk_size=None):
+        # Small chunks split tags and gzip blocks across feeds
+        for i in range(0, len(self._content), self.chunk_size):
+            yield self._content[i:i + self.chunk_size]
+
 
 class DummyAsyncClient:
     def __init__(self, response_map):
         self._responses = response_map
+        self.streamed = []
 
     async def get(self, url, **kwargs):
         payload = self._responses[url]
@@ -46,6 +41,11 @@ class DummyAsyncClient:
             payload = payload()
         return DummyResponse(url, payload)
 
+    @asynccontextmanager
+    async def stream(self, method, url, **kwargs):
+        self.streamed.append(url)
+        yield await self.get(url)
+
 
 @pytest.mark.asyncio
 async def test_iter_sitemap_handles_namespace_less_sitemaps():
@@ -132,3 +132,46 @@ async def test_iter_sitemap_normalizes_relative_locations():
         "https://example.com/relative-path",
         "https://example.com/absolute",
     ]
+
+
+@pytest.mark.asyncio
+async def test_iter_sitemap_streams_gzipped_sitemaps():
+    xml = "<urlset>" + "".join(
+        f"<url><loc>https://example.com/p{i}</loc></url>" for i in range(500)
+    ) + "</urlset>"
+    seeder = AsyncUrlSeeder(client=DummyAsyncClient({"https://example.com/sitemap.xml.gz": gzip.compress(xml.encode())}))
+
+    urls = [u async for u in seeder._iter_sitemap("https://example.com/sitemap.xml.gz")]
+
+    assert urls == [f"https://example.com/p{i}" for i in range(500)]
+    assert seeder.client.streamed == ["https://example.com/sitemap.xml.gz"]
+
+
+def test_parser_yields_entries_as_they_complete_and_clears_them():
+    parser = _SitemapParser()
+    assert parser.feed(b"<urlset><url><loc>https://example.com/a</loc>") == []
+    assert parser.feed(b"</url><url><loc>https://example.com/b") == [("url", "https://example.com/a", None)]
+    assert parser.feed(b"</loc></url></urlset>") == [("url", "https://example.com/b", None)]
+    assert parser.close() == []
+    assert len(parser._root) == 0
+
+
+def test_parser_ignores_nested_locs_and_tracks_lastmod():
+    xml = b"""<urlset xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">
+        <url>
+            <loc>https://example.com/a</loc>
+            <lastmod>2024-01-01</lastmod>
+            <image:image><image:loc>https://example.com/a.png</image:loc></image:image>
+        </url>
+        <url><loc>https://example.com/b</loc><lastmod>2024-03-01</lastmod></url>
+    </urlset>"""
+
+    parser = _SitemapParser()
+    entries = parser.feed(xml) + parser.close()
+
+    assert entries == [
+        ("url", "https://example.com/a", "2024-01-01"),
+        ("url", "https://example.com/b", "2024-03-01"),
+    ]
+    assert parser.lastmod == "2024-03-01"
+    assert _parse_sitemap_lastmod(xml) == "2024-03-01"
@@ -0,0 +1,196 @@
+"""Unit tests for batch URL filtering and scoring.
+
+No browser or network required.
+"""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from crawl4ai.deep_crawling import (
+    BestFirstCrawlingStrategy,
+    BFSDeepCrawlStrategy,
+    CompositeScorer,
+    ContentTypeFilter,
+    ContentTypeScorer,
+    DFSDeepCrawlStrategy,
+    DomainAuthorityScorer,
+    DomainFilter,
+    FilterChain,
+    FreshnessScorer,
+    KeywordRelevanceScorer,
+    PathDepthScorer,
+    URLBatch,
+    URLFilter,
+    URLPatternFilter,
+    URLScorer,
+)
+
+
+def _urls(n=500, seed=3):
+    rng = random.Random(seed)
+    hosts = ["example.com", "docs.python.org", "github.com", "blog.example.com:8080"]
+    parts = ["a", "blog", "2019", "2023-05-01", "guide.pdf", "page.html", "img.png"]
+    # Unique, since URLPatternFilter.apply caches repeated URLs without counting them
+    return list(dict.fromkeys(
+        f"https://{rng.choice(hosts)}/" + "/".join(rng.choice(parts) for _ in range(rng.randint(0, 6)))
+        for _ in range(n)
+    ))
+
+
+def _filters():
+    return [
+        URLPatternFilter(["*/blog/*", "*.pdf"]),
+        URLPatternFilter(["*2019*"], reverse=True),
+        DomainFilter(allowed_domains=["example.com", "github.com"], blocked_domains=["docs.python.org"]),
+        ContentTypeFilter(["text/html"]),
+    ]
+
+
+def _scorers():
+    return [
+        KeywordRelevanceScorer(["blog", "python"], weight=0.7),
+        PathDepthScorer(optimal_depth=2, weight=0.3),
+        ContentTypeScorer({".html$": 1.0, ".pdf$": 0.5, "docs": 0.8}),
+        FreshnessScorer(weight=0.9, current_year=2024),
+        DomainAuthorityScorer({"python.org": 1.0, "docs.python.org": 0.9, "github.com": 0.8}),
+    ]
+
+
+class AsyncRejectPdf(URLFilter):
+    def __init__(self):
+        super().__init__()
+        self.seen = []
+
+    async def apply(self, url: str) -> bool:
+        self.seen.append(url)
+        result = not url.endswith(".pdf")
+        self._update_stats(result)
+        return result
+
+
+class TestBatchFilters:
+
+    def test_batch_matches_single_url_results_and_stats(self):
+        urls = _urls()
+        for single, batch in zip(_filters(), _filters()):
+            expected = [single.apply(url) for url in urls]
+            assert batch.apply_many(urls).tolist() == expected
+            assert tuple(batch.stats._counters) == tuple(single.stats._counters)
+
+    @pytest.mark.asyncio
+    async def test_chain_matches_apply(self):
+        urls = _urls()
+        single, batch = FilterChain(_filters()), FilterChain(_filters())
+        expected = [await single.apply(url) for url in urls]
+
+        assert (await batch.apply_many(urls)).tolist() == expected
+        assert tuple(batch.stats._counters) == tuple(single.stats._counters)
+
+    @pytest.mark.asyncio
+    async def test_async_filters_see_only_urls_passing_sync_filters(self):
+        urls = ["https://example.com/a.pdf", "https://example.com/b", "https://other.com/c"]
+        async_filter = AsyncRejectPdf()
+        chain = FilterChain([async_filter, DomainFilter(allowed_domains=["example.com"])])
+
+        assert (await chain.apply_many(urls)).tolist() == [False, True, False]
+        assert async_filter.seen == urls[:2]
+        assert tuple(chain.stats._counters) == (3, 1, 2)
+
+    def test_batch_shares_parsing(self):
+        batch = URLBatch(["https://example.com/a/b?q=1", "http://[bad"])
+        assert batch.paths == ["/a/b", ""]
+        assert batch.parsed[1] is None
+
+        subset = batch.subset([0])
+        assert subset.urls == ["https://example.com/a/b?q=1"]
+        assert subset.paths == ["/a/b"]
+
+
+class TestBatchScorers:
+
+    def test_batch_matches_single_url_scores(self):
+        urls = _urls()
+        for scorer in _scorers():
+            expected = [scorer.score(url) for url in urls]
+            assert scorer.score_many(urls).tolist() == expected
+
+    @pytest.mark.parametrize("normalize", [True, False])
+    def test_composite_matches_single_url_scores(self, normalize):
+        urls = _urls()
+        single, batch = CompositeScorer(_scorers(), normalize), CompositeScorer(_scorers(), normalize)
+
+        assert batch.score_many(urls).tolist() == [single.score(url) for url in urls]
+        assert batch.stats.get_average() == pytest.approx(single.stats.get_average())
+
+    def test_subclasses_overriding_score_are_honoured(self):
+        class Constant(URLScorer):
+            def _calculate_score(self, url):
+                return 0.0
+
+            def score(self, url):
+                return 0.25
+
+        assert Constant().score_many(["https://example.com/"]).tolist() == [0.25]
+
+
+def _result(*hrefs):
+    return SimpleNamespace(links={"internal": [{"href": h} for h in hrefs]}, metadata={})
+
+
+class TestLinkDiscovery:
+
+    LINKS = (
+        "https://example.com/blog/a",
+        "https://example.com/blog/a",
+        "https://example.com/about",
+        "https://example.com/blog/old/page/deep/x",
+        "mailto:someone@example.com",
+    )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("strategy_cls", [BFSDeepCrawlStrategy, DFSDeepCrawlStrategy])
+    async def test_links_are_filtered_and_scored_per_page(self, strategy_cls):
+        strategy = strategy_cls(
+            max_depth=2,
+            filter_chain=FilterChain([URLPatternFilter(["*/blog/*"])]),
+            url_scorer=PathDepthScorer(optimal_depth=2),
+            score_threshold=0.3,
+        )
+        next_level, depths = [], {}
+        await strategy.link_discovery(
+            _result(*self.LINKS), "https://example.com/", 0, set(), next_level, depths
+        )
+
+        assert next_level == [("https://example.com/blog/a", "https://example.com/")]
+        assert depths == {"https://example.com/blog/a": 1}
+        assert strategy.stats.urls_skipped == 3
+
+    @pytest.mark.asyncio
+    async def test_best_first_discovery_filters_per_page(self):
+        strategy = BestFirstCrawlingStrategy(
+            max_depth=2, filter_chain=FilterChain([URLPatternFilter(["*/blog/*"])])
+        )
+        next_links, depths = [], {}
+        await strategy.link_discovery(
+            _result(*self.LINKS), "https://example.com/", 0, set(), next_links, depths
+        )
+
+        assert [url for url, _ in next_links] == [
+            "https://example.com/blog/a",
+            "https://example.com/blog/old/page/deep/x",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_custom_can_process_url_is_used(self):
+        class OnlyAbout(BFSDeepCrawlStrategy):
+            async def can_process_url(self, url, depth):
+                return url.endswith("/about")
+
+        strategy = OnlyAbout(max_depth=2)
+        next_level = []
+        await strategy.link_discovery(
+            _result(*self.LINKS), "https://example.com/", 0, set(), next_level, {}
+        )
+        assert next_level == [("https://example.com/about", "https://example.com/")]